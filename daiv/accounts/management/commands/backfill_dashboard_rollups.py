@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from sessions.models import Run, RunDailyStats
+from sessions.rollups import refresh_run_daily_stats
+
+from codebase.models import MergeDailyStats, MergeMetric
+from codebase.rollups import refresh_merge_daily_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the daily run and merge rollups behind the dashboard from the underlying rows. "
+        "Only needed to repair drift, e.g. after changing TIME_ZONE or bulk-editing runs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=None, help="Only recompute the last N days (default: the whole history)."
+        )
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        if days is not None and days < 1:
+            raise CommandError("--days must be a positive number.")
+
+        runs, run_rollups = Run.objects.all(), RunDailyStats.objects.all()
+        merges, merge_rollups = MergeMetric.objects.all(), MergeDailyStats.objects.all()
+        if days is not None:
+            cutoff = timezone.localdate() - timedelta(days=days - 1)
+            runs, run_rollups = runs.filter(created_at__date__gte=cutoff), run_rollups.filter(day__gte=cutoff)
+            merges, merge_rollups = merges.filter(merged_at__date__gte=cutoff), merge_rollups.filter(day__gte=cutoff)
+
+        # Days that already have rollup rows are recomputed too, so rows whose runs or merges are gone are dropped.
+        run_days = set(runs.dates("created_at", "day")) | set(run_rollups.values_list("day", flat=True))
+        merge_days = set(merges.dates("merged_at", "day")) | set(merge_rollups.values_list("day", flat=True))
+
+        refresh_run_daily_stats(run_days)
+        refresh_merge_daily_stats(merge_days)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Recomputed {len(run_days)} day(s) of run stats and {len(merge_days)} of merge stats.")
+        )
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import logging
+import math
+import time
 from typing import TYPE_CHECKING, Generic, TypeVar
 
+from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
 
 from accounts.crypto import KeyGenerator
 
@@ -17,6 +21,14 @@ logger = logging.getLogger("daiv.accounts")
 
 T = TypeVar("T", bound="APIKey")
 
+# Verified keys are remembered briefly so a polling client (chat streams, MCP ``get_job_status``)
+# does not pay a key lookup and hash verification on every request. The entry is keyed by a keyed
+# hash of the presented token — never the token itself — and a per-prefix pointer to it lets a
+# revoke, expiry change or delete (see ``APIKey.save``/``delete``) drop it without the token.
+VERIFIED_KEY_CACHE_KEY = "api-key:verified:{digest}"
+VERIFIED_KEY_POINTER_CACHE_KEY = "api-key:verified-pointer:{prefix}"
+VERIFIED_KEY_CACHE_TIMEOUT = 60
+
 
 class APIKeyManager(models.Manager, Generic[T]):  # noqa: UP046
     """
@@ -50,7 +62,57 @@ class APIKeyManager(models.Manager, Generic[T]):  # noqa: UP046
             return None
         return api_key
 
+    async def get_active_user(self, key: str) -> User | None:
+        """Return the active user owning usable ``key``, or None; verified keys are cached briefly.
+
+        A cache hit skips the key lookup and verification but still loads the user, so a
+        deactivated user is rejected immediately. Queryset-level ``update()``/``delete()`` bypass
+        the invalidation; the short timeout bounds how long such a key keeps working.
+        """
+        from accounts.models import User
+
+        prefix, _, _ = key.partition(".")
+        digest = _token_digest(key)
+        entry = await cache.aget(VERIFIED_KEY_CACHE_KEY.format(digest=digest))
+        if entry is not None and constant_time_compare(entry["prefix"], prefix) and time.time() < entry["valid_until"]:
+            user = await User.objects.filter(pk=entry["user_id"], is_active=True).afirst()
+            if user is None:
+                logger.warning("API key used by an inactive user")
+            return user
+
+        api_key = await self.get_active_key(key)
+        if api_key is None:
+            return None
+
+        valid_until = time.time() + VERIFIED_KEY_CACHE_TIMEOUT
+        if api_key.expires_at is not None:
+            valid_until = min(valid_until, api_key.expires_at.timestamp())
+        timeout = math.ceil(valid_until - time.time())
+        if timeout > 0:
+            await cache.aset_many(
+                {
+                    VERIFIED_KEY_CACHE_KEY.format(digest=digest): {
+                        "prefix": prefix,
+                        "user_id": api_key.user_id,
+                        "valid_until": valid_until,
+                    },
+                    VERIFIED_KEY_POINTER_CACHE_KEY.format(prefix=prefix): digest,
+                },
+                timeout=timeout,
+            )
+        return api_key.user
+
+    def forget_verified_key(self, prefix: str) -> None:
+        """Drop the cached verification of the key with ``prefix``, if any."""
+        pointer = VERIFIED_KEY_POINTER_CACHE_KEY.format(prefix=prefix)
+        if (digest := cache.get(pointer)) is not None:
+            cache.delete_many([pointer, VERIFIED_KEY_CACHE_KEY.format(digest=digest)])
+
     def get_usable_keys(self) -> models.QuerySet:
         return self.filter(
             models.Q(revoked=False), models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=timezone.now())
         )
+
+
+def _token_digest(key: str) -> str:
+    return salted_hmac("accounts.api-key-cache", key, algorithm="sha256").hexdigest()
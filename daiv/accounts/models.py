@@ -53,3 +53,13 @@ class APIKey(TimeStampedModel):
 
     def __str__(self):
         return f"{self.name} ({self.user})"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # A revoke or expiry change must not be masked by a cached verification.
+        APIKey.objects.forget_verified_key(self.prefix)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        APIKey.objects.forget_verified_key(self.prefix)
+        return result
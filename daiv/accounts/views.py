@@ -5,7 +5,7 @@ from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
 from django.db import IntegrityError
-from django.db.models import Avg, Count, DurationField, ExpressionWrapper, F, Q, Sum
+from django.db.models import Q
 from django.shortcuts import redirect, render
 from django.urls import reverse, reverse_lazy
 from django.utils.timezone import localdate
@@ -13,7 +13,8 @@ from django.views import View
 from django.views.generic import CreateView, DeleteView, ListView, TemplateView, UpdateView
 
 from django_filters.views import FilterView
-from sessions.models import Run, RunStatus, SessionOrigin
+from sessions.models import RunStatus, SessionOrigin
+from sessions.rollups import run_activity_stats
 
 from accounts.context_processors import running_jobs_count
 from accounts.emails import send_welcome_email
@@ -21,7 +22,7 @@ from accounts.filters import UserFilter
 from accounts.forms import APIKeyCreateForm, UserCreateForm, UserUpdateForm
 from accounts.mixins import AdminRequiredMixin, BreadcrumbMixin
 from accounts.models import APIKey, User
-from codebase.models import MergeMetric
+from codebase.rollups import merge_velocity_stats
 from schedules.models import ScheduledJob
 
 logger = logging.getLogger(__name__)
@@ -134,32 +135,8 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         return context
 
     def _get_activity_data(self, cutoff_date: date | None, user: User) -> dict:
-        visible = Run.objects.visible_to(user)
-        activities = visible.filter(created_at__date__gte=cutoff_date) if cutoff_date is not None else visible
-
-        successful = Q(status=RunStatus.SUCCESSFUL)
-        failed = Q(status=RunStatus.FAILED)
-        issue_trigger = Q(trigger_type=SessionOrigin.ISSUE_WEBHOOK)
-        mr_trigger = Q(trigger_type=SessionOrigin.MR_WEBHOOK)
-        mcp_trigger = Q(trigger_type=SessionOrigin.MCP_JOB)
-        schedule_trigger = Q(trigger_type=SessionOrigin.SCHEDULE)
-        api_trigger = Q(trigger_type=SessionOrigin.API_JOB)
-        chat_trigger = Q(trigger_type=SessionOrigin.CHAT)
-        duration_expr = ExpressionWrapper(F("finished_at") - F("started_at"), output_field=DurationField())
-
-        stats = activities.aggregate(
-            total=Count("id"),
-            successful=Count("id", filter=successful),
-            failed_count=Count("id", filter=failed),
-            issues=Count("id", filter=issue_trigger & ~failed),
-            mrs=Count("id", filter=mr_trigger & ~failed),
-            mcp_jobs=Count("id", filter=mcp_trigger & ~failed),
-            scheduled=Count("id", filter=schedule_trigger & ~failed),
-            api_jobs=Count("id", filter=api_trigger & ~failed),
-            chat_jobs=Count("id", filter=chat_trigger & ~failed),
-            code_changes=Count("id", filter=successful & Q(code_changes=True)),
-            avg_duration=Avg(duration_expr, filter=successful),
-        )
+        # Finished runs come from the daily rollup, so the render does not scan the run history.
+        stats = run_activity_stats(user, cutoff_date)
 
         # "Running now" is global (not period-filtered); share the request-memoized helper
         # with the ``nav`` context processor so the sidebar badge and dashboard card resolve
@@ -229,24 +206,13 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         }
 
     def _get_velocity_data(self, cutoff_date: date | None) -> dict | None:
-        merges = MergeMetric.objects.all()
-        if cutoff_date is not None:
-            merges = merges.filter(merged_at__date__gte=cutoff_date)
-
-        stats = merges.aggregate(
-            total=Count("id"),
-            total_added=Sum("lines_added", default=0),
-            total_removed=Sum("lines_removed", default=0),
-            daiv_merges=Count("id", filter=Q(daiv_commits__gt=0)),
-            total_commits_sum=Sum("total_commits", default=0),
-            daiv_commits_sum=Sum("daiv_commits", default=0),
-        )
+        stats = merge_velocity_stats(cutoff_date)
 
         if not stats["total"]:
             return None
 
         total_merges = stats["total"]
-        daiv_merges = stats["daiv_merges"]
+        daiv_merges = stats["daiv_merges_sum"]
         human_merges = total_merges - daiv_merges
         total_commits = stats["total_commits_sum"]
         daiv_commits = stats["daiv_commits_sum"]
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import asyncio
-import contextlib
+import hashlib
+import json
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Generic, TypeVar
 
@@ -13,7 +15,7 @@ from langgraph.graph.state import CompiledStateGraph
 
 from automation.agent.chat_models import ChatOpenRouter
 from automation.agent.model_catalog.exceptions import MissingApiKeyError
-from automation.agent.provider_clients import build_sdk_client_kwargs
+from automation.agent.provider_clients import build_sdk_client_kwargs, pooled_http_clients
 from core.constants import BOT_NAME
 from core.models import Provider, ProviderType
 from core.models import ThinkingLevelChoices as ThinkingLevel
@@ -218,43 +220,6 @@ class ResolvedProvider:
 _HTTPX_CLIENT_PROVIDER_TYPES = frozenset({ProviderType.OPENAI, ProviderType.OPENROUTER})
 
 
-_PENDING_ACLOSE_TASKS: set[asyncio.Task] = set()
-
-
-def _close_insecure_http_clients(kw: dict) -> None:
-    """Close httpx clients attached by :func:`_apply_insecure_http_clients` when the
-    downstream :func:`init_chat_model` call fails — prevents ``ResourceWarning`` and
-    connection-pool retention under retry loops."""
-    sync_client = kw.pop("http_client", None)
-    async_client = kw.pop("http_async_client", None)
-
-    if sync_client is not None:
-        # The sync transport can raise on already-closed pools / interpreter shutdown
-        # — suppress so we don't mask the original init_chat_model exception.
-        with contextlib.suppress(Exception):
-            sync_client.close()
-
-    if async_client is None:
-        return
-
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        # No running loop — we cannot await aclose() from sync context. Surface this
-        # so operators can correlate ResourceWarnings with the call site.
-        logger.warning(
-            "Cannot close insecure httpx.AsyncClient: no running event loop. "
-            "Expect a ResourceWarning; the underlying connection pool will be released by GC."
-        )
-        return
-
-    # Retain a reference until done so Python's GC doesn't drop the task before
-    # aclose() completes (RUF006 / fire-and-forget asyncio task pitfall).
-    task = loop.create_task(async_client.aclose())
-    _PENDING_ACLOSE_TASKS.add(task)
-    task.add_done_callback(_PENDING_ACLOSE_TASKS.discard)
-
-
 def _apply_insecure_http_clients(kw: dict, row: Provider.Cached) -> None:
     if row.provider_type not in _HTTPX_CLIENT_PROVIDER_TYPES:
         logger.warning(
@@ -264,10 +229,40 @@ def _apply_insecure_http_clients(kw: dict, row: Provider.Cached) -> None:
             row.provider_type,
         )
         return
-    import httpx
+    kw["http_client"], kw["http_async_client"] = pooled_http_clients(row)
+
 
-    kw["http_client"] = httpx.Client(verify=False)  # noqa: S501  # admin-opted-in via Provider.verify_ssl
-    kw["http_async_client"] = httpx.AsyncClient(verify=False)  # noqa: S501
+# Chat models are immutable once built (binding tools or structured output returns a new
+# runnable), so one instance per distinct configuration serves every run in the process.
+MODEL_CACHE_SIZE = 64
+
+_model_cache: OrderedDict[str, BaseChatModel] = OrderedDict()
+_model_cache_lock = threading.Lock()
+
+
+def _unkeyable(value: object) -> object:
+    raise TypeError(f"{type(value).__name__} is not part of a cacheable model configuration")
+
+
+def _model_cache_key(row: Provider.Cached, kw: dict) -> str | None:
+    """Digest of everything that shapes the model built from ``kw``; ``None`` when a caller passed
+    something without a stable value (a callback, a client), so that model is built uncached.
+
+    The pooled httpx clients are left out: they are a function of the row, which is keyed. The API
+    key is part of the digest, so rotating it builds a fresh model.
+    """
+    config = {name: value for name, value in kw.items() if name not in ("http_client", "http_async_client")}
+    try:
+        payload = json.dumps([str(row.provider_type), row.verify_ssl, config], sort_keys=True, default=_unkeyable)
+    except TypeError, ValueError:
+        return None
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def clear_model_cache() -> None:
+    """Forget every cached chat model; the pooled clients they share stay open."""
+    with _model_cache_lock:
+        _model_cache.clear()
 
 
 _BARE_NAME_HEURISTICS = (
@@ -350,21 +345,36 @@ class BaseAgent(ABC, Generic[T]):  # noqa: UP046
         """
         Get the model instance to use for the agent.
 
+        Instances are cached per resolved configuration (see :func:`_model_cache_key`), so repeated
+        calls return the same model and its warm HTTP connections instead of building a new one.
+
         Returns:
             BaseChatModel: The model instance
         """
         resolved = parse_model_spec(model)
         model_kwargs = BaseAgent.get_model_kwargs(resolved=resolved, thinking_level=thinking_level, **kwargs)
-        try:
-            if resolved.row.provider_type == ProviderType.OPENROUTER:
-                # OpenRouter routes through our ChatOpenAI subclass (reasoning extraction +
-                # base-URL default). init_chat_model can't return a subclass, so instantiate
-                # directly.
-                return ChatOpenRouter(**model_kwargs)
-            return init_chat_model(**model_kwargs)
-        except Exception:
-            _close_insecure_http_clients(model_kwargs)
-            raise
+        key = _model_cache_key(resolved.row, model_kwargs)
+        if key is not None:
+            with _model_cache_lock:
+                if (cached := _model_cache.get(key)) is not None:
+                    _model_cache.move_to_end(key)
+                    return cached
+
+        if resolved.row.provider_type == ProviderType.OPENROUTER:
+            # OpenRouter routes through our ChatOpenAI subclass (reasoning extraction +
+            # base-URL default). init_chat_model can't return a subclass, so instantiate
+            # directly.
+            instance = ChatOpenRouter(**model_kwargs)
+        else:
+            instance = init_chat_model(**model_kwargs)
+
+        if key is not None:
+            with _model_cache_lock:
+                _model_cache[key] = instance
+                _model_cache.move_to_end(key)
+                while len(_model_cache) > MODEL_CACHE_SIZE:
+                    _model_cache.popitem(last=False)
+        return instance
 
     @staticmethod
     def get_model_kwargs(*, resolved: ResolvedProvider, thinking_level: ThinkingLevel | None = None, **kwargs) -> dict:
@@ -378,7 +388,7 @@ class BaseAgent(ABC, Generic[T]):  # noqa: UP046
 
         # Shared primitive: api_key plaintext, base_url, default_headers.
         # LangChain needs both sync and async httpx clients when verify_ssl=False
-        # — those are constructed below via _apply_insecure_http_clients, so we
+        # — those come from the shared pool via _apply_insecure_http_clients, so we
         # skip the helper's AsyncClient here to avoid leaking it.
         try:
             sdk_kw = build_sdk_client_kwargs(row, with_http_client=False)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -20,6 +23,10 @@ _TOKEN_RE = re.compile(r"[a-z0-9]+")
 _STOPWORDS = frozenset((Path(__file__).parent / "stopwords.txt").read_text().split())
 _INDEXED_TEXT_CAP = 2048
 _SUMMARY_CAP = 200
+# Distinct deferred tool sets a process keeps built indexes for. A deployment has a handful (the
+# main agent, subagents, per-user MCP selections); a catalog change retires its old set, which then
+# ages out of the LRU.
+_CORPUS_CACHE_SIZE = 32
 
 
 def _tokenize(text: str) -> list[str]:
@@ -34,20 +41,87 @@ class ToolEntry:
     summary: str
 
 
+@dataclass(frozen=True)
+class _Corpus:
+    """The part of an index that depends only on the tools' names and descriptions.
+
+    Everything costly — arg-schema rendering, tokenization, the BM25 model — lives here, so runs
+    whose deferred tool set is unchanged share one build. Tool instances do not: they are per run.
+    """
+
+    names: tuple[str, ...]
+    indexed_texts: tuple[str, ...]
+    summaries: tuple[str, ...]
+    token_sets: tuple[frozenset[str], ...]
+    bm25: BM25Plus | None
+
+
+_corpus_cache: OrderedDict[str, _Corpus] = OrderedDict()
+_corpus_cache_lock = threading.Lock()
+
+
+def tool_set_fingerprint(tools: Iterable[BaseTool]) -> str:
+    """Digest of the tools' names, descriptions and arg-schema types, in order."""
+    digest = hashlib.sha256()
+    for tool in tools:
+        schema = tool.args_schema
+        schema_id = f"{schema.__module__}.{schema.__qualname__}" if isinstance(schema, type) else ""
+        digest.update(f"{tool.name}\0{tool.description or ''}\0{schema_id}\0".encode())
+    return digest.hexdigest()
+
+
+def clear_index_cache() -> None:
+    """Drop every cached build; the next index for each tool set is built afresh."""
+    with _corpus_cache_lock:
+        _corpus_cache.clear()
+
+
+def _corpus(tools: list[BaseTool]) -> _Corpus:
+    key = tool_set_fingerprint(tools)
+    with _corpus_cache_lock:
+        if (cached := _corpus_cache.get(key)) is not None:
+            _corpus_cache.move_to_end(key)
+            return cached
+
+    # Built outside the lock: two runs racing on a new tool set both build, and either result is right.
+    texts = [DeferredToolsIndex._index_texts(tool) for tool in tools]
+    tokenized = [_tokenize(indexed_text) for indexed_text, _summary in texts]
+    corpus = _Corpus(
+        names=tuple(tool.name for tool in tools),
+        indexed_texts=tuple(indexed_text for indexed_text, _summary in texts),
+        summaries=tuple(summary for _indexed_text, summary in texts),
+        token_sets=tuple(frozenset(tokens) for tokens in tokenized),
+        bm25=BM25Plus(tokenized) if tokenized else None,
+    )
+    logger.debug("deferred-index: built index over %d tool(s) (%s)", len(tools), key[:12])
+    with _corpus_cache_lock:
+        _corpus_cache[key] = corpus
+        _corpus_cache.move_to_end(key)
+        while len(_corpus_cache) > _CORPUS_CACHE_SIZE:
+            _corpus_cache.popitem(last=False)
+    return corpus
+
+
 class DeferredToolsIndex:
-    """BM25 index over deferred tools — every tool given to it is treated as deferred."""
+    """BM25 index over deferred tools — every tool given to it is treated as deferred.
+
+    The BM25 build is cached per process by :func:`tool_set_fingerprint`, so constructing an index
+    for an already-seen tool set only pairs the cached corpus with this run's tool instances.
+    """
 
     def __init__(self, tools: Iterable[BaseTool]) -> None:
-        self._entries: dict[str, ToolEntry] = {}
+        unique: dict[str, BaseTool] = {}
         for tool in tools:
-            if tool.name in self._entries:
-                continue
-            self._entries[tool.name] = self._build_entry(tool)
+            unique.setdefault(tool.name, tool)
 
-        self._names: list[str] = list(self._entries.keys())
-        self._tokenized: list[list[str]] = [_tokenize(self._entries[n].indexed_text) for n in self._names]
-        self._token_sets: list[frozenset[str]] = [frozenset(t) for t in self._tokenized]
-        self._bm25 = BM25Plus(self._tokenized) if self._names else None
+        corpus = _corpus(list(unique.values()))
+        self._names: list[str] = list(corpus.names)
+        self._token_sets = corpus.token_sets
+        self._bm25 = corpus.bm25
+        self._entries: dict[str, ToolEntry] = {
+            name: ToolEntry(name=name, tool=unique[name], indexed_text=indexed_text, summary=summary)
+            for name, indexed_text, summary in zip(corpus.names, corpus.indexed_texts, corpus.summaries, strict=True)
+        }
 
     def get(self, name: str) -> ToolEntry | None:
         return self._entries.get(name)
@@ -88,7 +162,8 @@ class DeferredToolsIndex:
         return list(self._names)
 
     @staticmethod
-    def _build_entry(tool: BaseTool) -> ToolEntry:
+    def _index_texts(tool: BaseTool) -> tuple[str, str]:
+        """The text ``tool`` is indexed under, and its one-line summary."""
         name_text = re.sub(r"_+", " ", tool.name)
 
         arg_text = ""
@@ -106,5 +181,4 @@ class DeferredToolsIndex:
         description = tool.description or ""
         indexed_text = f"{name_text} {description} {arg_text}"[:_INDEXED_TEXT_CAP]
         summary = (description.splitlines() or [""])[0][:_SUMMARY_CAP]
-
-        return ToolEntry(name=tool.name, tool=tool, indexed_text=indexed_text, summary=summary)
+        return indexed_text, summary
@@ -0,0 +1,157 @@
+"""Fit a diff into the metadata model's token budget before it is sent.
+
+A title, branch name and commit message need the shape of a change, not every line of it, yet large
+refactors and lockfile or generated-file churn can run to megabytes of diff. :func:`condense_diff`
+keeps every file's header, so the model always sees what was touched, and then spends the budget
+on hunks:
+
+- lockfiles, vendored and generated files, and binaries are collapsed to a one-line summary;
+- each file's most-changed hunk is kept before any file's second, so no file is crowded out;
+- the hunks that do not fit are replaced by a note counting the lines they held.
+
+Tokens are estimated at four characters each; the budget only has to bound the request, not price it.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from unidiff import PatchSet
+from unidiff.errors import UnidiffParseError
+
+if TYPE_CHECKING:
+    from unidiff import Hunk, PatchedFile
+
+logger = logging.getLogger("daiv.tools")
+
+DIFF_TOKEN_BUDGET = 24_000
+CHARS_PER_TOKEN = 4
+
+LOCKFILE_PATTERNS = (
+    "*.lock",
+    "*package-lock.json",
+    "*npm-shrinkwrap.json",
+    "*pnpm-lock.yaml",
+    "*go.sum",
+    "*gradle.lockfile",
+)
+VENDORED_PATTERNS = ("vendor/*", "*/vendor/*", "node_modules/*", "*/node_modules/*", "third_party/*", "*/third_party/*")
+GENERATED_PATTERNS = (
+    "*.min.js",
+    "*.min.css",
+    "*.map",
+    "*.snap",
+    "*_pb2.py",
+    "*_pb2_grpc.py",
+    "*.pb.go",
+    "*.generated.*",
+    "dist/*",
+    "*/dist/*",
+)
+
+
+def _tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _kind(patch_file: PatchedFile) -> str | None:
+    """Why ``patch_file``'s content is not worth the model's budget, or ``None`` when it is."""
+    if patch_file.is_binary_file:
+        return "binary file"
+    for kind, patterns in (
+        ("lockfile", LOCKFILE_PATTERNS),
+        ("vendored file", VENDORED_PATTERNS),
+        ("generated file", GENERATED_PATTERNS),
+    ):
+        if any(fnmatch.fnmatch(patch_file.path, pattern) for pattern in patterns):
+            return kind
+    return None
+
+
+def _header(patch_file: PatchedFile) -> str:
+    info = "" if patch_file.patch_info is None else str(patch_file.patch_info)
+    if patch_file.is_binary_file:
+        return info
+    return f"{info}--- {patch_file.source_file}\n+++ {patch_file.target_file}\n"
+
+
+def _changed(hunk: Hunk) -> int:
+    return hunk.added + hunk.removed
+
+
+@dataclass
+class _File:
+    header: str
+    hunks: list[Hunk]
+    summary: str = ""
+    kept: set[int] = field(default_factory=set)
+
+    def render(self) -> str:
+        if self.summary:
+            return self.header + self.summary
+        parts = [self.header]
+        omitted = [hunk for index, hunk in enumerate(self.hunks) if index not in self.kept]
+        parts += (str(hunk) for index, hunk in enumerate(self.hunks) if index in self.kept)
+        if omitted:
+            parts.append(_omitted_note(omitted))
+        return "".join(parts)
+
+
+def _omitted_note(hunks: list[Hunk]) -> str:
+    added, removed = sum(hunk.added for hunk in hunks), sum(hunk.removed for hunk in hunks)
+    return f"[{len(hunks)} hunk(s) omitted to fit the size budget: +{added} -{removed} lines]\n"
+
+
+def condense_diff(diff: str, *, max_tokens: int = DIFF_TOKEN_BUDGET) -> str:
+    """``diff`` condensed to about ``max_tokens``, as described in the module docstring.
+
+    A diff already within budget is returned unchanged. One ``unidiff`` cannot parse (e.g. truncated
+    upstream) is cut to the budget instead, so condensation can never abort a publish.
+    """
+    if _tokens(diff) <= max_tokens:
+        return diff
+    try:
+        patch_set = PatchSet.from_string(diff)
+    except UnidiffParseError:
+        logger.warning("Could not parse diff for condensation (%d chars); truncating it instead.", len(diff))
+        return diff[: max_tokens * CHARS_PER_TOKEN] + "\n[diff truncated to fit the size budget]\n"
+
+    files: list[_File] = []
+    for patch_file in patch_set:
+        entry = _File(header=_header(patch_file), hunks=list(patch_file))
+        if kind := _kind(patch_file):
+            entry.summary = f"[{kind} changed: +{patch_file.added} -{patch_file.removed} lines, content omitted]\n"
+        files.append(entry)
+
+    budget = max_tokens
+    shown: list[_File] = []
+    for entry in files:
+        cost = _tokens(entry.render())
+        if cost > budget:
+            break
+        budget -= cost
+        shown.append(entry)
+
+    # Each file's hunks by how much they change, then round-robin across files: every file's
+    # largest hunk is offered before any file's second-largest.
+    ranked = [
+        (rank, -_changed(hunk), position, index)
+        for position, entry in enumerate(shown)
+        if not entry.summary
+        for rank, (index, hunk) in enumerate(sorted(enumerate(entry.hunks), key=lambda item: -_changed(item[1])))
+    ]
+    for _rank, _size, position, index in sorted(ranked):
+        entry = shown[position]
+        # The omitted-lines note was already paid for with the header, and only shrinks from here.
+        cost = _tokens(str(entry.hunks[index]))
+        if cost <= budget:
+            entry.kept.add(index)
+            budget -= cost
+
+    condensed = "".join(entry.render() for entry in shown)
+    if hidden := files[len(shown) :]:
+        condensed += f"[{len(hidden)} more changed file(s) omitted to fit the size budget]\n"
+    return condensed
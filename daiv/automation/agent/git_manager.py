@@ -4,8 +4,11 @@ import asyncio
 import logging
 import os
 import re
+import shutil
 import subprocess  # noqa: S404
+import tempfile
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
@@ -149,7 +152,7 @@ class GitManager:
         result = response.results[0]
         return _GitResult(exit_code=result.exit_code, output=result.output)
 
-    async def _git_local(self, args: tuple[str, ...]) -> _GitResult:
+    async def _git_local(self, args: tuple[str, ...], *, env: dict[str, str] | None = None) -> _GitResult:
         repo = self.repo
         if repo is None:  # pragma: no cover - guaranteed by __init__
             raise RuntimeError("GitManager is not in local mode")
@@ -170,7 +173,7 @@ class GitManager:
                 capture_output=True,
                 text=True,
                 check=False,
-                env={**os.environ, **overlay},
+                env={**os.environ, **overlay, **(env or {})},
             )
             return _GitResult(exit_code=proc.returncode, output=proc.stdout + proc.stderr)
 
@@ -242,12 +245,17 @@ class GitManager:
     async def get_diff(self, ref: str = "HEAD") -> str:
         """Unified diff of the working tree vs ``ref``, including untracked files.
 
-        Untracked files are folded in via per-file ``diff --no-index`` (a second
-        round-trip, only when any exist). Unlike :meth:`status_snapshot` this never
+        In sandbox mode untracked files are folded in via per-file ``diff --no-index`` (a second
+        round-trip, only when any exist); local mode diffs them in the same pass as tracked changes
+        (see :meth:`_local_diff`). Unlike :meth:`status_snapshot` this never
         touches the remote, so it works on detached/offline clones (eval harnesses).
         ``ref`` must resolve — there is no empty-repo (``--cached``) fallback like the
         pre-sandbox implementation had.
         """
+        if self.repo is not None:
+            untracked_res = await self._git("ls-files", "--others", "--exclude-standard")
+            return await self._local_diff(ref, self._nonempty_lines(untracked_res.output))
+
         specs: list[tuple[str, ...]] = [("diff", ref), ("ls-files", "--others", "--exclude-standard")]
         diff_res, untracked_res = await self._git_batch(specs)
         self._require_ok(specs[0], diff_res)
@@ -323,12 +331,16 @@ class GitManager:
 
         # Batch B: the working-tree diff against the resolved base, plus one diff --no-index per
         # untracked file. The main diff depends on the merge-base from batch A, so batch B always runs.
+        # Local mode has no round-trip to save, only processes: one diff covers the untracked files too.
         untracked = self._nonempty_lines(untracked_res.output)
-        diff_specs: list[tuple[str, ...]] = [("diff", base_ref)]
-        diff_specs += [("diff", "--no-index", "/dev/null", f) for f in untracked]
-        batch_b = await self._git_batch(diff_specs)
-        self._require_ok(diff_specs[0], batch_b[0])
-        diff = self._append_untracked(batch_b[0].output, untracked, batch_b[1:])
+        if self.repo is not None:
+            diff = await self._local_diff(base_ref, untracked)
+        else:
+            diff_specs: list[tuple[str, ...]] = [("diff", base_ref)]
+            diff_specs += [("diff", "--no-index", "/dev/null", f) for f in untracked]
+            batch_b = await self._git_batch(diff_specs)
+            self._require_ok(diff_specs[0], batch_b[0])
+            diff = self._append_untracked(batch_b[0].output, untracked, batch_b[1:])
 
         if log_idx >= 0:
             log_res = res[log_idx]
@@ -352,6 +364,41 @@ class GitManager:
             has_unpushed=has_unpushed,
         )
 
+    async def _local_diff(self, ref: str, untracked: list[str]) -> str:
+        """Local-mode working-tree diff vs ``ref`` with ``untracked`` files shown as additions.
+
+        The untracked paths are marked intent-to-add in a throwaway copy of the index (via
+        ``GIT_INDEX_FILE``), so a single ``git diff`` covers them alongside the tracked changes and the
+        real index is never touched. That is two git processes however many files the run created,
+        where a ``diff --no-index`` subprocess per file made the cost grow with the run's footprint.
+        Paths are handed over as ``ls-files`` printed them — C-quoted where needed, which
+        ``--pathspec-from-file`` unquotes — and matched literally, never as globs.
+        """
+        repo = self.repo
+        if repo is None:  # pragma: no cover - guaranteed by callers
+            raise RuntimeError("GitManager is not in local mode")
+        if not untracked:
+            diff_args: tuple[str, ...] = ("diff", ref)
+            return self._append_untracked(self._require_ok(diff_args, await self._git_local(diff_args)).output, [], [])
+
+        with tempfile.TemporaryDirectory(prefix="daiv-index-") as tmp:
+            index_file = Path(tmp) / "index"
+            pathspec_file = Path(tmp) / "untracked"
+
+            def _prepare() -> None:
+                real_index = Path(repo.git_dir) / "index"
+                if real_index.exists():
+                    shutil.copyfile(real_index, index_file)
+                pathspec_file.write_text("\n".join(untracked) + "\n", encoding="utf-8")
+
+            await asyncio.to_thread(_prepare)
+            env = {"GIT_INDEX_FILE": str(index_file), "GIT_LITERAL_PATHSPECS": "1"}
+            add_args = ("add", "--intent-to-add", f"--pathspec-from-file={pathspec_file}")
+            self._require_ok(add_args, await self._git_local(add_args, env=env))
+            diff_args = ("diff", ref)
+            diff = self._require_ok(diff_args, await self._git_local(diff_args, env=env)).output
+        return self._append_untracked(diff, [], [])
+
     # -- mutations -----------------------------------------------------------
     async def commit_all(self, message: str) -> None:
         """Stage every change and commit it. Callers should ensure the tree is dirty first
@@ -39,7 +39,7 @@ from automation.agent.middlewares.file_system import (
 )
 from automation.agent.middlewares.git import GitMiddleware
 from automation.agent.middlewares.git_platform import GitPlatformMiddleware
-from automation.agent.middlewares.logging import ToolCallLoggingMiddleware
+from automation.agent.middlewares.logging import PhaseTimingMiddleware, ToolCallLoggingMiddleware
 from automation.agent.middlewares.loop_breaker import LoopBreakerMiddleware
 from automation.agent.middlewares.memory import RepositoryMemoryMiddleware
 from automation.agent.middlewares.prompt_cache import AnthropicPromptCachingMiddleware
@@ -49,6 +49,7 @@ from automation.agent.middlewares.slash_commands import SlashCommandMiddleware
 from automation.agent.middlewares.step_budget import StepBudgetMiddleware
 from automation.agent.middlewares.web_fetch import WebFetchMiddleware
 from automation.agent.middlewares.web_search import WebSearchMiddleware
+from automation.agent.phase_timings import Phase, phase
 from automation.agent.profile import register as _register_harness_profile
 from automation.agent.prompts import DAIV_SYSTEM_PROMPT, REPO_RELATIVE_SYSTEM_REMINDER, WRITE_TODOS_SYSTEM_PROMPT
 from automation.agent.subagents import (
@@ -259,7 +260,8 @@ async def create_daiv_agent(
     # parent's MCP toolset — otherwise a `task` delegation that calls an MCP tool fails with
     # "command not found". Explore and the code-review detectors stay deliberately scoped and don't
     # receive it.
-    mcp_tools = await MCPToolkit.get_tools(user_id=ctx.acting_user_id, overrides=ctx.mcp_overrides)
+    with phase(Phase.MCP):
+        mcp_tools = await MCPToolkit.get_tools(user_id=ctx.acting_user_id, overrides=ctx.mcp_overrides)
 
     subagents = [
         create_general_purpose_subagent(
@@ -334,6 +336,7 @@ async def create_daiv_agent(
         StepBudgetMiddleware(),
         AnthropicPromptCachingMiddleware(),
         ToolCallLoggingMiddleware(),
+        PhaseTimingMiddleware(),
         ensure_non_empty_response,
         # Must stay after SandboxMiddleware: after_agent hooks run in REVERSE registration order,
         # so the turn-end publish/patch-capture runs while the sandbox session is still alive
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING, Annotated, Any, NotRequired, cast
 
 import httpx
 import requests
-from asgiref.sync import sync_to_async
 from git import GitCommandError
 from github import GithubException
 from gitlab.exceptions import GitlabError
@@ -17,6 +16,7 @@ from langsmith import get_current_run_tree
 
 from automation.agent.git_manager import SandboxGitProtocolError
 from automation.agent.git_utils import open_git_manager
+from automation.agent.phase_timings import Phase, phase
 from automation.agent.publishers import GitChangePublisher
 from automation.agent.utils import conversation_thread_id
 from codebase.base import MergeRequest, Scope
@@ -278,7 +278,7 @@ class GitMiddleware(AgentMiddleware[GitState, RuntimeCtx]):
             return None
         try:
             client = RepoClient.create_instance(git_platform=context.git_platform)
-            return await sync_to_async(client.get_merge_request_by_branches)(context.repository.slug, current_branch)
+            return await client.aget_merge_request_by_branches(context.repository.slug, current_branch)
         except _MR_LOOKUP_PLATFORM_ERRORS:
             logger.exception(
                 "Failed to look up open merge request for %s on %s", context.repository.slug, current_branch
@@ -404,7 +404,8 @@ class GitMiddleware(AgentMiddleware[GitState, RuntimeCtx]):
                 async with open_git_manager(
                     sandbox_backend=self._sandbox_backend, gitrepo=runtime.context.gitrepo
                 ) as git_manager:
-                    update["model_patch"] = await git_manager.get_diff()
+                    with phase(Phase.SNAPSHOT):
+                        update["model_patch"] = await git_manager.get_diff()
             except GitCommandError, httpx.HTTPError, SandboxGitProtocolError:
                 # Narrow on purpose: sandbox wire anomalies degrade, but wiring bugs (bare
                 # RuntimeError from mode-mismatch guards, asyncio misuse) always propagate.
@@ -422,7 +423,8 @@ class GitMiddleware(AgentMiddleware[GitState, RuntimeCtx]):
         publisher = GitChangePublisher(
             runtime.context, sandbox_backend=self._sandbox_backend, thread_id=conversation_thread_id()
         )
-        outcome = await publisher.publish(merge_request=self._state_merge_request(state), skip_ci=self.skip_ci)
+        with phase(Phase.PUBLISH):
+            outcome = await publisher.publish(merge_request=self._state_merge_request(state), skip_ci=self.skip_ci)
 
         if outcome.diff_stats is not None:
             update["diff_stats"] = outcome.diff_stats.model_dump()
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Annotated, Literal, NotRequired
 from django.core.cache import cache
 from django.utils import timezone
 
+import gitlab as python_gitlab
 from deepagents.backends.composite import CompositeBackend
 from deepagents.backends.utils import sanitize_tool_call_id
 from langchain.agents import AgentState
@@ -20,6 +21,7 @@ from langchain_core.messages import ToolMessage
 from langchain_core.prompts import SystemMessagePromptTemplate
 from langgraph.types import Command
 
+from automation.agent.middlewares.gitlab_cli import GitLabCLIError, GitLabCLISession
 from codebase.base import GitPlatform
 from codebase.clients import RepoClient
 from codebase.clients.github.utils import get_github_integration
@@ -457,6 +459,26 @@ GITLAB_CLI_ALLOW_COMMANDS: dict[str, set[str] | Literal["*"]] = {
     "project-snippet-award-emoji": {"list", "get", "create", "delete"},
 }
 
+# Allowed GitLab actions that only read; repeats of these within a run may be served from its cache.
+GITLAB_CLI_READ_ACTIONS = frozenset({
+    "list",
+    "get",
+    "diff",
+    "refs",
+    "merge-requests",
+    "languages",
+    "participants",
+    "related-merge-requests",
+    "related-issues",
+    "closes-issues",
+    "closed-by",
+    "commits",
+    "changes",
+    "time-stats",
+    "content",
+    "trace",
+})
+
 GITHUB_CLI_ALLOW_COMMANDS: dict[str, set[str] | Literal["*"]] = {
     # Typical issue workflow
     "issue": {"status", "list", "view", "create", "edit", "comment", "close", "reopen", "lock", "unlock", "develop"},
@@ -584,6 +606,17 @@ async def _create_gitlab_inline_discussion(args: list[str], runtime: ToolRuntime
         return f"error: Failed to create inline discussion. Details: {e}"
 
 
+def _gitlab_cli_client() -> python_gitlab.Gitlab:
+    """The API client behind a run's ``gitlab`` tool, configured as the CLI used to be through its env."""
+    return python_gitlab.Gitlab(
+        url=settings.GITLAB_URL.encoded_string(),
+        private_token=settings.GITLAB_AUTH_TOKEN.get_secret_value(),
+        timeout=GITLAB_REQUESTS_TIMEOUT,
+        per_page=int(GITLAB_PER_PAGE),
+        user_agent=USER_AGENT,
+    )
+
+
 async def _run_gitlab_subcommand(
     subcommand: str,
     runtime: ToolRuntime[RuntimeCtx],
@@ -592,11 +625,13 @@ async def _run_gitlab_subcommand(
     *,
     backend: BackendProtocol,
     large_tool_results_prefix: str,
+    session: GitLabCLISession | None = None,
 ) -> str:
     """
     Run a `python-gitlab` CLI subcommand on behalf of the ``gitlab`` tool.
 
-    Runs a subprocess without shell expansion and keeps the returned output minimal. When
+    Runs the CLI in-process on ``session`` (a run's shared API client and read cache; a fresh one
+    when omitted), without shell expansion, and keeps the returned output minimal. When
     ``to_file`` is set the full result is written to the large-tool-results dir via ``backend``
     and a compact confirmation is returned; otherwise the output is returned inline and the
     deepagents FilesystemMiddleware evicts it to that same dir if it exceeds the middleware's
@@ -635,17 +670,7 @@ async def _run_gitlab_subcommand(
         if any(arg == "--position" or arg.startswith("--position=") for arg in rest_args):
             return await _create_gitlab_inline_discussion(rest_args, runtime)
 
-    envs = {
-        "PATH": os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin"),
-        "HOME": os.environ.get("HOME", "/tmp"),  # noqa: S108
-        "GITLAB_TIMEOUT": str(GITLAB_REQUESTS_TIMEOUT),
-        "GITLAB_PRIVATE_TOKEN": settings.GITLAB_AUTH_TOKEN.get_secret_value(),
-        "GITLAB_URL": settings.GITLAB_URL.encoded_string(),
-        "GITLAB_PER_PAGE": GITLAB_PER_PAGE,
-        "GITLAB_USER_AGENT": USER_AGENT,
-    }
-
-    args = ["gitlab"]
+    args: list[str] = []
 
     is_job_trace = resource == "project-job" and action == "trace"
     if to_file and not is_job_trace:
@@ -659,30 +684,25 @@ async def _run_gitlab_subcommand(
     args += splitted_subcommand
     args += ["--project-id" if resource != "project" else "--id", runtime.context.repository.slug]
 
+    session = session or GitLabCLISession(_gitlab_cli_client)
     try:
-        process = await asyncio.create_subprocess_exec(
-            *args, env=envs, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        output = await asyncio.wait_for(
+            asyncio.to_thread(
+                session.run, args, cacheable=action in GITLAB_CLI_READ_ACTIONS, timeout=DEFAULT_CLI_TIMEOUT
+            ),
+            timeout=DEFAULT_CLI_TIMEOUT,
         )
-
-        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=DEFAULT_CLI_TIMEOUT)
     except TimeoutError:
-        try:
-            process.kill()
-            await process.wait()
-        except Exception as e:
-            logger.warning("[%s] Failed to kill GitLab process: %s", GITLAB_TOOL_NAME, e)
         return "error: GitLab command timed out after 30 seconds. The operation may be too complex or the API is slow."
+    except GitLabCLIError as e:
+        return f"error: GitLab command failed. Details: {e}"
     except Exception as e:
         logger.exception("[%s] Failed to execute GitLab command.", GITLAB_TOOL_NAME)
         return f"error: Failed to execute GitLab command. Details: {str(e)}"
 
-    if process.returncode != 0:
-        stderr_text = stderr.decode("utf-8").strip()
-        return f"error: GitLab command failed (exit code {process.returncode}). Details: {stderr_text}"
-
-    output = stdout.decode("utf-8").strip()
+    output = output.strip()
     if not output:
-        # This branch is reached only after returncode == 0 (failures return an `error: ...`
+        # This branch is reached only after a successful call (failures return an `error: ...`
         # string above), so "no file was written" provably means a genuinely empty result, not a
         # failed command. The substrings `empty result` and `no file was written` are asserted in
         # tests/unit_tests/automation/agent/middlewares/test_git_platform.py; the rest is free prose.
@@ -909,6 +929,7 @@ class GitPlatformMiddleware(AgentMiddleware):
 
         self._backend = backend
         self._large_tool_results_prefix = _large_tool_results_prefix(backend)
+        self._gitlab_session = GitLabCLISession(_gitlab_cli_client)
 
         self.tools = []
 
@@ -921,6 +942,7 @@ class GitPlatformMiddleware(AgentMiddleware):
         """Build the ``gitlab`` tool as a closure over the bound backend + results prefix."""
         backend = self._backend
         large_tool_results_prefix = self._large_tool_results_prefix
+        session = self._gitlab_session
 
         @tool(GITLAB_TOOL_NAME, description=GITLAB_TOOL_DESCRIPTION)
         async def gitlab(
@@ -956,6 +978,7 @@ class GitPlatformMiddleware(AgentMiddleware):
                 output_to_file,
                 backend=backend,
                 large_tool_results_prefix=large_tool_results_prefix,
+                session=session,
             )
 
         return gitlab
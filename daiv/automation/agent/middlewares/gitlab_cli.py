@@ -0,0 +1,233 @@
+"""In-process execution of ``python-gitlab`` CLI subcommands for the ``gitlab`` tool.
+
+Spawning the ``gitlab`` console script costs an interpreter start-up, the python-gitlab import and
+a fresh TLS handshake per call — seconds per call on review runs that call the tool dozens of
+times. :class:`GitLabCLISession` parses the same argv with the CLI's own parser and runs it through
+the CLI's own ``GitlabCLI`` and printers, on one authenticated ``gitlab.Gitlab`` (and so one pooled
+HTTP session) per agent run.
+
+Three habits of the CLI, harmless in a one-shot process, are contained here:
+
+- ``GitlabCLI`` formats parent ids (the project) into the manager *class*'s ``_path``, so each
+  call works on a throwaway manager subclass instead;
+- the printers write with bare ``print``, so a call's result is fetched in full first and only
+  the printing runs with ``sys.stdout`` redirected, one printer per process at a time;
+- argparse and ``cli.die`` print and ``sys.exit``, so both are turned into :class:`GitLabCLIError`
+  carrying what they would have printed.
+
+A call given a timeout also stops at the first API response past its deadline, rather than
+paginating on behind a caller that has already given up on it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import io
+import threading
+import time
+from contextlib import redirect_stdout
+from typing import TYPE_CHECKING, Any
+
+import gitlab
+from gitlab import cli as gitlab_cli
+from gitlab.v4 import cli as v4_cli
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Reads repeated within this window are answered from the run's cache. Short, so that polling a
+# pipeline or a job still sees it move.
+READ_CACHE_TTL_S = 30
+
+# What ``gitlab.cli.main`` strips from the parsed arguments before handing them to the action.
+_CLI_BEHAVIOUR_ARGS = (
+    "api_version",
+    "config_file",
+    "debug",
+    "fields",
+    "gitlab",
+    "gitlab_resource",
+    "job_token",
+    "mask_credentials",
+    "oauth_token",
+    "output",
+    "pagination",
+    "private_token",
+    "resource_action",
+    "server_url",
+    "skip_login",
+    "ssl_verify",
+    "timeout",
+    "user_agent",
+    "verbose",
+    "version",
+)
+
+
+class GitLabCLIError(Exception):
+    """Where the CLI would have exited non-zero; the message is what it would have printed."""
+
+
+class _HelpRequested(Exception):  # noqa: N818 - control flow, not an error
+    pass
+
+
+# ``redirect_stdout`` swaps the process-wide stream, so printers take turns. Only the printing
+# (local work on a result already fetched) is held under it, never an API request.
+_output_lock = threading.Lock()
+_deadline = threading.local()
+
+
+def _check_deadline(response: Any, *args: Any, **kwargs: Any) -> None:
+    """``requests`` response hook: stop a call whose caller has stopped waiting for it."""
+    deadline = getattr(_deadline, "at", None)
+    if deadline is not None and time.monotonic() > deadline:
+        raise GitLabCLIError("GitLab command exceeded its deadline")
+
+
+def _raise_usage_error(parser: argparse.ArgumentParser, message: str) -> None:
+    raise GitLabCLIError(f"{parser.format_usage().strip()}\n{parser.prog}: error: {message}")
+
+
+def _raise_help(parser: argparse.ArgumentParser, file: Any = None) -> None:
+    raise _HelpRequested(parser.format_help())
+
+
+def _contain(parser: argparse.ArgumentParser, prog: str) -> None:
+    """Make ``parser`` and its subparsers raise instead of printing and exiting, and name them
+    after the ``gitlab`` command rather than this process's ``argv[0]``."""
+    parser.prog = parser.prog.replace(prog, "gitlab", 1)
+    parser.error = functools.partial(_raise_usage_error, parser)  # type: ignore[method-assign]
+    parser.print_help = functools.partial(_raise_help, parser)  # type: ignore[method-assign]
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            for subparser in action.choices.values():
+                _contain(subparser, prog)
+
+
+@functools.cache
+def _parser() -> argparse.ArgumentParser:
+    """The full CLI parser. Building it walks every resource class, so it is built once per process."""
+    parser = gitlab_cli._get_parser()
+    _contain(parser, parser.prog)
+    return parser
+
+
+class _GitlabCLI(v4_cli.GitlabCLI):
+    """``GitlabCLI`` whose manager class is a per-call subclass, so the formatted ``_path`` stays local."""
+
+    def _process_from_parent_attrs(self) -> None:
+        # ``__init__`` formats the parent ids into ``self.mgr_cls._path`` right after this hook.
+        self.mgr_cls = type(self.mgr_cls.__name__, (self.mgr_cls,), {})
+        super()._process_from_parent_attrs()
+
+
+def _exit_message(exc: SystemExit) -> str:
+    """What the CLI printed to stderr before exiting with ``exc``.
+
+    ``cli.die`` formats "<what failed> (<the error>)" into its ``msg`` before writing it, so the
+    message is read back from its frame rather than by redirecting the process's stderr.
+    """
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    if tb is not None and tb.tb_frame.f_code is gitlab_cli.die.__code__:
+        return str(tb.tb_frame.f_locals["msg"])
+    if (error := exc.__context__) is not None:
+        return f"{type(error).__name__}: {error}"
+    return str(exc.code)
+
+
+def _render(data: Any, *, output: str, verbose: bool, fields: list[str]) -> str:
+    """What ``v4_cli.run`` would have written to stdout for ``data``."""
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    if isinstance(data, str):
+        return data + "\n"
+    if not isinstance(data, dict | list | gitlab.base.RESTObjectList | gitlab.base.RESTObject):
+        return data.decode() + "\n" if hasattr(data, "decode") else ""
+
+    # Fetch every page and flatten the object before taking the lock: printing is all it covers.
+    printer = v4_cli.PRINTERS[output]()
+    if isinstance(data, list | gitlab.base.RESTObjectList):
+        show = functools.partial(printer.display_list, list(data), fields, verbose=verbose)
+    elif isinstance(data, dict):
+        show = functools.partial(printer.display, data, verbose=True, obj=data)
+    else:
+        show = functools.partial(printer.display, v4_cli.get_dict(data, fields), verbose=verbose, obj=data)
+
+    buffer = io.StringIO()
+    with _output_lock, redirect_stdout(buffer):
+        show()
+    return buffer.getvalue()
+
+
+class GitLabCLISession:
+    """One run's GitLab CLI: a lazily built API client, reused by every call, and a cache of reads.
+
+    Any call not marked ``cacheable`` clears the cache, so a run never reads a resource back
+    from before its own change to it.
+    """
+
+    def __init__(self, client_factory: Callable[[], gitlab.Gitlab]) -> None:
+        self._client_factory = client_factory
+        self._client: gitlab.Gitlab | None = None
+        self._lock = threading.Lock()
+        self._reads: dict[tuple[str, ...], tuple[float, str]] = {}
+
+    def _get_client(self) -> gitlab.Gitlab:
+        with self._lock:
+            if self._client is None:
+                self._client = self._client_factory()
+                self._client.session.hooks["response"].append(_check_deadline)
+            return self._client
+
+    def run(self, argv: list[str], *, cacheable: bool, timeout: float | None = None) -> str:
+        """Run ``argv`` (the ``gitlab`` command's arguments) and return what the CLI would print.
+
+        With ``timeout``, a call that is already late never reaches the API, and one still talking
+        to the API that many seconds from now fails at its next response instead of carrying on.
+
+        Raises:
+            GitLabCLIError: where the CLI would have exited non-zero, with its error message.
+        """
+        key = tuple(argv)
+        with self._lock:
+            if not cacheable:
+                self._reads.clear()
+            elif (cached := self._reads.get(key)) and time.monotonic() - cached[0] < READ_CACHE_TTL_S:
+                return cached[1]
+
+        _deadline.at = time.monotonic() + timeout if timeout is not None else None
+        try:
+            output = self._execute(argv)
+        finally:
+            _deadline.at = None
+        if cacheable:
+            with self._lock:
+                self._reads[key] = (time.monotonic(), output)
+        return output
+
+    def _execute(self, argv: list[str]) -> str:
+        try:
+            args = _parser().parse_args(argv)
+        except _HelpRequested as help_requested:
+            return str(help_requested)
+
+        output, verbose = args.output, args.verbose
+        fields = [field.strip() for field in args.fields.split(",")] if args.fields else []
+        gitlab_resource, resource_action = args.gitlab_resource, args.resource_action
+        params = vars(args)
+        for name in _CLI_BEHAVIOUR_ARGS:
+            params.pop(name, None)
+
+        _check_deadline(None)
+        try:
+            params = {key: gitlab_cli._parse_value(value) for key, value in params.items() if value is not None}
+            data = _GitlabCLI(self._get_client(), gitlab_resource, resource_action, params).run()
+            return _render(data, output=output, verbose=verbose, fields=fields)
+        except SystemExit as exc:
+            raise GitLabCLIError(_exit_message(exc)) from exc
+        except gitlab.GitlabError as exc:
+            raise GitLabCLIError(str(exc)) from exc
@@ -5,9 +5,12 @@ from typing import TYPE_CHECKING, Any
 
 from langchain.agents.middleware import AgentMiddleware
 
+from automation.agent.phase_timings import Phase, phase
+
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
+    from langchain.agents.middleware import ModelRequest, ModelResponse
     from langchain_core.messages import ToolMessage
     from langgraph.prebuilt.tool_node import ToolCallRequest
     from langgraph.types import Command
@@ -130,3 +133,24 @@ class ToolCallLoggingMiddleware(AgentMiddleware):
             tool_call_id = request.tool_call.get("id")
             return str(tool_call_id) if tool_call_id is not None else None
         return None
+
+
+class PhaseTimingMiddleware(AgentMiddleware):
+    """
+    Middleware to time the main agent's model turns and tool calls into the run's phase timings.
+
+    Only registered on the main agent: a subagent's turns already count towards the ``task``
+    tool call that ran it.
+    """
+
+    async def awrap_model_call(
+        self, request: ModelRequest, handler: Callable[[ModelRequest], Awaitable[ModelResponse]]
+    ) -> ModelResponse:
+        with phase(Phase.MODEL):
+            return await handler(request)
+
+    async def awrap_tool_call(
+        self, request: ToolCallRequest, handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]]
+    ) -> ToolMessage | Command:
+        with phase(Phase.TOOLS):
+            return await handler(request)
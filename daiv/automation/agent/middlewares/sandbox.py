@@ -19,6 +19,7 @@ from langgraph.typing import StateT  # noqa: TC002
 from automation.agent.conf import settings as agent_settings
 from automation.agent.constants import BUILTIN_SKILLS_PATH
 from automation.agent.middlewares.file_system import SandboxFileBackend  # noqa: TC001
+from automation.agent.phase_timings import Phase, phase
 from automation.agent.utils import conversation_thread_id
 from codebase.context import RuntimeCtx  # noqa: TC001
 from core.conf import settings
@@ -568,15 +569,16 @@ class SandboxMiddleware(AgentMiddleware):
 
         sb = runtime.context.sandbox
         try:
-            session_id = await client.start_session(
-                StartSessionRequest(
-                    base_image=sb.base_image,
-                    egress=sb.egress,
-                    memory_bytes=sb.memory_bytes,
-                    cpus=sb.cpus,
-                    environment=sb.env_vars or None,
+            with phase(Phase.SANDBOX_START):
+                session_id = await client.start_session(
+                    StartSessionRequest(
+                        base_image=sb.base_image,
+                        egress=sb.egress,
+                        memory_bytes=sb.memory_bytes,
+                        cpus=sb.cpus,
+                        environment=sb.env_vars or None,
+                    )
                 )
-            )
         except httpx.HTTPStatusError as exc:
             # A network-enabled env on a sandbox with no egress proxy (no shared CA) is rejected up
             # front with HTTP 400 (see _EGRESS_PROXY_UNAVAILABLE_MARKER). Match that specific signal so
@@ -595,10 +597,12 @@ class SandboxMiddleware(AgentMiddleware):
             raise
         try:
             working_dir = Path(runtime.context.gitrepo.working_dir)
-            repo_archive, skills_archive = await asyncio.gather(
-                asyncio.to_thread(_make_repo_archive, str(working_dir)), asyncio.to_thread(_make_global_skills_archive)
-            )
-            await client.seed_session(session_id, repo_archive=repo_archive, skills_archive=skills_archive)
+            with phase(Phase.SANDBOX_SEED):
+                repo_archive, skills_archive = await asyncio.gather(
+                    asyncio.to_thread(_make_repo_archive, str(working_dir)),
+                    asyncio.to_thread(_make_global_skills_archive),
+                )
+                await client.seed_session(session_id, repo_archive=repo_archive, skills_archive=skills_archive)
         except Exception:
             # Build/seed failure on an already-created session (the egress-unavailable case fails earlier).
             logger.exception("Failed to build or seed sandbox session %s", session_id)
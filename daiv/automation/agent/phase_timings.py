@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+logger = logging.getLogger("daiv.agent")
+
+
+class Phase(StrEnum):
+    """The phases of a run whose wall time is recorded.
+
+    Phases can nest, so they do not add up to the run's duration: ``tools`` includes the
+    subagents a ``task`` call ran, and ``publish`` includes its own ``snapshot``.
+    """
+
+    CLONE = "clone"
+    SANDBOX_START = "sandbox_start"
+    SANDBOX_SEED = "sandbox_seed"
+    MCP = "mcp"
+    BUILD = "build"
+    MODEL = "model"
+    TOOLS = "tools"
+    SNAPSHOT = "snapshot"
+    PUBLISH = "publish"
+
+
+@dataclass
+class PhaseRecorder:
+    """Seconds spent and number of entries per phase for one run."""
+
+    seconds: defaultdict[str, float] = field(default_factory=lambda: defaultdict(float))
+    counts: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    def add(self, name: str, elapsed: float) -> None:
+        self.seconds[name] += elapsed
+        self.counts[name] += 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """The compact breakdown stored on ``Run.phase_timings``: ``{phase: {"seconds", "count"}}``."""
+        return {
+            name: {"seconds": round(self.seconds[name], 3), "count": self.counts[name]} for name in sorted(self.seconds)
+        }
+
+
+_phase_recorder_var: ContextVar[PhaseRecorder | None] = ContextVar("daiv_phase_recorder", default=None)
+
+
+@asynccontextmanager
+async def track_phases() -> AsyncIterator[PhaseRecorder]:
+    """Record the phases entered in the enclosed block, subagents and worker threads included.
+
+    The recorder is reached through a ``ContextVar``, so the instrumented code needs nothing
+    threaded through it: tasks and ``asyncio.to_thread`` calls copy the context and share the
+    one recorder. The breakdown is logged on exit, so a failed run's timings are not lost.
+    """
+    recorder = PhaseRecorder()
+    token = _phase_recorder_var.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _phase_recorder_var.reset(token)
+        if recorder.seconds:
+            logger.info("Run phase timings: %s", recorder.summary())
+
+
+@contextmanager
+def phase(name: Phase) -> Iterator[None]:
+    """Time the enclosed block into ``name``. A no-op outside :func:`track_phases`."""
+    if (recorder := _phase_recorder_var.get()) is None:
+        yield
+        return
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        recorder.add(name, time.monotonic() - started)
@@ -1,17 +1,36 @@
 """Shared row→SDK-client kwargs primitive. Consumers layer their own shape on top
-(LangChain ``init_chat_model`` kwargs vs. raw SDK client constructor kwargs)."""
+(LangChain ``init_chat_model`` kwargs vs. raw SDK client constructor kwargs).
+
+Also owns the process-wide pool of httpx clients handed to chat models, so every model
+talking to one endpoint reuses the same warm keep-alive connections. The async pool is split per
+event loop underneath, since an ``httpx.AsyncClient``'s connections belong to the loop that
+opened them."""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypedDict
+import asyncio
+import atexit
+import contextlib
+import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, TypedDict
+
+import httpx
 
 from automation.agent.model_catalog.exceptions import MissingApiKeyError
 
 if TYPE_CHECKING:
-    import httpx
-
     from core.models import Provider
 
+logger = logging.getLogger("daiv.automation")
+
+# Sized like the OpenAI SDK's own default pool; idle connections outlive the gap between
+# the LLM calls of one agent turn, so tool round-trips don't pay a new TLS handshake.
+POOL_MAX_CONNECTIONS = 1_000
+POOL_MAX_KEEPALIVE_CONNECTIONS = 100
+POOL_KEEPALIVE_EXPIRY = 60.0
+
 
 class SdkClientKwargs(TypedDict):
     api_key: str
@@ -35,8 +54,6 @@ def build_sdk_client_kwargs(row: Provider.Cached, *, with_http_client: bool = Tr
 
     http_client = None
     if with_http_client and not row.verify_ssl:
-        import httpx
-
         http_client = httpx.AsyncClient(verify=False)  # noqa: S501  # admin-opted-in via Provider.verify_ssl
 
     return SdkClientKwargs(
@@ -45,3 +62,109 @@ def build_sdk_client_kwargs(row: Provider.Cached, *, with_http_client: bool = Tr
         default_headers=dict(row.extra_headers or {}),
         http_client=http_client,
     )
+
+
+class LoopBoundAsyncClient(httpx.AsyncClient):
+    """An ``httpx.AsyncClient`` that sends each request through a client owned by the running loop.
+
+    Chat models are cached for the process and keep the client they were built with, while the
+    ASGI server and the task workers each run their own event loops. This client builds requests
+    itself (default headers, timeouts) and hands them to the running loop's client, opened on
+    first use and dropped with its loop, as ``codebase.clients.aio`` does for the platform APIs.
+    """
+
+    def __init__(self, **client_kwargs: Any):
+        super().__init__(**client_kwargs)
+        self._client_kwargs = client_kwargs
+        self._loop_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loop_clients_lock = threading.Lock()
+
+    def loop_client(self) -> httpx.AsyncClient:
+        """The client that sends this client's requests on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._loop_clients_lock:
+            client = self._loop_clients.get(loop)
+            if client is None or client.is_closed:
+                client = self._loop_clients[loop] = httpx.AsyncClient(**self._client_kwargs)
+            return client
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        return await self.loop_client().send(request, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close the running loop's client. Clients of other loops cannot be closed from this one,
+        so they are dropped and their connections released by GC."""
+        with self._loop_clients_lock:
+            client = self._loop_clients.pop(asyncio.get_running_loop(), None)
+            self._loop_clients.clear()
+        if client is not None:
+            await client.aclose()
+        await super().aclose()
+
+
+_pooled_clients: dict[tuple[str, bool], tuple[httpx.Client, LoopBoundAsyncClient]] = {}
+_pool_lock = threading.Lock()
+_PENDING_ACLOSE_TASKS: set[asyncio.Task] = set()
+
+
+def pooled_http_clients(row: Provider.Cached) -> tuple[httpx.Client, LoopBoundAsyncClient]:
+    """Return the sync and async httpx clients shared by every model talking to ``row``'s endpoint.
+
+    Keyed by base URL and TLS verification only: the SDKs send the API key and headers per
+    request, so providers fronting the same endpoint can share one pool. The clients live for the
+    process — callers must never close them; :func:`close_pooled_http_clients` does at shutdown.
+    The sync client is one pool for the process; the async one opens a pool per event loop.
+    """
+    key = (row.base_url or str(row.provider_type), row.verify_ssl)
+    with _pool_lock:
+        if (clients := _pooled_clients.get(key)) is not None:
+            return clients
+        limits = httpx.Limits(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+        )
+        # verify=False only when the admin opted in via Provider.verify_ssl.
+        clients = (
+            httpx.Client(verify=row.verify_ssl, limits=limits),
+            LoopBoundAsyncClient(verify=row.verify_ssl, limits=limits),
+        )
+        _pooled_clients[key] = clients
+        return clients
+
+
+def close_pooled_http_clients() -> None:
+    """Close and forget every pooled client. Registered with :mod:`atexit`; safe to call twice."""
+    with _pool_lock:
+        clients = list(_pooled_clients.values())
+        _pooled_clients.clear()
+
+    for sync_client, async_client in clients:
+        # The sync transport can raise on already-closed pools / interpreter shutdown.
+        with contextlib.suppress(Exception):
+            sync_client.close()
+        _aclose(async_client)
+
+
+def _aclose(client: httpx.AsyncClient) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No running loop (shutdown, sync callers): drive aclose() to completion on a fresh one.
+        # A pool bound to a loop that is already gone can refuse; GC releases it then.
+        try:
+            asyncio.run(client.aclose())
+        except Exception:
+            logger.warning("Could not close pooled httpx.AsyncClient; its connections will be released by GC.")
+        return
+
+    # Retain a reference until done so Python's GC doesn't drop the task before
+    # aclose() completes (RUF006 / fire-and-forget asyncio task pitfall).
+    task = loop.create_task(client.aclose())
+    _PENDING_ACLOSE_TASKS.add(task)
+    task.add_done_callback(_PENDING_ACLOSE_TASKS.discard)
+
+
+atexit.register(close_pooled_http_clients)
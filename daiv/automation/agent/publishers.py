@@ -1,19 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
 import re
 from abc import abstractmethod
 from dataclasses import dataclass
 from textwrap import dedent
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
 from urllib.parse import quote, urlencode
 
+from django.core.cache import cache
 from django.template.loader import render_to_string
 from django.urls import reverse
 
 from asgiref.sync import sync_to_async
 
 from automation.agent.git_utils import open_git_manager
+from automation.agent.phase_timings import Phase, phase
 from automation.agent.utils import build_langsmith_config
 from codebase.base import GitPlatform, MergeRequest, MergeRequestDiffStats, Scope
 from codebase.clients import RepoClient
@@ -23,9 +28,13 @@ from core.constants import BOT_AUTO_LABEL, BOT_LABEL, BOT_NAME
 from core.site_settings import site_settings
 from core.utils import build_absolute_url
 
+from .diff_to_metadata.condense import condense_diff
 from .diff_to_metadata.graph import create_diff_to_metadata_graph
+from .diff_to_metadata.schemas import CommitMetadata, PullRequestMetadata
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from automation.agent.middlewares.file_system import SandboxFileBackend
     from codebase.clients.base import GitAuthEnv
     from codebase.context import RuntimeCtx
@@ -33,6 +42,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("daiv.tools")
 
+T = TypeVar("T")
+
 # Git trailer token carrying the producing session's URL. A wire format read by `git log`
 # and `git interpret-trailers`, so it stays a literal rather than deriving from BOT_NAME.
 SESSION_TRAILER = "DAIV-Session"
@@ -40,6 +51,11 @@ SESSION_TRAILER = "DAIV-Session"
 # A trailer line ("Token: value") or its folded continuation (leading whitespace).
 _TRAILER_LINE_RE = re.compile(r"[A-Za-z0-9-]+:\s|\s+\S")
 
+# Metadata generated for a diff is reused when the same diff is published again within this window.
+METADATA_CACHE_TTL_S = 60 * 60
+
+_METADATA_SCHEMAS = {"pr_metadata": PullRequestMetadata, "commit_message": CommitMetadata}
+
 
 def append_trailer(commit_message: str, trailer: str) -> str:
     """Append ``trailer`` to ``commit_message``, joining a trailer block it already ends with.
@@ -80,6 +96,31 @@ class PublishOutcome:
     prepared answers zero."""
 
 
+class _PublishSteps:
+    """The independent steps of a publish, started as concurrent tasks.
+
+    Leaving the ``async with`` cancels any step still running, such as a lookup that an early return
+    or a failure made moot. Timing is left to the run's phase recorder (``Phase.PUBLISH`` and
+    ``Phase.SNAPSHOT``).
+    """
+
+    def __init__(self) -> None:
+        self._tasks: list[asyncio.Task] = []
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def start(self, awaitable: Awaitable[T]) -> asyncio.Task[T]:
+        task = asyncio.ensure_future(awaitable)
+        self._tasks.append(task)
+        return task
+
+
 class ChangePublisher:
     """
     Publisher for changes made by the agent.
@@ -115,7 +156,16 @@ class GitChangePublisher(ChangePublisher):
         ``GitMiddleware._is_unpublished`` gate): a clean tree whose work is already on its MR — or no
         changes at all — short-circuits without an LLM metadata call or a no-op push. Otherwise
         commits any uncommitted work (LLM-generated message), pushes, and opens/updates the MR.
+
+        Platform lookups run alongside the metadata call wherever it does not need their answer;
+        commit, push and MR creation keep their order.
         """
+        async with _PublishSteps() as steps:
+            return await self._publish(steps, merge_request=merge_request, skip_ci=skip_ci, as_draft=as_draft)
+
+    async def _publish(
+        self, steps: _PublishSteps, *, merge_request: MergeRequest | None, skip_ci: bool, as_draft: bool
+    ) -> PublishOutcome:
         protected_branch_fallback_source: str | None = None
         default_branch = cast("str", self.ctx.config.default_branch)
         # The diff base is the MR's real target — for a branch stacked off a release branch that is
@@ -142,10 +192,11 @@ class GitChangePublisher(ChangePublisher):
         async with open_git_manager(
             sandbox_backend=self.sandbox_backend, gitrepo=self.ctx.gitrepo, auth_env=auth_env
         ) as git_manager:
-            snapshot = await git_manager.status_snapshot(
-                base_branch=base_branch,
-                mr_source_branch=merge_request.source_branch if merge_request is not None else None,
-            )
+            with phase(Phase.SNAPSHOT):
+                snapshot = await git_manager.status_snapshot(
+                    base_branch=base_branch,
+                    mr_source_branch=merge_request.source_branch if merge_request is not None else None,
+                )
 
             # Above the empty-diff return, not below it: see ``PublishOutcome.diff_stats``.
             diff_stats = diff_line_stats(snapshot.diff)
@@ -158,10 +209,37 @@ class GitChangePublisher(ChangePublisher):
                 logger.info("Changes already on MR !%s; nothing new.", merge_request.merge_request_id)
                 return PublishOutcome(merge_request=merge_request, published=False, diff_stats=diff_stats)
 
+            # The platform lookups touch no database, so they run off the shared sync thread and
+            # overlap each other as well as the metadata call.
+            protection = None
+            if merge_request is not None:
+                protection = steps.start(
+                    sync_to_async(self.client.is_branch_protected, thread_sensitive=False)(
+                        self.ctx.repository.slug, merge_request.source_branch
+                    )
+                )
+            # An ephemeral-token push (GitLab's project-scoped bot) yields a pipeline that can't read
+            # private cross-project CI includes; skip that push's CI and re-trigger as the service
+            # account below. The client capability answers False for platforms without ephemeral
+            # tokens, so no platform check is needed here; an explicit skip_ci ("no CI at all") also
+            # leaves nothing to heal. First needed at the push.
+            ephemeral_token = None
+            if not skip_ci:
+                ephemeral_token = steps.start(
+                    sync_to_async(self.client.push_uses_ephemeral_token, thread_sensitive=False)(self.ctx.repository)
+                )
+
+            # The protection check only decides whether PR metadata is needed. When it is needed
+            # either way (a new MR, or a draft being readied — a protected branch only means a new MR),
+            # the metadata call does not wait for it.
+            metadata = None
+            if merge_request is None or (merge_request.draft and as_draft is False):
+                metadata = steps.start(
+                    self._diff_to_metadata(pr_metadata_diff=snapshot.diff, commit_message_diff=snapshot.diff)
+                )
+
             fallback_from_mr: MergeRequest | None = None
-            if merge_request is not None and await sync_to_async(self.client.is_branch_protected)(
-                self.ctx.repository.slug, merge_request.source_branch
-            ):
+            if protection is not None and await protection:
                 logger.warning(
                     "Source branch '%s' of MR !%s is protected; opening a new MR with a fresh branch instead.",
                     merge_request.source_branch,
@@ -171,12 +249,14 @@ class GitChangePublisher(ChangePublisher):
                 protected_branch_fallback_source = merge_request.source_branch
                 merge_request = None
 
-            pr_metadata_diff = (
-                snapshot.diff if merge_request is None or (merge_request.draft and as_draft is False) else None
-            )
-            changes_metadata = await self._diff_to_metadata(
-                pr_metadata_diff=pr_metadata_diff, commit_message_diff=snapshot.diff
-            )
+            if metadata is None:
+                metadata = steps.start(
+                    self._diff_to_metadata(
+                        pr_metadata_diff=snapshot.diff if merge_request is None else None,
+                        commit_message_diff=snapshot.diff,
+                    )
+                )
+            changes_metadata = await metadata
 
             if snapshot.dirty:
                 commit_message = changes_metadata["commit_message"].commit_message
@@ -191,14 +271,7 @@ class GitChangePublisher(ChangePublisher):
             else:
                 branch_name = merge_request.source_branch
 
-            # An ephemeral-token push (GitLab's project-scoped bot) yields a pipeline that can't read
-            # private cross-project CI includes; skip that push's CI and re-trigger as the service
-            # account below. The client capability answers False for platforms without ephemeral
-            # tokens, so no platform check is needed here; an explicit skip_ci ("no CI at all") also
-            # leaves nothing to heal.
-            heal_pipeline = not skip_ci and await sync_to_async(self.client.push_uses_ephemeral_token)(
-                self.ctx.repository
-            )
+            heal_pipeline = ephemeral_token is not None and await ephemeral_token
 
             # Only an existing MR's source branch may have advanced under the run (a dependabot
             # force-push, or a concurrent push) — integrate + retry there so the work isn't lost.
@@ -356,8 +429,9 @@ class GitChangePublisher(ChangePublisher):
             The pull request metadata and commit message.
         """
 
+        omit_content_patterns = self.ctx.config.omit_content_patterns
         input_data = {
-            "commit_message_diff": redact_diff_content(commit_message_diff, self.ctx.config.omit_content_patterns)
+            "commit_message_diff": condense_diff(redact_diff_content(commit_message_diff, omit_content_patterns))
         }
         if self.ctx.scope == Scope.ISSUE:
             input_data["extra_context"] = dedent(
@@ -371,9 +445,12 @@ class GitChangePublisher(ChangePublisher):
             ).format(issue=self.ctx.issue)
 
         if pr_metadata_diff:
-            input_data["pr_metadata_diff"] = redact_diff_content(
-                pr_metadata_diff, self.ctx.config.omit_content_patterns
-            )
+            input_data["pr_metadata_diff"] = condense_diff(redact_diff_content(pr_metadata_diff, omit_content_patterns))
+
+        cache_key = self._metadata_cache_key(input_data)
+        if (cached := await cache.aget(cache_key)) is not None:
+            logger.info("Reusing the metadata generated for an identical diff.")
+            return {name: _METADATA_SCHEMAS[name].model_validate(value) for name, value in cached.items()}
 
         changes_metadata_graph = create_diff_to_metadata_graph(ctx=self.ctx, include_pr_metadata=bool(pr_metadata_diff))
         config = build_langsmith_config(
@@ -381,10 +458,34 @@ class GitChangePublisher(ChangePublisher):
         )
         result = await changes_metadata_graph.ainvoke(input_data, config=config)
         if result and ("pr_metadata" in result or "commit_message" in result):
+            await cache.aset(
+                cache_key, {name: value.model_dump() for name, value in result.items()}, timeout=METADATA_CACHE_TTL_S
+            )
             return result
 
         raise ValueError("Failed to get PR metadata from the diff.")
 
+    def _metadata_cache_key(self, input_data: dict[str, str]) -> str:
+        """Cache key for the metadata of ``input_data`` (the condensed diffs and extra context).
+
+        Also keyed on the repository, the scope and the models that would answer, since any of those
+        changes what the model would write.
+        """
+        payload = json.dumps(
+            {
+                "repository": self.ctx.repository.slug,
+                "scope": self.ctx.scope,
+                "models": [
+                    site_settings.diff_to_metadata_model_name,
+                    site_settings.diff_to_metadata_fallback_model_name,
+                ],
+                **input_data,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return f"diff_to_metadata:{hashlib.sha256(payload.encode()).hexdigest()}"
+
     async def _create_merge_request(
         self,
         branch_name: str,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Final, TypedDict
+from typing import TYPE_CHECKING, Any, Final, NotRequired, TypedDict
 
 if TYPE_CHECKING:
     from langchain.agents import CompiledAgent
@@ -34,6 +34,9 @@ class AgentResult(TypedDict):
     usage: dict[str, Any] | None
     """Token usage and cost summary, or None if not available."""
 
+    phase_timings: NotRequired[dict[str, Any]]
+    """Seconds and entries per run phase (see ``automation.agent.phase_timings``); absent when not tracked."""
+
 
 def parse_agent_result(rv: dict | str | None) -> AgentResult:
     """Parse a DBTaskResult.return_value into an AgentResult.
@@ -42,13 +45,16 @@ def parse_agent_result(rv: dict | str | None) -> AgentResult:
     or old ``{"code_changes": bool}`` without a "response" key).
     """
     if isinstance(rv, dict):
-        return AgentResult(
+        result = AgentResult(
             response=rv.get("response", ""),
             code_changes=bool(rv.get("code_changes")),
             merge_request_id=rv.get("merge_request_id"),
             merge_request_web_url=rv.get("merge_request_web_url"),
             usage=rv.get("usage") if isinstance(rv.get("usage"), dict) else None,
         )
+        if isinstance(rv.get("phase_timings"), dict):
+            result["phase_timings"] = rv["phase_timings"]
+        return result
     return AgentResult(
         response=str(rv) if rv else "",
         code_changes=False,
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import logging
 from collections import defaultdict
 from contextlib import contextmanager
 from contextvars import ContextVar
 from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
-from genai_prices import Usage, calc_price
-from genai_prices.types import TieredPrices
+from genai_prices import Usage
+from genai_prices.data_snapshot import get_snapshot
+from genai_prices.types import ModelPrice, TieredPrices, TimeOfDateConstraint
 from langchain_core.callbacks.usage import UsageMetadataCallbackHandler
 from langchain_core.messages import AIMessage
 from langchain_core.outputs import ChatGeneration
@@ -21,6 +24,7 @@ from core.models import ProviderType
 if TYPE_CHECKING:
     from collections.abc import Iterator, Mapping
 
+    from genai_prices.types import ModelInfo
     from langchain_core.outputs import LLMResult
 
 logger = logging.getLogger("daiv.usage")
@@ -43,6 +47,38 @@ def _resolve_mtok_rate(field_mtok: Decimal | TieredPrices | None, total_input_to
     return field_mtok
 
 
+@dataclass(frozen=True)
+class _Pricing:
+    """A model's resolved pricing entry, and its price for the day when that holds all day."""
+
+    provider_id: str
+    model: ModelInfo
+    daily_price: ModelPrice | None
+
+    def price_at(self, timestamp: datetime) -> ModelPrice:
+        # Off-peak (time-of-day) prices can change within the day, so those are picked per call.
+        return self.daily_price or self.model.get_prices(timestamp)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_pricing(model_name: str, provider_id: str | None, day: date) -> _Pricing | None:
+    """Look up ``model_name`` in the pricing database once per (provider, model, day).
+
+    ``genai_prices`` re-scans every provider's match rules for each lookup it has not seen succeed,
+    so an unpriced model would otherwise pay a full scan (and log a warning) on every call.
+    """
+    try:
+        provider, model = get_snapshot().find_provider_model(model_name, None, provider_id, None)
+    except LookupError:
+        logger.warning("No pricing found for model %r", model_name)
+        return None
+    varies_within_day = not isinstance(model.prices, ModelPrice) and any(
+        isinstance(conditional.constraint, TimeOfDateConstraint) for conditional in model.prices
+    )
+    daily_price = None if varies_within_day else model.get_prices(datetime.combine(day, time(), UTC))
+    return _Pricing(provider_id=provider.id, model=model, daily_price=daily_price)
+
+
 def _calc_model_cost(model_name: str, usage_metadata: Mapping[str, Any]) -> Decimal | None:
     """Return None if the model is not in the pricing database."""
     input_details = usage_metadata.get("input_token_details") or {}
@@ -64,27 +100,27 @@ def _calc_model_cost(model_name: str, usage_metadata: Mapping[str, Any]) -> Deci
     # OpenRouter model names contain a slash (e.g. "anthropic/claude-sonnet-4.6")
     # and need an explicit provider_id to resolve correctly.
     provider_id = "openrouter" if "/" in model_name else None
-    try:
-        result = calc_price(genai_usage, model_ref=model_name, provider_id=provider_id)
-    except LookupError:
-        logger.warning("No pricing found for model %r", model_name)
+    now = datetime.now(tz=UTC)
+    pricing = _resolve_pricing(model_name, provider_id, now.date())
+    if pricing is None:
         return None
+    model_price = pricing.price_at(now)
+    try:
+        cost = model_price.calc_price(genai_usage)["total_price"]
     except ValueError, TypeError, ArithmeticError:
         logger.warning("Cost calculation failed for model %r", model_name, exc_info=True)
         return None
 
-    cost = result.total_price
-
     # Anthropic prices 1-hour ephemeral cache writes at 2x the base input rate, while
     # 5-minute writes are 1.25x. genai-prices' single ``cache_write_mtok`` reflects only
     # the 5-minute rate, so add the (1h − 5m) differential for the 1h portion.
     # OpenRouter-routed Anthropic models share the underlying rates and need the same surcharge.
-    is_anthropic = result.provider.id == ProviderType.ANTHROPIC or model_name.startswith(
+    is_anthropic = pricing.provider_id == ProviderType.ANTHROPIC or model_name.startswith(
         f"{ProviderType.ANTHROPIC.value}/"
     )
     if ephemeral_1h and is_anthropic:
-        input_rate = _resolve_mtok_rate(result.model_price.input_mtok, input_tokens)
-        cache_write_rate = _resolve_mtok_rate(result.model_price.cache_write_mtok, input_tokens)
+        input_rate = _resolve_mtok_rate(model_price.input_mtok, input_tokens)
+        cache_write_rate = _resolve_mtok_rate(model_price.cache_write_mtok, input_tokens)
         if input_rate is not None and cache_write_rate is not None:
             surcharge_per_mtok = Decimal(2) * input_rate - cache_write_rate
             cost += Decimal(ephemeral_1h) * surcharge_per_mtok / Decimal(1_000_000)
@@ -17,5 +17,4 @@ class AuthBearer(HttpBearer):
         if key is None:
             return None
 
-        api_key = await APIKey.objects.get_active_key(key)
-        return api_key.user if api_key else None
+        return await APIKey.objects.get_active_user(key)
@@ -18,14 +18,18 @@ from ag_ui.core.events import (
     TextMessageEndEvent,
     TextMessageStartEvent,
 )
+from asgiref.sync import sync_to_async
 from copilotkit import LangGraphAGUIAgent
 from langgraph.store.memory import InMemoryStore
 from sessions.locks import SessionLock
 from sessions.models import Run, RunStatus, SessionOrigin, usage_field_updates
+from sessions.rollups import refresh_run_daily_stats_on_commit
 from sessions.services import apersist_session_ref, areset_session_ref
+from sessions.summaries import refresh_session_summaries
 
 from automation.agent.events import ASSISTANT_MESSAGE_EVENT, parse_assistant_message
 from automation.agent.graph import create_daiv_agent
+from automation.agent.phase_timings import Phase, phase, track_phases
 from automation.agent.usage_tracking import build_usage_summary, track_usage_metadata
 from automation.agent.utils import build_langsmith_config, get_daiv_agent_kwargs
 from codebase.base import Scope
@@ -66,7 +70,13 @@ async def start_chat_run(*, session_id: str, user_id, prompt: str, repo_id: str,
 
 
 async def finalize_chat_run(
-    run_pk, *, success: bool, usage: dict | None, response_text: str, error_message: str = ""
+    run_pk,
+    *,
+    success: bool,
+    usage: dict | None,
+    response_text: str,
+    error_message: str = "",
+    phase_timings: dict | None = None,
 ) -> None:
     """Terminal transition for a chat Run. Reuses ``usage_field_updates`` so the
     token/cost denormalization stays identical to the task-backed path
@@ -80,10 +90,15 @@ async def finalize_chat_run(
         update["error_message"] = error_message[:2000]
     if usage:
         update.update(usage_field_updates(usage, run_ref=run_pk))
+    if phase_timings:
+        update["phase_timings"] = phase_timings
     await Run.objects.filter(pk=run_pk).aupdate(**update)
-    # ``aupdate`` fires no post_save, so the nav badge poke the Run signal would have
-    # sent has to be issued here.
+    # ``aupdate`` fires no post_save, so the nav badge poke, the session summary refresh and the
+    # dashboard rollup refresh the Run signals would have issued have to be issued here.
     await ui_events.publisher.aruns_changed()
+    if run := await Run.objects.filter(pk=run_pk).values("session_id", "created_at").afirst():
+        await sync_to_async(refresh_session_summaries)([run["session_id"]])
+        await sync_to_async(refresh_run_daily_stats_on_commit)([timezone.localdate(run["created_at"])])
 
 
 # GitState fields that survive the ag-ui output-schema filter and reach the
@@ -274,6 +289,7 @@ class ChatRunStreamer:
         # Created after the stream context opens; finalized in ``finally``.
         chat_run: Run | None = None
         usage_handler = None
+        phases = None
         response_buffer = ""
         try:
             # Surface the auto-resolved env before any agent output so the locked composer
@@ -284,6 +300,7 @@ class ChatRunStreamer:
             if self.auto_resolved_env is not None:
                 yield CustomEvent(type=EventType.CUSTOM, name="resolved_env", value=self.auto_resolved_env)
             async with (
+                track_phases() as phases,
                 open_checkpointer() as checkpointer,
                 set_runtime_ctx(
                     repo_id=self.repo_id,
@@ -328,9 +345,10 @@ class ChatRunStreamer:
                     agent_model=self.agent_model,
                     agent_thinking_level=self.agent_thinking_level,
                 )
-                agent = await create_daiv_agent(
-                    ctx=runtime_ctx, checkpointer=checkpointer, store=InMemoryStore(), **agent_kwargs
-                )
+                with phase(Phase.BUILD):
+                    agent = await create_daiv_agent(
+                        ctx=runtime_ctx, checkpointer=checkpointer, store=InMemoryStore(), **agent_kwargs
+                    )
                 langsmith_config = build_langsmith_config(
                     runtime_ctx,
                     trigger="chat",
@@ -460,6 +478,7 @@ class ChatRunStreamer:
                         usage=build_usage_summary(usage_handler).to_dict() if usage_handler else None,
                         response_text=response_buffer,
                         error_message=run_error_message or "",
+                        phase_timings=phases.summary() if phases else None,
                     )
                 except Exception:
                     logger.exception("chat: failed to finalize chat run for thread_id=%s", self.thread_id)
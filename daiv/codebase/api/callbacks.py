@@ -18,9 +18,9 @@ class BaseCallback(BaseModel, ABC):
     """
 
     @abstractmethod
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         pass
 
     @abstractmethod
-    def process_callback(self):
+    async def process_callback(self):
         pass
@@ -11,3 +11,5 @@ class CodebaseConfig(AppConfig):
     def ready(self):
         autodiscover_modules("clients.github.api.views")
         autodiscover_modules("clients.gitlab.api.views")
+
+        import codebase.signals  # noqa: F401
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+import math
+import time
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
@@ -33,6 +36,17 @@ _BACKSTOP_STALENESS = timedelta(hours=1)
 _BACKSTOP_PROBE_KEY = "repo-access:backstop-probe"
 _BACKSTOP_PROBE_INTERVAL = 60
 
+# Each member's fresh access rows are resolved once into a ``RepositoryVisibility`` snapshot,
+# cached per user and stamped with the sync generation it was built under. The access sync bumps
+# the generation when it finishes, retiring every snapshot at once; linking or unlinking a platform
+# account drops that user's snapshot (see ``codebase.signals``).
+_VISIBILITY_KEY = "repo-access:visibility:{user_id}"
+_VISIBILITY_VERSION_KEY = "repo-access:visibility-version"
+# Within one request the snapshot is also memoized on the user object. The memo is short-lived so
+# a user held across a long stream still picks up a new sync generation promptly.
+_VISIBILITY_MEMO_ATTR = "_repo_visibility"
+_VISIBILITY_MEMO_SECONDS = 5
+
 
 class RepositoryAccessDenied(Exception):  # noqa: N818
     """The user lacks the required access level on one or more repositories."""
@@ -42,6 +56,24 @@ class RepositoryAccessDenied(Exception):  # noqa: N818
         super().__init__(REPO_ACCESS_DENIED_MESSAGE)
 
 
+@dataclass(frozen=True, slots=True)
+class RepositoryVisibility:
+    """A member's fresh repository access, resolved in one query.
+
+    ``levels`` maps each repository the user can read to their tier on it. ``expires_at`` (epoch
+    seconds) is capped by the oldest row's hard-TTL deadline, so a snapshot never outlives the
+    freshness of the rows it was built from.
+    """
+
+    uid: str | None
+    levels: dict[str, RepoAccessLevel]
+    version: int
+    expires_at: float
+
+    def level(self, repo_id: str) -> RepoAccessLevel | None:
+        return self.levels.get(repo_id)
+
+
 def _provider() -> str:
     return settings.CLIENT.value
 
@@ -94,15 +126,64 @@ def _maybe_enqueue_backstop() -> None:
         _enqueue_sync()
 
 
-def _resolve_uid(user: User) -> str | None:
-    """Probe the backstop, then resolve ``user`` to their platform uid (``None`` if unlinked).
+def invalidate_repository_visibility() -> None:
+    """Retire every cached visibility snapshot. Called by the access sync once it has written."""
+    cache.set(_VISIBILITY_VERSION_KEY, time.time_ns(), timeout=None)
 
-    Groups the two steps every non-admin authorization entry point shares, so the
-    security-load-bearing "keep the sync alive, then map to a platform identity" ordering
-    lives in one place and cannot drift between call sites.
+
+def forget_repository_visibility(user_id: int) -> None:
+    """Drop ``user_id``'s cached snapshot, e.g. when their platform identity changes."""
+    cache.delete(_VISIBILITY_KEY.format(user_id=user_id))
+
+
+def _visibility_version() -> int:
+    version = time.time_ns()
+    if cache.add(_VISIBILITY_VERSION_KEY, version, timeout=None):
+        return version
+    return cache.get(_VISIBILITY_VERSION_KEY, version)
+
+
+def _build_visibility(user: User, version: int) -> RepositoryVisibility:
+    uid = _identity(user)
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=settings.REPO_ACCESS_VISIBILITY_CACHE_SECONDS)
+    hard_ttl = timedelta(hours=settings.REPO_ACCESS_HARD_TTL_HOURS)
+    levels: dict[str, RepoAccessLevel] = {}
+    if uid is not None:
+        for repo_id, access_level, synced_at in _fresh_rows(uid).values_list("repo_id", "access_level", "synced_at"):
+            try:
+                levels[repo_id] = RepoAccessLevel(access_level)
+            except ValueError:
+                # An unknown tier (bad migration, a platform level this enum hasn't learned) must
+                # deny rather than 500 the caller — this is a security decision, so fail closed.
+                logger.warning("Unknown access_level %r on %s for uid %s; denying", access_level, repo_id, uid)
+                continue
+            expires_at = min(expires_at, synced_at + hard_ttl)
+    return RepositoryVisibility(uid=uid, levels=levels, version=version, expires_at=expires_at.timestamp())
+
+
+def repository_visibility(user: User) -> RepositoryVisibility:
+    """The member's ``RepositoryVisibility``: memoized on ``user``, else cached, else built.
+
+    Every non-admin entry point resolves through here, so the security-load-bearing "keep the sync
+    alive, then map to a platform identity, then trust only fresh rows" ordering lives in one place.
+    Callers MUST handle admins (who are unrestricted) first.
     """
+    now = time.time()
+    memo = getattr(user, _VISIBILITY_MEMO_ATTR, None)
+    if memo is not None and now - memo[0] < _VISIBILITY_MEMO_SECONDS and now < memo[1].expires_at:
+        return memo[1]
+
     _maybe_enqueue_backstop()
-    return _identity(user)
+    key = _VISIBILITY_KEY.format(user_id=user.pk)
+    cached = cache.get_many([_VISIBILITY_VERSION_KEY, key])
+    version = cached.get(_VISIBILITY_VERSION_KEY) or _visibility_version()
+    snapshot = cached.get(key)
+    if snapshot is None or snapshot.version != version or now >= snapshot.expires_at:
+        snapshot = _build_visibility(user, version)
+        cache.set(key, snapshot, timeout=max(1, math.ceil(snapshot.expires_at - now)))
+    setattr(user, _VISIBILITY_MEMO_ATTR, (now, snapshot))
+    return snapshot
 
 
 def get_access_level(user: User, repo_id: str) -> RepoAccessLevel | None:
@@ -114,19 +195,7 @@ def get_access_level(user: User, repo_id: str) -> RepoAccessLevel | None:
     """
     if user.is_admin:
         return RepoAccessLevel.WRITE
-    uid = _resolve_uid(user)
-    if uid is None:
-        return None
-    row = _fresh_rows(uid).filter(repo_id=repo_id).only("access_level").first()
-    if row is None:
-        return None
-    try:
-        return RepoAccessLevel(row.access_level)
-    except ValueError:
-        # An unknown tier (bad migration, a platform level this enum hasn't learned) must
-        # deny rather than 500 the caller — this is a security decision, so fail closed.
-        logger.warning("Unknown access_level %r on %s for uid %s; denying", row.access_level, repo_id, uid)
-        return None
+    return repository_visibility(user).level(repo_id)
 
 
 def can_view(user: User, repo_id: str) -> bool:
@@ -143,15 +212,8 @@ def assert_can_run(user: User, repo_ids: Iterable[str]) -> None:
     repo_ids = list(repo_ids)
     if user.is_admin:
         return
-    uid = _resolve_uid(user)
-    if uid is None:
-        raise RepositoryAccessDenied(repo_ids)
-    writable = set(
-        _fresh_rows(uid)
-        .filter(repo_id__in=repo_ids, access_level=RepoAccessLevel.WRITE)
-        .values_list("repo_id", flat=True)
-    )
-    denied = [repo_id for repo_id in repo_ids if repo_id not in writable]
+    visibility = repository_visibility(user)
+    denied = [repo_id for repo_id in repo_ids if visibility.level(repo_id) != RepoAccessLevel.WRITE]
     if denied:
         raise RepositoryAccessDenied(denied)
 
@@ -161,23 +223,34 @@ def viewable_repo_ids(user: User, repo_ids: Iterable[str]) -> set[str]:
     repo_ids = list(repo_ids)
     if user.is_admin:
         return set(repo_ids)
-    uid = _resolve_uid(user)
-    if uid is None:
-        return set()
-    return set(_fresh_rows(uid).filter(repo_id__in=repo_ids).values_list("repo_id", flat=True))
+    levels = repository_visibility(user).levels
+    return {repo_id for repo_id in repo_ids if repo_id in levels}
+
+
+def all_viewable_repo_ids(user: User) -> list[str]:
+    """Every repo the user can read (fresh READ+), served from the user's visibility snapshot.
+
+    For short lists such as repository search; filters over large tables should use
+    :func:`viewable_repo_ids_subquery` instead. Empty when the user has no linked platform identity.
+
+    Callers MUST handle admins (who are unrestricted) before calling this: an admin with
+    no OAuth link would otherwise resolve to an empty set.
+    """
+    return list(repository_visibility(user).levels)
 
 
 def viewable_repo_ids_subquery(user: User):
     """A lazy ``repo_id`` values-queryset of the repos the user can read (fresh READ+).
 
-    Intended for ``repo_id__in=<subquery>`` filters over large tables (e.g. ``Activity``)
-    so the id set is never materialized in Python. Returns an empty values-queryset when
-    the user has no linked platform identity.
+    Intended for ``repo_id__in=<subquery>`` filters over large tables (sessions, runs, rollups)
+    so the id set is never materialized in Python. The platform uid comes from the user's
+    visibility snapshot; the rows themselves are read by the outer query. Returns an empty
+    values-queryset when the user has no linked platform identity.
 
     Callers MUST handle admins (who are unrestricted) before calling this: an admin with
     no OAuth link would otherwise resolve to an empty set.
     """
-    uid = _resolve_uid(user)
+    uid = repository_visibility(user).uid
     if uid is None:
         return RepositoryAccess.objects.none().values_list("repo_id", flat=True)
     return _fresh_rows(uid).values_list("repo_id", flat=True)
@@ -198,15 +271,17 @@ def search_viewable_repositories(
     ``topics`` is AND-matched in Python because the SQLite test backend does not support the
     ``JSONField __contains`` lookup used on Postgres. The match streams slug-ordered rows and stops
     once ``limit`` are found, so it never materializes more of the catalog than the window needs —
-    important for an admin, whose unfiltered candidate set is the entire fresh catalog.
+    important for an admin, whose unfiltered candidate set is the entire fresh catalog. On Postgres
+    the ``icontains`` search is served by trigram indexes on ``slug`` and ``name``.
     """
-    _maybe_enqueue_backstop()
     rows = RepositoryCatalog.objects.fresh().filter(provider=_provider())
-    if not user.is_admin:
-        uid = _identity(user)
-        if uid is None:
+    if user.is_admin:
+        _maybe_enqueue_backstop()
+    else:
+        repo_ids = all_viewable_repo_ids(user)
+        if not repo_ids:
             return []
-        rows = rows.filter(slug__in=_fresh_rows(uid).values_list("repo_id", flat=True))
+        rows = rows.filter(slug__in=repo_ids)
     if search:
         rows = rows.filter(Q(slug__icontains=search) | Q(name__icontains=search))
     rows = rows.order_by("slug")
@@ -0,0 +1,192 @@
+"""Async HTTP transport for the git platform APIs.
+
+``python-gitlab`` and ``PyGithub`` are synchronous, so every call they make from a coroutine (a
+webhook callback, an addressor manager) either blocks the event loop or pays a thread hop. The
+``a``-prefixed :class:`~codebase.clients.base.RepoClient` methods talk to the REST APIs directly
+through :class:`AsyncAPIClient` instead:
+
+- one ``httpx.AsyncClient`` per event loop, shared by every platform client, so the TCP+TLS
+  connections (and HTTP/2 streams when ``h2`` is installed) are reused across calls;
+- pagination as async iterators that follow the ``Link: rel="next"`` header both platforms send;
+- rate-limit aware retries that honour ``Retry-After`` and the platforms' reset headers.
+
+The sync API stays the one cron tasks and management commands use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import time
+import weakref
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from daiv import USER_AGENT
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Mapping
+
+logger = logging.getLogger("daiv.clients")
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Retry budget: long enough to ride out a rate-limit window reported in seconds, short enough that a
+# webhook callback (which holds the platform's delivery open) never waits minutes on a single call.
+MAX_RETRIES = 3
+MAX_RETRY_WAIT_SECONDS = 30.0
+
+# Statuses worth retrying on any method: the platform rejected the request before acting on it.
+RATE_LIMIT_STATUSES = frozenset({429})
+# Transient server statuses, retried only on idempotent methods — a POST that hit a 502 may have landed.
+TRANSIENT_STATUSES = frozenset({500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+_pooled_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def _pooled_client() -> httpx.AsyncClient:
+    """The ``httpx.AsyncClient`` shared by every API call on the running event loop.
+
+    An ``AsyncClient``'s connections belong to the loop that opened them, so the pool is per loop:
+    the ASGI server's long-lived loop keeps one for the life of the process, and a worker's
+    per-task loop gets a fresh one that is dropped with it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _pooled_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _pooled_clients[loop] = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            headers={"User-Agent": USER_AGENT},
+        )
+    return client
+
+
+async def aclose_pooled_client() -> None:
+    """Close the running loop's shared client, if any. The next call opens a new one."""
+    if (client := _pooled_clients.pop(asyncio.get_running_loop(), None)) is not None:
+        await client.aclose()
+
+
+def _is_rate_limited(response: httpx.Response) -> bool:
+    """True for a rate-limit rejection: GitLab's 429, or GitHub's 429/403 with an exhausted quota
+    (primary limit) or a ``Retry-After`` (secondary limit)."""
+    if response.status_code in RATE_LIMIT_STATUSES:
+        return True
+    return response.status_code == 403 and (
+        response.headers.get("x-ratelimit-remaining") == "0" or "retry-after" in response.headers
+    )
+
+
+def _backoff(attempt: int) -> float:
+    return min(0.5 * 2**attempt, MAX_RETRY_WAIT_SECONDS)
+
+
+def retry_delay(response: httpx.Response, method: str, attempt: int) -> float | None:
+    """Seconds to wait before retrying ``response``'s request, or ``None`` if it must not be retried.
+
+    ``Retry-After`` wins when present; otherwise a rate-limited response waits until the quota
+    resets (GitLab's ``RateLimit-Reset``, GitHub's ``X-RateLimit-Reset``, both epoch seconds) and a
+    transient one backs off exponentially. Waits are capped at :data:`MAX_RETRY_WAIT_SECONDS`.
+    """
+    rate_limited = _is_rate_limited(response)
+    if not rate_limited and not (method in IDEMPOTENT_METHODS and response.status_code in TRANSIENT_STATUSES):
+        return None
+
+    if (retry_after := response.headers.get("retry-after")) is not None:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_WAIT_SECONDS)
+        except ValueError:
+            pass  # The HTTP-date form; fall back to the reset headers or the backoff.
+
+    if rate_limited and (reset := response.headers.get("ratelimit-reset") or response.headers.get("x-ratelimit-reset")):
+        try:
+            return min(max(float(reset) - time.time(), 0.0), MAX_RETRY_WAIT_SECONDS)
+        except ValueError:
+            pass
+
+    return _backoff(attempt)
+
+
+class AsyncAPIClient:
+    """JSON client for one platform's REST API over the shared pooled ``httpx.AsyncClient``.
+
+    Args:
+        base_url: The API root, e.g. ``https://gitlab.com/api/v4`` or ``https://api.github.com``.
+        auth_headers: Called per request, so a rotating credential (a GitHub installation token)
+            is always current.
+    """
+
+    def __init__(self, base_url: str, auth_headers: Callable[[], Mapping[str, str]]):
+        self.base_url = f"{base_url.rstrip('/')}/"
+        self._auth_headers = auth_headers
+
+    def _url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}{path.lstrip('/')}"
+
+    async def request(
+        self, method: str, path: str, *, params: Mapping[str, Any] | None = None, json: Any = None
+    ) -> httpx.Response:
+        """Send a request, retrying rate limits and transient failures; raise on an error status.
+
+        Raises:
+            httpx.HTTPStatusError: The final response had a 4xx/5xx status.
+            httpx.TransportError: The connection failed on every attempt.
+        """
+        url = self._url(path)
+        client = _pooled_client()
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await client.request(method, url, params=params, json=json, headers=self._auth_headers())
+            except httpx.TransportError:
+                if method not in IDEMPOTENT_METHODS or attempt == MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_backoff(attempt))
+                continue
+
+            delay = retry_delay(response, method, attempt)
+            if delay is None or attempt == MAX_RETRIES:
+                break
+            logger.info(
+                "%s %s returned %s, retrying in %.1fs (attempt %d/%d)",
+                method,
+                response.url.path,
+                response.status_code,
+                delay,
+                attempt + 1,
+                MAX_RETRIES,
+            )
+            await asyncio.sleep(delay)
+
+        response.raise_for_status()
+        return response
+
+    async def get(self, path: str, *, params: Mapping[str, Any] | None = None) -> Any:
+        return (await self.request("GET", path, params=params)).json()
+
+    async def post(self, path: str, *, json: Any = None) -> Any:
+        response = await self.request("POST", path, json=json)
+        return response.json() if response.content else None
+
+    async def paginate(
+        self, path: str, *, params: Mapping[str, Any] | None = None, per_page: int = 100
+    ) -> AsyncIterator[Any]:
+        """Yield every item of a list endpoint, fetching the next page only once this one is consumed.
+
+        The ``next`` link carries the query (including the page cursor), so ``params`` only shape
+        the first request.
+        """
+        url: str | None = path
+        page_params: Mapping[str, Any] | None = {"per_page": per_page, **(params or {})}
+        while url:
+            response = await self.request("GET", url, params=page_params)
+            for item in response.json():
+                yield item
+            url = response.links.get("next", {}).get("url")
+            page_params = None
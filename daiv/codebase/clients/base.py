@@ -11,6 +11,7 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
+from asgiref.sync import sync_to_async
 from pydantic import SecretStr
 
 from codebase.base import (
@@ -161,6 +162,22 @@ class RepoClient(abc.ABC):
         iterator ordered by the mutable ``last_activity_at``) must dedupe before returning.
         """
 
+    def iter_repository_pages(
+        self, search: str | None = None, topics: list[str] | None = None, page_size: int = 100
+    ) -> Iterator[list[Repository]]:
+        """Yield the repositories :meth:`list_repositories` would return, ``page_size`` at a time.
+
+        Pages are fetched from the platform as they are consumed, so a caller walking the whole
+        universe (the access sync) holds one page in memory rather than every repository. The
+        one-entry-per-slug guarantee holds across pages, not just within one, and the pages must
+        come in an order activity cannot change: the access sync prunes every repository the walk
+        did not yield.
+
+        The default yields :meth:`list_repositories` as a single page, for platforms whose universe
+        is small; GitLab and GitHub stream.
+        """
+        yield self.list_repositories(search=search, topics=topics)
+
     @abc.abstractmethod
     def list_repository_members(self, repo_id: str) -> list[RepoMember]:
         """
@@ -504,6 +521,35 @@ class RepoClient(abc.ABC):
     def current_user(self) -> User:
         pass
 
+    # Async
+    #
+    # Counterparts of the sync methods above for callers already on an event loop (webhook callbacks,
+    # the addressor managers). These defaults run the sync method in a worker thread; the GitLab and
+    # GitHub clients override them with native calls on the pooled client of ``codebase.clients.aio``.
+    async def acurrent_user(self) -> User:
+        return await sync_to_async(lambda: self.current_user)()
+
+    async def aget_issue_comment(self, repo_id: str, issue_id: int, comment_id: str) -> Discussion:
+        return await sync_to_async(self.get_issue_comment)(repo_id, issue_id, comment_id)
+
+    async def acreate_issue_emoji(self, repo_id: str, issue_id: int, emoji: Emoji, note_id: int | None = None):
+        return await sync_to_async(self.create_issue_emoji)(repo_id, issue_id, emoji, note_id)
+
+    async def ahas_issue_reaction(self, repo_id: str, issue_id: int, emoji: Emoji) -> bool:
+        return await sync_to_async(self.has_issue_reaction)(repo_id, issue_id, emoji)
+
+    async def aget_merge_request(self, repo_id: str, merge_request_id: int) -> MergeRequest:
+        return await sync_to_async(self.get_merge_request)(repo_id, merge_request_id)
+
+    async def aget_merge_request_comment(self, repo_id: str, merge_request_id: int, comment_id: str) -> Discussion:
+        return await sync_to_async(self.get_merge_request_comment)(repo_id, merge_request_id, comment_id)
+
+    async def aget_merge_request_by_branches(self, repo_id: str, source_branch: str) -> MergeRequest | None:
+        return await sync_to_async(self.get_merge_request_by_branches)(repo_id, source_branch)
+
+    async def acreate_merge_request_note_emoji(self, repo_id: str, merge_request_id: int, emoji: Emoji, note_id: int):
+        return await sync_to_async(self.create_merge_request_note_emoji)(repo_id, merge_request_id, emoji, note_id)
+
     # Factory
     @staticmethod
     @functools.cache
@@ -1,9 +1,9 @@
 import logging
-from functools import cached_property
 from typing import Any, Literal
 
-from asgiref.sync import sync_to_async
+import httpx
 from github.GithubException import GithubException
+from pydantic import TypeAdapter
 from sandbox_envs.services import resolve_env_for_run
 from sessions.models import SessionOrigin
 from sessions.services import acreate_run
@@ -11,6 +11,7 @@ from sessions.services import acreate_run
 from accounts.utils import resolve_user
 from codebase.api.callbacks import BaseCallback
 from codebase.base import Scope
+from codebase.base import User as BaseUser
 from codebase.clients import RepoClient
 from codebase.clients.base import Emoji
 from codebase.repo_config import RepositoryConfig
@@ -45,7 +46,7 @@ class IssueCallback(GitHubCallback):
         self._repo_config = RepositoryConfig.get_config(self.repository.full_name)
         self._client = RepoClient.create_instance()
 
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         # Check basic conditions
         if not (
             self._repo_config.issue_addressing.enabled
@@ -65,7 +66,7 @@ class IssueCallback(GitHubCallback):
             return False
 
         # Check if DAIV has already reacted to the issue (prevents re-launching when label is removed and re-added)
-        if self._client.has_issue_reaction(self.repository.full_name, self.issue.number, Emoji.EYES):
+        if await self._client.ahas_issue_reaction(self.repository.full_name, self.issue.number, Emoji.EYES):
             logger.info(
                 "Skipping issue %s#%s: DAIV has already reacted to this issue",
                 self.repository.full_name,
@@ -92,8 +93,8 @@ class IssueCallback(GitHubCallback):
 
     async def process_callback(self):
         try:
-            self._client.create_issue_emoji(self.repository.full_name, self.issue.number, Emoji.EYES)
-        except GithubException, OSError:
+            await self._client.acreate_issue_emoji(self.repository.full_name, self.issue.number, Emoji.EYES)
+        except GithubException, httpx.HTTPError, OSError:
             logger.exception("Failed to add reaction to issue %s#%s", self.repository.full_name, self.issue.number)
         thread_id = compute_thread_id(
             repo_slug=self.repository.full_name, scope=Scope.ISSUE, entity_iid=self.issue.number
@@ -140,15 +141,15 @@ class IssueCommentCallback(GitHubCallback):
         self._repo_config = RepositoryConfig.get_config(self.repository.full_name)
         self._client = RepoClient.create_instance()
 
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         """
         Check if the webhook is accepted.
         """
-        if (
-            self.action not in ["created", "edited"]
-            or self.issue.state != "open"
-            or self.comment.user.id == self._client.current_user.id
-        ):
+        if self.action not in ["created", "edited"] or self.issue.state != "open":
+            return False
+
+        current_user = await self._client.acurrent_user()
+        if self.comment.user.id == current_user.id:
             return False
 
         # Check if user is allowed to interact with DAIV
@@ -161,20 +162,21 @@ class IssueCommentCallback(GitHubCallback):
             )
             return False
 
-        return bool(self._is_issue_comment or self._is_merge_request_review)
+        return self._is_issue_comment(current_user) or self._is_merge_request_review(current_user)
 
     async def process_callback(self):
         """
         Trigger the task to address the review feedback or issue comment like the plan approval use case.
         """
         daiv_user = await resolve_user("github", self.comment.user.id, username=self.comment.user.username)
+        current_user = await self._client.acurrent_user()
 
-        if self._is_issue_comment:
+        if self._is_issue_comment(current_user):
             try:
-                self._client.create_issue_emoji(
+                await self._client.acreate_issue_emoji(
                     self.repository.full_name, self.issue.number, Emoji.EYES, self.comment.id
                 )
-            except GithubException, OSError:
+            except GithubException, httpx.HTTPError, OSError:
                 logger.exception("Failed to add reaction to issue comment %s", self.comment.id)
             thread_id = compute_thread_id(
                 repo_slug=self.repository.full_name, scope=Scope.ISSUE, entity_iid=self.issue.number
@@ -207,12 +209,12 @@ class IssueCommentCallback(GitHubCallback):
                     "Failed to create run for issue comment %s#%s", self.repository.full_name, self.issue.number
                 )
 
-        elif self._is_merge_request_review:
+        elif self._is_merge_request_review(current_user):
             try:
-                self._client.create_merge_request_note_emoji(
+                await self._client.acreate_merge_request_note_emoji(
                     self.repository.full_name, self.issue.number, Emoji.EYES, self.comment.id
                 )
-            except GithubException, OSError:
+            except GithubException, httpx.HTTPError, OSError:
                 logger.exception("Failed to add reaction to PR comment %s", self.comment.id)
             thread_id = compute_thread_id(
                 repo_slug=self.repository.full_name, scope=Scope.MERGE_REQUEST, entity_iid=self.issue.number
@@ -230,7 +232,7 @@ class IssueCommentCallback(GitHubCallback):
             # fails the activity is still useful without a branch — don't drop it.
             source_branch = ""
             try:
-                pr = await sync_to_async(self._client.get_merge_request)(self.repository.full_name, self.issue.number)
+                pr = await self._client.aget_merge_request(self.repository.full_name, self.issue.number)
                 source_branch = pr.source_branch
             except Exception:
                 logger.exception(
@@ -256,8 +258,7 @@ class IssueCommentCallback(GitHubCallback):
                     "Failed to create run for PR comment %s#%s", self.repository.full_name, self.issue.number
                 )
 
-    @property
-    def _is_merge_request_review(self) -> bool:
+    def _is_merge_request_review(self, current_user: BaseUser) -> bool:
         """
         Accept the webhook if the note is a merge request comment that mentions DAIV.
         """
@@ -267,11 +268,10 @@ class IssueCommentCallback(GitHubCallback):
             and self.issue.state == "open"
             # and not self.issue.draft
             and self.action in ["created", "edited"]
-            and note_mentions_daiv(self.comment.body, self._client.current_user)
+            and note_mentions_daiv(self.comment.body, current_user)
         )
 
-    @cached_property
-    def _is_issue_comment(self) -> bool:
+    def _is_issue_comment(self, current_user: BaseUser) -> bool:
         """
         Accept the webhook if the note is an issue comment that mentions DAIV.
         """
@@ -280,7 +280,7 @@ class IssueCommentCallback(GitHubCallback):
             and self.issue.is_issue()
             and self.issue.state == "open"
             and self.action in ["created", "edited"]
-            and note_mentions_daiv(self.comment.body, self._client.current_user)
+            and note_mentions_daiv(self.comment.body, current_user)
         )
 
 
@@ -292,7 +292,7 @@ class PullRequestCallback(GitHubCallback):
     action: str
     pull_request: PullRequest
 
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         """
         Accept the webhook only when a pull request is merged into the default branch.
         """
@@ -326,7 +326,7 @@ class PushCallback(GitHubCallback):
 
     ref: str
 
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         """
         Accept the webhook if the push is to the default branch.
         """
@@ -339,3 +339,7 @@ class PushCallback(GitHubCallback):
         if self.repository.default_branch and self.ref.endswith(self.repository.default_branch):
             # Invalidate the cache for the repository configurations, they could have changed.
             RepositoryConfig.invalidate_cache(self.repository.full_name)
+
+
+# What the webhook inbox validates a recorded delivery into, in the order the endpoint used to try them.
+WEBHOOK_CALLBACKS = TypeAdapter(IssueCallback | IssueCommentCallback | PullRequestCallback | PushCallback)
@@ -143,3 +143,11 @@ class PullRequest(BaseModel):
     def has_max_label(self) -> bool:
         """Check if the pull request carries the ``daiv-max`` label (case-insensitive)."""
         return any(label.name.lower() == BOT_MAX_LABEL.lower() for label in self.labels)
+
+
+class WebhookEnvelope(BaseModel):
+    """
+    The part of a GitHub webhook the endpoint needs to verify and record it; the inbox validates the rest.
+    """
+
+    repository: Repository
@@ -1,42 +1,66 @@
+import json
 import logging
 
+from django.db import DatabaseError
+
 from codebase.api.callbacks import UnprocessableEntityResponse
 from codebase.api.router import router
 from codebase.base import GitPlatform
 from codebase.conf import settings
+from codebase.models import PlatformType
+from codebase.webhooks import arecord_delivery
 
-from .callbacks import IssueCallback, IssueCommentCallback, PullRequestCallback, PushCallback  # noqa: TC001
+from .models import WebhookEnvelope  # noqa: TC001
 from .security import validate_github_webhook
 
 logger = logging.getLogger("daiv.webhooks")
 
+CALLBACK_RESPONSES = {204: None, 401: None, 403: None, 422: UnprocessableEntityResponse, 503: None}
+
+# The events repositories are subscribed to (see ``GitHubClient.set_repository_webhooks``). Anything
+# else (``ping``, or an event an admin added to the hook by hand) is acknowledged without a record.
+RECORDED_EVENTS = frozenset({"issues", "issue_comment", "pull_request", "pull_request_review", "push"})
 
-@router.post("/callbacks/github", response={204: None, 401: None, 403: None, 422: UnprocessableEntityResponse})
-@router.post("/callbacks/github/", response={204: None, 401: None, 403: None, 422: UnprocessableEntityResponse})
-async def callback(request, payload: IssueCallback | IssueCommentCallback | PullRequestCallback | PushCallback):
+
+@router.post("/callbacks/github", response=CALLBACK_RESPONSES)
+@router.post("/callbacks/github/", response=CALLBACK_RESPONSES)
+async def callback(request, payload: WebhookEnvelope):
     """
-    GitHub callback endpoint for processing callbacks.
+    GitHub callback endpoint for recording callbacks.
 
-    Validates the webhook secret before processing the callback and returns 401 Unauthorized if validation fails.
+    Validates the webhook secret before recording the callback and returns 401 Unauthorized if validation fails.
     Returns 403 Forbidden if client type is not set to GitHub.
+    Returns 503 Service Unavailable if the callback could not be recorded, so GitHub retries it.
+    Returns 204 No Content without recording events DAIV has no callback for.
+
+    The callback is processed asynchronously from the webhook inbox (see ``codebase.webhooks``).
     """
     if settings.CLIENT != GitPlatform.GITHUB:
         logger.warning("GitHub Hook: Client type is not set to GitHub, skipping callback.")
         return 403, None
 
-    event = request.headers.get("X-GitHub-Event")
+    event = request.headers.get("X-GitHub-Event", "")
 
     if not validate_github_webhook(request):
         logger.warning("GitHub Hook: Unauthorized webhook '%s' for project '%s'", event, payload.repository.full_name)
         return 401, None
 
-    if payload.accept_callback():
-        logger.info("GitHub Hook: Processing hook '%s' for project '%s'", event, payload.repository.full_name)
-        await payload.process_callback()
-    else:
-        logger.info(
-            "GitHub Hook: Ignored hook '%s' for project '%s', conditions for acceptance not met.",
-            event,
-            payload.repository.full_name,
+    if event not in RECORDED_EVENTS:
+        logger.info("GitHub Hook: Ignored unhandled hook '%s' for project '%s'", event, payload.repository.full_name)
+        return 204, None
+
+    try:
+        await arecord_delivery(
+            platform=PlatformType.GITHUB,
+            event=event,
+            repo_id=payload.repository.full_name,
+            payload=json.loads(request.body),
+        )
+    except DatabaseError:
+        logger.exception(
+            "GitHub Hook: Failed to record hook '%s' for project '%s'", event, payload.repository.full_name
         )
+        return 503, None
+
+    logger.info("GitHub Hook: Recorded hook '%s' for project '%s'", event, payload.repository.full_name)
     return 204, None
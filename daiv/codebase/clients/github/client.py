@@ -4,6 +4,7 @@ import logging
 import tempfile
 from contextlib import contextmanager
 from functools import cached_property
+from itertools import chain, islice
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -27,6 +28,7 @@ from codebase.base import (
     User,
 )
 from codebase.clients import RepoClient
+from codebase.clients.aio import AsyncAPIClient
 from codebase.clients.base import Emoji, WebhookSetupResult
 from codebase.exceptions import CloneRefNotFoundError
 from core.utils import async_download_url, is_git_ref_not_found_text
@@ -105,13 +107,27 @@ class GitHubClient(RepoClient):
         Returns:
             The list of repositories.
         """
+        return list(islice(chain.from_iterable(self.iter_repository_pages(search=search, topics=topics)), limit))
+
+    def iter_repository_pages(
+        self, search: str | None = None, topics: list[str] | None = None, page_size: int = 100
+    ) -> Iterator[list[Repository]]:
+        """
+        Yield the installation's repositories ``page_size`` at a time, filtered as they stream by.
+
+        ``search`` and ``topics`` have no server-side equivalent on the installation listing, so they
+        are matched in memory per repository.
+        """
         # No dedup pass (cf. the GitLab client): get_repos() lists the installation's repositories
         # without a mutable-key ordering, so it has no structural source of duplicate slugs.
-        repos: list[Repository] = []
+        search_lower = search.lower() if search else None
+        page: list[Repository] = []
         for repo in self.client_installation.get_repos():
             if topics is not None and not any(topic in repo.topics for topic in topics):
                 continue
-            repos.append(
+            if search_lower and search_lower not in repo.name.lower() and search_lower not in repo.full_name.lower():
+                continue
+            page.append(
                 Repository(
                     pk=repo.id,
                     slug=repo.full_name,
@@ -123,15 +139,11 @@ class GitHubClient(RepoClient):
                     html_url=repo.html_url,
                 )
             )
-            # Break early only when no search filter needs full scan
-            if limit is not None and search is None and len(repos) >= limit:
-                break
-        if search:
-            search_lower = search.lower()
-            repos = [r for r in repos if search_lower in r.name.lower() or search_lower in r.slug.lower()]
-            if limit is not None:
-                repos = repos[:limit]
-        return repos
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
 
     def list_repository_members(self, repo_id: str) -> list[RepoMember]:
         """
@@ -817,6 +829,88 @@ class GitHubClient(RepoClient):
         user = self.client.get_user(f"{self.client_installation.app_slug}[bot]")
         return User(id=user.id, username=self.client_installation.app_slug, name=user.name)
 
+    # Async
+    @cached_property
+    def async_api(self) -> AsyncAPIClient:
+        requester = self.client.requester
+        # The installation token is read per request: PyGithub renews it shortly before it expires.
+        return AsyncAPIClient(
+            requester.base_url,
+            lambda: {
+                "Authorization": f"Bearer {requester.auth.token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+        )
+
+    async def aget_issue_comment(self, repo_id: str, issue_id: int, comment_id: str) -> Discussion:
+        # Comment ids are repository-wide, so one request fetches it without going through the issue.
+        comment = await self.async_api.get(f"repos/{repo_id}/issues/comments/{int(comment_id)}")
+        return Discussion(id=str(comment_id), notes=self._serialize_comment_payloads([comment]))
+
+    async def acreate_issue_emoji(self, repo_id: str, issue_id: int, emoji: Emoji, note_id: int | None = None):
+        if not (emoji_reaction := EMOJI_MAP.get(emoji)):
+            raise ValueError(f"Unsupported emoji: {emoji}")
+
+        if note_id is not None:
+            target = f"repos/{repo_id}/issues/comments/{note_id}/reactions"
+        else:
+            target = f"repos/{repo_id}/issues/{issue_id}/reactions"
+        # GitHub answers an existing reaction with 200 rather than an error, so this is idempotent.
+        await self.async_api.post(target, json={"content": emoji_reaction})
+
+    async def ahas_issue_reaction(self, repo_id: str, issue_id: int, emoji: Emoji) -> bool:
+        if not (emoji_reaction := EMOJI_MAP.get(emoji)):
+            raise ValueError(f"Unsupported emoji: {emoji}")
+
+        current_user_id = (await self.acurrent_user()).id
+        async for reaction in self.async_api.paginate(
+            f"repos/{repo_id}/issues/{issue_id}/reactions", params={"content": emoji_reaction}
+        ):
+            if reaction["user"]["id"] == current_user_id:
+                return True
+        return False
+
+    async def aget_merge_request_comment(self, repo_id: str, merge_request_id: int, comment_id: str) -> Discussion:
+        comment = await self.async_api.get(f"repos/{repo_id}/issues/comments/{int(comment_id)}")
+        return Discussion(
+            id=str(comment_id), notes=self._serialize_comment_payloads([comment], from_merge_request=True)
+        )
+
+    async def aget_merge_request_by_branches(self, repo_id: str, source_branch: str) -> MergeRequest | None:
+        owner = repo_id.split("/", 1)[0]
+        params = {"state": "open", "head": f"{owner}:{source_branch}", "sort": "created", "direction": "asc"}
+        pr = None
+        # As in the sync lookup: re-check head.ref, take the first match and peek one more for duplicates.
+        async for candidate in self.async_api.paginate(f"repos/{repo_id}/pulls", params=params):
+            if candidate["head"]["ref"] != source_branch:
+                continue
+            if pr is not None:
+                logger.warning(
+                    "Multiple open PRs for head %s in %s; using the oldest (#%s).", source_branch, repo_id, pr["number"]
+                )
+                break
+            pr = candidate
+        if pr is None:
+            return None
+        return MergeRequest(
+            repo_id=repo_id,
+            merge_request_id=pr["number"],
+            source_branch=pr["head"]["ref"],
+            target_branch=pr["base"]["ref"],
+            title=pr["title"],
+            description=pr["body"] or "",
+            labels=[label["name"] for label in pr["labels"]],
+            web_url=pr["html_url"],
+            sha=pr["head"]["sha"],
+            # The simple user object carries no display name.
+            author=User(id=pr["user"]["id"], username=pr["user"]["login"], name=pr["user"].get("name")),
+            draft=pr["draft"],
+        )
+
+    async def acreate_merge_request_note_emoji(self, repo_id: str, merge_request_id: int, emoji: Emoji, note_id: int):
+        await self.acreate_issue_emoji(repo_id, issue_id=merge_request_id, emoji=emoji, note_id=note_id)
+
     def _serialize_comments(self, comments: list[IssueComment], from_merge_request: bool = False) -> list[Note]:
         """
         Get the notes of an issue or a merge request.
@@ -838,3 +932,27 @@ class GitHubClient(RepoClient):
             )
             for note in comments
         ]
+
+    def _serialize_comment_payloads(self, comments: list[dict], from_merge_request: bool = False) -> list[Note]:
+        """
+        :meth:`_serialize_comments` for raw REST payloads.
+
+        The comment's ``user`` is the simple user object, which carries no display name; fetching it
+        would cost a request per author for a field no caller reads, so ``name`` stays unset.
+        """
+        return [
+            Note(
+                id=comment["id"],
+                body=comment["body"],
+                type=NoteType.DISCUSSION_NOTE,
+                noteable_type=NoteableType.MERGE_REQUEST if from_merge_request else NoteableType.ISSUE,
+                system=False,
+                resolvable=False,
+                resolved=False,
+                author=User(
+                    id=comment["user"]["id"], username=comment["user"]["login"], name=comment["user"].get("name")
+                ),
+                position=None,
+            )
+            for comment in comments
+        ]
@@ -1,8 +1,9 @@
 import logging
-from functools import cached_property
 from typing import Any, Literal
 
+import httpx
 from gitlab.exceptions import GitlabError
+from pydantic import TypeAdapter
 from sandbox_envs.services import resolve_env_for_run
 from sessions.models import SessionOrigin
 from sessions.services import acreate_run
@@ -10,6 +11,7 @@ from sessions.services import acreate_run
 from accounts.utils import resolve_user
 from codebase.api.callbacks import BaseCallback
 from codebase.base import Scope
+from codebase.base import User as BaseUser
 from codebase.clients import RepoClient
 from codebase.clients.base import Emoji
 from codebase.repo_config import RepositoryConfig
@@ -49,7 +51,7 @@ class IssueCallback(BaseCallback):
         self._repo_config = RepositoryConfig.get_config(self.project.path_with_namespace)
         self._client = RepoClient.create_instance()
 
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         # Check basic conditions
         if not (
             self._repo_config.issue_addressing.enabled
@@ -71,7 +73,9 @@ class IssueCallback(BaseCallback):
             return False
 
         # Check if DAIV has already reacted to the issue (prevents re-launching when label is removed and re-added)
-        if self._client.has_issue_reaction(self.project.path_with_namespace, self.object_attributes.iid, Emoji.EYES):
+        if await self._client.ahas_issue_reaction(
+            self.project.path_with_namespace, self.object_attributes.iid, Emoji.EYES
+        ):
             logger.info(
                 "Skipping issue %s#%s: DAIV has already reacted to this issue",
                 self.project.path_with_namespace,
@@ -109,8 +113,10 @@ class IssueCallback(BaseCallback):
         Trigger the task to address the issue.
         """
         try:
-            self._client.create_issue_emoji(self.project.path_with_namespace, self.object_attributes.iid, Emoji.EYES)
-        except GitlabError, OSError:
+            await self._client.acreate_issue_emoji(
+                self.project.path_with_namespace, self.object_attributes.iid, Emoji.EYES
+            )
+        except GitlabError, httpx.HTTPError, OSError:
             logger.exception("Failed to add reaction to issue %s", self.object_attributes.iid)
         thread_id = compute_thread_id(
             repo_slug=self.project.path_with_namespace, scope=Scope.ISSUE, entity_iid=self.object_attributes.iid
@@ -162,17 +168,20 @@ class NoteCallback(BaseCallback):
         self._repo_config = RepositoryConfig.get_config(self.project.path_with_namespace)
         self._client = RepoClient.create_instance()
 
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         """
         Check if the webhook is accepted.
         """
         if (
             self.object_attributes.noteable_type not in [NoteableType.ISSUE, NoteableType.MERGE_REQUEST]
             or self.object_attributes.system
-            or self.user.id == self._client.current_user.id
         ):
             return False
 
+        current_user = await self._client.acurrent_user()
+        if self.user.id == current_user.id:
+            return False
+
         # Check if user is allowed to interact with DAIV
         if not self._repo_config.is_user_allowed(self.user.username):
             logger.info(
@@ -182,7 +191,7 @@ class NoteCallback(BaseCallback):
             )
             return False
 
-        return bool(self._is_issue_comment or self._is_merge_request_comment)
+        return self._is_issue_comment(current_user) or self._is_merge_request_comment(current_user)
 
     async def process_callback(self):
         """
@@ -191,13 +200,14 @@ class NoteCallback(BaseCallback):
         GitLab Note Webhook is called multiple times, one per note/discussion.
         """
         daiv_user = await resolve_user("gitlab", self.user.id, username=self.user.username, email=self.user.email)
+        current_user = await self._client.acurrent_user()
 
-        if self.issue and self._is_issue_comment:
+        if self.issue and self._is_issue_comment(current_user):
             try:
-                self._client.create_issue_emoji(
+                await self._client.acreate_issue_emoji(
                     self.project.path_with_namespace, self.issue.iid, Emoji.EYES, self.object_attributes.id
                 )
-            except GitlabError, OSError:
+            except GitlabError, httpx.HTTPError, OSError:
                 logger.exception("Failed to add reaction to issue comment %s", self.object_attributes.id)
             thread_id = compute_thread_id(
                 repo_slug=self.project.path_with_namespace, scope=Scope.ISSUE, entity_iid=self.issue.iid
@@ -230,12 +240,12 @@ class NoteCallback(BaseCallback):
                     "Failed to create run for issue comment %s#%s", self.project.path_with_namespace, self.issue.iid
                 )
 
-        elif self.merge_request and self._is_merge_request_comment:
+        elif self.merge_request and self._is_merge_request_comment(current_user):
             try:
-                self._client.create_merge_request_note_emoji(
+                await self._client.acreate_merge_request_note_emoji(
                     self.project.path_with_namespace, self.merge_request.iid, Emoji.EYES, self.object_attributes.id
                 )
-            except GitlabError, OSError:
+            except GitlabError, httpx.HTTPError, OSError:
                 logger.exception("Failed to add reaction to MR comment %s", self.object_attributes.id)
             thread_id = compute_thread_id(
                 repo_slug=self.project.path_with_namespace, scope=Scope.MERGE_REQUEST, entity_iid=self.merge_request.iid
@@ -271,8 +281,7 @@ class NoteCallback(BaseCallback):
                     self.merge_request.iid,
                 )
 
-    @cached_property
-    def _is_merge_request_comment(self) -> bool:
+    def _is_merge_request_comment(self, current_user: BaseUser) -> bool:
         """
         Accept the webhook if the note is a merge request comment that mentions DAIV.
         """
@@ -283,11 +292,10 @@ class NoteCallback(BaseCallback):
             and self.object_attributes.action in [NoteAction.CREATE, NoteAction.UPDATE]
             and self.merge_request
             and self.merge_request.state == "opened"
-            and note_mentions_daiv(self.object_attributes.note, self._client.current_user)
+            and note_mentions_daiv(self.object_attributes.note, current_user)
         )
 
-    @cached_property
-    def _is_issue_comment(self) -> bool:
+    def _is_issue_comment(self, current_user: BaseUser) -> bool:
         """
         Accept the webhook if the note is an issue comment that mentions DAIV.
         """
@@ -297,7 +305,7 @@ class NoteCallback(BaseCallback):
             and self.object_attributes.action == NoteAction.CREATE
             and self.issue
             and self.issue.state == "opened"
-            and note_mentions_daiv(self.object_attributes.note, self._client.current_user)
+            and note_mentions_daiv(self.object_attributes.note, current_user)
         )
 
 
@@ -311,7 +319,7 @@ class MergeRequestCallback(BaseCallback):
     user: User
     object_attributes: MergeRequestEvent
 
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         """
         Accept the webhook only when a merge request is merged into the default branch.
         """
@@ -349,7 +357,7 @@ class PushCallback(BaseCallback):
     checkout_sha: str
     ref: str
 
-    def accept_callback(self) -> bool:
+    async def accept_callback(self) -> bool:
         """
         Accept the webhook if the push is to the default branch.
         """
@@ -360,3 +368,7 @@ class PushCallback(BaseCallback):
         Process the push webhook to invalidate the cache for the repository configurations.
         """
         RepositoryConfig.invalidate_cache(self.project.path_with_namespace)
+
+
+# What the webhook inbox validates a recorded delivery into, in the order the endpoint used to try them.
+WEBHOOK_CALLBACKS = TypeAdapter(IssueCallback | MergeRequestCallback | NoteCallback | PushCallback)
@@ -229,3 +229,12 @@ class MergeRequestEvent(BaseModel):
     target_branch: str
     author_id: int
     merged_at: str | None = None
+
+
+class WebhookEnvelope(BaseModel):
+    """
+    The part of a Gitlab webhook the endpoint needs to verify and record it; the inbox validates the rest.
+    """
+
+    object_kind: str
+    project: Project
@@ -1,24 +1,39 @@
+import json
 import logging
 
+from django.db import DatabaseError
+
 from codebase.api.callbacks import UnprocessableEntityResponse
 from codebase.api.router import router
 from codebase.base import GitPlatform
 from codebase.conf import settings
+from codebase.models import PlatformType
+from codebase.webhooks import arecord_delivery
 
-from .callbacks import IssueCallback, MergeRequestCallback, NoteCallback, PushCallback  # noqa: TC001
+from .models import WebhookEnvelope  # noqa: TC001
 from .security import validate_gitlab_webhook
 
 logger = logging.getLogger("daiv.webhooks")
 
+CALLBACK_RESPONSES = {204: None, 401: None, 403: None, 422: UnprocessableEntityResponse, 503: None}
+
+# The kinds the callbacks handle. Anything else is acknowledged without a record: a 4xx would count as
+# a failed delivery, and GitLab disables webhooks that keep failing.
+RECORDED_OBJECT_KINDS = frozenset({"issue", "work_item", "note", "merge_request", "push"})
 
-@router.post("/callbacks/gitlab", response={204: None, 401: None, 403: None, 422: UnprocessableEntityResponse})
-@router.post("/callbacks/gitlab/", response={204: None, 401: None, 403: None, 422: UnprocessableEntityResponse})
-async def callback(request, payload: IssueCallback | MergeRequestCallback | NoteCallback | PushCallback):
+
+@router.post("/callbacks/gitlab", response=CALLBACK_RESPONSES)
+@router.post("/callbacks/gitlab/", response=CALLBACK_RESPONSES)
+async def callback(request, payload: WebhookEnvelope):
     """
-    GitLab callback endpoint for processing callbacks.
+    GitLab callback endpoint for recording callbacks.
 
-    Validates the webhook secret before processing the callback and returns 401 Unauthorized if validation fails.
+    Validates the webhook secret before recording the callback and returns 401 Unauthorized if validation fails.
     Returns 403 Forbidden if client type is not set to GitLab.
+    Returns 503 Service Unavailable if the callback could not be recorded, so GitLab retries it.
+    Returns 204 No Content without recording events DAIV has no callback for.
+
+    The callback is processed asynchronously from the webhook inbox (see ``codebase.webhooks``).
     """
     if settings.CLIENT != GitPlatform.GITLAB:
         logger.warning("GitLab Hook: Client type is not set to GitLab, skipping callback.")
@@ -28,13 +43,22 @@ async def callback(request, payload: IssueCallback | MergeRequestCallback | Note
         logger.warning("GitLab Hook: Unauthorized webhook request for project %d", payload.project.id)
         return 401, None
 
-    if payload.accept_callback():
-        logger.info("GitLab Hook: Processing hook '%s' for project %d", payload.object_kind, payload.project.id)
-        await payload.process_callback()
-    else:
-        logger.info(
-            "GitLab Hook: Ignored hook '%s' for project %d, conditions for acceptance not met.",
-            payload.object_kind,
-            payload.project.id,
+    if payload.object_kind not in RECORDED_OBJECT_KINDS:
+        logger.info("GitLab Hook: Ignored unhandled hook '%s' for project %d", payload.object_kind, payload.project.id)
+        return 204, None
+
+    try:
+        await arecord_delivery(
+            platform=PlatformType.GITLAB,
+            event=payload.object_kind,
+            repo_id=payload.project.path_with_namespace,
+            payload=json.loads(request.body),
+        )
+    except DatabaseError:
+        logger.exception(
+            "GitLab Hook: Failed to record hook '%s' for project %d", payload.object_kind, payload.project.id
         )
+        return 503, None
+
+    logger.info("GitLab Hook: Recorded hook '%s' for project %d", payload.object_kind, payload.project.id)
     return 204, None
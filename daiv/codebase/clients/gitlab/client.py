@@ -6,11 +6,14 @@ import tempfile
 import time
 from contextlib import contextmanager
 from functools import cached_property
+from itertools import chain, islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
+from urllib.parse import quote
 
 from django.core.exceptions import ImproperlyConfigured
 
+import httpx
 from git import GitCommandError, Repo
 from gitlab import Gitlab, GitlabCreateError, GitlabOperationError
 from gitlab.const import AccessLevel
@@ -35,6 +38,7 @@ from codebase.base import (
     User,
 )
 from codebase.clients import RepoClient
+from codebase.clients.aio import AsyncAPIClient
 from codebase.clients.gitlab.clone_tokens import get_ephemeral_clone_token, invalidate_clone_token
 from codebase.exceptions import CloneRefNotFoundError, MergeRequestBranchNotVisibleError
 from core.constants import BOT_NAME
@@ -102,13 +106,21 @@ def _is_source_branch_missing_error(error: GitlabCreateError) -> bool:
     return "source_branch" in body and "does not exist" in body
 
 
+AWARD_EMOJI_TAKEN_MESSAGE = "Award Emoji Name has already been taken"
+
+
 def _is_award_emoji_taken_error(error: GitlabCreateError) -> bool:
     """True when GitLab rejected the award because this user already made it.
 
     Reported as `404 Award Emoji Name has already been taken`. Stringifies the body so it matches
     whether python-gitlab surfaced ``error_message`` as the parsed dict or as a str.
     """
-    return error.response_code == 404 and "Award Emoji Name has already been taken" in str(error.error_message)
+    return error.response_code == 404 and AWARD_EMOJI_TAKEN_MESSAGE in str(error.error_message)
+
+
+def _is_award_emoji_taken_response(response: httpx.Response) -> bool:
+    """The :func:`_is_award_emoji_taken_error` check for a raw API response."""
+    return response.status_code == 404 and AWARD_EMOJI_TAKEN_MESSAGE in response.text
 
 
 def _create_award_emoji(target: AwardEmojiTarget, emoji: Emoji):
@@ -199,36 +211,60 @@ class GitLabClient(RepoClient):
         Returns:
             The list of repositories.
         """
+        page_size = min(limit, 100) if limit is not None else 100
+        pages = self._iter_project_pages(
+            search=search, topics=topics, page_size=page_size, ordering={"order_by": "last_activity_at", "sort": "desc"}
+        )
+        return list(islice(chain.from_iterable(pages), limit))
+
+    def iter_repository_pages(
+        self, search: str | None = None, topics: list[str] | None = None, page_size: int = 100
+    ) -> Iterator[list[Repository]]:
+        """
+        Yield the maintainer-accessible, non-archived projects ``page_size`` at a time, in project id
+        order. Each API page is fetched only when the previous one has been consumed.
+
+        The walk may span a whole access sync, so it is keyset-paginated on the immutable id: a
+        project that sees activity mid-walk cannot move onto a page already consumed and be missed.
+        """
+        return self._iter_project_pages(
+            search=search,
+            topics=topics,
+            page_size=page_size,
+            ordering={"order_by": "id", "sort": "asc", "pagination": "keyset"},
+        )
+
+    def _iter_project_pages(
+        self, *, search: str | None, topics: list[str] | None, page_size: int, ordering: dict[str, str]
+    ) -> Iterator[list[Repository]]:
         optional_kwargs: dict[str, Any] = {}
         if search:
             optional_kwargs["search"] = search
             optional_kwargs["search_namespaces"] = True
         if topics:
             optional_kwargs["topic"] = ",".join(topics)
-        if limit is not None:
-            optional_kwargs["per_page"] = min(limit, 100)
-
-        # The listing is ordered by a mutable key (last_activity_at), so a paginated iterator can
-        # surface the same project on two pages when its activity shifts mid-iteration. Dedupe by
-        # slug as we go — in-loop rather than a post-hoc pass so `limit` bounds unique repos and the
-        # early break is preserved. Callers rely on one entry per slug (see abstract list_repositories).
-        repos: list[Repository] = []
+
+        # Ordered by a mutable key (last_activity_at), a paginated iterator can surface the same
+        # project on two pages when its activity shifts mid-iteration. Dedupe by slug as we go —
+        # across pages, so a consumer never sees a slug twice (callers rely on one entry per slug,
+        # see abstract list_repositories). Only the slugs are kept, not the objects.
         seen: set[str] = set()
+        page: list[Repository] = []
         for project in self.client.projects.list(
             iterator=True,
+            per_page=page_size,
             archived=False,
             simple=True,
             membership=True,
             min_access_level=40,  # 40 is the access level for the maintainer role
-            order_by="last_activity_at",
-            sort="desc",
+            **ordering,
             **optional_kwargs,
         ):
             slug = project.path_with_namespace
             if slug in seen:
                 continue
             seen.add(slug)
-            repos.append(
+            page.append(
                 Repository(
                     pk=cast("int", project.get_id()),
                     slug=slug,
@@ -240,9 +276,11 @@ class GitLabClient(RepoClient):
                     topics=project.topics,
                 )
             )
-            if limit is not None and len(repos) >= limit:
-                break
-        return repos
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
 
     def list_repository_members(self, repo_id: str) -> list[RepoMember]:
         """
@@ -1111,6 +1149,100 @@ class GitLabClient(RepoClient):
             return User(id=user.id, username=user.username, name=user.name)
         raise ValueError("Couldn't get current user profile")
 
+    # Async
+    @cached_property
+    def async_api(self) -> AsyncAPIClient:
+        token = self.client.private_token
+        return AsyncAPIClient(self.client.api_url, lambda: {"PRIVATE-TOKEN": token})
+
+    @staticmethod
+    def _project_path(repo_id: str) -> str:
+        """The ``projects/:id`` path segment; a ``group/project`` slug must be URL-encoded."""
+        return f"projects/{quote(str(repo_id), safe='')}"
+
+    async def aget_issue_comment(self, repo_id: str, issue_id: int, comment_id: str) -> Discussion:
+        discussion = await self.async_api.get(
+            f"{self._project_path(repo_id)}/issues/{issue_id}/discussions/{comment_id}"
+        )
+        return Discussion(
+            id=comment_id, notes=self._serialize_notes(discussion["notes"], [None], only_resolvable=False)
+        )
+
+    async def acreate_issue_emoji(self, repo_id: str, issue_id: int, emoji: Emoji, note_id: int | None = None):
+        target = f"{self._project_path(repo_id)}/issues/{issue_id}"
+        if note_id is not None:
+            target = f"{target}/notes/{note_id}"
+        await self._acreate_award_emoji(target, emoji)
+
+    async def ahas_issue_reaction(self, repo_id: str, issue_id: int, emoji: Emoji) -> bool:
+        current_user_id = (await self.acurrent_user()).id
+        async for award_emoji in self.async_api.paginate(
+            f"{self._project_path(repo_id)}/issues/{issue_id}/award_emoji"
+        ):
+            if award_emoji["name"] == emoji and award_emoji["user"]["id"] == current_user_id:
+                return True
+        return False
+
+    async def aget_merge_request_comment(self, repo_id: str, merge_request_id: int, comment_id: str) -> Discussion:
+        discussion = await self.async_api.get(
+            f"{self._project_path(repo_id)}/merge_requests/{merge_request_id}/discussions/{comment_id}"
+        )
+        return Discussion(
+            id=discussion["id"], notes=self._serialize_notes(discussion["notes"], [None], only_resolvable=False)
+        )
+
+    async def aget_merge_request_by_branches(self, repo_id: str, source_branch: str) -> MergeRequest | None:
+        merge_requests = await self.async_api.get(
+            f"{self._project_path(repo_id)}/merge_requests",
+            params={
+                "source_branch": source_branch,
+                "state": "opened",
+                "order_by": "created_at",
+                "sort": "asc",
+                "per_page": 2,
+            },
+        )
+        if not merge_requests:
+            return None
+        merge_request = merge_requests[0]
+        if len(merge_requests) > 1:
+            logger.warning(
+                "Multiple open MRs for source branch %s in %s; using the oldest (!%s).",
+                source_branch,
+                repo_id,
+                merge_request["iid"],
+            )
+        return MergeRequest(
+            repo_id=repo_id,
+            merge_request_id=merge_request["iid"],
+            source_branch=merge_request["source_branch"],
+            target_branch=merge_request["target_branch"],
+            title=merge_request["title"],
+            description=merge_request["description"] or "",
+            labels=merge_request["labels"],
+            web_url=merge_request["web_url"],
+            sha=merge_request["sha"],
+            author=User(
+                id=merge_request["author"]["id"],
+                username=merge_request["author"]["username"],
+                name=merge_request["author"]["name"],
+            ),
+            draft=merge_request["draft"],
+        )
+
+    async def acreate_merge_request_note_emoji(self, repo_id: str, merge_request_id: int, emoji: Emoji, note_id: int):
+        await self._acreate_award_emoji(
+            f"{self._project_path(repo_id)}/merge_requests/{merge_request_id}/notes/{note_id}", emoji
+        )
+
+    async def _acreate_award_emoji(self, target: str, emoji: Emoji):
+        """Async :func:`_create_award_emoji`: award ``emoji`` on the ``target`` resource path, idempotently."""
+        try:
+            await self.async_api.post(f"{target}/award_emoji", json={"name": emoji})
+        except httpx.HTTPStatusError as e:
+            if not _is_award_emoji_taken_response(e.response):
+                raise
+
     def _get_issue_notes(self, repo_id: str, issue_id: int) -> list[Note]:
         """
         Get the notes of an issue.
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import tempfile
+import threading
 from contextlib import contextmanager
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -31,6 +33,29 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("daiv.clients")
 
+# One lock per clone-cache entry, shared by every client in the process: concurrent evaluation
+# workers asking for the same repository or commit wait for one clone instead of racing it.
+_cache_locks: dict[Path, threading.Lock] = {}
+_cache_locks_guard = threading.Lock()
+
+
+def _cache_lock(path: Path) -> threading.Lock:
+    with _cache_locks_guard:
+        return _cache_locks.setdefault(path, threading.Lock())
+
+
+def _link_or_copy(prepared: Path, src: str, dst: str) -> None:
+    """Hardlink the git objects of the ``prepared`` clone, which are never modified once written, and
+    copy everything else (the working tree may have its own ``objects`` directories)."""
+    if Path(src).is_relative_to(prepared / ".git" / "objects"):
+        try:
+            os.link(src, dst)
+        except OSError:
+            pass
+        else:
+            return
+    shutil.copy2(src, dst)
+
 
 class SWERepoClient(RepoClient):
     """
@@ -39,12 +64,17 @@ class SWERepoClient(RepoClient):
     This client is designed for SWE-bench style evaluations where repositories
     are cloned temporarily and cleaned up after use. It does not support
     issue/MR/CI operations as those are not needed for SWE-bench evaluations.
+
+    With a ``clone_cache_dir``, each repository is fetched once into a bare clone there and
+    each (repository, commit) is checked out and sanitized once; every ``load_repo`` then gets
+    its own copy of that prepared clone, so instances sharing a repository or base commit skip
+    the network clone and the history sanitization.
     """
 
     client: None = None  # No API client needed
     git_platform = GitPlatform.SWE
 
-    def __init__(self, repo_host: str | None = None):
+    def __init__(self, repo_host: str | None = None, clone_cache_dir: str | Path | None = None):
         """
         Initialize the SWE client.
 
@@ -54,8 +84,11 @@ class SWERepoClient(RepoClient):
                 kwargs — callers like ``GitMiddleware`` only know the run's platform and
                 never clone. Cloning paths (:meth:`get_repository`) fail fast without it
                 rather than silently defaulting to a host.
+            clone_cache_dir: Directory to keep bare and prepared clones in across
+                ``load_repo`` calls (and clients). ``None`` clones from the remote every time.
         """
         self.repo_host = repo_host
+        self.clone_cache_dir = Path(clone_cache_dir) if clone_cache_dir is not None else None
         self._loaded_repo: Repo | None = None
 
     def get_repository(self, repo_id: str) -> Repository:
@@ -208,17 +241,16 @@ class SWERepoClient(RepoClient):
             The repository object cloned to the temporary directory.
         """
         with tempfile.TemporaryDirectory(prefix=f"{safe_slug(repository.slug)}-{repository.pk}") as tmpdir:
-            logger.debug("Cloning repository %s to %s", repository.clone_url, tmpdir)
-
             clone_dir = Path(tmpdir) / "repo"
-            clone_dir.mkdir(parents=True, exist_ok=True)
-            # Clone the repository without depth restriction to ensure the specific commit is available
-            # For SWE-bench, we often need specific historical commits, so a full clone is necessary
-            repo = Repo.clone_from(repository.clone_url, clone_dir)
-            # Detach so the base commit is never tied to a branch ref — branch refs are
-            # removed by the sanitization below.
-            repo.git.checkout("--detach", sha)
-            self._sanitize_history(repo)
+            if self.clone_cache_dir is None:
+                logger.debug("Cloning repository %s to %s", repository.clone_url, tmpdir)
+                clone_dir.mkdir(parents=True, exist_ok=True)
+                repo = self._clone(repository.clone_url, clone_dir, sha)
+            else:
+                prepared = self.prepare_clone(repository, sha)
+                logger.debug("Copying prepared clone %s to %s", prepared, tmpdir)
+                shutil.copytree(prepared, clone_dir, symlinks=True, copy_function=partial(_link_or_copy, prepared))
+                repo = Repo(clone_dir)
 
             # Store instance variable for reuse by other methods
             self._loaded_repo = repo
@@ -229,6 +261,57 @@ class SWERepoClient(RepoClient):
                 # Clear instance variable when context exits
                 self._loaded_repo = None
 
+    def prepare_clone(self, repository: Repository, sha: str) -> Path:
+        """
+        Return the cached clone of ``repository`` checked out and sanitized at ``sha``, preparing it
+        on first use.
+
+        Blocking and thread-safe: evaluation runners can call it from worker threads ahead of
+        ``load_repo`` so a cold cache never stalls their event loop.
+
+        Raises:
+            RuntimeError: If the client has no ``clone_cache_dir``.
+        """
+        if self.clone_cache_dir is None:
+            raise RuntimeError("SWERepoClient was constructed without clone_cache_dir.")
+
+        slug = safe_slug(repository.slug)
+        entry = self.clone_cache_dir / f"{slug}@{sha}"
+        with _cache_lock(entry):
+            marker = entry / ".prepared"
+            if not marker.exists():
+                # A leftover from a preparation that was interrupted midway.
+                shutil.rmtree(entry, ignore_errors=True)
+                entry.mkdir(parents=True)
+                self._clone(str(self._bare_clone(repository, slug)), entry / "repo", sha)
+                marker.touch()
+        return entry / "repo"
+
+    def _bare_clone(self, repository: Repository, slug: str) -> Path:
+        """The cached bare clone of ``repository``, fetched from the remote once per cache. Its branches
+        and tags are what a direct clone would fetch; pull-request refs are left out."""
+        assert self.clone_cache_dir is not None
+        bare = self.clone_cache_dir / f"{slug}.git"
+        with _cache_lock(bare):
+            marker = self.clone_cache_dir / f"{slug}.git.fetched"
+            if not marker.exists():
+                logger.debug("Fetching repository %s to %s", repository.clone_url, bare)
+                shutil.rmtree(bare, ignore_errors=True)
+                Repo.clone_from(repository.clone_url, bare, bare=True)
+                marker.touch()
+        return bare
+
+    @classmethod
+    def _clone(cls, source: str, clone_dir: Path, sha: str) -> Repo:
+        # Clone the repository without depth restriction to ensure the specific commit is available
+        # For SWE-bench, we often need specific historical commits, so a full clone is necessary
+        repo = Repo.clone_from(source, clone_dir)
+        # Detach so the base commit is never tied to a branch ref — branch refs are
+        # removed by the sanitization below.
+        repo.git.checkout("--detach", sha)
+        cls._sanitize_history(repo)
+        return repo
+
     @staticmethod
     def _sanitize_history(repo: Repo) -> None:
         """
@@ -20,6 +20,14 @@ class CodebaseSettings(BaseSettings):
         default="*/5 * * * *", description="Cron expression for periodic webhook setup (GitLab only)"
     )
 
+    WEBHOOK_INBOX_SWEEP_CRON: str = Field(
+        default="* * * * *",
+        description="Cron expression for the webhook inbox sweep that recovers and prunes recorded deliveries",
+    )
+    WEBHOOK_INBOX_RETENTION_DAYS: int = Field(
+        default=7, description="Days a processed, ignored or failed webhook delivery is kept in the inbox"
+    )
+
     REPO_ACCESS_SYNC_CRON: str = Field(
         default="*/15 * * * *", description="Cron expression for the periodic repository access sync"
     )
@@ -27,6 +35,12 @@ class CodebaseSettings(BaseSettings):
         default=24,
         description="Deny non-admin access to a repository when its synced access data is older than this many hours",
     )
+    REPO_ACCESS_VISIBILITY_CACHE_SECONDS: int = Field(
+        default=300,
+        description=(
+            "Seconds a user's resolved repository access is cached; a finished access sync invalidates it immediately"
+        ),
+    )
 
     # GitHub
     GITHUB_URL: HttpUrl | None = Field(default=None, description="URL of the GitHub instance")
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from git import Repo  # noqa: TC002
 
+from automation.agent.phase_timings import Phase, phase
 from codebase.base import GitPlatform, Issue, MergeRequest, Repository, Scope  # noqa: TC001
 from codebase.clients import RepoClient
 from codebase.exceptions import CloneRefNotFoundError, SingleRepoRequiredError
@@ -137,22 +138,24 @@ def _load_repo_with_optional_fallback(
     and unwinds the ``finally`` teardown, never the fallback branch. When ``fallback`` is False,
     or the missing ref already *is* the default branch, the ``CloneRefNotFoundError`` propagates.
     """
-    try:
-        cm = repo_client.load_repo(repository, sha=ref)
-        repo = cm.__enter__()
-        effective_ref = ref
-    except CloneRefNotFoundError:
-        if not fallback or ref == default_branch:
-            raise
-        logger.warning(
-            "Clone of %s failed because ref %r no longer exists on the remote; falling back to the default branch %r.",
-            repository.slug,
-            ref,
-            default_branch,
-        )
-        cm = repo_client.load_repo(repository, sha=default_branch)
-        repo = cm.__enter__()
-        effective_ref = default_branch
+    with phase(Phase.CLONE):
+        try:
+            cm = repo_client.load_repo(repository, sha=ref)
+            repo = cm.__enter__()
+            effective_ref = ref
+        except CloneRefNotFoundError:
+            if not fallback or ref == default_branch:
+                raise
+            logger.warning(
+                "Clone of %s failed because ref %r no longer exists on the remote; "
+                "falling back to the default branch %r.",
+                repository.slug,
+                ref,
+                default_branch,
+            )
+            cm = repo_client.load_repo(repository, sha=default_branch)
+            repo = cm.__enter__()
+            effective_ref = default_branch
     try:
         yield repo, effective_ref
     finally:
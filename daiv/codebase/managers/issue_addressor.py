@@ -6,6 +6,7 @@ from django.template.loader import render_to_string
 from langchain_core.messages import HumanMessage
 
 from automation.agent.graph import create_daiv_agent
+from automation.agent.phase_timings import Phase, phase
 from automation.agent.usage_tracking import build_usage_summary, track_usage_metadata
 from automation.agent.utils import build_langsmith_config, extract_text_content, get_daiv_agent_kwargs
 from automation.agent.validators import AgentConfigurationError
@@ -87,7 +88,7 @@ class IssueAddressorManager(BaseManager):
 
         if self.mention_comment_id:
             # The issue was triggered by a mention in a comment, so we need to add the comment to the messages.
-            mention_comment = self.client.get_issue_comment(
+            mention_comment = await self.client.aget_issue_comment(
                 self.ctx.repository.slug, self.issue.iid, self.mention_comment_id
             )
             latest_comment = mention_comment.notes[-1]
@@ -118,9 +119,10 @@ class IssueAddressorManager(BaseManager):
                     reply_to_id=self.mention_comment_id if self.ctx.git_platform == GitPlatform.GITLAB else None,
                 )
                 return
-            daiv_agent = await create_daiv_agent(
-                ctx=self.ctx, checkpointer=checkpointer, store=self.store, **agent_kwargs
-            )
+            with phase(Phase.BUILD):
+                daiv_agent = await create_daiv_agent(
+                    ctx=self.ctx, checkpointer=checkpointer, store=self.store, **agent_kwargs
+                )
             agent_config = build_langsmith_config(
                 self.ctx,
                 trigger="mention" if self.mention_comment_id else "label",
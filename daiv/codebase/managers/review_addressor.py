@@ -12,6 +12,7 @@ from unidiff import LINE_TYPE_CONTEXT, Hunk, PatchedFile
 from unidiff.patch import Line
 
 from automation.agent.graph import create_daiv_agent
+from automation.agent.phase_timings import Phase, phase
 from automation.agent.usage_tracking import build_usage_summary, track_usage_metadata
 from automation.agent.utils import build_langsmith_config, extract_text_content, get_daiv_agent_kwargs
 from automation.agent.validators import AgentConfigurationError
@@ -264,15 +265,16 @@ class CommentsAddressorManager(BaseManager):
         """
         Process comments left directly on the merge request (not in the diff or thread) that mention DAIV.
         """
-        mention_comment = self.client.get_merge_request_comment(
+        mention_comment = await self.client.aget_merge_request_comment(
             self.ctx.repository.slug, self.merge_request.merge_request_id, self.mention_comment_id
         )
 
         async with open_checkpointer() as checkpointer:
             agent_kwargs = get_daiv_agent_kwargs(model_config=self.ctx.config.models.agent)
-            daiv_agent = await create_daiv_agent(
-                ctx=self.ctx, checkpointer=checkpointer, store=self.store, **agent_kwargs
-            )
+            with phase(Phase.BUILD):
+                daiv_agent = await create_daiv_agent(
+                    ctx=self.ctx, checkpointer=checkpointer, store=self.store, **agent_kwargs
+                )
             agent_config = build_langsmith_config(
                 self.ctx,
                 trigger="mention",
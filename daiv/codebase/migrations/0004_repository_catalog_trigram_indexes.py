@@ -0,0 +1,31 @@
+from django.db import migrations
+
+# Repository search filters the catalog with ``slug__icontains`` / ``name__icontains``, which Postgres
+# runs as ``UPPER(col) LIKE UPPER(%term%)``: a leading-wildcard scan no B-tree can serve. Trigram GIN
+# indexes on the same ``UPPER`` expressions can. Postgres-only, so they are created here rather than
+# declared on the model (the SQLite test database has neither ``pg_trgm`` nor GIN).
+INDEXES = {"repo_catalog_slug_trgm": "slug", "repo_catalog_name_trgm": "name"}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("codebase", "RepositoryCatalog")._meta.db_table
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (UPPER({column}) gin_trgm_ops)"  # noqa: S608
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [("codebase", "0003_repository_catalog")]
+
+    operations = [migrations.RunPython(create_trigram_indexes, drop_trigram_indexes)]
@@ -0,0 +1,59 @@
+# Generated by Django 6.0.6 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+import django_extensions.db.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [("codebase", "0004_repository_catalog_trigram_indexes")]
+
+    operations = [
+        migrations.CreateModel(
+            name="WebhookDelivery",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name="modified"),
+                ),
+                (
+                    "platform",
+                    models.CharField(
+                        choices=[("gitlab", "GitLab"), ("github", "GitHub")], max_length=10, verbose_name="platform"
+                    ),
+                ),
+                ("event", models.CharField(max_length=64, verbose_name="event")),
+                ("repo_id", models.CharField(max_length=255, verbose_name="repository ID")),
+                ("payload", models.JSONField(verbose_name="payload")),
+                ("coalesce_key", models.CharField(blank=True, max_length=255, verbose_name="coalesce key")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("processed", "Processed"),
+                            ("superseded", "Superseded"),
+                            ("ignored", "Ignored"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="status",
+                    ),
+                ),
+                ("processed_at", models.DateTimeField(blank=True, null=True, verbose_name="processed at")),
+                ("error", models.TextField(blank=True, verbose_name="error")),
+            ],
+            options={
+                "verbose_name": "Webhook Delivery",
+                "verbose_name_plural": "Webhook Deliveries",
+                "indexes": [models.Index(fields=["repo_id", "status", "created"], name="webhook_delivery_inbox_idx")],
+            },
+        )
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def populate_merge_daily_stats(apps, schema_editor):
+    """Roll up the merge metrics recorded before the rollup existed; later ones refresh it as they are saved."""
+    MergeMetric = apps.get_model("codebase", "MergeMetric")
+    MergeDailyStats = apps.get_model("codebase", "MergeDailyStats")
+
+    rows = (
+        MergeMetric.objects
+        .order_by()
+        .values(day=TruncDate("merged_at"))
+        .annotate(
+            n_merges=models.Count("id"),
+            n_daiv_merges=models.Count("id", filter=models.Q(daiv_commits__gt=0)),
+            sum_lines_added=models.Sum("lines_added"),
+            sum_lines_removed=models.Sum("lines_removed"),
+            sum_total_commits=models.Sum("total_commits"),
+            sum_daiv_commits=models.Sum("daiv_commits"),
+        )
+    )
+    MergeDailyStats.objects.bulk_create(
+        (
+            MergeDailyStats(
+                day=row["day"],
+                merges=row["n_merges"],
+                daiv_merges=row["n_daiv_merges"],
+                lines_added=row["sum_lines_added"],
+                lines_removed=row["sum_lines_removed"],
+                total_commits=row["sum_total_commits"],
+                daiv_commits=row["sum_daiv_commits"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [("codebase", "0005_webhookdelivery")]
+
+    operations = [
+        migrations.CreateModel(
+            name="MergeDailyStats",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day", models.DateField(unique=True, verbose_name="day")),
+                ("merges", models.PositiveIntegerField(default=0, verbose_name="merges")),
+                ("daiv_merges", models.PositiveIntegerField(default=0, verbose_name="DAIV merges")),
+                ("lines_added", models.PositiveIntegerField(default=0, verbose_name="lines added")),
+                ("lines_removed", models.PositiveIntegerField(default=0, verbose_name="lines removed")),
+                ("total_commits", models.PositiveIntegerField(default=0, verbose_name="total commits")),
+                ("daiv_commits", models.PositiveIntegerField(default=0, verbose_name="DAIV commits")),
+            ],
+            options={"verbose_name": "Merge Daily Stats", "verbose_name_plural": "Merge Daily Stats"},
+        ),
+        migrations.RunPython(populate_merge_daily_stats, migrations.RunPython.noop),
+    ]
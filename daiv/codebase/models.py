@@ -73,6 +73,30 @@ class MergeMetric(TimeStampedModel):
         super().save(*args, **kwargs)
 
 
+class MergeDailyStats(models.Model):
+    """Per-day rollup of ``MergeMetric``, backing the dashboard's velocity card.
+
+    One row per local ``day`` of ``merged_at``, recomputed from that day's merge metrics whenever
+    one of them is saved or deleted (see ``codebase.rollups``). Rebuild with
+    ``backfill_dashboard_rollups``.
+    """
+
+    day = models.DateField(_("day"), unique=True)
+    merges = models.PositiveIntegerField(_("merges"), default=0)
+    daiv_merges = models.PositiveIntegerField(_("DAIV merges"), default=0)
+    lines_added = models.PositiveIntegerField(_("lines added"), default=0)
+    lines_removed = models.PositiveIntegerField(_("lines removed"), default=0)
+    total_commits = models.PositiveIntegerField(_("total commits"), default=0)
+    daiv_commits = models.PositiveIntegerField(_("DAIV commits"), default=0)
+
+    class Meta:
+        verbose_name = _("Merge Daily Stats")
+        verbose_name_plural = _("Merge Daily Stats")
+
+    def __str__(self) -> str:
+        return f"{self.day}: {self.merges} merges ({self.daiv_merges} DAIV)"
+
+
 def _hard_ttl_cutoff():
     """Cutoff for the hard-TTL freshness window shared by RepositoryAccess and RepositoryCatalog:
     a synced row is trusted only while ``synced_at >= _hard_ttl_cutoff()``."""
@@ -190,8 +214,44 @@ class RepositoryCatalog(models.Model):
         # The unique constraint's backing index already serves the ``provider`` + ``slug`` lookups
         # (equality and the ``provider``-prefixed ``slug__in``/``icontains`` scans), so no separate
         # index is declared — unlike ``RepositoryAccess``, whose indexes cover different prefixes
-        # than its unique key.
+        # than its unique key. Search's ``icontains`` scans are served by Postgres-only trigram
+        # indexes created in migration 0004.
         constraints = [models.UniqueConstraint(fields=["provider", "slug"], name="repo_catalog_unique")]
 
     def __str__(self) -> str:
         return f"{self.provider}:{self.slug}"
+
+
+class WebhookDelivery(TimeStampedModel):
+    """A verified webhook delivery, recorded by the callback view and processed by the inbox worker.
+
+    The view only stores the payload and acknowledges; validation, repository configuration and the
+    callback's side effects run in ``process_webhook_inbox_task``. Deliveries sharing a non-empty
+    ``coalesce_key`` within a repository are coalesced when claimed: only the latest is processed and
+    the earlier ones are marked superseded (see ``codebase.webhooks``).
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        PROCESSING = "processing", _("Processing")
+        PROCESSED = "processed", _("Processed")
+        SUPERSEDED = "superseded", _("Superseded")
+        IGNORED = "ignored", _("Ignored")
+        FAILED = "failed", _("Failed")
+
+    platform = models.CharField(_("platform"), max_length=10, choices=PlatformType.choices)
+    event = models.CharField(_("event"), max_length=64)
+    repo_id = models.CharField(_("repository ID"), max_length=255)
+    payload = models.JSONField(_("payload"))
+    coalesce_key = models.CharField(_("coalesce key"), max_length=255, blank=True)
+    status = models.CharField(_("status"), max_length=10, choices=Status.choices, default=Status.PENDING)
+    processed_at = models.DateTimeField(_("processed at"), null=True, blank=True)
+    error = models.TextField(_("error"), blank=True)
+
+    class Meta:
+        verbose_name = _("Webhook Delivery")
+        verbose_name_plural = _("Webhook Deliveries")
+        indexes = [models.Index(fields=["repo_id", "status", "created"], name="webhook_delivery_inbox_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.platform}:{self.event} for {self.repo_id} ({self.status})"
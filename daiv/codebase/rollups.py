@@ -0,0 +1,78 @@
+"""Maintenance and reads of the ``MergeDailyStats`` rollup behind the dashboard's velocity card.
+
+Like ``sessions.rollups``, a day's row is recomputed from that day's merge metrics rather than
+incremented, so repeated webhook deliveries of the same merge cannot inflate it, and recomputes
+of the same day are serialized.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from codebase.models import MergeDailyStats, MergeMetric
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+REFRESH_LOCK_TIMEOUT = 60
+
+
+def _day_start(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def refresh_merge_daily_stats(days: Iterable[date]) -> None:
+    """Recompute the rollup row of each of ``days`` from its merge metrics."""
+    for day in sorted(set(days)):
+        with cache.lock(f"merge-daily-stats:{day.isoformat()}", timeout=REFRESH_LOCK_TIMEOUT):
+            stats = MergeMetric.objects.filter(
+                merged_at__gte=_day_start(day), merged_at__lt=_day_start(day + timedelta(days=1))
+            ).aggregate(
+                n_merges=Count("id"),
+                n_daiv_merges=Count("id", filter=Q(daiv_commits__gt=0)),
+                sum_lines_added=Sum("lines_added", default=0),
+                sum_lines_removed=Sum("lines_removed", default=0),
+                sum_total_commits=Sum("total_commits", default=0),
+                sum_daiv_commits=Sum("daiv_commits", default=0),
+            )
+            if stats["n_merges"]:
+                MergeDailyStats.objects.update_or_create(
+                    day=day,
+                    defaults={
+                        "merges": stats["n_merges"],
+                        "daiv_merges": stats["n_daiv_merges"],
+                        "lines_added": stats["sum_lines_added"],
+                        "lines_removed": stats["sum_lines_removed"],
+                        "total_commits": stats["sum_total_commits"],
+                        "daiv_commits": stats["sum_daiv_commits"],
+                    },
+                )
+            else:
+                MergeDailyStats.objects.filter(day=day).delete()
+
+
+def refresh_merge_daily_stats_on_commit(days: Iterable[date]) -> None:
+    """Refresh ``days`` once the current transaction commits; a failure is logged, never raised."""
+    if days := frozenset(days):
+        transaction.on_commit(lambda: refresh_merge_daily_stats(days), robust=True)
+
+
+def merge_velocity_stats(cutoff_date: date | None) -> dict:
+    """The dashboard's merge counters for merges on or after ``cutoff_date``, summed from the rollup."""
+    rollups = MergeDailyStats.objects.all()
+    if cutoff_date is not None:
+        rollups = rollups.filter(day__gte=cutoff_date)
+    return rollups.aggregate(
+        total=Sum("merges", default=0),
+        total_added=Sum("lines_added", default=0),
+        total_removed=Sum("lines_removed", default=0),
+        daiv_merges_sum=Sum("daiv_merges", default=0),
+        total_commits_sum=Sum("total_commits", default=0),
+        daiv_commits_sum=Sum("daiv_commits", default=0),
+    )
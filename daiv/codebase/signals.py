@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from allauth.socialaccount.models import SocialAccount
+
+from codebase.authorization import forget_repository_visibility
+from codebase.models import MergeMetric
+from codebase.rollups import refresh_merge_daily_stats_on_commit
+
+
+@receiver(post_save, sender=SocialAccount)
+@receiver(post_delete, sender=SocialAccount)
+def forget_visibility_on_identity_change(sender: type, instance: SocialAccount, **kwargs: Any) -> None:
+    """A linked, relinked or unlinked platform account changes which access rows the user maps to,
+    so their cached repository visibility must not outlive the change."""
+    forget_repository_visibility(instance.user_id)
+
+
+@receiver(post_save, sender=MergeMetric)
+@receiver(post_delete, sender=MergeMetric)
+def refresh_merge_daily_stats_on_change(sender: type, instance: MergeMetric, **kwargs: Any) -> None:
+    """Keep the dashboard's merge rollup in step with the metric's day."""
+    refresh_merge_daily_stats_on_commit([timezone.localdate(instance.merged_at)])
@@ -10,6 +10,7 @@ from django_tasks import task
 from github.GithubException import GithubException
 from gitlab.exceptions import GitlabError
 
+from automation.agent.phase_timings import track_phases
 from codebase.base import GitPlatform, Scope
 from codebase.clients import RepoClient
 from codebase.conf import settings as codebase_settings
@@ -18,11 +19,18 @@ from codebase.exceptions import CloneRefNotFoundError
 from core.utils import locked_task
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
+    from automation.agent.phase_timings import PhaseRecorder
     from automation.agent.results import AgentResult
-    from codebase.base import MergeRequest
+    from codebase.base import MergeRequest, Repository
 
 logger = logging.getLogger("daiv.tasks")
 
+# Repositories listed, catalogued and member-synced per step of the access sync. GitLab serves at
+# most 100 projects per API page, so larger pages would only buffer several API pages per step.
+REPO_ACCESS_SYNC_PAGE_SIZE = 100
+
 
 def _mr_comment_skip_result(response: str, merge_request: MergeRequest) -> AgentResult:
     from automation.agent.results import AgentResult
@@ -36,6 +44,13 @@ def _mr_comment_skip_result(response: str, merge_request: MergeRequest) -> Agent
     )
 
 
+def _with_phase_timings(result: AgentResult | None, phases: PhaseRecorder) -> AgentResult | None:
+    """Attach the run's phase breakdown to an addressor's result (``None`` when it ended before running)."""
+    if result is not None:
+        result["phase_timings"] = phases.summary()
+    return result
+
+
 if codebase_settings.CLIENT == GitPlatform.GITLAB:
 
     @cron(codebase_settings.WEBHOOK_SETUP_CRON)
@@ -47,6 +62,38 @@ if codebase_settings.CLIENT == GitPlatform.GITLAB:
         call_command("setup_webhooks", disable_ssl_verification=settings.DEBUG)  # noqa: S106
 
 
+@task
+async def process_webhook_inbox_task(repo_id: str) -> int:
+    """
+    Process the webhook deliveries recorded for a repository, coalescing superseded ones.
+
+    Not deduplicated, but runs for one repository never overlap: a run that finds the repository
+    being processed returns at once and leaves its deliveries to the run in progress.
+
+    Args:
+        repo_id (str): The repository id.
+
+    Returns:
+        The number of deliveries processed.
+    """
+    from codebase.webhooks import aprocess_inbox
+
+    return await aprocess_inbox(repo_id)
+
+
+@cron(codebase_settings.WEBHOOK_INBOX_SWEEP_CRON)
+@task
+@locked_task(key="webhook-inbox")
+def sweep_webhook_inbox_cron_task():
+    """
+    Hand back webhook deliveries whose worker died, re-enqueue repositories with deliveries that were
+    never picked up and prune finished deliveries past the retention period.
+    """
+    from codebase.webhooks import sweep_inbox
+
+    sweep_inbox()
+
+
 @cron(codebase_settings.REPO_ACCESS_SYNC_CRON)
 @task
 @locked_task(key="repo-access")
@@ -71,10 +118,11 @@ def sync_repository_access_cron_task():
     observability, not the access decision (which is per-row) nor the backstop enqueue (keyed
     on ``last_started_at``).
     """
-    from django.db import transaction
     from django.utils import timezone
 
+    from codebase.authorization import invalidate_repository_visibility
     from codebase.models import RepositoryAccess, RepositoryAccessSyncState, RepositoryCatalog
+    from core.db import TemporaryKeySet
 
     if codebase_settings.CLIENT == GitPlatform.SWE:
         return
@@ -85,28 +133,89 @@ def sync_repository_access_cron_task():
     state.save(update_fields=["last_started_at"])
 
     client = RepoClient.create_instance()
-    try:
-        universe = client.list_repositories()
-    except Exception:
-        logger.exception("Repository access sync: failed to list repositories")
+    failures = 0
+    catalog_synced_at = timezone.now()
+
+    # The universe is streamed a page at a time — catalog upsert and member sync per page — so a
+    # large instance never holds every repository in memory nor writes the catalog in one giant
+    # INSERT. The slugs seen go to a temporary table, which the prune below excludes against; the
+    # client pages in an order activity cannot change, so a long walk cannot skip a busy repository.
+    with TemporaryKeySet("repo_access_sync_seen") as seen:
+        pages = None
+        while True:
+            try:
+                # Opened inside the ``try``: a client may fail the listing's first request eagerly.
+                if pages is None:
+                    pages = iter(client.iter_repository_pages(page_size=REPO_ACCESS_SYNC_PAGE_SIZE))
+                page = next(pages, None)
+            except Exception:
+                # Pages already synced keep their fresh rows; nothing is pruned, since an
+                # interrupted listing says nothing about the repositories it did not reach.
+                logger.exception("Repository access sync: failed to list repositories")
+                invalidate_repository_visibility()
+                state.status = RepositoryAccessSyncState.Status.FAILED
+                state.save(update_fields=["status"])
+                return
+            if page is None:
+                break
+
+            seen.add(repo.slug for repo in page)
+            failures += _upsert_catalog_page(provider, page, catalog_synced_at)
+            for repo in page:
+                failures += _sync_repository_members(client, provider, repo)
+
+        # Prune access rows for repos no longer in the universe, so a repo the bot lost access to
+        # (or that was deleted/renamed) is revoked promptly rather than only after the hard TTL.
+        # This trusts the listing to be complete: a *fully empty* listing is treated as a degraded
+        # response and the prune is skipped (see below), but a *partially truncated* listing —
+        # non-empty yet missing repos — will still prune the missing repos' rows. That is an
+        # accepted, self-healing fail-CLOSED event (users of dropped repos are denied until the next
+        # complete sync recreates the rows ~1 cycle later); we prefer it to the fail-OPEN
+        # alternative of never pruning, which would let a lost repo keep granting access for a full
+        # hard-TTL window.
+        if len(seen):
+            RepositoryAccess.objects.filter(provider=provider).exclude(repo_id__in=seen.subquery()).delete()
+            # Isolated like the catalog upsert: a prune failure must not pre-empt the sync-state
+            # write below, which would leave an otherwise-clean access sync recorded as neither OK
+            # nor FAILED. Freshness bounds any rows this fails to prune until the next clean cycle.
+            try:
+                RepositoryCatalog.objects.filter(provider=provider).exclude(slug__in=seen.subquery()).delete()
+            except Exception:
+                failures += 1
+                logger.exception("Repository access sync: failed to prune repository catalog")
+        elif RepositoryAccess.objects.filter(provider=provider).exists():
+            # Empty listing while rows exist is a degraded response, not a real "no repos" state:
+            # skip the destructive prune and mark the run failed so it does not read as clean.
+            failures += 1
+            logger.warning("Repository access sync: repository universe is empty but rows exist; skipping prune")
+
+    # Drop rows aged past the hard TTL. They already grant no access (the authorization filter
+    # ignores them), so this is access-neutral; it bounds table growth and makes the empty-member
+    # guard self-terminating — once a genuinely member-less repo's stale rows expire and are
+    # cleared, it no longer has "prior rows" and stops being flagged as degraded.
+    RepositoryAccess.objects.filter(provider=provider).stale().delete()
+
+    # Cached per-user visibility was built from the rows this run replaced.
+    invalidate_repository_visibility()
+
+    if failures:
         state.status = RepositoryAccessSyncState.Status.FAILED
-        state.save(update_fields=["status"])
-        return
+    else:
+        state.status = RepositoryAccessSyncState.Status.OK
+        state.last_success_at = timezone.now()
+    state.save(update_fields=["status", "last_success_at"])
 
-    # Snapshot which repos currently have rows, once, so the empty-member guard below does not
-    # issue a per-repo EXISTS query across the whole universe every run.
-    repos_with_rows = set(
-        RepositoryAccess.objects.filter(provider=provider).values_list("repo_id", flat=True).distinct()
-    )
 
-    failures = 0
+def _upsert_catalog_page(provider: str, page: list[Repository], synced_at: datetime) -> int:
+    """
+    Upsert one listing page into ``RepositoryCatalog``; returns the number of failures (0 or 1).
+
+    The catalog (repo metadata + the admin-visible universe) is mirrored so repo listings are served
+    from this table instead of live platform fetches. It is not security-load-bearing, so a failure
+    here is isolated: it marks the run degraded but must not abort the access sync.
+    """
+    from codebase.models import RepositoryCatalog
 
-    # Mirror the repository catalog (metadata + admin-visible universe) from the same universe
-    # listing, so repo listings are served from this table instead of live platform fetches. The
-    # catalog is not security-load-bearing, so a failure here is isolated: it marks the run
-    # degraded but must not abort the access sync below. An empty universe yields an empty
-    # bulk_create (no-op); the prune below is guarded on it.
-    catalog_synced_at = timezone.now()
     try:
         RepositoryCatalog.objects.bulk_create(
             [
@@ -117,96 +226,67 @@ def sync_repository_access_cron_task():
                     default_branch=repo.default_branch or "",
                     html_url=repo.html_url,
                     topics=repo.topics,
-                    synced_at=catalog_synced_at,
+                    synced_at=synced_at,
                 )
-                for repo in universe
+                for repo in page
             ],
             update_conflicts=True,
             unique_fields=["provider", "slug"],
             update_fields=["name", "default_branch", "html_url", "topics", "synced_at"],
         )
     except Exception:
-        failures += 1
-        logger.exception("Repository access sync: failed to upsert repository catalog (%d repos)", len(universe))
+        logger.exception("Repository access sync: failed to upsert repository catalog (%d repos)", len(page))
+        return 1
+    return 0
 
-    for repo in universe:
-        try:
-            members = client.list_repository_members(repo.slug)
-            # An empty member list is almost always a degraded/partial API response (paginated
-            # endpoints can return an empty first page without raising) rather than a genuine
-            # membership wipe. For a repo that previously had rows, treat it as a failure and keep
-            # those rows (serve-stale) instead of silently locking everyone out. A first-ever sync
-            # has no rows to preserve, but an empty result is still suspicious, so log it — a
-            # genuinely degraded first sync must be visible in logs, not indistinguishable from a
-            # legitimately member-less repo silently recorded with zero rows.
-            if not members:
-                if repo.slug in repos_with_rows:
-                    failures += 1
-                    logger.warning(
-                        "Repository access sync: %s returned no members but had prior rows; keeping previous rows",
-                        repo.slug,
-                    )
-                else:
-                    logger.warning("Repository access sync: %s returned no members on first sync", repo.slug)
-                continue
-            synced_at = timezone.now()
-            rows = [
-                RepositoryAccess(
-                    provider=provider,
-                    uid=member.uid,
-                    username=member.username,
-                    repo_id=repo.slug,
-                    access_level=member.access_level,
-                    synced_at=synced_at,
-                )
-                for member in members
-            ]
-            with transaction.atomic():
-                RepositoryAccess.objects.filter(provider=provider, repo_id=repo.slug).delete()
-                RepositoryAccess.objects.bulk_create(rows)
-        except Exception:
-            failures += 1
-            logger.exception("Repository access sync: failed to sync %s (keeping previous rows)", repo.slug)
-            continue
-
-    # Prune access rows for repos no longer in the universe, so a repo the bot lost access to
-    # (or that was deleted/renamed) is revoked promptly rather than only after the hard TTL.
-    # This trusts the listing to be complete: a *fully empty* listing is treated as a degraded
-    # response and the prune is skipped (see below), but a *partially truncated* listing —
-    # non-empty yet missing repos — will still prune the missing repos' rows. That is an
-    # accepted, self-healing fail-CLOSED event (users of dropped repos are denied until the next
-    # complete sync recreates the rows ~1 cycle later); we prefer it to the fail-OPEN
-    # alternative of never pruning, which would let a lost repo keep granting access for a full
-    # hard-TTL window.
-    if universe:
-        universe_slugs = [r.slug for r in universe]
-        RepositoryAccess.objects.filter(provider=provider).exclude(repo_id__in=universe_slugs).delete()
-        # Isolated like the catalog upsert above: a prune failure must not pre-empt the sync-state
-        # write below, which would leave an otherwise-clean access sync recorded as neither OK nor
-        # FAILED. Freshness bounds any rows this fails to prune until the next clean cycle.
-        try:
-            RepositoryCatalog.objects.filter(provider=provider).exclude(slug__in=universe_slugs).delete()
-        except Exception:
-            failures += 1
-            logger.exception("Repository access sync: failed to prune repository catalog")
-    elif repos_with_rows:
-        # Empty listing while rows exist is a degraded response, not a real "no repos" state:
-        # skip the destructive prune and mark the run failed so it does not read as clean.
-        failures += 1
-        logger.warning("Repository access sync: repository universe is empty but rows exist; skipping prune")
 
-    # Drop rows aged past the hard TTL. They already grant no access (the authorization filter
-    # ignores them), so this is access-neutral; it bounds table growth and makes the empty-member
-    # guard self-terminating — once a genuinely member-less repo's stale rows expire and are
-    # cleared, it no longer has "prior rows" and stops being flagged as degraded.
-    RepositoryAccess.objects.filter(provider=provider).stale().delete()
+def _sync_repository_members(client: RepoClient, provider: str, repo: Repository) -> int:
+    """
+    Replace ``repo``'s ``RepositoryAccess`` rows with its current members; returns the number of
+    failures (0 or 1). A failure keeps the previous rows (serve-stale).
+    """
+    from django.db import transaction
+    from django.utils import timezone
 
-    if failures:
-        state.status = RepositoryAccessSyncState.Status.FAILED
-    else:
-        state.status = RepositoryAccessSyncState.Status.OK
-        state.last_success_at = timezone.now()
-    state.save(update_fields=["status", "last_success_at"])
+    from codebase.models import RepositoryAccess
+
+    try:
+        members = client.list_repository_members(repo.slug)
+        # An empty member list is almost always a degraded/partial API response (paginated
+        # endpoints can return an empty first page without raising) rather than a genuine
+        # membership wipe. For a repo that previously had rows, treat it as a failure and keep
+        # those rows (serve-stale) instead of silently locking everyone out. A first-ever sync
+        # has no rows to preserve, but an empty result is still suspicious, so log it — a
+        # genuinely degraded first sync must be visible in logs, not indistinguishable from a
+        # legitimately member-less repo silently recorded with zero rows.
+        if not members:
+            if RepositoryAccess.objects.filter(provider=provider, repo_id=repo.slug).exists():
+                logger.warning(
+                    "Repository access sync: %s returned no members but had prior rows; keeping previous rows",
+                    repo.slug,
+                )
+                return 1
+            logger.warning("Repository access sync: %s returned no members on first sync", repo.slug)
+            return 0
+        synced_at = timezone.now()
+        rows = [
+            RepositoryAccess(
+                provider=provider,
+                uid=member.uid,
+                username=member.username,
+                repo_id=repo.slug,
+                access_level=member.access_level,
+                synced_at=synced_at,
+            )
+            for member in members
+        ]
+        with transaction.atomic():
+            RepositoryAccess.objects.filter(provider=provider, repo_id=repo.slug).delete()
+            RepositoryAccess.objects.bulk_create(rows)
+    except Exception:
+        logger.exception("Repository access sync: failed to sync %s (keeping previous rows)", repo.slug)
+        return 1
+    return 0
 
 
 @task(dedup=True)
@@ -237,12 +317,16 @@ async def address_issue_task(
 
     client = RepoClient.create_instance()
     issue = client.get_issue(repo_id, issue_iid)
-    async with set_runtime_ctx(
-        repo_id, scope=Scope.ISSUE, ref=ref, issue=issue, sandbox_env_id=sandbox_environment_id
-    ) as runtime_ctx:
-        return await IssueAddressorManager.address_issue(
+    async with (
+        track_phases() as phases,
+        set_runtime_ctx(
+            repo_id, scope=Scope.ISSUE, ref=ref, issue=issue, sandbox_env_id=sandbox_environment_id
+        ) as runtime_ctx,
+    ):
+        result = await IssueAddressorManager.address_issue(
             issue=issue, mention_comment_id=mention_comment_id, runtime_ctx=runtime_ctx, thread_id=thread_id
         )
+    return _with_phase_timings(result, phases)
 
 
 @task(dedup=True)
@@ -411,19 +495,23 @@ async def address_mr_comments_task(
         return _mr_comment_skip_result(response, merge_request)
 
     try:
-        async with set_runtime_ctx(
-            repo_id,
-            scope=Scope.MERGE_REQUEST,
-            ref=merge_request.source_branch,
-            merge_request=merge_request,
-            sandbox_env_id=sandbox_environment_id,
-        ) as runtime_ctx:
-            return await CommentsAddressorManager.address_comments(
+        async with (
+            track_phases() as phases,
+            set_runtime_ctx(
+                repo_id,
+                scope=Scope.MERGE_REQUEST,
+                ref=merge_request.source_branch,
+                merge_request=merge_request,
+                sandbox_env_id=sandbox_environment_id,
+            ) as runtime_ctx,
+        ):
+            result = await CommentsAddressorManager.address_comments(
                 merge_request=merge_request,
                 mention_comment_id=mention_comment_id,
                 runtime_ctx=runtime_ctx,
                 thread_id=thread_id,
             )
+        return _with_phase_timings(result, phases)
     except CloneRefNotFoundError:
         response = (
             f"The source branch `{merge_request.source_branch}` for this merge request no longer "
@@ -0,0 +1,215 @@
+"""Durable inbox between the webhook endpoints and the callbacks they trigger.
+
+The callback views only verify a delivery, record it as a ``WebhookDelivery`` and acknowledge, so
+the platform's webhook timeout never waits on repository configuration, user or sandbox
+resolution, or the platform API. ``process_webhook_inbox_task`` then works through a repository's
+pending deliveries in arrival order, one run per repository at a time.
+
+Bursts are coalesced when a batch is claimed: of the pending deliveries sharing a coalesce key
+(pushes to the same ref, repeated edits of the same comment) only the latest is processed, the
+earlier ones are marked superseded. Delivery is at-least-once: a batch whose worker died is handed
+back by the sweep, and a delivery whose callback raised is marked failed rather than retried, since
+callbacks react and enqueue work on the platform.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from asgiref.sync import sync_to_async
+from pydantic import ValidationError
+from redis.exceptions import LockError, LockNotOwnedError
+
+from codebase.conf import settings as codebase_settings
+from codebase.models import PlatformType, WebhookDelivery
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+    from codebase.api.callbacks import BaseCallback
+
+logger = logging.getLogger("daiv.webhooks")
+
+# A claimed batch not finished within this window is assumed lost with its worker and handed back.
+STALE_PROCESSING_AFTER = timedelta(minutes=30)
+
+# Serializes one repository's inbox processing. It expires with the batches its holder claimed.
+INBOX_LOCK_KEY = "webhook-inbox:{repo_id}"
+
+# Pending deliveries older than this have missed their enqueue (or its worker); the sweep re-enqueues them.
+PENDING_GRACE = timedelta(minutes=1)
+
+FINISHED_STATUSES = (
+    WebhookDelivery.Status.PROCESSED,
+    WebhookDelivery.Status.SUPERSEDED,
+    WebhookDelivery.Status.IGNORED,
+    WebhookDelivery.Status.FAILED,
+)
+
+
+def coalesce_key(platform: str, event: str, payload: dict[str, Any]) -> str:
+    """
+    Key under which a later delivery makes an earlier pending one redundant, or ``""`` when every
+    delivery of ``event`` must be processed.
+
+    Comment deliveries keep their action in the key: an edit supersedes earlier edits, never the
+    creation that may be the one mentioning DAIV.
+    """
+    if event == "push":
+        return f"push:{payload.get('ref', '')}"
+    if platform == PlatformType.GITLAB and event == "note":
+        note = payload.get("object_attributes") or {}
+        if note.get("id") is not None:
+            return f"note:{note['id']}:{note.get('action', '')}"
+    if platform == PlatformType.GITHUB and event == "issue_comment":
+        comment = payload.get("comment") or {}
+        if comment.get("id") is not None:
+            return f"comment:{comment['id']}:{payload.get('action', '')}"
+    return ""
+
+
+async def arecord_delivery(*, platform: str, event: str, repo_id: str, payload: dict[str, Any]) -> WebhookDelivery:
+    """
+    Record a verified delivery and enqueue its repository's inbox processing.
+
+    Only the insert has to succeed: a failed enqueue leaves the delivery pending for the sweep.
+    """
+    from codebase.tasks import process_webhook_inbox_task
+
+    delivery = await WebhookDelivery.objects.acreate(
+        platform=platform,
+        event=event,
+        repo_id=repo_id,
+        payload=payload,
+        coalesce_key=coalesce_key(platform, event, payload),
+    )
+    try:
+        await process_webhook_inbox_task.aenqueue(repo_id=repo_id)
+    except Exception:
+        logger.exception("Webhook inbox: failed to enqueue processing for %s, leaving it to the sweep", repo_id)
+    return delivery
+
+
+def _claim(repo_id: str) -> list[WebhookDelivery]:
+    """Mark ``repo_id``'s pending deliveries processing, superseding all but the latest per coalesce key."""
+    now = timezone.now()
+    with transaction.atomic():
+        pending = list(
+            WebhookDelivery.objects
+            .select_for_update(skip_locked=True)
+            .filter(repo_id=repo_id, status=WebhookDelivery.Status.PENDING)
+            .order_by("created", "pk")
+        )
+        latest = {delivery.coalesce_key: delivery.pk for delivery in pending if delivery.coalesce_key}
+        claimed = [d for d in pending if not d.coalesce_key or latest[d.coalesce_key] == d.pk]
+        superseded = [d.pk for d in pending if d.coalesce_key and latest[d.coalesce_key] != d.pk]
+
+        WebhookDelivery.objects.filter(pk__in=superseded).update(
+            status=WebhookDelivery.Status.SUPERSEDED, processed_at=now, modified=now
+        )
+        WebhookDelivery.objects.filter(pk__in=[d.pk for d in claimed]).update(
+            status=WebhookDelivery.Status.PROCESSING, modified=now
+        )
+    if superseded:
+        logger.info("Webhook inbox: coalesced %d superseded deliveries for %s", len(superseded), repo_id)
+    return claimed
+
+
+def _callbacks(platform: str) -> TypeAdapter[BaseCallback]:
+    if platform == PlatformType.GITLAB:
+        from codebase.clients.gitlab.api.callbacks import WEBHOOK_CALLBACKS
+    else:
+        from codebase.clients.github.api.callbacks import WEBHOOK_CALLBACKS
+    return WEBHOOK_CALLBACKS
+
+
+async def _adispatch(delivery: WebhookDelivery) -> tuple[WebhookDelivery.Status, str]:
+    """Run ``delivery``'s callback; returns the delivery's final status and error."""
+    try:
+        # Validation runs the callbacks' ``model_post_init``, which loads the repository configuration.
+        callback = await sync_to_async(_callbacks(delivery.platform).validate_python)(delivery.payload)
+    except ValidationError as exc:
+        logger.info("Webhook inbox: ignored '%s' for %s, no callback matches it.", delivery.event, delivery.repo_id)
+        return WebhookDelivery.Status.IGNORED, str(exc)
+
+    if not await callback.accept_callback():
+        logger.info(
+            "Webhook inbox: ignored '%s' for %s, conditions for acceptance not met.", delivery.event, delivery.repo_id
+        )
+        return WebhookDelivery.Status.IGNORED, ""
+
+    logger.info("Webhook inbox: processing '%s' for %s", delivery.event, delivery.repo_id)
+    await callback.process_callback()
+    return WebhookDelivery.Status.PROCESSED, ""
+
+
+async def _aprocess(delivery: WebhookDelivery) -> None:
+    try:
+        status, error = await _adispatch(delivery)
+    except Exception as exc:
+        logger.exception("Webhook inbox: failed to process '%s' for %s", delivery.event, delivery.repo_id)
+        status, error = WebhookDelivery.Status.FAILED, str(exc)
+    now = timezone.now()
+    await WebhookDelivery.objects.filter(pk=delivery.pk).aupdate(
+        status=status, error=error, processed_at=now, modified=now
+    )
+
+
+async def aprocess_inbox(repo_id: str) -> int:
+    """
+    Process ``repo_id``'s pending deliveries in arrival order; returns how many were claimed.
+
+    Runs for one repository are serialized by a lock, so a later delivery is never handled while an
+    earlier one still is. A run that finds the lock held leaves its deliveries to the holder, which
+    claims batches until the inbox is empty and looks again once it has released the lock, so a
+    delivery recorded as it finished is not left for the sweep.
+    """
+    lock_key = INBOX_LOCK_KEY.format(repo_id=repo_id)
+    processed = 0
+    while True:
+        try:
+            with cache.lock(lock_key, timeout=STALE_PROCESSING_AFTER.total_seconds(), blocking=False):
+                while claimed := await sync_to_async(_claim)(repo_id):
+                    for delivery in claimed:
+                        await _aprocess(delivery)
+                    processed += len(claimed)
+        # Raised on release, and must precede its LockError superclass to not read as a held lock.
+        except LockNotOwnedError:
+            logger.error("Webhook inbox: processing %s outran its lock, a concurrent run was possible", repo_id)
+        except LockError:
+            return processed
+        if not await WebhookDelivery.objects.filter(repo_id=repo_id, status=WebhookDelivery.Status.PENDING).aexists():
+            return processed
+
+
+def sweep_inbox() -> None:
+    """
+    Recover and prune the inbox: hand back batches whose worker died, re-enqueue repositories whose
+    pending deliveries were never picked up, and delete finished deliveries past the retention period.
+    """
+    from codebase.tasks import process_webhook_inbox_task
+
+    now = timezone.now()
+    if stale := WebhookDelivery.objects.filter(
+        status=WebhookDelivery.Status.PROCESSING, modified__lt=now - STALE_PROCESSING_AFTER
+    ).update(status=WebhookDelivery.Status.PENDING, modified=now):
+        logger.warning("Webhook inbox: handed back %d deliveries stuck in processing", stale)
+
+    repo_ids = (
+        WebhookDelivery.objects
+        .filter(status=WebhookDelivery.Status.PENDING, created__lt=now - PENDING_GRACE)
+        .values_list("repo_id", flat=True)
+        .distinct()
+    )
+    for repo_id in repo_ids:
+        process_webhook_inbox_task.enqueue(repo_id=repo_id)
+
+    WebhookDelivery.objects.filter(
+        status__in=FINISHED_STATUSES, created__lt=now - timedelta(days=codebase_settings.WEBHOOK_INBOX_RETENTION_DAYS)
+    ).delete()
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import json
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, ParamSpec, TypeVar
+from typing import TYPE_CHECKING, Any, ParamSpec, TypeVar
 
 from django.db import transaction
 from django.utils.version import PY311
 
 from django_tasks.base import Task, TaskResultStatus
+from django_tasks.signals import task_enqueued
 from django_tasks.utils import normalize_json
 from django_tasks_db import DatabaseBackend
-from django_tasks_db.models import DBTaskResult
+from django_tasks_db.models import DBTaskResult, get_date_max
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from django_tasks_db.backend import TaskResult as DatabaseTaskResult
 
 logger = logging.getLogger("daiv.tasks")
@@ -20,6 +24,21 @@ logger = logging.getLogger("daiv.tasks")
 T = TypeVar("T")
 P = ParamSpec("P")
 
+DEDUP_STATUSES = [TaskResultStatus.READY, TaskResultStatus.RUNNING, TaskResultStatus.SUCCESSFUL]
+
+
+def _dedup_key(args_kwargs: dict[str, Any]) -> str:
+    return json.dumps(args_kwargs, sort_keys=True)
+
+
+def supports_bulk_enqueue(task: Task) -> bool:
+    """
+    Whether ``task``'s backend inserts a whole batch of calls at once.
+
+    Other backends (the immediate one tests run on) are left to per-call ``enqueue``.
+    """
+    return isinstance(task.get_backend(), DeduplicatingDatabaseBackend)
+
 
 @dataclass(frozen=True, slots=PY311, kw_only=True)
 class DeduplicatingTask(Task[P, T]):
@@ -60,6 +79,63 @@ class DeduplicatingDatabaseBackend(DatabaseBackend):
 
         return super().enqueue(task, args, kwargs)
 
+    @transaction.atomic
+    def bulk_enqueue(
+        self, task: DeduplicatingTask[P, T], calls: Sequence[tuple[tuple, dict[str, Any]]]
+    ) -> list[DatabaseTaskResult[T]]:
+        """
+        Enqueue every ``(args, kwargs)`` call of ``task`` in one dedup query and one insert.
+
+        Deduplication matches ``enqueue``: a call matching a queued task (or an earlier call of the
+        same batch) gets that task's result instead of a new row.
+
+        Args:
+            task: Task instance being enqueued.
+            calls: Positional and keyword arguments of each call.
+
+        Returns:
+            The task results, in the order of ``calls``.
+        """
+        self.validate_task(task)
+        args_kwargs = [normalize_json({"args": args, "kwargs": kwargs}) for args, kwargs in calls]
+
+        results: dict[str, DBTaskResult] = {}
+        if task.dedup:
+            for existing in DBTaskResult.objects.filter(
+                backend_name=self.alias,
+                task_path=task.module_path,
+                args_kwargs__in=args_kwargs,
+                status__in=DEDUP_STATUSES,
+            ).select_for_update():
+                results.setdefault(_dedup_key(existing.args_kwargs), existing)
+
+        rows: list[DBTaskResult] = []
+        resolved: list[DBTaskResult] = []
+        for call_args_kwargs in args_kwargs:
+            key = _dedup_key(call_args_kwargs)
+            if task.dedup and key in results:
+                logger.info("Skipping duplicate task: %s with args_kwargs: %r", task.module_path, call_args_kwargs)
+                resolved.append(results[key])
+                continue
+            row = DBTaskResult(
+                id=self._get_id(),
+                args_kwargs=call_args_kwargs,
+                priority=task.priority,
+                task_path=task.module_path,
+                queue_name=task.queue_name,
+                # ``bulk_create`` skips the ``pre_save`` hook that fills this in for ``enqueue``.
+                run_after=task.run_after or get_date_max(),
+                backend_name=self.alias,
+            )
+            rows.append(row)
+            resolved.append(row)
+            results[key] = row
+
+        DBTaskResult.objects.bulk_create(rows)
+        for row in rows:
+            task_enqueued.send(type(self), task_result=row.task_result)
+        return [row.task_result for row in resolved]
+
     @transaction.atomic
     def _get_existing_task_result(self, task_path: str, args: P.args, kwargs: P.kwargs) -> DBTaskResult | None:
         """
@@ -79,7 +155,7 @@ class DeduplicatingDatabaseBackend(DatabaseBackend):
                 backend_name=self.alias,
                 task_path=task_path,
                 args_kwargs=normalize_json({"args": args, "kwargs": kwargs}),
-                status__in=[TaskResultStatus.READY, TaskResultStatus.RUNNING, TaskResultStatus.SUCCESSFUL],
+                status__in=DEDUP_STATUSES,
             )
             .select_for_update()
             .first()
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field, HttpUrl, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -32,5 +34,38 @@ class CoreSettings(BaseSettings):
         ),
     )
 
+    SCHEDULER_INTERACTIVE_WEIGHT: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Share of busy workers interactive work (API/MCP/UI runs, chat-adjacent tasks) is entitled to, "
+            "relative to SCHEDULER_BATCH_WEIGHT."
+        ),
+    )
+    SCHEDULER_BATCH_WEIGHT: int = Field(
+        default=1,
+        ge=1,
+        description="Share of busy workers batch work (scheduled runs, background maintenance) is entitled to.",
+    )
+    SCHEDULER_MAX_RUNNING_PER_USER: int | None = Field(
+        default=None, ge=1, description="Maximum tasks running at once on behalf of one user. None disables the cap."
+    )
+    SCHEDULER_MAX_RUNNING_PER_SCHEDULE: int | None = Field(
+        default=4, ge=1, description="Maximum runs of one scheduled job executing at once. None disables the cap."
+    )
+    SCHEDULER_AGING_SECONDS: int = Field(
+        default=600,
+        ge=0,
+        description="Seconds a ready task may wait before it is claimed ahead of every fair-share decision.",
+    )
+
+    SESSION_LOCK_BACKEND: Literal["database", "redis"] = Field(
+        default="database",
+        description=(
+            "Where per-session run slots are held: 'database' heartbeats the session row, 'redis' holds a "
+            "TTL lease on DJANGO_REDIS_URL and only mirrors the holder to the database on claim and release."
+        ),
+    )
+
 
 settings = CoreSettings()
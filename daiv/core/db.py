@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Self
+
+from django.db import connections
+from django.db.models.expressions import RawSQL
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_TABLE_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+class TemporaryKeySet:
+    """A set of string keys held in a connection-scoped temporary table instead of in Python.
+
+    For work that streams a large key universe and afterwards needs "everything not seen": the keys
+    are inserted as they go by, and :meth:`subquery` lets the ORM express the complement as
+    ``.exclude(field__in=keys.subquery())`` — one ``NOT IN (SELECT …)`` the database resolves,
+    rather than a list of tens of thousands of parameters built and shipped from memory.
+
+    The table lives on the connection that creates it, so every query against it must run on that
+    connection (same thread, ``using`` alias). It is dropped on exit; it is also dropped on entry in
+    case a pooled connection still carries one from a run that died before cleaning up.
+    """
+
+    def __init__(self, name: str, *, using: str = "default"):
+        if not _TABLE_NAME.match(name):
+            raise ValueError(f"Invalid temporary table name: {name!r}")
+        self.name = name
+        self.using = using
+
+    def __enter__(self) -> Self:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.name}")
+            cursor.execute(f"CREATE TEMPORARY TABLE {self.name} (member VARCHAR(512) PRIMARY KEY)")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {self.name}")
+
+    def add(self, keys: Iterable[str]) -> None:
+        """Record ``keys``; keys already in the set are ignored."""
+        params = [(key,) for key in keys]
+        if not params:
+            return
+        with connections[self.using].cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {self.name} (member) VALUES (%s) ON CONFLICT (member) DO NOTHING",  # noqa: S608
+                params,
+            )
+
+    def __len__(self) -> int:
+        with connections[self.using].cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {self.name}")  # noqa: S608
+            return cursor.fetchone()[0]
+
+    def subquery(self) -> RawSQL:
+        """The set as a subquery, for ``field__in=`` lookups."""
+        return RawSQL(f"SELECT member FROM {self.name}", ())  # noqa: S608, S611
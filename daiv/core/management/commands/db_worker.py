@@ -0,0 +1,139 @@
+"""``db_worker`` with the fair claim order of :mod:`core.scheduling`.
+
+Shadows ``django_tasks_db``'s command of the same name (``core`` is listed before it in
+``INSTALLED_APPS``), so the worker entrypoints and every deployment keep invoking
+``django-admin db_worker``. Options, signal handling and task execution are upstream's; only
+the choice of which ready task to claim differs.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import random
+import time
+
+from django.db import close_old_connections
+from django.db.utils import OperationalError
+from django.utils import timezone
+from django.utils.autoreload import DJANGO_AUTORELOAD_ENV, run_with_reloader
+
+from django_tasks_db.management.commands.db_worker import Command as DBWorkerCommand
+from django_tasks_db.management.commands.db_worker import Worker
+from django_tasks_db.models import DBTaskResult
+from django_tasks_db.utils import exclusive_transaction, retry
+
+from core.scheduling import SchedulingPolicy, candidates_from, claim_window, current_load
+
+logger = logging.getLogger("django_tasks_db")
+
+
+class FairWorker(Worker):
+    def __init__(self, *, policy: SchedulingPolicy, **kwargs):
+        super().__init__(**kwargs)
+        self.policy = policy
+
+    @retry()
+    def claim_next(self) -> DBTaskResult | None:
+        """Lock a window of ready tasks, let the policy pick one, and claim it.
+
+        Runs in one exclusive transaction, like upstream's ``get_locked`` + ``claim``, so two
+        workers never claim the same row. ``of=("self",)`` keeps the ``run``/``session`` joins
+        the snapshot reads out of the lock set (and out of the nullable side of an outer join,
+        which PostgreSQL refuses to lock).
+        """
+        tasks = DBTaskResult.objects.ready().filter(backend_name=self.backend_name)
+        if not self.process_all_queues:
+            tasks = tasks.filter(queue_name__in=self.queue_names)
+
+        with exclusive_transaction(tasks.db):
+            load = current_load(self.backend_name)
+            window = claim_window(tasks.select_for_update(skip_locked=True, of=("self",)), self.policy, load)
+            candidates = candidates_from(window)
+            if not candidates:
+                return None
+            chosen = self.policy.pick(candidates, load, timezone.now())
+            if chosen is None:
+                logger.debug("All %d ready task(s) are held back by concurrency caps", len(candidates))
+                return None
+            task_result = DBTaskResult.objects.get(pk=chosen.id)
+            task_result.claim(self.worker_id)
+            return task_result
+
+    def run(self) -> None:
+        logger.info("Starting fair worker worker_id=%s queues=%s", self.worker_id, ",".join(self.queue_names))
+
+        if self.startup_delay and self.interval:
+            # Add a random small delay before starting to avoid a thundering herd
+            time.sleep(random.random())  # noqa: S311
+
+        while self.running:
+            try:
+                task_result = self.claim_next()
+            except OperationalError as e:
+                # Ignore locked databases and keep trying; it should unlock eventually.
+                if "is locked" not in e.args[0]:
+                    raise
+                task_result = None
+
+            if task_result is not None:
+                self.run_task(task_result)
+
+            if self.batch and task_result is None:
+                logger.info("No more tasks to run for worker_id=%s - exiting gracefully.", self.worker_id)
+                return
+
+            if self.max_tasks is not None and self._run_tasks >= self.max_tasks:
+                logger.info(
+                    "Run maximum tasks (%d) on worker=%s - exiting gracefully.", self._run_tasks, self.worker_id
+                )
+                return
+
+            close_old_connections()
+
+            if self.running and not task_result:
+                time.sleep(self.interval)
+
+
+class Command(DBWorkerCommand):
+    help = "Run a database background worker that claims tasks by the fair scheduling policy"
+
+    def handle(
+        self,
+        *,
+        verbosity: int,
+        queue_name: str,
+        interval: float,
+        batch: bool,
+        backend_name: str,
+        startup_delay: bool,
+        reload: bool,
+        max_tasks: int | None,
+        worker_id: str,
+        **options,
+    ) -> None:
+        self.configure_logging(verbosity)
+
+        if reload and batch:
+            logger.warning("Warning: --reload and --batch cannot be specified together. Disabling autoreload.")
+            reload = False
+
+        worker = FairWorker(
+            policy=SchedulingPolicy.from_settings(),
+            queue_names=queue_name.split(","),
+            interval=interval,
+            batch=batch,
+            backend_name=backend_name,
+            startup_delay=startup_delay,
+            max_tasks=max_tasks,
+            worker_id=worker_id,
+        )
+
+        if reload:
+            if os.environ.get(DJANGO_AUTORELOAD_ENV) == "true":
+                # Only the child process should configure its signals
+                worker.configure_signals()
+            run_with_reloader(worker.run)
+        else:
+            worker.configure_signals()
+            worker.run()
@@ -0,0 +1,260 @@
+"""Fair scheduling policy for the database task workers.
+
+``db_worker`` claims the highest-priority, oldest ready task, so a 200-repository batch
+from ``dispatch_scheduled_jobs_cron_task`` enqueued a second before a user's API job keeps
+every worker busy until the whole batch drains. This module decides *which* ready task a
+worker claims instead; it never preempts what is already running.
+
+Three rules, applied in order:
+
+1. **Concurrency caps** — a task whose user (or schedule) already has as many tasks running
+   as its cap allows is skipped until one of them finishes.
+2. **Aging** — a task that has waited longer than ``aging_after`` is claimed before anything
+   else (oldest first), so no class or user can be starved by a steady stream of others.
+3. **Weighted fair queuing** — otherwise the next task comes from the work class whose running
+   share is furthest below its weight, and within a class by priority then FIFO.
+
+The policy is pure: it works on :class:`Candidate` snapshots and a :class:`Load`, so the same
+code drives the worker's claim (``core.management.commands.db_worker``), the queue position the
+runs UI shows (:func:`queue_positions`), and the deterministic tests that pin it down.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import timedelta
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from core.constants import TASK_QUEUE_INTERACTIVE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from datetime import datetime
+
+    from django.db.models import QuerySet
+
+# How many ready tasks each claim weighs, read in :data:`CLAIM_ORDER`. Larger windows see deeper
+# into a backlog at the cost of a bigger locked snapshot. The window always holds the oldest
+# uncapped tasks of the top priority, so the aging rule reaches anything that has waited longest.
+CLAIM_WINDOW = 200
+
+# Priority first, then FIFO. Not upstream's ``(-priority, run_after)``: every immediate task has
+# the same ``run_after``, which would leave a window of equal-priority tasks in no age order.
+CLAIM_ORDER = ("-priority", "enqueued_at", "id")
+
+
+class WorkClass(StrEnum):
+    """Coarse class a ready task is scheduled under."""
+
+    INTERACTIVE = "interactive"
+    """A human is waiting on it: chat-adjacent work and API/MCP/UI submitted runs."""
+
+    BATCH = "batch"
+    """Scheduled runs and background maintenance nobody is watching."""
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """A ready task as the policy sees it."""
+
+    id: str
+    work_class: WorkClass
+    enqueued_at: datetime
+    priority: int = 0
+    user_key: str | None = None
+    schedule_key: str | None = None
+
+
+@dataclass
+class Load:
+    """What is running right now, tallied along every axis a cap or weight applies to."""
+
+    by_class: Counter[str] = field(default_factory=Counter)
+    by_user: Counter[str] = field(default_factory=Counter)
+    by_schedule: Counter[str] = field(default_factory=Counter)
+
+    @classmethod
+    def from_running(cls, running: Iterable[Candidate]) -> Load:
+        load = cls()
+        for candidate in running:
+            load.add(candidate)
+        return load
+
+    def add(self, candidate: Candidate) -> None:
+        self.by_class[candidate.work_class] += 1
+        if candidate.user_key is not None:
+            self.by_user[candidate.user_key] += 1
+        if candidate.schedule_key is not None:
+            self.by_schedule[candidate.schedule_key] += 1
+
+    def copy(self) -> Load:
+        return Load(by_class=self.by_class.copy(), by_user=self.by_user.copy(), by_schedule=self.by_schedule.copy())
+
+
+def _fifo_key(candidate: Candidate) -> tuple:
+    return (-candidate.priority, candidate.enqueued_at, candidate.id)
+
+
+@dataclass(frozen=True)
+class SchedulingPolicy:
+    """The knobs of the three rules; :meth:`from_settings` reads them from ``DAIV_SCHEDULER_*``."""
+
+    weights: Mapping[WorkClass, int] = field(default_factory=lambda: {WorkClass.INTERACTIVE: 4, WorkClass.BATCH: 1})
+    max_running_per_user: int | None = None
+    max_running_per_schedule: int | None = None
+    aging_after: timedelta = timedelta(minutes=10)
+
+    @classmethod
+    def from_settings(cls) -> SchedulingPolicy:
+        from core.conf import settings
+
+        return cls(
+            weights={
+                WorkClass.INTERACTIVE: settings.SCHEDULER_INTERACTIVE_WEIGHT,
+                WorkClass.BATCH: settings.SCHEDULER_BATCH_WEIGHT,
+            },
+            max_running_per_user=settings.SCHEDULER_MAX_RUNNING_PER_USER,
+            max_running_per_schedule=settings.SCHEDULER_MAX_RUNNING_PER_SCHEDULE,
+            aging_after=timedelta(seconds=settings.SCHEDULER_AGING_SECONDS),
+        )
+
+    def is_capped(self, candidate: Candidate, load: Load) -> bool:
+        """Whether starting ``candidate`` now would exceed its user's or schedule's cap."""
+        if (
+            self.max_running_per_user is not None
+            and candidate.user_key is not None
+            and load.by_user[candidate.user_key] >= self.max_running_per_user
+        ):
+            return True
+        return (
+            self.max_running_per_schedule is not None
+            and candidate.schedule_key is not None
+            and load.by_schedule[candidate.schedule_key] >= self.max_running_per_schedule
+        )
+
+    def pick(self, candidates: Iterable[Candidate], load: Load, now: datetime) -> Candidate | None:
+        """The candidate a free worker should claim next, or ``None`` if every one is capped."""
+        eligible = [c for c in candidates if not self.is_capped(c, load)]
+        if not eligible:
+            return None
+
+        aged = [c for c in eligible if now - c.enqueued_at >= self.aging_after]
+        if aged:
+            return min(aged, key=lambda c: (c.enqueued_at, c.id))
+
+        heads: dict[WorkClass, Candidate] = {}
+        for candidate in sorted(eligible, key=_fifo_key):
+            heads.setdefault(candidate.work_class, candidate)
+
+        def share(work_class: WorkClass) -> tuple:
+            # Running tasks per unit of weight: the class furthest below its share goes next.
+            # Ties go to the heavier class, then to the class name so the order is total.
+            weight = max(self.weights.get(work_class, 1), 1)
+            return (load.by_class[work_class] / weight, -weight, work_class)
+
+        return heads[min(heads, key=share)]
+
+    def order(self, candidates: Iterable[Candidate], load: Load, now: datetime) -> list[Candidate]:
+        """The order the ready ``candidates`` would be claimed in if nothing finished meanwhile.
+
+        Each pick is assumed to start, so its class, user and schedule weigh on the picks after
+        it. Candidates that stay capped are appended last, oldest first — they only move once a
+        running task finishes, which this projection does not model.
+        """
+        remaining = list(candidates)
+        projected = load.copy()
+        ordered: list[Candidate] = []
+        while remaining:
+            chosen = self.pick(remaining, projected, now)
+            if chosen is None:
+                break
+            ordered.append(chosen)
+            projected.add(chosen)
+            remaining.remove(chosen)
+        ordered.extend(sorted(remaining, key=lambda c: (c.enqueued_at, c.id)))
+        return ordered
+
+
+def _candidate_from_row(row: Mapping) -> Candidate:
+    # ``SessionOrigin.SCHEDULE``, spelled out so the worker's hot path keeps ``sessions`` out of ``core``.
+    trigger_type = row.get("run__trigger_type")
+    if row["queue_name"] == TASK_QUEUE_INTERACTIVE or (trigger_type and trigger_type != "schedule"):
+        work_class = WorkClass.INTERACTIVE
+    else:
+        work_class = WorkClass.BATCH
+    user_id = row.get("run__user_id") or (row.get("args_kwargs") or {}).get("kwargs", {}).get("user_id")
+    schedule_id = row.get("run__session__scheduled_job_id")
+    return Candidate(
+        id=str(row["id"]),
+        work_class=work_class,
+        enqueued_at=row["enqueued_at"],
+        priority=row["priority"],
+        user_key=str(user_id) if user_id is not None else None,
+        schedule_key=str(schedule_id) if schedule_id is not None else None,
+    )
+
+
+CANDIDATE_FIELDS = (
+    "id",
+    "queue_name",
+    "priority",
+    "enqueued_at",
+    "args_kwargs",
+    "run__trigger_type",
+    "run__user_id",
+    "run__session__scheduled_job_id",
+)
+
+
+def candidates_from(queryset: QuerySet) -> list[Candidate]:
+    """Snapshot ``DBTaskResult`` rows (and the ``Run`` each may back) as candidates."""
+    return [_candidate_from_row(row) for row in queryset.values(*CANDIDATE_FIELDS)]
+
+
+def current_load(backend_name: str) -> Load:
+    """Tally the backend's running tasks into a :class:`Load`."""
+    from django_tasks_db.models import DBTaskResult
+
+    return Load.from_running(candidates_from(DBTaskResult.objects.running().filter(backend_name=backend_name)))
+
+
+def claim_window(ready: QuerySet, policy: SchedulingPolicy, load: Load) -> QuerySet:
+    """The first :data:`CLAIM_WINDOW` of the ``ready`` tasks a worker weighs, in :data:`CLAIM_ORDER`.
+
+    Tasks whose user or schedule is already at its cap are left out in SQL, so a backlog of them
+    cannot fill the window and idle every worker while eligible tasks wait behind it.
+    """
+    capped_users = _capped_keys(load.by_user, policy.max_running_per_user)
+    if capped_users:
+        # The user comes from the run when there is one, else from the task's kwargs (either type).
+        kwarg_values = [*capped_users, *(str(user_id) for user_id in capped_users)]
+        ready = ready.exclude(run__user_id__in=capped_users).exclude(args_kwargs__kwargs__user_id__in=kwarg_values)
+    capped_schedules = _capped_keys(load.by_schedule, policy.max_running_per_schedule)
+    if capped_schedules:
+        ready = ready.exclude(run__session__scheduled_job_id__in=capped_schedules)
+    return ready.order_by(*CLAIM_ORDER)[:CLAIM_WINDOW]
+
+
+def _capped_keys(running: Counter[str], cap: int | None) -> list[int]:
+    if cap is None:
+        return []
+    return [int(key) for key, count in running.items() if count >= cap and key.isdigit()]
+
+
+def queue_positions(backend_name: str, queue_names: Iterable[str], *, now: datetime) -> dict[str, int]:
+    """1-based claim position of the ready tasks on ``queue_names``, keyed by task id.
+
+    Only the first :data:`CLAIM_WINDOW` ready tasks are read, the same window a worker weighs,
+    so a task missing from the result is at least that deep in the queue. Read-only and
+    unlocked: a projection for the runs UI, not a promise — a task enqueued after this call,
+    or one finishing early, reorders what follows.
+    """
+    from django_tasks_db.models import DBTaskResult
+
+    policy = SchedulingPolicy.from_settings()
+    ready = DBTaskResult.objects.ready().filter(backend_name=backend_name, queue_name__in=list(queue_names))
+    ready = ready.order_by(*CLAIM_ORDER)[:CLAIM_WINDOW]
+    ordered = policy.order(candidates_from(ready), current_load(backend_name), now)
+    return {candidate.id: position for position, candidate in enumerate(ordered, start=1)}
@@ -48,6 +48,11 @@ class JobSubmitResponse(Schema):
     failed: list[JobSubmitFailureItem]
 
 
+class PhaseTiming(Schema):
+    seconds: float
+    count: int
+
+
 class JobStatusResponse(Schema):
     job_id: str
     status: Literal["QUEUED", "READY", "RUNNING", "SUCCESSFUL", "FAILED"]
@@ -58,3 +63,4 @@ class JobStatusResponse(Schema):
     created_at: datetime | None = None
     started_at: datetime | None = None
     finished_at: datetime | None = None
+    phase_timings: dict[str, PhaseTiming] | None = None
@@ -133,4 +133,5 @@ async def get_job_status(request: HttpRequest, job_id: str):
         created_at=run.created_at,
         started_at=run.started_at,
         finished_at=run.finished_at,
+        phase_timings=run.phase_timings,
     )
@@ -115,6 +115,7 @@ async def run_job_task(
     from sessions.services import apersist_session_ref
 
     from automation.agent.graph import create_daiv_agent
+    from automation.agent.phase_timings import Phase, phase, track_phases
     from automation.agent.results import build_agent_result
     from automation.agent.usage_tracking import build_usage_summary, track_usage_metadata
     from automation.agent.utils import build_langsmith_config, extract_text_content, get_daiv_agent_kwargs
@@ -145,6 +146,7 @@ async def run_job_task(
     try:
         try:
             async with (
+                track_phases() as phases,
                 set_runtime_ctx(
                     repo_id=repo_id,
                     scope=Scope.GLOBAL,
@@ -169,7 +171,8 @@ async def run_job_task(
                     agent_model=agent_kwargs["model_names"][0],
                     agent_thinking_level=agent_kwargs["thinking_level"] or "",
                 )
-                daiv_agent = await create_daiv_agent(ctx=runtime_ctx, checkpointer=checkpointer, **agent_kwargs)
+                with phase(Phase.BUILD):
+                    daiv_agent = await create_daiv_agent(ctx=runtime_ctx, checkpointer=checkpointer, **agent_kwargs)
                 config = build_langsmith_config(
                     runtime_ctx,
                     trigger="job",
@@ -213,10 +216,12 @@ async def run_job_task(
         )
     except Exception:
         logger.exception("run_job_task: failed to persist session ref for thread_id=%s", thread_id)
-    return await build_agent_result(
+    agent_result = await build_agent_result(
         daiv_agent,
         config,
         response=response_text,
         usage=build_usage_summary(usage_handler).to_dict(),
         snapshot=snapshot,
     )
+    agent_result["phase_timings"] = phases.summary()
+    return agent_result
@@ -44,8 +44,7 @@ async def _user_from_oauth_token(token: str) -> User | None:
 
 async def _user_from_api_key(token: str) -> User | None:
     """Resolve the active user for an API key, or None if the key is unusable/inactive."""
-    api_key = await APIKey.objects.get_active_key(token)
-    return api_key.user if api_key else None
+    return await APIKey.objects.get_active_user(token)
 
 
 async def get_current_user() -> User | None:
@@ -74,3 +74,5 @@ class MCPServersConfig(AppConfig):
         from django.db.models.signals import post_migrate
 
         post_migrate.connect(_on_post_migrate, sender=self)
+
+        import mcp_servers.signals  # noqa: F401
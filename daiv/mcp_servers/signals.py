@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from mcp_servers.models import MCPServer
+
+
+@receiver(post_save, sender=MCPServer)
+@receiver(post_delete, sender=MCPServer)
+def clear_deferred_index_cache_on_catalog_change(sender: type, instance: MCPServer, **kwargs: Any) -> None:
+    """A changed MCP catalog retires the tool sets this process indexed; drop them rather than let
+    them sit in the cache until the LRU ages them out. Other processes key by tool-set fingerprint,
+    so they never serve a stale index either way."""
+    from automation.agent.deferred.index import clear_index_cache
+
+    clear_index_cache()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, cast
 
 from django.db import transaction
@@ -10,15 +10,18 @@ from django.utils import timezone
 from asgiref.sync import sync_to_async
 
 from core.site_settings import site_settings
+from memory.fingerprint import deduplicate, record_savings
 from memory.llm import build_structured_llm
 from memory.models import EntryStatus, MemoryEntry, MemoryObservation, ObservationStatus, RepositoryMemory
 from memory.render import prune_to_budget, render_memory_document
+from memory.retrieval import plan_batches
 from memory.schemas import MAX_OPERATIONS, MemoryOperations
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from datetime import datetime
 
+    from memory.retrieval import ConsolidationBatch
     from memory.schemas import MemoryOperation
 
 logger = logging.getLogger("daiv.memory")
@@ -47,6 +50,8 @@ class RoundOutcome:
     # The part of ``still_pending`` we deferred ourselves at ``MAX_OPERATIONS``, as opposed to
     # observations the model simply never named. Only the latter is a model fault.
     truncated: int = 0
+    # Observations settled by ``memory.fingerprint`` without being shown to the model.
+    deduplicated: int = 0
 
 
 class ConsolidationRound:
@@ -281,13 +286,12 @@ async def run_consolidation_round(
     """Decide and apply one round of operations for ``observations``.
 
     Shared by the scheduled task and the backfill command: the caller owns which observations the
-    round sees and whether the repository is in a fit state to consolidate, this owns the LLM call
-    and the apply. Returns ``None`` when nothing was applied.
+    round sees and whether the repository is in a fit state to consolidate, this owns the LLM calls
+    and the apply. A large store is consolidated in relevance-scoped batches (see
+    ``memory.retrieval.plan_batches``), one call each, and observations that merely restate an entry
+    or each other never reach the model (see ``memory.fingerprint.deduplicate``). Returns ``None``
+    when nothing was applied.
     """
-    from langchain_core.messages import HumanMessage, SystemMessage
-
-    from memory.prompts import consolidation_human, consolidation_system
-
     # Empty override → reuse the repo's agent model.
     consolidation_model = site_settings.memory_consolidation_model_name or config.models.agent.model
     try:
@@ -302,12 +306,73 @@ async def run_consolidation_round(
         return None
 
     entries = [entry async for entry in MemoryEntry.objects.filter(repo_id=repo_id).active().order_by("created_at")]
+    # Restatements of an entry or of each other are settled locally; only the rest reach the model.
+    deduplication = deduplicate(observations, entries)
+    batches = plan_batches(deduplication.undecided, entries) if deduplication.undecided else []
+    # Counted without re-planning the undeduplicated round: only a round settled entirely by
+    # fingerprint is sure to have saved a call, so this is a lower bound for a batched store.
+    avoided_calls = 1 if observations and not batches else 0
+    if len(batches) > 1:
+        logger.info(
+            "consolidation: repo %s — %d observation(s) against %d entr(ies) split into %d relevance-scoped batches",
+            repo_id,
+            len(deduplication.undecided),
+            len(entries),
+            len(batches),
+        )
+
+    # Batches never share an entry or an observation (see ``memory.retrieval``), so their
+    # operations are applied together as one round: one transaction, one render.
+    operations: list[MemoryOperation] = []
+    deferred: list[MemoryOperation] = []
+    for batch in batches:
+        batch_operations = deduplication.expand(
+            await _decide_operations(repo_id, structured_llm, consolidation_model, batch)
+        )
+        operations += batch_operations[:MAX_OPERATIONS]
+        deferred += batch_operations[MAX_OPERATIONS:]
+    # The model's decision on an entry wins over a local CONFIRM of it: the round would reject the
+    # second one anyway, and the observations behind a dropped CONFIRM stay pending for the next.
+    targeted = {entry_id for operation in operations for entry_id in operation.entry_ids}
+    operations += [
+        confirmation for confirmation in deduplication.confirmations if confirmation.entry_ids[0] not in targeted
+    ]
+    if not operations:
+        return None
+
+    round_ = ConsolidationRound(repo_id, operations, observations, entries, deferred=deferred)
+    outcome = await sync_to_async(round_.apply)(
+        max_lines=site_settings.memory_max_lines, max_bytes=site_settings.memory_max_bytes
+    )
+    if outcome is None:
+        return None
+    if deduplication.resolved:
+        logger.info(
+            "consolidation: repo %s — %d of %d observation(s) settled by fingerprint, %d model call(s) avoided",
+            repo_id,
+            deduplication.resolved,
+            len(observations),
+            avoided_calls,
+        )
+        await record_savings(repo_id, observations=deduplication.resolved, llm_calls=avoided_calls)
+    return replace(outcome, deduplicated=deduplication.resolved)
+
+
+async def _decide_operations(
+    repo_id: str, structured_llm, consolidation_model: str, batch: ConsolidationBatch
+) -> list[MemoryOperation]:
+    """Ask the model for the operations covering one batch; an empty list when it gave none."""
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    from memory.prompts import consolidation_human, consolidation_system
+
     entries_text = "\n".join(
-        f"- {entry.pk} | {entry.category} | {entry.last_confirmed_at:%Y-%m-%d} | {entry.content}" for entry in entries
+        f"- {entry.pk} | {entry.category} | {entry.last_confirmed_at:%Y-%m-%d} | {entry.content}"
+        for entry in batch.entries
     )
     observations_text = "\n".join(
         f"- {observation.pk} | {observation.category} | {observation.created_at:%Y-%m-%d} | {observation.content}"
-        for observation in observations
+        for observation in batch.observations
     )
 
     result = cast(
@@ -333,30 +398,24 @@ async def run_consolidation_round(
             "parse failure; leaving %d observation(s) pending",
             repo_id,
             consolidation_model,
-            len(observations),
+            len(batch.observations),
         )
-        return None
+        return []
     if not result.operations:
         logger.error(
             "consolidation: model returned an empty operation list for repo %s; leaving %d observation(s) pending",
             repo_id,
-            len(observations),
+            len(batch.observations),
         )
-        return None
-
-    operations, deferred = result.operations[:MAX_OPERATIONS], result.operations[MAX_OPERATIONS:]
-    if deferred:
+        return []
+    if len(result.operations) > MAX_OPERATIONS:
         logger.warning(
             "consolidation: repo %s — model returned %d operations, over the %d cap; the rest are deferred",
             repo_id,
             len(result.operations),
             MAX_OPERATIONS,
         )
-
-    round_ = ConsolidationRound(repo_id, operations, observations, entries, deferred=deferred)
-    return await sync_to_async(round_.apply)(
-        max_lines=site_settings.memory_max_lines, max_bytes=site_settings.memory_max_bytes
-    )
+    return result.operations
 
 
 def document_would_be_discarded(repo_id: str) -> bool:
@@ -0,0 +1,200 @@
+"""Local near-duplicate detection, so the model is never paid to rediscover a fact memory already holds.
+
+High-volume repositories teach the same things run after run: the same build command, the same
+reviewer convention. Two texts are taken to state the same fact when their normalised forms hash
+equal, or when the Jaccard similarity of their word-shingle sets reaches ``NEAR_DUPLICATE_SIMILARITY``.
+MinHash signatures, banded for locality-sensitive hashing, pick the candidates worth comparing, so a
+lookup never scans the whole store; the exact similarity then decides, so a signature collision
+cannot merge two different facts. Texts are only ever compared within one category.
+
+The threshold is deliberately conservative: a missed duplicate costs one model decision, whereas a
+false match silently folds a new fact into an old one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from django.db.models import F
+
+from memory.models import RepositoryMemory
+from memory.schemas import MemoryOperation
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from memory.models import MemoryEntry, MemoryObservation
+
+NEAR_DUPLICATE_SIMILARITY = 0.8
+SHINGLE_SIZE = 2
+NUM_PERMUTATIONS = 64
+# 16 bands of 4 rows: a pair is compared when any band matches, which happens for all but ~0.02% of
+# pairs at ``NEAR_DUPLICATE_SIMILARITY`` and for few unrelated ones.
+LSH_BANDS = 16
+
+_WORD_RE = re.compile(r"[a-z0-9_./-]+")
+_STOPWORDS = frozenset({"a", "an", "and", "are", "be", "by", "for", "in", "is", "it", "of", "on", "or", "the", "to"})
+_PRIME = (1 << 61) - 1
+# Fixed seed: a signature must mean the same thing in every process that computes one.
+_rng = random.Random(0x6D656D6F7279)  # noqa: S311 - hashing, not security
+_PERMUTATIONS = tuple((_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERMUTATIONS))
+
+
+def normalize(text: str) -> str:
+    """Lowercased words without punctuation or stopwords, so rewording noise does not hide a repeat."""
+    words = (token.strip("./-") for token in _WORD_RE.findall(text.lower()))
+    return " ".join(word for word in words if word and word not in _STOPWORDS)
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+@dataclass(frozen=True, slots=True)
+class Fingerprint:
+    """A text's normalised digest, its hashed word shingles and their MinHash signature."""
+
+    digest: str
+    shingles: frozenset[int]
+    signature: tuple[int, ...]
+
+    @classmethod
+    def of(cls, text: str) -> Fingerprint:
+        normalized = normalize(text)
+        words = normalized.split()
+        shingles = {" ".join(words[i : i + SHINGLE_SIZE]) for i in range(max(len(words) - SHINGLE_SIZE + 1, 1))}
+        hashes = frozenset(_hash(shingle) for shingle in shingles)
+        return cls(
+            digest=hashlib.sha256(normalized.encode()).hexdigest(),
+            shingles=hashes,
+            signature=tuple(min((a * value + b) % _PRIME for value in hashes) for a, b in _PERMUTATIONS),
+        )
+
+    def similarity(self, other: Fingerprint) -> float:
+        """Jaccard similarity of the two texts' shingle sets."""
+        if self.digest == other.digest:
+            return 1.0
+        return len(self.shingles & other.shingles) / len(self.shingles | other.shingles)
+
+    def bands(self) -> Iterator[tuple[int, tuple[int, ...]]]:
+        rows = len(self.signature) // LSH_BANDS
+        for band in range(LSH_BANDS):
+            yield band, self.signature[band * rows : (band + 1) * rows]
+
+
+class FingerprintIndex:
+    """Near-duplicate lookup over items carrying ``category`` and ``content`` (entries or observations).
+
+    Items are bucketed by signature band, so a lookup only scores the few items sharing a band with it.
+    """
+
+    def __init__(self, items: Iterable[Any] = ()) -> None:
+        self._exact: dict[tuple[str, str], Any] = {}
+        self._buckets: defaultdict[tuple, list[tuple[Fingerprint, Any]]] = defaultdict(list)
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Any) -> None:
+        fingerprint = Fingerprint.of(item.content)
+        self._exact.setdefault((item.category, fingerprint.digest), item)
+        for band in fingerprint.bands():
+            self._buckets[(item.category, *band)].append((fingerprint, item))
+
+    def match(self, category: str, content: str) -> Any | None:
+        """The earliest-added item of ``category`` that ``content`` restates, or ``None``."""
+        fingerprint = Fingerprint.of(content)
+        if (exact := self._exact.get((category, fingerprint.digest))) is not None:
+            return exact
+        best, best_similarity = None, NEAR_DUPLICATE_SIMILARITY
+        seen: set[int] = set()
+        for band in fingerprint.bands():
+            for candidate, item in self._buckets.get((category, *band), ()):
+                if id(item) in seen:
+                    continue
+                seen.add(id(item))
+                similarity = fingerprint.similarity(candidate)
+                if similarity > best_similarity or (best is None and similarity == best_similarity):
+                    best, best_similarity = item, similarity
+        return best
+
+
+def novel(candidates: Sequence[Any], known: Iterable[Any]) -> list[Any]:
+    """``candidates`` minus those restating a ``known`` item or an earlier candidate, in order."""
+    index = FingerprintIndex(known)
+    kept = []
+    for candidate in candidates:
+        if index.match(candidate.category, candidate.content) is None:
+            kept.append(candidate)
+            index.add(candidate)
+    return kept
+
+
+@dataclass
+class Deduplication:
+    """How a consolidation round's observations split between local resolution and the model."""
+
+    # What the model still has to decide: one representative per group of restatements.
+    undecided: list[MemoryObservation] = field(default_factory=list)
+    # One CONFIRM per active entry that observations restate, naming every such observation.
+    confirmations: list[MemoryOperation] = field(default_factory=list)
+    # Representative id → the ids of later observations restating it; they follow its decision.
+    followers: dict[str, list[str]] = field(default_factory=dict)
+    resolved: int = 0
+
+    def expand(self, operations: Iterable[MemoryOperation]) -> list[MemoryOperation]:
+        """``operations`` with each representative's followers added wherever it is named."""
+        expanded = []
+        for operation in operations:
+            followers = [fid for oid in operation.observation_ids for fid in self.followers.get(oid, ())]
+            if followers:
+                operation = MemoryOperation.model_validate({
+                    **operation.model_dump(),
+                    "observation_ids": [*operation.observation_ids, *followers],
+                })
+            expanded.append(operation)
+        return expanded
+
+
+def deduplicate(observations: Sequence[MemoryObservation], entries: Sequence[MemoryEntry]) -> Deduplication:
+    """Settle what fingerprints can before a round asks the model.
+
+    An observation restating an active entry becomes a CONFIRM of it, exactly as the model would
+    answer; one restating an earlier observation of the round is held back from the prompt and
+    follows that observation's operation. ``observations`` must be oldest first, so the oldest
+    statement of a fact is the one the model sees.
+    """
+    known = FingerprintIndex(entries)
+    representatives = FingerprintIndex()
+    confirmed: dict[str, list[str]] = {}
+    result = Deduplication()
+    for observation in observations:
+        if (entry := known.match(observation.category, observation.content)) is not None:
+            confirmed.setdefault(str(entry.pk), []).append(str(observation.pk))
+        elif (representative := representatives.match(observation.category, observation.content)) is not None:
+            result.followers.setdefault(str(representative.pk), []).append(str(observation.pk))
+        else:
+            representatives.add(observation)
+            result.undecided.append(observation)
+            continue
+        result.resolved += 1
+    result.confirmations = [
+        MemoryOperation(op="CONFIRM", entry_ids=[entry_id], observation_ids=observation_ids)
+        for entry_id, observation_ids in confirmed.items()
+    ]
+    return result
+
+
+async def record_savings(repo_id: str, *, observations: int = 0, llm_calls: int = 0) -> None:
+    """Add to the repository's counters of observations resolved and model calls avoided locally."""
+    if not (observations or llm_calls):
+        return
+    await RepositoryMemory.objects.aget_or_create(repo_id=repo_id)
+    await RepositoryMemory.objects.filter(repo_id=repo_id).aupdate(
+        deduplicated_observations=F("deduplicated_observations") + observations,
+        avoided_llm_calls=F("avoided_llm_calls") + llm_calls,
+    )
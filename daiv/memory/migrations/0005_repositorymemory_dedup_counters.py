@@ -0,0 +1,20 @@
+# Generated by Django 6.0.7 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("memory", "0004_backfill_entries_from_documents")]
+
+    operations = [
+        migrations.AddField(
+            model_name="repositorymemory",
+            name="deduplicated_observations",
+            field=models.PositiveIntegerField(default=0, verbose_name="deduplicated observations"),
+        ),
+        migrations.AddField(
+            model_name="repositorymemory",
+            name="avoided_llm_calls",
+            field=models.PositiveIntegerField(default=0, verbose_name="avoided LLM calls"),
+        ),
+    ]
@@ -159,6 +159,9 @@ class RepositoryMemory(models.Model):
     # Bumped on every round, including the ones that change nothing, so a repository whose
     # consolidation keeps failing backs off like a healthy one instead of retrying hourly.
     last_attempted_at = models.DateTimeField(_("last attempted at"), null=True, blank=True)
+    # Running totals of what ``memory.fingerprint`` settled without the model.
+    deduplicated_observations = models.PositiveIntegerField(_("deduplicated observations"), default=0)
+    avoided_llm_calls = models.PositiveIntegerField(_("avoided LLM calls"), default=0)
     updated_at = models.DateTimeField(_("updated at"), auto_now=True)
 
     objects = RepositoryMemoryQuerySet.as_manager()
@@ -34,7 +34,7 @@ extraction_human = HumanMessagePromptTemplate.from_template(
     """Repository: {{repo_id}}
 Run finished with status: {{status}}
 
-Run transcript (roles, text, tool calls; long outputs truncated):
+Run transcript (roles, text, tool calls; long outputs truncated, repeats collapsed, low-signal turns elided):
 ~~~
 {{transcript}}
 ~~~
@@ -72,6 +72,8 @@ Rules:
   below is rejected and its observations are re-queued, so never invent or reformat one.
 - Entries you do not name are left exactly as they are. There is no operation that rewrites
   memory as a whole, and you must not attempt one.
+- On a large memory you are shown only the entries related to this batch of observations, not
+  every entry; an entry missing from the list is not evidence that memory lacks the fact.
 - DISCARD is a decision, not a fallback: reject an observation when it is ephemeral (a one-off
   error count, a resolved incident, the state of one run), generic advice, a restatement of a
   task, or specific to a deployment rather than the repository. Always give a reason — a
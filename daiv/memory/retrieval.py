@@ -0,0 +1,154 @@
+"""Scope a consolidation round to the memory entries each new observation is actually about.
+
+Showing the model every entry alongside every observation makes a round's prompt grow with the
+store, not with the work. For a store past ``FULL_CONTEXT_MAX_ENTRIES`` the round is split instead:
+each observation retrieves its lexically nearest entries from a BM25 index built over the store,
+observations that share an entry (or restate one another) are clustered so every operation that
+could touch an entry is decided in one call, and clusters are packed into batches of at most
+``MAX_ENTRIES_PER_BATCH`` entries and ``MAX_OBSERVATIONS_PER_BATCH`` observations. A round's cost
+is then bounded by its observations.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from memory.schemas import MAX_OPERATIONS
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from memory.models import MemoryEntry, MemoryObservation
+
+# Small stores go to the model whole: the entry list is cheap and a complete view decides best.
+FULL_CONTEXT_MAX_ENTRIES = 60
+NEIGHBOURS_PER_OBSERVATION = 5
+MAX_ENTRIES_PER_BATCH = 40
+# One operation per observation at most, so a batch never asks for more than the model may return.
+MAX_OBSERVATIONS_PER_BATCH = MAX_OPERATIONS
+# Two observations sharing this fraction of their terms are treated as one fact, so their ADDs
+# are decided together rather than landing twice from two batches.
+OBSERVATION_OVERLAP = 0.6
+
+_TOKEN_RE = re.compile(r"[a-z0-9_./-]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased terms; keeps ``_``, ``.``, ``/`` and ``-`` so commands, paths and flags stay whole."""
+    return [token.strip("./-") for token in _TOKEN_RE.findall(text.lower()) if len(token.strip("./-")) > 2]
+
+
+@dataclass
+class ConsolidationBatch:
+    """The observations decided in one model call, and the only entries that call is shown."""
+
+    observations: list[MemoryObservation] = field(default_factory=list)
+    entries: list[MemoryEntry] = field(default_factory=list)
+
+
+class MemoryIndex:
+    """BM25 index over a repository's active entries."""
+
+    def __init__(self, entries: Sequence[MemoryEntry]) -> None:
+        # Local: ``rank_bm25`` pulls in numpy, and the memory views import this module at startup.
+        from rank_bm25 import BM25Plus
+
+        self.entries = list(entries)
+        self._token_sets = [frozenset(tokenize(entry.content)) for entry in self.entries]
+        self._bm25 = BM25Plus([tokenize(entry.content) for entry in self.entries]) if self.entries else None
+
+    def neighbours(self, text: str, top_k: int = NEIGHBOURS_PER_OBSERVATION) -> list[int]:
+        """Indices of the ``top_k`` entries nearest ``text``, best first; only entries sharing a term.
+
+        BM25Plus scores every document above zero, so without the overlap filter an unrelated entry
+        would fill a slot whenever fewer than ``top_k`` entries match.
+        """
+        tokens = tokenize(text)
+        if self._bm25 is None or not tokens:
+            return []
+        query = set(tokens)
+        scores = self._bm25.get_scores(tokens)
+        ranked = sorted(
+            (i for i, token_set in enumerate(self._token_sets) if token_set & query), key=lambda i: -scores[i]
+        )
+        return ranked[:top_k]
+
+
+class _Clusters:
+    """Union-find over observation positions."""
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        self.parent[self.find(a)] = self.find(b)
+
+
+def plan_batches(observations: Sequence[MemoryObservation], entries: Sequence[MemoryEntry]) -> list[ConsolidationBatch]:
+    """Split a round into batches; a single whole-store batch while the store is small.
+
+    Observations keep their incoming (oldest-first) order within a batch, and batches are ordered
+    by their oldest observation, so the prompt's "cover the oldest first" still holds per call.
+    """
+    if len(entries) <= FULL_CONTEXT_MAX_ENTRIES:
+        return [ConsolidationBatch(observations=list(observations), entries=list(entries))]
+
+    index = MemoryIndex(entries)
+    neighbours = [index.neighbours(observation.content) for observation in observations]
+    clusters = _Clusters(len(observations))
+
+    owner: dict[int, int] = {}
+    for position, entry_positions in enumerate(neighbours):
+        for entry_position in entry_positions:
+            if entry_position in owner:
+                clusters.union(position, owner[entry_position])
+            else:
+                owner[entry_position] = position
+
+    token_sets = [frozenset(tokenize(observation.content)) for observation in observations]
+    for a in range(len(observations)):
+        for b in range(a + 1, len(observations)):
+            smaller = min(len(token_sets[a]), len(token_sets[b]))
+            if smaller and len(token_sets[a] & token_sets[b]) >= OBSERVATION_OVERLAP * smaller:
+                clusters.union(a, b)
+
+    grouped: dict[int, list[int]] = {}
+    for position in range(len(observations)):
+        grouped.setdefault(clusters.find(position), []).append(position)
+
+    batches: list[ConsolidationBatch] = []
+    current: list[int] = []
+    current_entries: set[int] = set()
+    for members in grouped.values():
+        cluster_entries = {entry_position for position in members for entry_position in neighbours[position]}
+        if current and (
+            len(current_entries | cluster_entries) > MAX_ENTRIES_PER_BATCH
+            or len(current) + len(members) > MAX_OBSERVATIONS_PER_BATCH
+        ):
+            batches.append(_batch(observations, entries, current, current_entries))
+            current, current_entries = [], set()
+        current += members
+        current_entries |= cluster_entries
+    if current:
+        batches.append(_batch(observations, entries, current, current_entries))
+    return batches
+
+
+def _batch(
+    observations: Sequence[MemoryObservation],
+    entries: Sequence[MemoryEntry],
+    positions: list[int],
+    entry_positions: set[int],
+) -> ConsolidationBatch:
+    return ConsolidationBatch(
+        observations=[observations[position] for position in sorted(positions)],
+        entries=[entries[position] for position in sorted(entry_positions)],
+    )
@@ -15,6 +15,7 @@ from codebase.repo_config import RepositoryConfig
 from core.site_settings import site_settings
 from core.utils import locked_task
 from memory.consolidation import document_would_be_discarded, run_consolidation_round
+from memory.fingerprint import novel, record_savings
 from memory.models import MemoryObservation, RepositoryMemory
 
 logger = logging.getLogger("daiv.memory")
@@ -93,13 +94,14 @@ async def consolidate_memory_task(repo_id: str) -> None:
         )
     logger.info(
         "consolidate_memory_task: repo %s — applied %d operation(s) (%d consolidated, %d discarded, "
-        "%d still pending, %d rejected)",
+        "%d still pending, %d rejected, %d deduplicated)",
         repo_id,
         outcome.applied,
         outcome.consolidated,
         outcome.discarded,
         outcome.still_pending,
         outcome.rejected,
+        outcome.deduplicated,
     )
 
 
@@ -142,7 +144,25 @@ async def extract_observations_task(run_id: str) -> None:
         logger.info("extract_observations_task: memory disabled for repo %s, skipping", run.repo_id)
         return
 
-    if not (observations := await extract_observations(run)):
+    if not (extracted := await extract_observations(run)):
+        return
+
+    # A restatement of a fact already waiting for consolidation would only join that fact's
+    # decision, so it is not stored. Restatements of active entries are: consolidation confirms
+    # them without the model, which keeps the entry fresh against budget eviction.
+    pending = [
+        obs async for obs in MemoryObservation.objects.filter(repo_id=run.repo_id).pending().only("category", "content")
+    ]
+    observations = novel(extracted, pending)
+    if dropped := len(extracted) - len(observations):
+        logger.info(
+            "extract_observations_task: dropped %d of %d observation(s) from run %s as restating pending ones",
+            dropped,
+            len(extracted),
+            run_id,
+        )
+        await record_savings(run.repo_id, observations=dropped)
+    if not observations:
         return
 
     await MemoryObservation.objects.abulk_create([
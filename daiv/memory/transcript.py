@@ -1,13 +1,47 @@
+"""Serialize a finished run into the transcript the extraction model reads.
+
+Long runs are mostly re-reads and repeated tool output, while the learnings sit in a handful of
+turns: the task, the errors, and the retries and corrections that follow them. Serialization
+therefore compacts before it truncates:
+
+- a re-read of a file (or listing) the run has not written since shows only its call;
+- an output identical to an earlier one is replaced by a back-reference;
+- error outputs get a larger limit than other outputs, and the turn after an error is kept whole;
+- when the result is still over budget, whole turns are dropped by extraction relevance —
+  plain reads first — instead of eliding the middle of the run.
+"""
+
 from __future__ import annotations
 
+import hashlib
+import re
+from dataclasses import dataclass, field
 from typing import Any
 
 from automation.agent.utils import extract_text_content
 
 MAX_TOOL_OUTPUT_CHARS = 1_000
+MAX_ERROR_OUTPUT_CHARS = 4_000
 MAX_TOOL_ARG_CHARS = 200
 MAX_TRANSCRIPT_CHARS = 60_000
 
+# Tools whose repeat on the same target returns what the run has already seen, unless the target
+# was written in between. Any other tool (bash above all) may change files, so it resets that.
+READ_ONLY_TOOLS = frozenset({"read_file", "ls", "glob", "grep"})
+FILE_WRITING_TOOLS = frozenset({"write_file", "edit_file"})
+
+# Relevance of a turn to extraction; the lowest are dropped first when the budget runs out.
+SCORE_TOOL_ONLY = 0
+SCORE_REASONING = 1
+SCORE_CORRECTION = 2
+SCORE_CRITICAL = 3
+
+_ERROR_RE = re.compile(r"\A\s*error\b|Traceback \(most recent call last\)|\"exit_code\":\s*[1-9]", re.IGNORECASE)
+_CORRECTION_RE = re.compile(
+    r"\b(actually|instead|mistake|wrong|incorrect|turns out|doesn't work|didn't work|retry|revert)\b", re.IGNORECASE
+)
+_ELIDED = "... [{count} lower-signal turn(s) elided] ..."
+
 
 def _truncate(text: str, limit: int) -> str:
     if len(text) <= limit:
@@ -15,29 +49,149 @@ def _truncate(text: str, limit: int) -> str:
     return text[:limit] + f"... [truncated {len(text) - limit} chars]"
 
 
-def serialize_transcript(messages: list[Any], *, max_chars: int = MAX_TRANSCRIPT_CHARS) -> str:
-    """Serialize a LangGraph message list into a compact plain-text transcript.
+@dataclass
+class _Turn:
+    """A human message, or an AI message together with the outputs of its tool calls."""
 
-    Keeps roles, text content, tool names and truncated args/outputs. When the
-    result exceeds ``max_chars``, the middle is elided: the head holds the task
-    definition and the tail holds outcomes/corrections — where extraction signal
-    lives.
-    """
-    lines: list[str] = []
-    for message in messages:
+    lines: list[str] = field(default_factory=list)
+    score: int = SCORE_TOOL_ONLY
+    failed: bool = False
+
+    @property
+    def text(self) -> str:
+        return "\n".join(self.lines)
+
+
+def _target(args: Any) -> str | None:
+    if not isinstance(args, dict):
+        return None
+    return args.get("file_path") or args.get("path") or args.get("pattern")
+
+
+class _Compactor:
+    """Builds the run's turns, collapsing re-reads and repeated outputs as it goes."""
+
+    def __init__(self) -> None:
+        self.turns: list[_Turn] = []
+        # ``(tool, target, args)`` of the reads already in the transcript and still current.
+        self.seen_reads: set[tuple[str, str, str]] = set()
+        self.seen_outputs: set[str] = set()
+        # ``tool_call_id``s whose output is known to be a repeat of a read already in the transcript.
+        self.rereads: set[str] = set()
+
+    def add(self, message: Any) -> None:
         msg_type = getattr(message, "type", "unknown")
         if msg_type == "tool":
-            name = getattr(message, "name", None) or "tool"
-            content = _truncate(extract_text_content(message.content), MAX_TOOL_OUTPUT_CHARS)
-            lines.append(f"[tool:{name}] {content}")
-            continue
+            self._add_tool_output(message)
+            return
+
+        turn = _Turn(score=SCORE_CRITICAL if msg_type == "human" else SCORE_TOOL_ONLY)
+        self.turns.append(turn)
         if text := extract_text_content(message.content):
-            lines.append(f"[{msg_type}] {text}")
+            turn.lines.append(f"[{msg_type}] {text}")
+            if msg_type != "human":
+                turn.score = SCORE_CORRECTION if _CORRECTION_RE.search(text) else SCORE_REASONING
         for tool_call in getattr(message, "tool_calls", None) or []:
-            args = _truncate(str(tool_call.get("args", {})), MAX_TOOL_ARG_CHARS)
-            lines.append(f"[{msg_type}:tool_call] {tool_call.get('name', '?')}({args})")
+            turn.lines.append(self._tool_call_line(msg_type, tool_call))
+
+    def _tool_call_line(self, msg_type: str, tool_call: dict) -> str:
+        name = tool_call.get("name", "?")
+        raw_args = tool_call.get("args", {})
+        args = _truncate(str(raw_args), MAX_TOOL_ARG_CHARS)
+        target = _target(raw_args)
+        if name in READ_ONLY_TOOLS and target:
+            key = (name, target, str(raw_args))
+            if key in self.seen_reads:
+                if call_id := tool_call.get("id"):
+                    self.rereads.add(call_id)
+                return f"[{msg_type}:tool_call] {name}({args}) (re-read)"
+            self.seen_reads.add(key)
+        elif name in FILE_WRITING_TOOLS and target:
+            # The written file reads differently now, and so may any listing or search.
+            self.seen_reads = {key for key in self.seen_reads if key[0] == "read_file" and key[1] != target}
+        elif name not in READ_ONLY_TOOLS:
+            self.seen_reads.clear()
+        return f"[{msg_type}:tool_call] {name}({args})"
+
+    def _add_tool_output(self, message: Any) -> None:
+        if not self.turns:
+            self.turns.append(_Turn())
+        turn = self.turns[-1]
+        name = getattr(message, "name", None) or "tool"
+        content = extract_text_content(message.content)
+        failed = getattr(message, "status", None) == "error" or bool(_ERROR_RE.search(content))
+        digest = hashlib.blake2b(f"{name}\0{content}".encode(), digest_size=16).hexdigest()
+
+        if getattr(message, "tool_call_id", None) in self.rereads and not failed:
+            turn.lines.append(f"[tool:{name}] (output omitted, already read above)")
+        elif digest in self.seen_outputs:
+            turn.lines.append(f"[tool:{name}] (same {'error' if failed else 'output'} as an earlier call)")
+        else:
+            self.seen_outputs.add(digest)
+            limit = MAX_ERROR_OUTPUT_CHARS if failed else MAX_TOOL_OUTPUT_CHARS
+            turn.lines.append(f"[tool:{name}] {_truncate(content, limit)}")
+        if failed:
+            turn.failed = True
+            turn.score = SCORE_CRITICAL
+
+    def compacted(self) -> list[_Turn]:
+        for previous, turn in zip(self.turns, self.turns[1:], strict=False):
+            if previous.failed:
+                # The retry or correction that answers an error.
+                turn.score = SCORE_CRITICAL
+        return [turn for turn in self.turns if turn.lines]
+
+
+def _fit(turns: list[_Turn], max_chars: int) -> str:
+    """Join ``turns``, dropping the least relevant middle ones until the result fits ``max_chars``.
+
+    The first turn (the task) and the last (the outcome) are always kept. Among equally relevant
+    turns those furthest from either end go first, so what survives is the task's opening and the
+    run's conclusion.
+    """
+    texts = [turn.text for turn in turns]
+    total = sum(map(len, texts)) + max(len(texts) - 1, 0)
+    if total <= max_chars:
+        return "\n".join(texts)
+
+    count = len(turns)
+    dropped = [False] * count
+    marker_chars = len(_ELIDED.format(count=9999)) + 1
+    candidates = sorted(range(1, count - 1), key=lambda i: (turns[i].score, -min(i, count - 1 - i)))
+    for i in candidates:
+        if total <= max_chars:
+            break
+        dropped[i] = True
+        total -= len(texts[i]) + 1
+        neighbours = dropped[i - 1] + dropped[i + 1]
+        # A new run of dropped turns needs a marker; joining two runs frees one.
+        total += marker_chars * (1 - neighbours)
+
+    parts: list[str] = []
+    elided = 0
+    for text, is_dropped in zip(texts, dropped, strict=True):
+        if is_dropped:
+            elided += 1
+            continue
+        if elided:
+            parts.append(_ELIDED.format(count=elided))
+            elided = 0
+        parts.append(text)
+    return "\n".join(parts)
+
+
+def serialize_transcript(messages: list[Any], *, max_chars: int = MAX_TRANSCRIPT_CHARS) -> str:
+    """Serialize a LangGraph message list into a compact plain-text transcript.
+
+    Keeps roles, text content, tool names and truncated args/outputs, compacted as described in
+    the module docstring. Should a few huge turns still exceed ``max_chars``, the middle is elided
+    by characters: the head holds the task definition and the tail holds outcomes/corrections.
+    """
+    compactor = _Compactor()
+    for message in messages:
+        compactor.add(message)
 
-    transcript = "\n".join(lines)
+    transcript = _fit(compactor.compacted(), max_chars)
     if len(transcript) <= max_chars:
         return transcript
     head_chars = max_chars // 3
@@ -4,6 +4,9 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from uuid import UUID
+
     from accounts.models import User
     from notifications.choices import ChannelType
     from notifications.models import Notification, NotificationDelivery
@@ -16,7 +19,8 @@ class NotificationChannel(ABC):
     implement ``send``, and register themselves with the ``@register_channel``
     decorator from ``notifications.channels.registry``. ``resolve_address`` has a
     sensible default (most recent verified ``UserChannelBinding`` for this channel)
-    that subclasses may override.
+    that subclasses may override, and so does ``send_batch`` (one ``send`` per delivery),
+    which channels override to share a connection across a batch.
     """
 
     channel_type: ClassVar[ChannelType]
@@ -42,3 +46,24 @@ class NotificationChannel(ABC):
     def send(self, notification: Notification, delivery: NotificationDelivery) -> None:
         """Deliver. Raise UnrecoverableDeliveryError for permanent failures; any other exception
         is treated as transient and retried."""
+
+    def send_batch(self, deliveries: Sequence[NotificationDelivery]) -> dict[UUID, Exception | None]:
+        """Deliver each of ``deliveries`` (with ``notification`` loaded) and report how each went:
+        ``None`` when sent, otherwise the exception ``send`` raised for it. An exception raised out of
+        this method instead (e.g. the connection could not be opened) fails the whole batch as transient."""
+        return send_each(deliveries, self.send)
+
+
+def send_each(
+    deliveries: Sequence[NotificationDelivery], send: Callable[[Notification, NotificationDelivery], None]
+) -> dict[UUID, Exception | None]:
+    """Call ``send`` for each delivery in turn, collecting its outcome rather than stopping at a failure."""
+    outcomes: dict[UUID, Exception | None] = {}
+    for delivery in deliveries:
+        try:
+            send(delivery.notification, delivery)
+        except Exception as exc:
+            outcomes[delivery.id] = exc
+        else:
+            outcomes[delivery.id] = None
+    return outcomes
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import contextlib
 import logging
-from smtplib import SMTPRecipientsRefused
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.core.mail import BadHeaderError, send_mail
+from django.core.mail import BadHeaderError, get_connection, send_mail
 from django.template import TemplateDoesNotExist, TemplateSyntaxError
 from django.template.loader import render_to_string
 from django.utils.translation import gettext_lazy as _
@@ -16,17 +17,31 @@ from notifications.choices import ChannelType
 from notifications.exceptions import UnrecoverableDeliveryError
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from uuid import UUID
+
+    from django.core.mail.backends.base import BaseEmailBackend
+
     from notifications.models import Notification, NotificationDelivery
 
 logger = logging.getLogger(__name__)
 
+# Per SMTP operation. Bounds a batch against a stalled server, so it ends before the claim on its
+# deliveries lapses (see ``notifications.tasks.DELIVERY_BATCH_SIZE``).
+_SMTP_TIMEOUT_SECONDS = 5.0
+
+# Failures of the connection rather than of one message; nothing more can be sent over it.
+_CONNECTION_ERRORS = (TimeoutError, ConnectionError, SMTPServerDisconnected)
+
 
 @register_channel
 class EmailChannel(NotificationChannel):
     channel_type = ChannelType.EMAIL
     display_name = _("Email")
 
-    def send(self, notification: Notification, delivery: NotificationDelivery) -> None:
+    def send(
+        self, notification: Notification, delivery: NotificationDelivery, *, connection: BaseEmailBackend | None = None
+    ) -> None:
         from core.utils import build_absolute_url, prefixed_email_subject
 
         link_absolute_url = build_absolute_url(notification.link_url) if notification.link_url else ""
@@ -44,6 +59,33 @@ class EmailChannel(NotificationChannel):
                 from_email=settings.DEFAULT_FROM_EMAIL,
                 recipient_list=[delivery.address],
                 html_message=html_body,
+                connection=connection,
             )
         except (SMTPRecipientsRefused, BadHeaderError) as exc:
             raise UnrecoverableDeliveryError(f"Permanent email failure: {exc}") from exc
+
+    def send_batch(self, deliveries: Sequence[NotificationDelivery]) -> dict[UUID, Exception | None]:
+        """Send the batch over one SMTP connection instead of a connection per message.
+
+        Once the connection itself fails (timed out, dropped), the rest of the batch is left unsent for
+        its retry rather than each waiting out the same dead connection.
+        """
+        connection = get_connection(timeout=_SMTP_TIMEOUT_SECONDS)
+        connection.open()
+        outcomes: dict[UUID, Exception | None] = {}
+        try:
+            for delivery in deliveries:
+                try:
+                    self.send(delivery.notification, delivery, connection=connection)
+                except _CONNECTION_ERRORS as exc:
+                    outcomes.update((pending.id, exc) for pending in deliveries if pending.id not in outcomes)
+                    break
+                except Exception as exc:
+                    outcomes[delivery.id] = exc
+                else:
+                    outcomes[delivery.id] = None
+        finally:
+            # The outcomes must survive a connection that cannot be closed cleanly: the messages sent are sent.
+            with contextlib.suppress(OSError):
+                connection.close()
+        return outcomes
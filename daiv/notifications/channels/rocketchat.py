@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
 import logging
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING
 
 from django.utils.translation import gettext_lazy as _
@@ -10,13 +12,16 @@ import httpx
 
 from core.site_settings import site_settings
 from core.utils import build_absolute_url, build_uri
-from notifications.channels.base import NotificationChannel
+from notifications.channels.base import NotificationChannel, send_each
 from notifications.channels.registry import register_channel
 from notifications.channels.rocketchat_renderers.registry import get_renderer
 from notifications.choices import ChannelType
 from notifications.exceptions import UnrecoverableDeliveryError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from uuid import UUID
+
     from notifications.models import Notification, NotificationDelivery
 
 logger = logging.getLogger("daiv.notifications")
@@ -41,12 +46,14 @@ class _RCClient:
     """Bundled Rocket Chat credentials + convenience HTTP calls.
 
     ``token`` is excluded from the default repr to avoid leaking the bot secret
-    via log lines, exception tracebacks, or test output.
+    via log lines, exception tracebacks, or test output. Calls go through ``http`` when set
+    (see ``pooled``), and through a one-off connection otherwise.
     """
 
     url: str
     user_id: str
     token: str = field(repr=False)
+    http: httpx.Client | None = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_site_settings(cls) -> _RCClient | None:
@@ -57,12 +64,18 @@ class _RCClient:
             return None
         return cls(url=url, user_id=user_id, token=token.get_secret_value())
 
+    @contextmanager
+    def pooled(self) -> Iterator[_RCClient]:
+        """This client, making its calls over one keep-alive connection pool for the block."""
+        with httpx.Client(timeout=_RC_TIMEOUT_SECONDS) as http:
+            yield replace(self, http=http)
+
     @property
     def _headers(self) -> dict[str, str]:
         return {"X-Auth-Token": self.token, "X-User-Id": self.user_id}
 
     def post(self, method: str, payload: dict) -> httpx.Response:
-        return httpx.post(
+        return (self.http or httpx).post(
             build_uri(self.url, f"api/v1/{method}"),
             headers={**self._headers, "Content-Type": "application/json"},
             json=payload,
@@ -186,13 +199,28 @@ class RocketChatChannel(NotificationChannel):
         return bool(site_settings.rocketchat_enabled)
 
     def send(self, notification: Notification, delivery: NotificationDelivery) -> None:
+        self._post_message(self._client(), notification, delivery)
+
+    def send_batch(self, deliveries: Sequence[NotificationDelivery]) -> dict[UUID, Exception | None]:
+        """Post the batch over one keep-alive connection. Rocket Chat has no bulk endpoint for direct
+        messages to different users, so it is still one ``chat.postMessage`` per delivery."""
+        try:
+            client = self._client()
+        except UnrecoverableDeliveryError as exc:
+            return dict.fromkeys((delivery.id for delivery in deliveries), exc)
+        with client.pooled() as pooled:
+            return send_each(deliveries, functools.partial(self._post_message, pooled))
+
+    def _client(self) -> _RCClient:
         if not self.is_enabled():
             raise UnrecoverableDeliveryError("Rocket Chat is disabled")
 
         client = _RCClient.from_site_settings()
         if client is None:
             raise UnrecoverableDeliveryError("Rocket Chat not configured")
+        return client
 
+    def _post_message(self, client: _RCClient, notification: Notification, delivery: NotificationDelivery) -> None:
         try:
             _rc_post(client, "chat.postMessage", _build_payload(notification, delivery))
         except RocketChatPermanentError as exc:
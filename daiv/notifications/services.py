@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import logging
 from typing import TYPE_CHECKING
 
 from django.db import transaction
@@ -16,8 +15,6 @@ if TYPE_CHECKING:
     from accounts.models import User
     from notifications.choices import ChannelType, EventType
 
-logger = logging.getLogger(__name__)
-
 
 def _resolve_address_or_skipped_reason(channel_type: ChannelType, recipient: User) -> tuple[str, str | None]:
     """Resolve the delivery address for a channel, or explain why it cannot be resolved.
@@ -73,18 +70,16 @@ def create_notification(
 
 
 def dispatch_notification(notification: Notification) -> None:
-    """Enqueue delivery tasks for each pending delivery on ``notification``."""
-    from notifications.tasks import deliver_notification_task
-
-    pending = notification.deliveries.filter(status=DeliveryStatus.PENDING).values_list("id", flat=True)
-    for delivery_id in pending:
-        try:
-            deliver_notification_task.enqueue(str(delivery_id))
-        except Exception:
-            logger.exception("Failed to enqueue delivery task for delivery_id=%s", delivery_id)
-            NotificationDelivery.objects.filter(id=delivery_id).update(
-                status=DeliveryStatus.FAILED, error_message="Failed to enqueue delivery task"
-            )
+    """Schedule a drain of each channel ``notification`` has a pending delivery on.
+
+    The drains deliver in batches, so a fan-out to many recipients enqueues one task per channel
+    rather than one per delivery (see ``notifications.tasks``).
+    """
+    from notifications.tasks import schedule_delivery
+
+    pending = notification.deliveries.filter(status=DeliveryStatus.PENDING).values_list("channel_type", flat=True)
+    for channel_type in set(pending):
+        schedule_delivery(channel_type)
 
 
 def notify(
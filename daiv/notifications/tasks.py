@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
-from uuid import UUID
+from datetime import datetime, timedelta
 
-from django.db.models import Count, Q
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q
 from django.utils import timezone
 
 from crontask import cron
@@ -22,65 +23,183 @@ logger = logging.getLogger("daiv.notifications")
 MAX_DELIVERY_ATTEMPTS = 3
 RETRY_BACKOFF_SECONDS = [60, 300]  # wait before attempt 2, before attempt 3
 
+# Deliveries claimed and sent per round trip. Small enough that even a batch of timeouts (5 s
+# per request on Rocket Chat, per SMTP operation on email) ends inside the first retry's backoff,
+# so no other drain can claim a delivery again while it is still being sent.
+DELIVERY_BATCH_SIZE = 10
 
-def _deliver_notification(delivery_id: UUID) -> None:
-    """Execute a single delivery attempt. Called by the django-tasks worker and by tests."""
-    try:
-        delivery = NotificationDelivery.objects.select_related("notification__recipient").get(id=delivery_id)
-    except NotificationDelivery.DoesNotExist:
-        logger.warning("Delivery %s no longer exists, skipping", delivery_id)
-        return
+# Set while a drain of the channel is enqueued but not yet started, so a fan-out to many
+# recipients enqueues one drain rather than one task per delivery. Expires in case the drain
+# is lost; the sweep below covers that window.
+DRAIN_SCHEDULED_KEY = "notifications:drain-scheduled:{channel_type}"
+DRAIN_SCHEDULED_TIMEOUT = 300
+
+# A delivery claimed for its last attempt whose outcome was never recorded (the worker died
+# mid-send) is failed by the sweep once it has been in flight this long.
+ABANDONED_AFTER = timedelta(minutes=15)
+
+
+def _backoff(attempts: int) -> int:
+    return RETRY_BACKOFF_SECONDS[min(attempts - 1, len(RETRY_BACKOFF_SECONDS) - 1)]
 
-    if delivery.status != DeliveryStatus.PENDING:
-        logger.info("Delivery %s has status=%s, skipping", delivery_id, delivery.status)
-        return
 
-    delivery.attempts += 1
-    delivery.last_attempted_at = timezone.now()
-    delivery.save(update_fields=["attempts", "last_attempted_at", "modified"])
+def _due(now: datetime) -> Q:
+    """Pending deliveries whose next attempt is due: never attempted, or past the backoff after their last attempt."""
+    due = Q(attempts=0)
+    for attempts in range(1, MAX_DELIVERY_ATTEMPTS):
+        due |= Q(attempts=attempts, last_attempted_at__lte=now - timedelta(seconds=_backoff(attempts)))
+    return due
 
+
+def _claim(channel_type: str) -> list[NotificationDelivery]:
+    """Claim the channel's next due deliveries by recording the attempt on them.
+
+    The attempt puts a delivery in its backoff window, which is what keeps concurrent drains off it:
+    ``skip_locked`` only covers the claim itself. A drain that dies after claiming leaves its
+    deliveries to be retried once that backoff has passed.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            NotificationDelivery.objects
+            .select_for_update(skip_locked=True)
+            .filter(_due(now), channel_type=channel_type, status=DeliveryStatus.PENDING)
+            .order_by("created")
+            .values_list("id", flat=True)[:DELIVERY_BATCH_SIZE]
+        )
+        NotificationDelivery.objects.filter(id__in=ids).update(
+            attempts=F("attempts") + 1, last_attempted_at=now, modified=now
+        )
+    return list(
+        NotificationDelivery.objects.filter(id__in=ids).select_related("notification__recipient").order_by("created")
+    )
+
+
+def _deliver_batch(channel_type: str, deliveries: list[NotificationDelivery]) -> datetime | None:
+    """Send one claimed batch and record every outcome in bulk.
+
+    Returns when the earliest delivery left pending for a retry becomes due, or ``None`` if none was.
+    """
+    now = timezone.now()
     try:
-        channel = get_channel(delivery.channel_type)
+        channel = get_channel(channel_type)
     except UnknownChannelError as exc:
-        delivery.mark_skipped(str(exc))
-        return
+        NotificationDelivery.objects.filter(id__in=[delivery.id for delivery in deliveries]).update(
+            status=DeliveryStatus.SKIPPED, error_message=str(exc), modified=now
+        )
+        return None
 
     try:
-        channel.send(delivery.notification, delivery)
-    except UnrecoverableDeliveryError as exc:
-        logger.warning("Unrecoverable failure delivering %s: %s", delivery_id, exc)
-        delivery.mark_failed(str(exc))
-        return
+        outcomes = channel.send_batch(deliveries)
     except Exception as exc:
-        logger.exception(
-            "Transient failure delivering %s via %s (attempt %d/%d)",
-            delivery_id,
-            delivery.channel_type,
+        logger.exception("Transient failure delivering a batch of %d via %s", len(deliveries), channel_type)
+        outcomes = dict.fromkeys((delivery.id for delivery in deliveries), exc)
+
+    sent, failed, retried = [], [], []
+    for delivery in deliveries:
+        exc = outcomes.get(delivery.id)
+        if exc is None:
+            sent.append(delivery.id)
+            continue
+        delivery.error_message = str(exc)
+        delivery.modified = now
+        if isinstance(exc, UnrecoverableDeliveryError):
+            logger.warning("Unrecoverable failure delivering %s: %s", delivery.id, exc)
+            delivery.status = DeliveryStatus.FAILED
+            failed.append(delivery)
+            continue
+        logger.warning(
+            "Transient failure delivering %s via %s (attempt %d/%d): %s",
+            delivery.id,
+            channel_type,
             delivery.attempts,
             MAX_DELIVERY_ATTEMPTS,
+            exc,
         )
         if delivery.attempts >= MAX_DELIVERY_ATTEMPTS:
-            delivery.mark_failed(str(exc))
-            return
-        # Stay PENDING; re-enqueue with backoff
-        delivery.error_message = str(exc)
-        delivery.save(update_fields=["error_message", "modified"])
-        backoff = RETRY_BACKOFF_SECONDS[min(delivery.attempts - 1, len(RETRY_BACKOFF_SECONDS) - 1)]
-        run_after = timezone.now() + timedelta(seconds=backoff)
+            delivery.status = DeliveryStatus.FAILED
+            failed.append(delivery)
+        else:
+            # Stays PENDING; due again once its backoff has passed.
+            retried.append(delivery)
+
+    if sent:
+        NotificationDelivery.objects.filter(id__in=sent).update(
+            status=DeliveryStatus.SENT, delivered_at=now, error_message="", modified=now
+        )
+    if failed or retried:
+        NotificationDelivery.objects.bulk_update([*failed, *retried], ["status", "error_message", "modified"])
+    if not retried:
+        return None
+    return min(delivery.last_attempted_at + timedelta(seconds=_backoff(delivery.attempts)) for delivery in retried)
+
+
+def _drain(channel_type: str) -> int:
+    """Deliver the channel's due deliveries a batch at a time until none are left; returns how many were attempted."""
+    attempted = 0
+    retry_at = None
+    while deliveries := _claim(channel_type):
+        attempted += len(deliveries)
+        if (due := _deliver_batch(channel_type, deliveries)) is not None:
+            retry_at = due if retry_at is None else min(retry_at, due)
+    if retry_at is not None:
         try:
-            deliver_notification_task.using(run_after=run_after).enqueue(str(delivery.id))
+            deliver_notifications_task.using(run_after=retry_at).enqueue(channel_type)
         except Exception:
-            logger.exception("Failed to re-enqueue delivery %s for retry", delivery_id)
-            delivery.mark_failed(f"Re-enqueue failed after attempt {delivery.attempts}")
-        return
+            # Left PENDING: the sweep picks the retries up once they are due.
+            logger.exception("Failed to schedule the %s delivery retry", channel_type)
+    return attempted
 
-    delivery.mark_sent()
+
+def schedule_delivery(channel_type: str) -> None:
+    """Enqueue a drain of ``channel_type`` unless one is already waiting to start.
+
+    A failed enqueue is logged and the pending deliveries are left for the sweep.
+    """
+    key = DRAIN_SCHEDULED_KEY.format(channel_type=channel_type)
+    if not cache.add(key, 1, timeout=DRAIN_SCHEDULED_TIMEOUT):
+        return
+    try:
+        deliver_notifications_task.enqueue(channel_type)
+    except Exception:
+        cache.delete(key)
+        logger.exception("Failed to enqueue the %s delivery task", channel_type)
 
 
 @task(queue_name=TASK_QUEUE_INTERACTIVE, priority=TASK_PRIORITY_NOTIFICATION)
-def deliver_notification_task(delivery_id: str) -> None:
-    """Public task entry point -- thin wrapper so tests can call ``_deliver_notification`` directly."""
-    _deliver_notification(UUID(delivery_id))
+def deliver_notifications_task(channel_type: str) -> int:
+    """Deliver every due pending delivery on ``channel_type``, in batches."""
+    # Cleared before claiming, so a delivery committed after this point schedules a new drain
+    # and one committed before it is claimed by this one.
+    cache.delete(DRAIN_SCHEDULED_KEY.format(channel_type=channel_type))
+    return _drain(channel_type)
+
+
+@cron("*/5 * * * *")
+@task
+@locked_task(key="sweep-notification-deliveries")
+def sweep_notification_deliveries_cron_task():
+    """Backstop for the drains: deliver what a lost or failed enqueue left pending, and fail
+    deliveries whose last attempt was claimed but never recorded.
+
+    ``locked_task`` (non-blocking) skips this tick if the prior one still holds the lock.
+    """
+    now = timezone.now()
+    abandoned = NotificationDelivery.objects.filter(
+        status=DeliveryStatus.PENDING, attempts__gte=MAX_DELIVERY_ATTEMPTS, last_attempted_at__lte=now - ABANDONED_AFTER
+    ).update(status=DeliveryStatus.FAILED, error_message="Delivery outcome was never recorded", modified=now)
+    if abandoned:
+        logger.warning("sweep_notification_deliveries: failed %d abandoned delivery(ies)", abandoned)
+
+    channel_types = (
+        NotificationDelivery.objects
+        .filter(_due(now), status=DeliveryStatus.PENDING)
+        .order_by()
+        .values_list("channel_type", flat=True)
+        .distinct()
+    )
+    for channel_type in channel_types:
+        _drain(channel_type)
 
 
 REDRIVE_BATCH_LIMIT = 200
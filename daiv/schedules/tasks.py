@@ -1,7 +1,8 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
-from django.db import models, transaction
+from django.db import connections, models, transaction
 
 from crontask import cron
 from django_tasks import task
@@ -10,18 +11,22 @@ from schedules.models import ScheduledJob
 
 logger = logging.getLogger("daiv.schedules")
 
+# Schedules claimed per short locking transaction, and dispatched at once. Claiming only as
+# the pool drains bounds how many advanced-but-undispatched schedules a crashed sweep loses.
+DISPATCH_CHUNK_SIZE = 20
+DISPATCH_CONCURRENCY = 4
 
-def _advance_or_disable(schedule: ScheduledJob, now: datetime) -> None:
-    """Recover a schedule after a failed dispatch.
 
-    Still advance ``next_run_at`` so the schedule does not busy-retry every minute; if even that
-    fails, disable the schedule so it stops wedging the dispatcher. Shared by every dispatch
-    failure path (access-denied and unexpected errors alike).
+def _advance_or_disable(schedule: ScheduledJob, now: datetime) -> bool:
+    """Move a claimed schedule past this occurrence, so no later sweep can claim it again.
+
+    If even that fails (e.g. a corrupt cron expression), disable the schedule so it stops
+    wedging the dispatcher. Returns whether it was advanced, i.e. whether it may be dispatched.
     """
     try:
-        schedule.refresh_from_db(fields=["run_count", "last_run_at", "last_run_batch_id", "next_run_at"])
-        advance_fields = schedule.advance_after_dispatch(after=now)
-        schedule.save(update_fields=["modified", *advance_fields])
+        with transaction.atomic():
+            advance_fields = schedule.advance_after_dispatch(after=now)
+            schedule.save(update_fields=["modified", *advance_fields])
     except Exception:
         logger.exception(
             "Failed to advance next_run_at for scheduled job pk=%d (%s); disabling schedule", schedule.pk, schedule.name
@@ -30,32 +35,29 @@ def _advance_or_disable(schedule: ScheduledJob, now: datetime) -> None:
             ScheduledJob.objects.filter(pk=schedule.pk).update(is_enabled=False)
         except Exception:
             logger.exception("Failed to disable stuck scheduled job pk=%d (%s)", schedule.pk, schedule.name)
+        return False
+    return True
 
 
-@cron("* * * * *")
-@task
-def dispatch_scheduled_jobs_cron_task():
-    """Check for scheduled jobs that are due and enqueue them.
+def _claim_due(now: datetime, exclude: set[int]) -> tuple[list[int], list[ScheduledJob]]:
+    """Lock up to ``DISPATCH_CHUNK_SIZE`` due schedules and advance them, in one short transaction.
 
-    Uses ``select_for_update(skip_locked=True)`` so that if the dispatcher
-    overlaps (takes >1 minute), the same schedule is not double-dispatched.
-    Each schedule is processed in its own savepoint so that one failure
-    does not roll back updates for other schedules.
-    """
-    from sandbox_envs.services import resolve_repo_envs
-    from sessions.models import SessionOrigin
-    from sessions.services import RepoTarget, submit_batch_runs
+    ``skip_locked`` leaves schedules another sweep is claiming to that sweep, and advancing at
+    claim time means a schedule is never claimed twice for one occurrence, so nothing is held
+    locked while it is dispatched. ``exclude`` keeps a schedule that could be neither advanced
+    nor disabled from being claimed again by the same sweep.
 
+    Returns the pks of every schedule claimed and the schedules to dispatch: those that were
+    advanced. One that could not be advanced is left out rather than dispatched off its stale
+    occurrence.
+    """
     from accounts.models import User
-    from codebase.authorization import RepositoryAccessDenied
-
-    now = datetime.now(tz=UTC)
-    dispatched = 0
-    failed = 0
 
     with transaction.atomic():
-        due_schedules = list(
-            ScheduledJob.objects.select_for_update(skip_locked=True).filter(
+        claimed = list(
+            ScheduledJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(
                 is_enabled=True,
                 next_run_at__lte=now,
                 # Skip schedules owned by inactivated users. Expressed as a subquery rather
@@ -65,56 +67,91 @@ def dispatch_scheduled_jobs_cron_task():
                 # schedules even though the schedule rows themselves are free.
                 user_id__in=User.objects.filter(is_active=True).values("pk"),
             )
+            .exclude(pk__in=exclude)
+            .order_by("next_run_at", "pk")[:DISPATCH_CHUNK_SIZE]
         )
+        advanced = [schedule for schedule in claimed if _advance_or_disable(schedule, now)]
+    return [schedule.pk for schedule in claimed], advanced
+
+
+def _dispatch_one(schedule: ScheduledJob, now: datetime) -> bool:
+    """Submit a claimed schedule's batch and record it, outside any lock. Returns whether it dispatched."""
+    from sandbox_envs.services import resolve_repo_envs
+    from sessions.models import SessionOrigin
+    from sessions.services import RepoTarget, submit_batch_runs
+
+    from codebase.authorization import RepositoryAccessDenied
+
+    try:
+        repos = [RepoTarget(repo_id=r["repo_id"], ref=r["ref"]) for r in schedule.repos]
+        repos = resolve_repo_envs(
+            user=schedule.user,
+            repos=repos,
+            explicit_env_id=(str(schedule.sandbox_environment_id) if schedule.sandbox_environment_id else None),
+        )
+        result = submit_batch_runs(
+            user=schedule.user,
+            prompt=schedule.prompt,
+            repos=repos,
+            agent_model=schedule.agent_model,
+            agent_thinking_level=schedule.agent_thinking_level,
+            trigger_type=SessionOrigin.SCHEDULE,
+            scheduled_job=schedule,
+            mcp_overrides=schedule.mcp_overrides,
+        )
+        schedule.last_run_at = now
+        schedule.last_run_batch_id = result.batch_id
+        schedule.run_count = models.F("run_count") + 1
+        schedule.save(update_fields=["last_run_at", "last_run_batch_id", "run_count", "modified"])
+    except RepositoryAccessDenied:
+        logger.warning(
+            "Scheduled job pk=%d (%s) skipped: owner lacks access to its repositories", schedule.pk, schedule.name
+        )
+        return False
+    except Exception:
+        logger.exception("Failed to dispatch scheduled job pk=%d (%s)", schedule.pk, schedule.name)
+        return False
+    finally:
+        # Pool threads each open their own connection; hand it back before the thread idles.
+        connections.close_all()
+
+    if result.failed:
+        logger.warning(
+            "Scheduled job pk=%d dispatched with %d per-repo enqueue failures: %s",
+            schedule.pk,
+            len(result.failed),
+            [f.repo_id for f in result.failed],
+        )
+    return True
+
+
+@cron("* * * * *")
+@task
+def dispatch_scheduled_jobs_cron_task():
+    """Check for scheduled jobs that are due and enqueue them.
+
+    Due schedules are claimed ``DISPATCH_CHUNK_SIZE`` at a time by :func:`_claim_due`, whose
+    ``select_for_update(skip_locked=True)`` transaction also advances them, so an overlapping
+    sweep (one that takes >1 minute) never double-dispatches. Each chunk is then submitted on
+    ``DISPATCH_CONCURRENCY`` threads with no lock held, and one schedule's failure does not
+    affect the others. A failed dispatch is not retried: its occurrence was already advanced past.
+    A schedule that cannot be advanced is disabled and not dispatched at all.
+    """
+    now = datetime.now(tz=UTC)
+    dispatched = 0
+    failed = 0
+    claimed: set[int] = set()
 
-        for schedule in due_schedules:
-            try:
-                with transaction.atomic():
-                    repos = [RepoTarget(repo_id=r["repo_id"], ref=r["ref"]) for r in schedule.repos]
-                    repos = resolve_repo_envs(
-                        user=schedule.user,
-                        repos=repos,
-                        explicit_env_id=(
-                            str(schedule.sandbox_environment_id) if schedule.sandbox_environment_id else None
-                        ),
-                    )
-                    result = submit_batch_runs(
-                        user=schedule.user,
-                        prompt=schedule.prompt,
-                        repos=repos,
-                        agent_model=schedule.agent_model,
-                        agent_thinking_level=schedule.agent_thinking_level,
-                        trigger_type=SessionOrigin.SCHEDULE,
-                        scheduled_job=schedule,
-                        mcp_overrides=schedule.mcp_overrides,
-                    )
-                    schedule.last_run_at = now
-                    schedule.last_run_batch_id = result.batch_id
-                    schedule.run_count = models.F("run_count") + 1
-                    advance_fields = schedule.advance_after_dispatch(after=now)
-                    schedule.save(
-                        update_fields=["last_run_at", "last_run_batch_id", "run_count", "modified", *advance_fields]
-                    )
-                dispatched += 1
-                if result.failed:
-                    logger.warning(
-                        "Scheduled job pk=%d dispatched with %d per-repo enqueue failures: %s",
-                        schedule.pk,
-                        len(result.failed),
-                        [f.repo_id for f in result.failed],
-                    )
-            except RepositoryAccessDenied:
-                logger.warning(
-                    "Scheduled job pk=%d (%s) skipped: owner lacks access to its repositories",
-                    schedule.pk,
-                    schedule.name,
-                )
-                failed += 1
-                _advance_or_disable(schedule, now)
-            except Exception:
-                logger.exception("Failed to dispatch scheduled job pk=%d (%s)", schedule.pk, schedule.name)
-                failed += 1
-                _advance_or_disable(schedule, now)
+    with ThreadPoolExecutor(max_workers=DISPATCH_CONCURRENCY, thread_name_prefix="schedule-dispatch") as pool:
+        while True:
+            chunk_pks, chunk = _claim_due(now, claimed)
+            if not chunk_pks:
+                break
+            claimed.update(chunk_pks)
+            failed += len(chunk_pks) - len(chunk)
+            for ok in pool.map(lambda schedule: _dispatch_one(schedule, now), chunk):
+                dispatched += ok
+                failed += not ok
 
     if dispatched:
         logger.info("Dispatched %d scheduled job(s)", dispatched)
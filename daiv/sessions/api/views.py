@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from django.utils import timezone
+
+from asgiref.sync import sync_to_async
 from ninja import Router
 from ninja.errors import HttpError
 from ninja.security import django_auth
@@ -10,7 +14,7 @@ from ninja.security import django_auth
 from chat.api.security import AuthBearer
 from chat.turns import build_turns
 from sessions.hydration import ahydrate_thread
-from sessions.models import Session
+from sessions.models import Run, Session
 from sessions.transcript import annotate_transcript
 
 if TYPE_CHECKING:
@@ -40,3 +44,14 @@ async def session_turns(request: HttpRequest, thread_id: str):
         "active": bool(session.active_run_id),
         "expired": expired,
     }
+
+
+@sessions_router.get("/phase-percentiles", response=dict, url_name="session_phase_percentiles")
+async def phase_percentiles(request: HttpRequest, days: int = 7, repo_id: str | None = None):
+    """Fleet-wide percentiles of each run phase's seconds over the last ``days`` days (admins only)."""
+    if not request.auth.is_admin:  # ty: ignore[unresolved-attribute]
+        raise HttpError(403, "Admin access required")
+    if not 1 <= days <= 90:
+        raise HttpError(400, "days must be between 1 and 90")
+    since = timezone.now() - timedelta(days=days)
+    return {"days": days, "phases": await sync_to_async(Run.objects.phase_percentiles)(since=since, repo_id=repo_id)}
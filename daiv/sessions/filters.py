@@ -8,7 +8,7 @@ from django.utils.translation import gettext_lazy as _
 
 import django_filters
 
-from sessions.models import RunStatus, Session, SessionOrigin
+from sessions.models import Run, RunStatus, Session, SessionOrigin
 
 RANGE_CHOICES: list[tuple[str, str]] = [
     ("today", _("Today")),
@@ -41,14 +41,15 @@ class SessionFilter(django_filters.FilterSet):
         fields: list[str] = []
 
     def filter_q(self, queryset, name, value):
+        # Served on Postgres by the trigram indexes on UPPER(title) / UPPER(repo_id) (migration 0009).
         return queryset.filter(Q(title__icontains=value) | Q(repo_id__icontains=value))
 
     def filter_status(self, queryset, name, value):
-        # Requires the with_latest_status() annotation on the base queryset.
         return queryset.filter(latest_run_status=value)
 
     def filter_batch(self, queryset, name, value):
-        return queryset.filter(runs__batch_id=value).distinct()
+        # A subquery rather than a ``runs`` join keeps this one row per session without ``distinct()``.
+        return queryset.filter(pk__in=Run.objects.filter(batch_id=value).values("session_id"))
 
     def filter_mr(self, queryset, name, value):
         # IIDs are per-project, so this pools every repository's request of that number unless
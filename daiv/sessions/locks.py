@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 from django.utils import timezone
 
+from core.conf import settings as core_settings
+from core.redis import redis_connections
 from sessions.models import Session
 
+if TYPE_CHECKING:
+    import redis
+
 logger = logging.getLogger("daiv.sessions")
 
 # A claim that hasn't bumped last_active_at within this window is considered
@@ -17,6 +26,26 @@ logger = logging.getLogger("daiv.sessions")
 # SessionLock; it is now the single source of truth.
 STALE_RUN_MINUTES = 30
 
+# Redis backend: how often a held lease's renewal also bumps the session row's
+# ``last_active_at``, which the UI and ``sync_stuck_runs`` read. Well inside
+# ``STALE_RUN_MINUTES`` so a live holder never looks stale to them.
+LEASE_MIRROR_INTERVAL_S = 5 * 60
+
+# The lease value is the holder id. Renew and release compare it, so a holder can only
+# extend or drop its own grant, never its successor's; claiming is a plain ``SET NX PX``.
+_RENEW_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 
 def stale_cutoff(now: datetime | None = None) -> datetime:
     """Heartbeat threshold: a session whose ``last_active_at`` predates this is treated as
@@ -27,32 +56,11 @@ def stale_cutoff(now: datetime | None = None) -> datetime:
     return (now or timezone.now()) - timedelta(minutes=STALE_RUN_MINUTES)
 
 
-class SessionLock:
-    """Unified execution slot for a session.
-
-    Holders are chat turns (holder_id = the AG-UI run_id) and background jobs
-    routed through ``run_job_task`` (holder_id = str(Run.pk)). Exactly one such
-    holder executes against a thread's checkpoint at a time — this closes the
-    historical race where a chat continuation and a ``run_job_task`` run on the
-    same thread ran concurrently.
-
-    Not covered: webhook addressors (issue/MR) call ``create_daiv_agent``
-    directly and never route through this lock, so they are not mutually
-    excluded with chat/job holders. Stale takeover (below) guards only the DB
-    slot, not the in-flight work: a holder that stalls past ``STALE_RUN_MINUTES``
-    can be superseded while its own graph invocation is still running (there is
-    no fencing token). The generous window makes that rare, and a takeover logs
-    a warning so it is observable.
-    """
-
-    @staticmethod
-    async def try_claim(thread_id: str, holder_id: str) -> bool:
-        """Claim the slot if it is free OR its heartbeat is stale.
+class DatabaseSessionLeases:
+    """Slot held on the session row itself: ``active_run_id`` names the holder and every
+    heartbeat is an ``UPDATE`` of ``last_active_at``."""
 
-        A stale takeover (claiming a slot a prior holder never released) is logged
-        at WARNING so it surfaces in monitoring — the prior holder may still be
-        executing against the checkpoint.
-        """
+    async def try_claim(self, thread_id: str, holder_id: str) -> bool:
         now = timezone.now()
         # Fast path: claim a free slot (the common, uncontended case) in one query.
         if await Session.objects.filter(thread_id=thread_id, active_run_id__isnull=True).aupdate(
@@ -77,31 +85,166 @@ class SessionLock:
             thread_id=thread_id, active_run_id=prior_holder, last_active_at__lt=cutoff
         ).aupdate(active_run_id=holder_id, last_active_at=now)
         if taken:
-            logger.warning(
-                "SessionLock: stale takeover of thread_id=%s from prior holder=%s by holder=%s; "
-                "prior holder may still be executing against the same checkpoint",
-                thread_id,
-                prior_holder,
-                holder_id,
-            )
+            _log_takeover(thread_id, prior_holder, holder_id)
         return bool(taken)
 
+    async def heartbeat(self, thread_id: str, holder_id: str) -> bool:
+        bumped = await Session.objects.filter(thread_id=thread_id, active_run_id=holder_id).aupdate(
+            last_active_at=timezone.now()
+        )
+        return bool(bumped)
+
+    async def release(self, thread_id: str, holder_id: str) -> None:
+        await Session.objects.filter(thread_id=thread_id, active_run_id=holder_id).aupdate(
+            active_run_id=None, last_active_at=timezone.now()
+        )
+
+
+class RedisSessionLeases:
+    """Slot held as a Redis lease that expires after ``STALE_RUN_MINUTES`` unless renewed.
+
+    Exclusivity and expiry live in Redis, so a heartbeat is a ``PEXPIRE`` rather than a
+    database write. The session row is kept as
+    a mirror for its readers (the UI, the relay tail, ``sync_stuck_runs``): written on
+    claim and release, and bumped by a renewal at most every ``LEASE_MIRROR_INTERVAL_S``.
+
+    Calls go through the sync client on a worker thread: holders run on the web loop and
+    on the task worker's ad-hoc loops alike, and the async client is bound to one loop.
+    """
+
+    def __init__(self) -> None:
+        # ``(thread_id, holder_id)`` → monotonic time of the last mirror write from this process.
+        self._mirrored: dict[tuple[str, str], float] = {}
+        self._mirrored_lock = threading.Lock()
+
+    @staticmethod
+    def _key(thread_id: str) -> str:
+        return f"daiv:session-lease:{thread_id}"
+
+    @staticmethod
+    def _client() -> redis.Redis:
+        return redis_connections.sync_client()
+
+    def _mark_mirrored(self, thread_id: str, holder_id: str) -> None:
+        with self._mirrored_lock:
+            self._mirrored[(thread_id, holder_id)] = time.monotonic()
+
+    def _mirror_due(self, thread_id: str, holder_id: str) -> bool:
+        with self._mirrored_lock:
+            last = self._mirrored.get((thread_id, holder_id))
+        return last is None or time.monotonic() - last >= LEASE_MIRROR_INTERVAL_S
+
+    def _forget(self, thread_id: str, holder_id: str) -> None:
+        with self._mirrored_lock:
+            self._mirrored.pop((thread_id, holder_id), None)
+
+    async def _run(self, source: str, thread_id: str, *args: str | int) -> int:
+        script = self._client().register_script(source)
+        return int(await asyncio.to_thread(script, keys=[self._key(thread_id)], args=list(args)))
+
+    async def try_claim(self, thread_id: str, holder_id: str) -> bool:
+        claimed = await asyncio.to_thread(
+            self._client().set, self._key(thread_id), holder_id, nx=True, px=STALE_RUN_MINUTES * 60 * 1000
+        )
+        if not claimed:
+            return False
+
+        # The lease was free, so whoever the row still names never released: its lease expired.
+        prior_holder = await (
+            Session.objects.filter(thread_id=thread_id).values_list("active_run_id", flat=True).afirst()
+        )
+        mirrored = await Session.objects.filter(thread_id=thread_id).aupdate(
+            active_run_id=holder_id, last_active_at=timezone.now()
+        )
+        if not mirrored:
+            # No such session: give the lease back, as the database backend would never have granted it.
+            await self._run(_RELEASE_SCRIPT, thread_id, holder_id)
+            return False
+
+        self._mark_mirrored(thread_id, holder_id)
+        if prior_holder and prior_holder != holder_id:
+            _log_takeover(thread_id, prior_holder, holder_id)
+        return True
+
+    async def heartbeat(self, thread_id: str, holder_id: str) -> bool:
+        if not await self._run(_RENEW_SCRIPT, thread_id, holder_id, STALE_RUN_MINUTES * 60 * 1000):
+            self._forget(thread_id, holder_id)
+            return False
+        if self._mirror_due(thread_id, holder_id):
+            await Session.objects.filter(thread_id=thread_id, active_run_id=holder_id).aupdate(
+                last_active_at=timezone.now()
+            )
+            self._mark_mirrored(thread_id, holder_id)
+        return True
+
+    async def release(self, thread_id: str, holder_id: str) -> None:
+        self._forget(thread_id, holder_id)
+        await self._run(_RELEASE_SCRIPT, thread_id, holder_id)
+        await Session.objects.filter(thread_id=thread_id, active_run_id=holder_id).aupdate(
+            active_run_id=None, last_active_at=timezone.now()
+        )
+
+
+def _log_takeover(thread_id: str, prior_holder: str, holder_id: str) -> None:
+    logger.warning(
+        "SessionLock: stale takeover of thread_id=%s from prior holder=%s by holder=%s; "
+        "prior holder may still be executing against the same checkpoint",
+        thread_id,
+        prior_holder,
+        holder_id,
+    )
+
+
+_BACKENDS = {"database": DatabaseSessionLeases(), "redis": RedisSessionLeases()}
+
+
+def _backend() -> DatabaseSessionLeases | RedisSessionLeases:
+    return _BACKENDS[core_settings.SESSION_LOCK_BACKEND]
+
+
+class SessionLock:
+    """Unified execution slot for a session.
+
+    Holders are chat turns (holder_id = the AG-UI run_id) and background jobs
+    routed through ``run_job_task`` (holder_id = str(Run.pk)). Exactly one such
+    holder executes against a thread's checkpoint at a time — this closes the
+    historical race where a chat continuation and a ``run_job_task`` run on the
+    same thread ran concurrently.
+
+    The slot is held by the backend named in ``DAIV_SESSION_LOCK_BACKEND``: the
+    session row (``DatabaseSessionLeases``, the default) or a Redis lease
+    (``RedisSessionLeases``). Both keep the same contract below.
+
+    Not covered: webhook addressors (issue/MR) call ``create_daiv_agent``
+    directly and never route through this lock, so they are not mutually
+    excluded with chat/job holders. Stale takeover (below) guards only the
+    slot, not the in-flight work: a holder that stalls past ``STALE_RUN_MINUTES``
+    (or whose Redis lease expires) can be superseded while its own graph
+    invocation is still running (there is no fencing token). The generous window
+    makes that rare, and a takeover logs a warning so it is observable.
+    """
+
+    @staticmethod
+    async def try_claim(thread_id: str, holder_id: str) -> bool:
+        """Claim the slot if it is free OR its heartbeat is stale.
+
+        A stale takeover (claiming a slot a prior holder never released) is logged
+        at WARNING so it surfaces in monitoring — the prior holder may still be
+        executing against the checkpoint.
+        """
+        return await _backend().try_claim(thread_id, holder_id)
+
     @staticmethod
     async def heartbeat(thread_id: str, holder_id: str) -> bool:
-        """Bump ``last_active_at`` while the slot is still ours.
+        """Keep the slot alive while it is still ours.
 
         Returns ``False`` if we no longer hold the slot (e.g. a stale takeover
         reassigned it) — the caller can then stop writing to a checkpoint it no
         longer owns.
         """
-        bumped = await Session.objects.filter(thread_id=thread_id, active_run_id=holder_id).aupdate(
-            last_active_at=timezone.now()
-        )
-        return bool(bumped)
+        return await _backend().heartbeat(thread_id, holder_id)
 
     @staticmethod
     async def release(thread_id: str, holder_id: str) -> None:
         """Clear the slot only if we still hold it (no-op if already reassigned)."""
-        await Session.objects.filter(thread_id=thread_id, active_run_id=holder_id).aupdate(
-            active_run_id=None, last_active_at=timezone.now()
-        )
+        await _backend().release(thread_id, holder_id)
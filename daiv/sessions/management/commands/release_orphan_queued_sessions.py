@@ -8,6 +8,7 @@ from django.db.models import Q
 
 from sessions.models import Run, RunStatus
 from sessions.signals import _enqueue_queued_run
+from sessions.summaries import refresh_session_summaries
 
 logger = logging.getLogger("daiv.sessions")
 
@@ -48,6 +49,7 @@ class Command(BaseCommand):
             if claimed != 1:
                 skipped += 1
                 continue
+            refresh_session_summaries([run.session_id])
             run.refresh_from_db()
             try:
                 ok = _enqueue_queued_run(run)
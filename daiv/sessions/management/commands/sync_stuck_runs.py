@@ -9,6 +9,8 @@ from django.utils import timezone
 from core import ui_events
 from sessions.locks import stale_cutoff
 from sessions.models import Run, RunStatus, SessionOrigin
+from sessions.rollups import refresh_run_daily_stats_on_commit
+from sessions.summaries import refresh_session_summaries
 
 logger = logging.getLogger("daiv.sessions")
 
@@ -68,19 +70,25 @@ class Command(BaseCommand):
         runs are intentionally excluded from the notification / memory / dispatch receivers.
         """
         cutoff = stale_cutoff()
-        reaped = Run.objects.filter(
+        orphaned = Run.objects.filter(
             trigger_type=SessionOrigin.CHAT,
             task_result__isnull=True,
             status=RunStatus.RUNNING,
             session__last_active_at__lt=cutoff,
-        ).update(
+        )
+        days = list(orphaned.dates("created_at", "day"))
+        session_ids = set(orphaned.values_list("session_id", flat=True))
+        reaped = orphaned.update(
             status=RunStatus.FAILED,
             finished_at=timezone.now(),
             error_message="Orphaned chat run: streamer never finalized (worker crash); reaped by sync_stuck_runs.",
         )
         if reaped:
             logger.warning("sync_stuck_runs: reaped %d orphaned chat run(s) stuck in RUNNING", reaped)
-            # The ``.update()`` above fires no post_save, so the nav badge poke is issued
-            # here; deferred so a wrapping ``atomic`` can't have readers recount too early.
+            # The ``.update()`` above fires no post_save, so the nav badge poke and the summary and
+            # rollup refreshes are issued here; the poke is deferred so a wrapping ``atomic`` can't
+            # have readers recount too early.
             transaction.on_commit(ui_events.publisher.runs_changed)
+            refresh_session_summaries(session_ids)
+            refresh_run_daily_stats_on_commit(days)
         return reaped
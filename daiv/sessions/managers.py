@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from statistics import quantiles
 from typing import TYPE_CHECKING
 
 from django.db import models
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import datetime
+
     from accounts.models import User
-    from sessions.models import Run, RunEnvelope, Session
+    from sessions.models import Run, RunDailyStats, RunEnvelope, Session
 
 
 class SessionQuerySet(models.QuerySet["Session"]):
@@ -16,17 +21,22 @@ class SessionQuerySet(models.QuerySet["Session"]):
         A user owns a session when they own the session row, match its
         ``external_username``, subscribe to its schedule, or acted in any of its runs
         (user FK or external_username on the Run). The run-level match preserves
-        per-actor visibility on shared webhook threads.
+        per-actor visibility on shared webhook threads. Every branch is a column test or an
+        ``EXISTS``, never a join, so the result has one row per session without ``distinct()``.
         """
+        from schedules.models import ScheduledJob
         from sessions.models import Run
 
         run_match = Run.objects.filter(session=models.OuterRef("pk")).filter(
             models.Q(user=user) | models.Q(external_username=user.username)
         )
+        subscription = ScheduledJob.subscribers.through.objects.filter(
+            scheduledjob_id=models.OuterRef("scheduled_job_id"), user=user
+        )
         return (
             models.Q(user=user)
             | models.Q(external_username=user.username)
-            | models.Q(scheduled_job__subscribers=user)
+            | models.Exists(subscription)
             | models.Exists(run_match)
         )
 
@@ -40,14 +50,14 @@ class SessionQuerySet(models.QuerySet["Session"]):
         """
         if user.is_admin:
             return self.all()
-        return self.filter(self._owner_q(user)).distinct()
+        return self.filter(self._owner_q(user))
 
     def visible_to(self, user: User) -> models.QuerySet[Session]:
         """Sessions the user may view: ownership OR a repository they can currently read.
 
         Adds sessions that ran on a repo with a fresh ``RepositoryAccess`` row to the
-        ownership set. SYNC ONLY — resolving the caller's platform identity does a DB read
-        at query-build time, so wrap in ``sync_to_async`` when used from an async view.
+        ownership set. SYNC ONLY — resolving the caller's repository visibility may do a DB
+        read at query-build time, so wrap in ``sync_to_async`` when used from an async view.
         """
         if user.is_admin:
             return self.all()
@@ -55,14 +65,14 @@ class SessionQuerySet(models.QuerySet["Session"]):
         # (and its codebase.* / allauth graph) in at app-load time.
         from codebase.authorization import viewable_repo_ids_subquery
 
-        return self.filter(self._owner_q(user) | models.Q(repo_id__in=viewable_repo_ids_subquery(user))).distinct()
+        return self.filter(self._owner_q(user) | models.Q(repo_id__in=viewable_repo_ids_subquery(user)))
 
     def for_merge_request(self, iid: int) -> models.QuerySet[Session]:
         """Sessions that touched merge request ``iid``, whichever way they learned of it.
 
         MR-scope sessions carry the IID from the webhook; an issue-scope session only learns it
         when its run backfills at completion. A subquery rather than a ``runs`` join keeps this
-        one row per session, so ``with_latest_status``'s per-row subquery is not multiplied.
+        one row per session.
         """
         from sessions.models import Run
 
@@ -71,19 +81,9 @@ class SessionQuerySet(models.QuerySet["Session"]):
             | models.Q(pk__in=Run.objects.filter(merge_request_iid=iid).values("session_id"))
         )
 
-    def with_latest_status(self) -> models.QuerySet[Session]:
-        """Annotate each session with ``latest_run_status`` (status of the newest run).
-
-        NULL for chat-only sessions that predate run tracking.
-        """
-        from sessions.models import Run
 
-        latest = Run.objects.filter(session=models.OuterRef("pk")).order_by("-created_at", "-id")
-        return self.annotate(latest_run_status=models.Subquery(latest.values("status")[:1]))
-
-
-# ``by_owner``/``visible_to``/``with_latest_status`` live on the QuerySet so they chain
-# (``Session.objects.visible_to(user).with_latest_status()``); the manager re-exports
+# ``by_owner``/``visible_to`` live on the QuerySet so they chain
+# (``Session.objects.visible_to(user).for_merge_request(iid)``); the manager re-exports
 # them for the bare ``Session.objects.by_owner(...)`` call sites.
 class SessionManager(models.Manager.from_queryset(SessionQuerySet)):
     pass
@@ -106,7 +106,7 @@ class RunManager(models.Manager["Run"]):
     def visible_to(self, user: User) -> models.QuerySet[Run]:
         """Runs the user may view: ownership OR a repository they can currently read.
 
-        SYNC ONLY (resolves platform identity via a DB read at build time); wrap in
+        SYNC ONLY (resolves repository visibility, possibly via a DB read, at build time); wrap in
         ``sync_to_async`` when used from an async view.
         """
         if user.is_admin:
@@ -120,6 +120,50 @@ class RunManager(models.Manager["Run"]):
     def by_batch(self, batch_id) -> models.QuerySet[Run]:
         return self.filter(batch_id=batch_id)
 
+    def phase_percentiles(
+        self, *, since: datetime, repo_id: str | None = None, percentiles: Sequence[int] = (50, 90, 99)
+    ) -> dict[str, dict[str, float | int]]:
+        """Fleet-wide percentiles of each phase's seconds over the runs created since ``since``.
+
+        Returns ``{phase: {"runs": n, "p50": s, ...}}``, where ``runs`` counts the runs that
+        entered the phase. Computed in Python from the stored breakdowns: Django has no portable
+        percentile aggregate, and the window keeps the read bounded.
+        """
+        runs = self.filter(created_at__gte=since, phase_timings__isnull=False)
+        if repo_id:
+            runs = runs.filter(repo_id=repo_id)
+
+        samples: dict[str, list[float]] = defaultdict(list)
+        for breakdown in runs.values_list("phase_timings", flat=True).iterator():
+            for name, timing in breakdown.items():
+                samples[name].append(timing["seconds"])
+
+        result: dict[str, dict[str, float | int]] = {}
+        for name, values in sorted(samples.items()):
+            cuts = quantiles(values, n=100, method="inclusive") if len(values) > 1 else values * 99
+            result[name] = {"runs": len(values), **{f"p{p}": round(cuts[p - 1], 3) for p in percentiles}}
+        return result
+
+
+class RunDailyStatsManager(models.Manager["RunDailyStats"]):
+    def visible_to(self, user: User) -> models.QuerySet[RunDailyStats]:
+        """Rollup rows of the runs ``user`` may view; mirrors :meth:`RunManager.visible_to`.
+
+        Schedule subscription is matched through a subquery rather than a join, so each row is
+        returned once and the rows can be summed as they are. SYNC ONLY, like ``visible_to``.
+        """
+        if user.is_admin:
+            return self.all()
+        from codebase.authorization import viewable_repo_ids_subquery
+        from schedules.models import ScheduledJob
+
+        return self.filter(
+            models.Q(user=user)
+            | models.Q(external_username=user.username)
+            | models.Q(scheduled_job__in=ScheduledJob.objects.filter(subscribers=user).values("pk"))
+            | models.Q(repo_id__in=viewable_repo_ids_subquery(user))
+        )
+
 
 class RunEnvelopeManager(models.Manager["RunEnvelope"]):
     def for_run(self, run: Run) -> RunEnvelope | None:
@@ -0,0 +1,139 @@
+import datetime
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import TruncDate
+
+
+def populate_run_daily_stats(apps, schema_editor):
+    """Roll up the runs that finished before the rollup existed; later runs refresh it as they finish.
+
+    Literals, not RunStatus: a historical migration must freeze what "finished" meant here.
+    """
+    Run = apps.get_model("agent_sessions", "Run")
+    RunDailyStats = apps.get_model("agent_sessions", "RunDailyStats")
+
+    successful = models.Q(status="SUCCESSFUL")
+    duration = models.ExpressionWrapper(
+        models.F("finished_at") - models.F("started_at"), output_field=models.DurationField()
+    )
+    rows = (
+        Run.objects
+        .filter(status__in=["SUCCESSFUL", "FAILED"])
+        .order_by()
+        .values(
+            "repo_id",
+            "trigger_type",
+            "user_id",
+            "external_username",
+            day=TruncDate("created_at"),
+            scheduled_job_id=models.F("session__scheduled_job_id"),
+        )
+        .annotate(
+            n_total=models.Count("pk"),
+            n_successful=models.Count("pk", filter=successful),
+            n_failed=models.Count("pk", filter=models.Q(status="FAILED")),
+            n_code_changes=models.Count("pk", filter=successful & models.Q(code_changes=True)),
+            n_timed_successful=models.Count(
+                "pk", filter=successful & models.Q(started_at__isnull=False, finished_at__isnull=False)
+            ),
+            sum_duration=models.Sum(duration, filter=successful),
+        )
+    )
+    RunDailyStats.objects.bulk_create(
+        (
+            RunDailyStats(
+                day=row["day"],
+                repo_id=row["repo_id"],
+                trigger_type=row["trigger_type"],
+                user_id=row["user_id"],
+                external_username=row["external_username"],
+                scheduled_job_id=row["scheduled_job_id"],
+                total=row["n_total"],
+                successful=row["n_successful"],
+                failed=row["n_failed"],
+                code_changes=row["n_code_changes"],
+                timed_successful=row["n_timed_successful"],
+                successful_duration=row["sum_duration"] or datetime.timedelta(0),
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("agent_sessions", "0006_run_muted_classify_eligible"),
+        ("schedules", "0019_muted_drop_notify_on"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RunDailyStats",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day", models.DateField(verbose_name="day")),
+                ("repo_id", models.CharField(max_length=255, verbose_name="repository")),
+                (
+                    "trigger_type",
+                    models.CharField(
+                        choices=[
+                            ("chat", "Chat"),
+                            ("api_job", "API Run"),
+                            ("mcp_job", "MCP Run"),
+                            ("schedule", "Scheduled Run"),
+                            ("ui_job", "UI Run"),
+                            ("issue_webhook", "Issue Webhook"),
+                            ("mr_webhook", "MR/PR Webhook"),
+                        ],
+                        max_length=20,
+                        verbose_name="trigger type",
+                    ),
+                ),
+                (
+                    "external_username",
+                    models.CharField(blank=True, default="", max_length=255, verbose_name="external username"),
+                ),
+                ("total", models.PositiveIntegerField(default=0, verbose_name="total")),
+                ("successful", models.PositiveIntegerField(default=0, verbose_name="successful")),
+                ("failed", models.PositiveIntegerField(default=0, verbose_name="failed")),
+                ("code_changes", models.PositiveIntegerField(default=0, verbose_name="code changes")),
+                ("timed_successful", models.PositiveIntegerField(default=0, verbose_name="timed successful")),
+                (
+                    "successful_duration",
+                    models.DurationField(default=datetime.timedelta, verbose_name="successful duration"),
+                ),
+                (
+                    "scheduled_job",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="schedules.scheduledjob",
+                        verbose_name="scheduled job",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Run Daily Stats",
+                "verbose_name_plural": "Run Daily Stats",
+                "indexes": [models.Index(fields=["day"], name="run_daily_stats_day_idx")],
+            },
+        ),
+        migrations.RunPython(populate_run_daily_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,13 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [("agent_sessions", "0007_rundailystats")]
+
+    operations = [
+        migrations.AddField(
+            model_name="run",
+            name="phase_timings",
+            field=models.JSONField(blank=True, null=True, verbose_name="phase timings"),
+        )
+    ]
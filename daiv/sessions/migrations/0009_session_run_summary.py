@@ -0,0 +1,134 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+# The session list's ``q`` search filters with ``title__icontains`` / ``repo_id__icontains``, which
+# Postgres runs as ``UPPER(col) LIKE UPPER(%term%)``: a leading-wildcard scan no B-tree can serve.
+# Trigram GIN indexes on the same ``UPPER`` expressions can. Postgres-only, so they are created here
+# rather than declared on the model (the SQLite test database has neither ``pg_trgm`` nor GIN).
+TRIGRAM_INDEXES = {"session_title_trgm": "title", "session_repo_trgm": "repo_id"}
+
+
+def populate_session_run_summary(apps, schema_editor):
+    """Fill in the run summary of every existing session in one set-based ``UPDATE``.
+
+    A frozen copy of ``sessions.summaries.summary_updates``: later runs refresh it as they are written.
+    """
+    Run = apps.get_model("agent_sessions", "Run")
+    Session = apps.get_model("agent_sessions", "Session")
+
+    latest = Run.objects.filter(session=models.OuterRef("pk")).order_by("-created_at", "-id")
+    totals = Run.objects.filter(session=models.OuterRef("pk")).order_by().values("session")
+    Session.objects.filter(models.Exists(Run.objects.filter(session=models.OuterRef("pk")))).update(
+        latest_run_id=models.Subquery(latest.values("id")[:1]),
+        latest_run_status=Coalesce(models.Subquery(latest.values("status")[:1]), models.Value("")),
+        latest_run_started_at=models.Subquery(latest.values("started_at")[:1]),
+        latest_run_finished_at=models.Subquery(latest.values("finished_at")[:1]),
+        latest_run_merge_request_web_url=Coalesce(
+            models.Subquery(latest.values("merge_request_web_url")[:1]), models.Value("")
+        ),
+        run_count=Coalesce(models.Subquery(totals.annotate(n=models.Count("pk")).values("n")), 0),
+        total_cost_usd=models.Subquery(totals.annotate(total=models.Sum("cost_usd")).values("total")),
+    )
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("agent_sessions", "Session")._meta.db_table
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin (UPPER({column}) gin_trgm_ops)"  # noqa: S608
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [("agent_sessions", "0008_run_phase_timings")]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="session",
+            options={
+                "ordering": ["-last_active_at", "-thread_id"],
+                "verbose_name": "Session",
+                "verbose_name_plural": "Sessions",
+            },
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="latest_run",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="agent_sessions.run",
+            ),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="latest_run_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("QUEUED", "Queued"),
+                    ("READY", "Pending"),
+                    ("RUNNING", "Running"),
+                    ("SUCCESSFUL", "Done"),
+                    ("FAILED", "Failed"),
+                ],
+                default="",
+                editable=False,
+                max_length=10,
+                verbose_name="latest run status",
+            ),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="latest_run_started_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name="latest run started at"),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="latest_run_finished_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name="latest run finished at"),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="latest_run_merge_request_web_url",
+            field=models.URLField(
+                blank=True, default="", editable=False, max_length=500, verbose_name="latest run merge request URL"
+            ),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="run_count",
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name="run count"),
+        ),
+        migrations.AddField(
+            model_name="session",
+            name="total_cost_usd",
+            field=models.DecimalField(
+                blank=True, decimal_places=6, editable=False, max_digits=12, null=True, verbose_name="total cost (USD)"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(fields=["-last_active_at", "-thread_id"], name="session_active_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(fields=["latest_run_status", "-last_active_at"], name="session_status_active_idx"),
+        ),
+        migrations.RunPython(populate_session_run_summary, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import uuid
+from datetime import timedelta
 from decimal import Decimal
 from typing import Any
 
@@ -14,7 +15,7 @@ from django.utils.translation import gettext_lazy as _
 from automation.agent.results import parse_agent_result
 from core.models import ThinkingLevelChoices
 from sessions.envelopes import validate_actionable
-from sessions.managers import RunEnvelopeManager, RunManager, SessionManager
+from sessions.managers import RunDailyStatsManager, RunEnvelopeManager, RunManager, SessionManager
 
 logger = logging.getLogger("daiv.sessions")
 
@@ -150,16 +151,37 @@ class Session(models.Model):
     # (not auto_now: queryset .aupdate() paths must control it, as ChatThread did).
     last_active_at = models.DateTimeField(_("last active at"), default=timezone.now)
 
+    # Denormalized summary of the session's runs, so the session list reads one row per session.
+    # Recomputed from the runs by ``sessions.summaries`` on every run write; never set directly.
+    latest_run = models.ForeignKey(
+        "Run", on_delete=models.SET_NULL, null=True, blank=True, editable=False, related_name="+"
+    )
+    latest_run_status = models.CharField(
+        _("latest run status"), max_length=10, choices=RunStatus.choices, blank=True, default="", editable=False
+    )
+    latest_run_started_at = models.DateTimeField(_("latest run started at"), null=True, blank=True, editable=False)
+    latest_run_finished_at = models.DateTimeField(_("latest run finished at"), null=True, blank=True, editable=False)
+    latest_run_merge_request_web_url = models.URLField(
+        _("latest run merge request URL"), max_length=500, blank=True, default="", editable=False
+    )
+    run_count = models.PositiveIntegerField(_("run count"), default=0, editable=False)
+    total_cost_usd = models.DecimalField(
+        _("total cost (USD)"), max_digits=12, decimal_places=6, null=True, blank=True, editable=False
+    )
+
     objects = SessionManager()
 
     class Meta:
         verbose_name = _("Session")
         verbose_name_plural = _("Sessions")
-        ordering = ["-last_active_at"]
+        ordering = ["-last_active_at", "-thread_id"]
         indexes = [
             models.Index(fields=["user", "-last_active_at"], name="session_user_active_idx"),
             models.Index(fields=["origin", "-last_active_at"], name="session_origin_active_idx"),
             models.Index(fields=["repo_id", "-last_active_at"], name="session_repo_active_idx"),
+            # The session list's keyset order, and its status filter.
+            models.Index(fields=["-last_active_at", "-thread_id"], name="session_active_idx"),
+            models.Index(fields=["latest_run_status", "-last_active_at"], name="session_status_active_idx"),
         ]
         constraints = [
             models.CheckConstraint(
@@ -194,6 +216,13 @@ class Session(models.Model):
         )
         return {self.merge_request_iid, *run_iids} - {None}
 
+    @property
+    def latest_run_duration(self) -> float | None:
+        """The latest run's execution time in seconds, or None while it has not finished."""
+        if self.latest_run_started_at and self.latest_run_finished_at:
+            return (self.latest_run_finished_at - self.latest_run_started_at).total_seconds()
+        return None
+
     async def atouch(self) -> None:
         """Bump ``last_active_at`` (queryset update; safe from async contexts)."""
         await type(self).objects.filter(pk=self.pk).aupdate(last_active_at=timezone.now())
@@ -282,6 +311,8 @@ class Run(models.Model):
     total_tokens = models.PositiveIntegerField(_("total tokens"), null=True, blank=True)
     cost_usd = models.DecimalField(_("cost (USD)"), max_digits=10, decimal_places=6, null=True, blank=True)
     usage_by_model = models.JSONField(_("usage by model"), null=True, blank=True)
+    # ``{phase: {"seconds", "count"}}`` — where the run's wall time went (see automation.agent.phase_timings).
+    phase_timings = models.JSONField(_("phase timings"), null=True, blank=True)
 
     created_at = models.DateTimeField(_("created at"), default=timezone.now, editable=False)
     started_at = models.DateTimeField(_("started at"), null=True, blank=True)
@@ -436,6 +467,9 @@ class Run(models.Model):
                 for field, value in usage_field_updates(usage, run_ref=self.pk).items():
                     setattr(self, field, value)
                     changed.append(field)
+            if (phase_timings := parsed.get("phase_timings")) and self.phase_timings is None:
+                self.phase_timings = phase_timings
+                changed.append("phase_timings")
 
         if tr.status == RunStatus.FAILED and tr.exception_class_path and not self.error_message:
             self.error_message = tr.exception_class_path
@@ -535,3 +569,52 @@ class RunEnvelope(models.Model):
     def is_actionable(self) -> bool:
         """Whether the console offers any action (Queue / Finding -> Fix gating)."""
         return self.offered_action != OfferedAction.NONE
+
+
+class RunDailyStats(models.Model):
+    """Per-day rollup of finished runs, backing the dashboard's activity card.
+
+    One row per local ``day`` of ``Run.created_at`` and per combination of the fields run
+    visibility is decided on (repository, trigger, owner, schedule), so a viewer's totals are a
+    sum over a few rollup rows instead of a scan over every run they can see. A day's rows are
+    recomputed from its runs whenever one of them finishes (see ``sessions.rollups``); runs still
+    in flight are counted live by the dashboard. Rebuild with ``backfill_dashboard_rollups``.
+    """
+
+    day = models.DateField(_("day"))
+    repo_id = models.CharField(_("repository"), max_length=255)
+    trigger_type = models.CharField(_("trigger type"), max_length=20, choices=SessionOrigin.choices)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("user"),
+    )
+    external_username = models.CharField(_("external username"), max_length=255, blank=True, default="")
+    scheduled_job = models.ForeignKey(
+        "schedules.ScheduledJob",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name=_("scheduled job"),
+    )
+    total = models.PositiveIntegerField(_("total"), default=0)
+    successful = models.PositiveIntegerField(_("successful"), default=0)
+    failed = models.PositiveIntegerField(_("failed"), default=0)
+    code_changes = models.PositiveIntegerField(_("code changes"), default=0)
+    # Successful runs with both timestamps set, and their summed duration: the average's inputs.
+    timed_successful = models.PositiveIntegerField(_("timed successful"), default=0)
+    successful_duration = models.DurationField(_("successful duration"), default=timedelta)
+
+    objects = RunDailyStatsManager()
+
+    class Meta:
+        verbose_name = _("Run Daily Stats")
+        verbose_name_plural = _("Run Daily Stats")
+        indexes = [models.Index(fields=["day"], name="run_daily_stats_day_idx")]
+
+    def __str__(self) -> str:
+        return f"{self.day} {self.trigger_type} on {self.repo_id}: {self.total} runs"
@@ -0,0 +1,105 @@
+"""Keyset pagination for the session list.
+
+Pages are cut at a ``(last_active_at, thread_id)`` position instead of an offset, so a page costs one
+indexed range read of ``page_size + 1`` rows however deep it is, and no ``COUNT(*)`` is issued. The
+cursor is base64(JSON) so the browser treats it as a token; it encodes only sort position, so it must
+be reused with the same filters. A session that becomes active again moves to the head of the list
+between two page loads rather than being shown twice.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from django.db.models import QuerySet
+
+    from sessions.models import Session
+
+# Every exception a malformed cursor can raise; a bad cursor falls back to the first page.
+_CURSOR_ERRORS = (ValueError, TypeError, KeyError, binascii.Error)
+
+
+def encode_cursor(session: Session, *, before: bool = False) -> str:
+    """Cursor for the page after ``session`` (or, with ``before``, the page before it)."""
+    payload = {"t": session.last_active_at.isoformat(), "id": session.thread_id, "b": before}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(raw: str) -> tuple[datetime, str, bool] | None:
+    """``(last_active_at, thread_id, before)`` from a cursor, or None when it is malformed."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(raw.encode()).decode())
+        last_active_at = parse_datetime(payload["t"])
+        if last_active_at is None or not isinstance(payload["id"], str):
+            return None
+        return last_active_at, payload["id"], bool(payload.get("b"))
+    except _CURSOR_ERRORS:
+        return None
+
+
+@dataclass
+class KeysetPage:
+    """One page of sessions, newest first, with the cursors of its neighbours."""
+
+    object_list: list[Session]
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+    has_other_pages: bool = field(init=False)
+
+    def __post_init__(self):
+        self.has_other_pages = bool(self.next_cursor or self.previous_cursor)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+def paginate_sessions(queryset: QuerySet[Session], cursor: str | None, page_size: int) -> KeysetPage:
+    """The page of ``queryset`` at ``cursor`` (the first page when it is missing or malformed)."""
+    position = decode_cursor(cursor) if cursor else None
+    if position is None:
+        rows = list(queryset.order_by("-last_active_at", "-thread_id")[: page_size + 1])
+        more = len(rows) > page_size
+        rows = rows[:page_size]
+        return KeysetPage(rows, next_cursor=encode_cursor(rows[-1]) if more else None)
+
+    last_active_at, thread_id, before = position
+    if before:
+        # Read the newer rows upwards from the cursor, then put them back in list order.
+        newer = Q(last_active_at__gt=last_active_at) | Q(last_active_at=last_active_at, thread_id__gt=thread_id)
+        rows = list(queryset.filter(newer).order_by("last_active_at", "thread_id")[: page_size + 1])
+        if len(rows) <= page_size:
+            # Back at the head of the list: serve the full first page rather than a short one.
+            return paginate_sessions(queryset, None, page_size)
+        rows = rows[:page_size][::-1]
+        return KeysetPage(
+            rows, next_cursor=encode_cursor(rows[-1]), previous_cursor=encode_cursor(rows[0], before=True)
+        )
+
+    older = Q(last_active_at__lt=last_active_at) | Q(last_active_at=last_active_at, thread_id__lt=thread_id)
+    rows = list(queryset.filter(older).order_by("-last_active_at", "-thread_id")[: page_size + 1])
+    more = len(rows) > page_size
+    rows = rows[:page_size]
+    return KeysetPage(
+        rows,
+        next_cursor=encode_cursor(rows[-1]) if more else None,
+        previous_cursor=encode_cursor(rows[0], before=True) if rows else None,
+    )
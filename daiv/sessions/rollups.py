@@ -0,0 +1,166 @@
+"""Maintenance and reads of the ``RunDailyStats`` rollup behind the dashboard's activity card.
+
+A day's rollup rows are recomputed from that day's finished runs rather than incremented, so a
+duplicate or replayed finish event cannot skew them and a refresh always converges on the runs as
+they are. Recomputes of the same day are serialized, so the last one to run sees every run
+committed before it. The cost of a refresh is bounded by one day's runs, and a dashboard read by
+the number of rollup rows in its period plus the runs still in flight — neither grows with history.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Q, Sum
+from django.utils import timezone
+
+from sessions.models import Run, RunDailyStats, RunStatus, SessionOrigin
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from accounts.models import User
+
+logger = logging.getLogger("daiv.sessions")
+
+# Stat keys of the trigger-keyed dashboard segments, each counting the trigger's non-failed runs.
+TRIGGER_STATS = {
+    "issues": SessionOrigin.ISSUE_WEBHOOK,
+    "mrs": SessionOrigin.MR_WEBHOOK,
+    "mcp_jobs": SessionOrigin.MCP_JOB,
+    "scheduled": SessionOrigin.SCHEDULE,
+    "api_jobs": SessionOrigin.API_JOB,
+    "chat_jobs": SessionOrigin.CHAT,
+}
+
+REFRESH_LOCK_TIMEOUT = 60
+
+
+def day_start(day: date) -> datetime:
+    """The first instant of ``day`` in the current time zone, the boundary ``__date`` filters use."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def refresh_run_daily_stats(days: Iterable[date]) -> None:
+    """Recompute the rollup rows of each of ``days`` from its finished runs."""
+    successful = Q(status=RunStatus.SUCCESSFUL)
+    duration = ExpressionWrapper(F("finished_at") - F("started_at"), output_field=DurationField())
+    for day in sorted(set(days)):
+        with cache.lock(f"run-daily-stats:{day.isoformat()}", timeout=REFRESH_LOCK_TIMEOUT):
+            rows = (
+                Run.objects
+                .filter(
+                    created_at__gte=day_start(day),
+                    created_at__lt=day_start(day + timedelta(days=1)),
+                    status__in=RunStatus.terminal(),
+                )
+                .order_by()
+                .values(
+                    "repo_id",
+                    "trigger_type",
+                    "user_id",
+                    "external_username",
+                    scheduled_job_id=F("session__scheduled_job_id"),
+                )
+                .annotate(
+                    n_total=Count("pk"),
+                    n_successful=Count("pk", filter=successful),
+                    n_failed=Count("pk", filter=Q(status=RunStatus.FAILED)),
+                    n_code_changes=Count("pk", filter=successful & Q(code_changes=True)),
+                    n_timed_successful=Count(
+                        "pk", filter=successful & Q(started_at__isnull=False, finished_at__isnull=False)
+                    ),
+                    sum_duration=Sum(duration, filter=successful),
+                )
+            )
+            stats = [
+                RunDailyStats(
+                    day=day,
+                    repo_id=row["repo_id"],
+                    trigger_type=row["trigger_type"],
+                    user_id=row["user_id"],
+                    external_username=row["external_username"],
+                    scheduled_job_id=row["scheduled_job_id"],
+                    total=row["n_total"],
+                    successful=row["n_successful"],
+                    failed=row["n_failed"],
+                    code_changes=row["n_code_changes"],
+                    timed_successful=row["n_timed_successful"],
+                    successful_duration=row["sum_duration"] or timedelta(0),
+                )
+                for row in rows
+            ]
+            with transaction.atomic():
+                RunDailyStats.objects.filter(day=day).delete()
+                RunDailyStats.objects.bulk_create(stats)
+
+
+def refresh_run_daily_stats_on_commit(days: Iterable[date]) -> None:
+    """Refresh ``days`` once the current transaction commits.
+
+    For the run lifecycle's write paths: a failed refresh is logged, never raised into the write
+    that triggered it, and is repaired by the next refresh of the same day.
+    """
+    if days := frozenset(days):
+        transaction.on_commit(lambda: refresh_run_daily_stats(days), robust=True)
+
+
+def run_activity_stats(user: User, cutoff_date: date | None) -> dict:
+    """The dashboard's run counters for the runs ``user`` may view, created on or after ``cutoff_date``.
+
+    Finished runs are summed from the rollup; queued and running runs, which the rollup does not
+    hold yet, are counted live. ``avg_duration`` is the mean duration of the successful runs, or
+    ``None`` when there are none. SYNC ONLY, like ``Run.objects.visible_to``.
+    """
+    rollups = RunDailyStats.objects.visible_to(user)
+    in_flight = Run.objects.visible_to(user).exclude(status__in=RunStatus.terminal())
+    if cutoff_date is not None:
+        rollups = rollups.filter(day__gte=cutoff_date)
+        in_flight = in_flight.filter(created_at__gte=day_start(cutoff_date))
+
+    finished = {
+        row["trigger_type"]: row
+        for row in rollups
+        .order_by()
+        .values("trigger_type")
+        .annotate(
+            n_total=Sum("total"),
+            n_successful=Sum("successful"),
+            n_failed=Sum("failed"),
+            n_code_changes=Sum("code_changes"),
+            n_timed_successful=Sum("timed_successful"),
+            sum_duration=Sum("successful_duration"),
+        )
+    }
+    # ``visible_to`` may join (and so ``distinct()``) for non-admins: group the matching primary keys
+    # instead, so a run reached through several joined rows is counted once.
+    unfinished = dict(
+        Run.objects
+        .filter(pk__in=in_flight.values("pk"))
+        .order_by()
+        .values("trigger_type")
+        .annotate(n_runs=Count("pk"))
+        .values_list("trigger_type", "n_runs")
+    )
+
+    def total(field: str) -> int:
+        return sum(row[field] for row in finished.values())
+
+    def non_failed(trigger: str) -> int:
+        row = finished.get(trigger)
+        return (row["n_total"] - row["n_failed"] if row else 0) + unfinished.get(trigger, 0)
+
+    timed = total("n_timed_successful")
+    duration = sum((row["sum_duration"] or timedelta(0) for row in finished.values()), timedelta(0))
+    return {
+        "total": total("n_total") + sum(unfinished.values()),
+        "successful": total("n_successful"),
+        "failed_count": total("n_failed"),
+        "code_changes": total("n_code_changes"),
+        "avg_duration": duration / timed if timed else None,
+        **{key: non_failed(trigger) for key, trigger in TRIGGER_STATS.items()},
+    }
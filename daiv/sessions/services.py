@@ -6,17 +6,22 @@ import uuid
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 from django.db.models import Q
+from django.utils import timezone
 
-from asgiref.sync import async_to_sync
+from asgiref.sync import async_to_sync, sync_to_async
+from django_tasks_db.models import DBTaskResult
 from jobs.tasks import run_job_task
 
 from automation.titling.tasks import generate_batch_title_task
 from chat.repo_state import mr_to_payload
 from codebase.authorization import aassert_can_run
+from core.backends.deduplicating import supports_bulk_enqueue
+from core.scheduling import CLAIM_WINDOW, queue_positions
 from sessions.models import Run, RunStatus, Session, SessionOrigin
 from sessions.signals import LINK_FAILED_PREFIX, emit_run_finished_if_terminal
+from sessions.summaries import refresh_session_summaries
 from sessions.validators import MAX_REPOS_PER_BATCH
 
 if TYPE_CHECKING:
@@ -224,6 +229,94 @@ async def _mark_failed_and_advance(run: Run, *, prefix: str, err: Exception, pre
         )
 
 
+def _bulk_submit(
+    *,
+    user: User | None,
+    prompt: str,
+    repos: list[RepoTarget],
+    titles: list[str],
+    agent_model: str,
+    agent_thinking_level: str,
+    muted: bool | None,
+    trigger_type: str,
+    scheduled_job: ScheduledJob | None,
+    external_username: str,
+    mcp_overrides: dict | None,
+    batch_id: uuid.UUID,
+) -> list[Run]:
+    """Create a fresh session, a READY run and a task for every target in a few set-based statements.
+
+    Only for batches that start new sessions: no sibling can be active on a session minted
+    here, so the per-repo ``IntegrityError`` fallback to QUEUED is never needed. One
+    transaction, so a failure leaves nothing behind and the caller can retry per repo.
+    """
+    sessions = [
+        Session(
+            thread_id=str(uuid.uuid4()),
+            origin=trigger_type,
+            repo_id=target.repo_id,
+            ref=target.ref,
+            user=user,
+            external_username=external_username,
+            title=title[: Session._meta.get_field("title").max_length],
+            agent_model=agent_model,
+            agent_thinking_level=agent_thinking_level,
+            sandbox_environment_id=target.sandbox_environment_id,
+            scheduled_job=scheduled_job,
+            mcp_overrides=mcp_overrides or {},
+        )
+        for target, title in zip(repos, titles, strict=True)
+    ]
+    runs = [
+        Run(
+            session=session,
+            trigger_type=trigger_type,
+            status=RunStatus.READY,
+            user=user,
+            external_username=external_username,
+            repo_id=target.repo_id,
+            ref=target.ref,
+            prompt=prompt,
+            agent_model=agent_model,
+            agent_thinking_level=agent_thinking_level,
+            muted=muted,
+            batch_id=batch_id,
+            title=title[: Run._meta.get_field("title").max_length],
+            sandbox_environment_id=target.sandbox_environment_id,
+        )
+        for session, target, title in zip(sessions, repos, titles, strict=True)
+    ]
+    with transaction.atomic():
+        Session.objects.bulk_create(sessions)
+        Run.objects.bulk_create(runs)
+        tasks = run_job_task.get_backend().bulk_enqueue(
+            run_job_task,
+            [
+                (
+                    (),
+                    {
+                        "repo_id": target.repo_id,
+                        "prompt": prompt,
+                        "ref": target.ref or None,
+                        "agent_model": agent_model or None,
+                        "agent_thinking_level": agent_thinking_level or None,
+                        "thread_id": session.thread_id,
+                        "sandbox_environment_id": target.sandbox_environment_id,
+                        "run_id": str(run.pk),
+                        "user_id": user.id if user is not None else None,
+                    },
+                )
+                for session, run, target in zip(sessions, runs, repos, strict=True)
+            ],
+        )
+        for run, task in zip(runs, tasks, strict=True):
+            run.task_result_id = task.id
+        Run.objects.bulk_update(runs, ["task_result_id"])
+        # ``bulk_create`` fires no post_save, so the new sessions' run summaries are filled in here.
+        refresh_session_summaries(session.thread_id for session in sessions)
+    return runs
+
+
 async def asubmit_batch_runs(
     *,
     user: User | None,
@@ -245,6 +338,10 @@ async def asubmit_batch_runs(
 
     Best-effort: any per-repo exception (enqueue failure or post-enqueue run-creation
     failure) lands in ``result.failed`` while siblings continue.
+
+    A batch of new sessions on the database task backend is written in one transaction of
+    set-based statements (:func:`_bulk_submit`) instead of a few round trips per repo; should
+    that fail as a whole, the batch falls back to the per-repo path.
     """
     _validate(repos)
     if user is not None:
@@ -262,16 +359,15 @@ async def asubmit_batch_runs(
             raise ValueError("thread_id continuation requires exactly one repo")
     batch_id = uuid.uuid4()
 
-    schedule_run_base = 0
+    titles = [""] * len(repos)
     if trigger_type == SessionOrigin.SCHEDULE and scheduled_job is not None:
         schedule_run_base = await Run.objects.filter(session__scheduled_job=scheduled_job).acount()
+        titles = [f"{scheduled_job.name} · run #{schedule_run_base + idx + 1}" for idx in range(len(repos))]
 
     async def _submit_one(idx: int, target: RepoTarget) -> Run | BatchSubmitFailure:
         effective_thread_id = thread_id or str(uuid.uuid4())
 
-        run_title = ""
-        if trigger_type == SessionOrigin.SCHEDULE and scheduled_job is not None:
-            run_title = f"{scheduled_job.name} · run #{schedule_run_base + idx + 1}"
+        run_title = titles[idx]
 
         common_kwargs: dict = {
             "trigger_type": trigger_type,
@@ -352,9 +448,30 @@ async def asubmit_batch_runs(
             )
         return run
 
-    # return_exceptions=True guards against BaseException (CancelledError, etc.) aborting the
-    # whole batch; _submit_one already catches Exception itself.
-    outcomes = await asyncio.gather(*[_submit_one(i, t) for i, t in enumerate(repos)], return_exceptions=True)
+    outcomes: list[Run | BatchSubmitFailure | BaseException] | None = None
+    if thread_id is None and supports_bulk_enqueue(run_job_task):
+        try:
+            outcomes = await sync_to_async(_bulk_submit)(
+                user=user,
+                prompt=prompt,
+                repos=repos,
+                titles=titles,
+                agent_model=agent_model,
+                agent_thinking_level=agent_thinking_level,
+                muted=muted,
+                trigger_type=trigger_type,
+                scheduled_job=scheduled_job,
+                external_username=external_username,
+                mcp_overrides=mcp_overrides,
+                batch_id=batch_id,
+            )
+        except Exception:
+            logger.exception("submit_batch_runs: bulk submission failed for batch_id=%s; retrying per repo", batch_id)
+
+    if outcomes is None:
+        # return_exceptions=True guards against BaseException (CancelledError, etc.) aborting the
+        # whole batch; _submit_one already catches Exception itself.
+        outcomes = await asyncio.gather(*[_submit_one(i, t) for i, t in enumerate(repos)], return_exceptions=True)
 
     runs: list[Run] = []
     failed: list[BatchSubmitFailure] = []
@@ -415,3 +532,20 @@ async def alist_user_runs(
         created_at, last_id = before
         qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id))
     return [run async for run in qs.order_by("-created_at", "-id")[:limit]]
+
+
+def run_queue_position(run: Run) -> str | None:
+    """1-based position of a READY run's task in its queue's fair claim order, for display.
+
+    ``"N+"`` when the task lies beyond the claim window, ``None`` once a worker has claimed it
+    (or for a run with no linked task). A projection, not a promise: see
+    :func:`core.scheduling.queue_positions`.
+    """
+    if run.status != RunStatus.READY or run.task_result_id is None:
+        return None
+    task = DBTaskResult.objects.ready().filter(pk=run.task_result_id).values("queue_name", "backend_name").first()
+    if task is None:
+        return None
+    positions = queue_positions(task["backend_name"], [task["queue_name"]], now=timezone.now())
+    position = positions.get(str(run.task_result_id))
+    return str(position) if position is not None else f"{CLAIM_WINDOW}+"
@@ -5,8 +5,9 @@ from typing import Any
 
 from django.conf import settings
 from django.db import IntegrityError, transaction
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import Signal, receiver
+from django.utils import timezone
 
 from asgiref.sync import async_to_sync
 from django_tasks.signals import task_finished, task_started
@@ -106,6 +107,63 @@ def publish_nav_runs_changed(sender: type, instance: Any, created: bool, **kwarg
     transaction.on_commit(ui_events.publisher.runs_changed)
 
 
+# The Run fields a ``RunDailyStats`` row is computed from.
+RUN_ROLLUP_FIELDS = frozenset({"status", "started_at", "finished_at", "code_changes"})
+
+
+@receiver(post_save, sender="agent_sessions.Run", dispatch_uid="sessions.refresh_run_daily_stats_on_save")
+def refresh_run_daily_stats_on_save(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Refresh the dashboard rollup of the day a finished run was saved on.
+
+    Saves that leave the rolled-up fields alone are skipped, as are unfinished runs, which the
+    dashboard counts live. Writes that bypass this signal (``finalize_chat_run``'s ``aupdate()``,
+    the ``sync_stuck_runs`` reaper's ``.update()``) refresh for themselves.
+    """
+    from sessions.models import RunStatus  # local import to avoid circulars
+    from sessions.rollups import refresh_run_daily_stats_on_commit
+
+    if instance.status not in RunStatus.terminal():
+        return
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and not RUN_ROLLUP_FIELDS.intersection(update_fields):
+        return
+    refresh_run_daily_stats_on_commit([timezone.localdate(instance.created_at)])
+
+
+@receiver(post_delete, sender="agent_sessions.Run", dispatch_uid="sessions.refresh_run_daily_stats_on_delete")
+def refresh_run_daily_stats_on_delete(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Drop a deleted finished run from its day's dashboard rollup."""
+    from sessions.models import RunStatus  # local import to avoid circulars
+    from sessions.rollups import refresh_run_daily_stats_on_commit
+
+    if instance.status in RunStatus.terminal():
+        refresh_run_daily_stats_on_commit([timezone.localdate(instance.created_at)])
+
+
+@receiver(post_save, sender="agent_sessions.Run", dispatch_uid="sessions.refresh_session_summary_on_save")
+def refresh_session_summary_on_save(sender: type, instance: Any, created: bool, **kwargs: Any) -> None:
+    """Refresh the run summary of the session a run was created in or had its summarized fields saved on.
+
+    Writes that bypass this signal (``finalize_chat_run``'s ``aupdate()``, the dispatchers' QUEUED→READY
+    claims, the ``sync_stuck_runs`` reaper's ``.update()``, the batch submit's ``bulk_create``) refresh
+    for themselves.
+    """
+    from sessions.summaries import SUMMARY_RUN_FIELDS, refresh_session_summaries
+
+    update_fields = kwargs.get("update_fields")
+    if not created and update_fields is not None and not SUMMARY_RUN_FIELDS.intersection(update_fields):
+        return
+    refresh_session_summaries([instance.session_id])
+
+
+@receiver(post_delete, sender="agent_sessions.Run", dispatch_uid="sessions.refresh_session_summary_on_delete")
+def refresh_session_summary_on_delete(sender: type, instance: Any, **kwargs: Any) -> None:
+    """Drop a deleted run from its session's run summary."""
+    from sessions.summaries import refresh_session_summaries
+
+    refresh_session_summaries([instance.session_id])
+
+
 def emit_run_finished_if_terminal(run: Any, previous_status: str | None, *, skip_dispatch: bool = False) -> None:
     """Emit run_finished if the run just transitioned to a terminal status.
 
@@ -187,6 +245,7 @@ def dispatch_next_in_session(sender: type, run: Any, **kwargs: Any) -> None:
     re-entry while still letting notification receivers fire.
     """
     from sessions.models import Run, RunStatus
+    from sessions.summaries import refresh_session_summaries
 
     if kwargs.get("skip_dispatch"):
         return
@@ -213,6 +272,7 @@ def dispatch_next_in_session(sender: type, run: Any, **kwargs: Any) -> None:
             # Another dispatcher took this exact row; try the next one.
             continue
 
+        refresh_session_summaries([session_id])
         next_q.refresh_from_db()
         if _enqueue_queued_run(next_q):
             return
@@ -0,0 +1,60 @@
+"""Maintenance of the latest-run summary each ``Session`` row carries for the session list.
+
+The summary (the newest run's id, status, timings and merge request link, plus the run count and
+the summed cost) is recomputed from the session's runs rather than patched field by field, so a
+refresh always converges on the runs as they are, whatever order the writes arrived in. The session
+rows are locked before their runs are read: of two concurrent refreshes of one session, the later
+one waits for the earlier to commit and then sees every run it saw.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from sessions.models import Run, Session
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger("daiv.sessions")
+
+# The Run fields a session's summary is computed from.
+SUMMARY_RUN_FIELDS = frozenset({"status", "started_at", "finished_at", "merge_request_web_url", "cost_usd"})
+
+
+def summary_updates() -> dict[str, Subquery | Coalesce]:
+    """``Session`` field updates that recompute the summary from the runs, one correlated subquery each."""
+    latest = Run.objects.filter(session=OuterRef("pk")).order_by("-created_at", "-id")
+    totals = Run.objects.filter(session=OuterRef("pk")).order_by().values("session")
+    return {
+        "latest_run_id": Subquery(latest.values("id")[:1]),
+        "latest_run_status": Coalesce(Subquery(latest.values("status")[:1]), Value("")),
+        "latest_run_started_at": Subquery(latest.values("started_at")[:1]),
+        "latest_run_finished_at": Subquery(latest.values("finished_at")[:1]),
+        "latest_run_merge_request_web_url": Coalesce(Subquery(latest.values("merge_request_web_url")[:1]), Value("")),
+        "run_count": Coalesce(Subquery(totals.annotate(n=Count("pk")).values("n")), 0),
+        "total_cost_usd": Subquery(totals.annotate(total=Sum("cost_usd")).values("total")),
+    }
+
+
+def refresh_session_summaries(session_ids: Iterable[str]) -> None:
+    """Recompute the run summary of each of ``session_ids`` in one statement.
+
+    For the run lifecycle's write paths: a failed refresh is logged, never raised into the write
+    that triggered it, and is repaired by the next refresh of the same session.
+    """
+    if not (ids := sorted(set(session_ids))):
+        return
+    try:
+        with transaction.atomic():
+            # Lock in primary key order, so two refreshes sharing sessions cannot deadlock.
+            locked = list(Session.objects.select_for_update().filter(pk__in=ids).order_by("pk").values_list("pk"))
+            if locked:
+                Session.objects.filter(pk__in=ids).update(**summary_updates())
+    except Exception:
+        logger.exception("Failed to refresh the run summary of sessions %s", ids)
@@ -36,6 +36,16 @@ def duration(value):
     return f"{hours}h {minutes}m"
 
 
+@register.filter
+def format_seconds(value):
+    """Format a phase timing in seconds, keeping sub-minute precision that ``duration`` drops."""
+    if value is None:
+        return ""
+    if value < 60:
+        return f"{value:.1f}s"
+    return duration(value)
+
+
 @register.filter
 def format_cost(value):
     """Format a Decimal cost as a compact USD string."""
@@ -115,6 +125,6 @@ def day_bucket(session) -> str:
 
 @register.simple_tag
 def session_cost(session) -> str:
-    """Sum cost_usd across a session's runs (uses the prefetch cache), formatted."""
-    total = sum((r.cost_usd for r in session.runs.all() if r.cost_usd is not None), Decimal("0"))
-    return format_cost(total) if total > 0 else ""
+    """The session's summed run cost (the denormalized ``total_cost_usd``), formatted."""
+    total = session.total_cost_usd
+    return format_cost(total) if total is not None and total > 0 else ""
@@ -11,7 +11,6 @@ from urllib.parse import urlencode
 from django.contrib import messages as messages_module
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied, SuspiciousOperation, ValidationError
-from django.db.models import Prefetch
 from django.http import Http404, HttpResponse, HttpResponseBase
 from django.shortcuts import redirect
 from django.urls import reverse
@@ -39,7 +38,8 @@ from sessions.forms import AgentRunCreateForm
 from sessions.hydration import ahydrate_thread
 from sessions.locks import stale_cutoff
 from sessions.models import Run, RunStatus, Session, SessionOrigin
-from sessions.services import RepoTarget, submit_batch_runs
+from sessions.pagination import paginate_sessions
+from sessions.services import RepoTarget, run_queue_position, submit_batch_runs
 from sessions.transcript import annotate_transcript
 from slash_commands.composer import composer_command_rows
 
@@ -136,33 +136,13 @@ class SessionListView(LoginRequiredMixin, FilterView):
         return ["sessions/session_list.html"]
 
     def get_queryset(self) -> QuerySet[Session]:
-        # ``latest_run_status`` (annotation) still drives the status FILTER. Row DISPLAY
-        # (latest status/duration/MR/cost, run count) reads the prefetched runs, which also
-        # gives the SSE dot the real ``Run.id`` to key live updates on.
-        return (
-            Session.objects
-            .visible_to(self.request.user)
-            .with_latest_status()
-            .select_related("user", "scheduled_job")
-            # Only the columns the row reads (status/duration/MR/cost/SSE id) — skips the fat
-            # prompt/result_summary/error_message/usage_by_model columns. Add a field here if
-            # the row template starts reading it, or it becomes a deferred-field N+1.
-            .prefetch_related(
-                Prefetch(
-                    "runs",
-                    queryset=Run.objects.only(
-                        "id",
-                        "session_id",
-                        "status",
-                        "started_at",
-                        "finished_at",
-                        "merge_request_web_url",
-                        "cost_usd",
-                        "created_at",
-                    ).order_by("-created_at", "-id"),
-                )
-            )
-        )
+        # Rows read the session's denormalized run summary (latest status/duration/MR, cost, run
+        # count; see ``sessions.summaries``), so a page is one range read with no per-row subquery.
+        return Session.objects.visible_to(self.request.user).select_related("user", "scheduled_job")
+
+    def paginate_queryset(self, queryset, page_size):
+        page = paginate_sessions(queryset, self.request.GET.get("cursor"), page_size)
+        return None, page, page.object_list, page.has_other_pages
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -303,8 +283,10 @@ class SessionDetailView(LoginRequiredMixin, DetailView):
                 "thread_ref": "",
                 "diff_stats": None,
                 "runs": [],
+                "timed_runs": [],
                 "is_in_flight": False,
                 "in_flight_ids": "",
+                "queue_position": None,
             })
             return ctx
 
@@ -340,6 +322,7 @@ class SessionDetailView(LoginRequiredMixin, DetailView):
         ctx["merge_request"] = merge_request
         ctx["diff_stats"] = diff_stats
         ctx["runs"] = runs
+        ctx["timed_runs"] = [r for r in runs if r.phase_timings]
         ctx["is_in_flight"] = is_in_flight
         # The chat page rejoins the event relay only when the in-flight holder is a
         # chat run (holder id == AG-UI run id). Background holders don't publish to
@@ -359,6 +342,8 @@ class SessionDetailView(LoginRequiredMixin, DetailView):
             (active_run.started_at or active_run.created_at).isoformat() if active_run else ""
         )
         ctx["in_flight_ids"] = ",".join(str(r.id) for r in non_terminal) if is_in_flight else ""
+        # Where a submitted-but-unclaimed run stands among everything the workers could pick next.
+        ctx["queue_position"] = run_queue_position(non_terminal[-1]) if is_in_flight else None
 
         # Engage transcript polling when a background run holds the slot and there is
         # no live chat stream from this tab (chat stream manages its own turns in JS;
@@ -1,7 +1,22 @@
+"""SWE-bench style evaluation of the DAIV agent.
+
+Instances run concurrently (``--workers``), each on its own clone of the instance's repository at
+its base commit. Clones come from a cache shared by the workers (``--clone-cache-dir``, a
+temporary directory by default): each repository is fetched once and each base commit checked out
+once, however many instances or reruns use it.
+
+Every finished instance is appended to the predictions file at once, and its wall time, token
+usage and cost to the metrics file, both as JSON lines. Rerunning the same command resumes: the
+instances already in the predictions file are skipped. An instance whose run raised is recorded
+in the metrics file only, so a rerun retries it.
+"""
+
 import argparse
 import asyncio
 import json
 import sys
+import tempfile
+import time
 import traceback
 from pathlib import Path
 from textwrap import dedent
@@ -18,35 +33,108 @@ django.setup()
 from automation.agent import ThinkingLevel  # noqa: E402
 from automation.agent.constants import ModelName  # noqa: E402
 from automation.agent.graph import create_daiv_agent  # noqa: E402
+from automation.agent.usage_tracking import build_usage_summary, track_usage_metadata  # noqa: E402
 from codebase.base import GitPlatform, Scope  # noqa: E402
+from codebase.clients import RepoClient  # noqa: E402
 from codebase.context import set_runtime_ctx  # noqa: E402
 
+REPO_HOST = "github.com"
 
-async def main(
-    dataset_path: str,
-    dataset_split: str,
-    output_path: str,
-    model_names: list[ModelName | str],
-    instance_ids: list[str] | None = None,
-    num_samples: int | None = None,
-):
-    dataset = load_dataset(dataset_path, split=dataset_split)
-    if instance_ids:
-        selected_instance_ids = set(instance_ids)
-        dataset = dataset.filter(lambda item: item["instance_id"] in selected_instance_ids)
+PROBLEM_PROMPT = dedent(
+    """\
+    You are given a problem statement, along with some hints extracted from the issue tracker, to help you understand and solve the problem.
 
-    if num_samples is not None:
-        if num_samples >= 20:
-            raise ValueError("num_samples must be less than or equal to 20")
+    VERY IMPORTANT: never activate the plan skill, just solve the problem.
 
-        dataset = dataset.take(num_samples)
+    ## Execution constraints
+
+    - Web research is unavailable: web search/fetch tools are disabled. Rely on the repository itself (existing code patterns, tests, docs). Installing packages with pip/uv DOES work — use it to provision test dependencies.
+
+    ## How to work
+
+    - Treat any root-cause analysis embedded in the problem statement as a hypothesis to verify, not a conclusion — reporters are sometimes wrong or partial.
+    - Before running tests, provision the environment in ONE step: check `pyproject.toml` / `setup.py` / `tox.ini` for the supported Python version and the test extra's name, then install it once (e.g. `pip install -e ".[test]"`) instead of discovering missing dependencies one test failure at a time.
+    - Prefer the smallest change that addresses the problem statement while preserving all existing intended behavior. A 3-line fix that follows the issue beats a 30-line architectural change; avoid touching files the fix doesn't require.
+    - When the bug was introduced by an identifiable feature commit, fix the interaction between that feature and the broken case — do NOT revert or remove the feature; upstream maintainers virtually never resolve a regression by deleting the feature that caused it. Untested does not mean unintended: behavior promised by the offending commit's docs/changelog must keep working even when no test pins it, and a green test suite does not prove behavior preservation.
+    - The grader resets every test file to its original state and applies its own held-out tests before scoring, so your edits to existing test files are discarded and never graded — only your source change is scored. Editing a pre-existing test to make it pass therefore cannot help here; if one seems to need changing, treat that as a signal you may be altering behavior the task wants preserved and re-examine your source. Adding new tests to characterize behavior is fine.
+    - Once your fix is implemented, run the issue's reproduction (if any) and the tests directly affected by your change. When those pass, do ONE final check and stop:
+      - Re-read the problem statement and verify every described behavior / expected outcome is addressed — multi-symptom issues need all symptoms fixed, not just the first one you reproduced.
+      - If your change introduced warnings in the test output that were not there before (RuntimeWarning, DeprecationWarning, ...), eliminate them — new warnings are regressions even when every test passes.
+      - Do NOT re-run test suites repeatedly, do not investigate or fix pre-existing failures unrelated to your change, and do not keep polishing (docstrings, comments, optional refactors).
+
+    ## Problem Statement
+    ```markdown
+    {problem_statement}
+    ```
+    """  # noqa: E501
+)
+
+HINTS_PROMPT = dedent(
+    """
+    ## Hints
+
+    Hints are **contextual clues** extracted from mid-discussion comments, not authoritative decisions. They may come from:
+    - Issue reporters (who might misunderstand the intended behavior)
+    - Discussion threads (where conclusions may be incomplete or premature)
+    - Maintainer comments (which carry more weight but may reflect an intermediate position)
+
+    **CRITICAL:** Even if hints suggest "closing", "won't fix", "working as intended", or otherwise imply no change is needed — **you MUST still produce a code fix**. This task always requires a code change. Hints that dismiss the issue may reflect an early opinion that was later reversed, or the fix may be a small improvement (e.g., better error messages, edge-case handling, or documentation) rather than the reporter's exact request. Your job is to find and implement the change that addresses the problem statement.
+
+    When hints describe a specific approach, prefer the simplest implementation that matches the hint over a more elaborate design.
+
+    **Hints:**
+    ```
+    {hints_text}
+    ```
+    """  # noqa: E501
+)
+
+
+def build_prompt(item: dict) -> str:
+    prompt = PROBLEM_PROMPT.format(problem_statement=item["problem_statement"])
+    if item["hints_text"]:
+        prompt += HINTS_PROMPT.format(hints_text=item["hints_text"])
+    return prompt
+
+
+def completed_instance_ids(predictions_path: Path) -> set[str]:
+    """Instance ids already in ``predictions_path``.
 
-    predictions = []
+    A torn last line (the evaluation was killed mid-write) is ignored, so that instance reruns.
+    """
+    if not predictions_path.exists():
+        return set()
+    completed = set()
+    with predictions_path.open() as f:
+        for line in f:
+            try:
+                completed.add(json.loads(line)["instance_id"])
+            except ValueError, KeyError, TypeError:
+                continue
+    return completed
 
-    try:
-        for item in dataset:
-            store = InMemoryStore()
-            # checkpointer = InMemorySaver()  # noqa: ERA001
+
+def append_line(path: Path, record: dict) -> None:
+    # Only the event loop thread writes, one whole line at a time, so lines never interleave.
+    with path.open("a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+async def evaluate_instance(item: dict, *, model_names: list[ModelName | str], clone_cache_dir: Path) -> dict:
+    """Run the agent on one instance and return its metrics, with ``model_patch`` set when the run finished."""
+    instance_id = item["instance_id"]
+    started = time.monotonic()
+    metrics: dict = {"instance_id": instance_id, "status": "failed", "model_patch": None}
+
+    with track_usage_metadata() as usage_handler:
+        try:
+            # Warm the clone cache off the event loop: a cold clone can take minutes, and the other
+            # workers' agents keep running meanwhile. The copy ``set_runtime_ctx`` then makes is local.
+            repo_client = RepoClient.create_instance(
+                git_platform=GitPlatform.SWE, repo_host=REPO_HOST, clone_cache_dir=clone_cache_dir
+            )
+            repository = repo_client.get_repository(item["repo"])
+            await asyncio.to_thread(repo_client.prepare_clone, repository, item["base_commit"])
 
             async with set_runtime_ctx(
                 item["repo"],
@@ -54,14 +142,14 @@ async def main(
                 ref=item["base_commit"],
                 offline=True,
                 git_platform=GitPlatform.SWE,
-                repo_host="github.com",
+                repo_host=REPO_HOST,
+                clone_cache_dir=clone_cache_dir,
             ) as ctx:
                 daiv_agent = await create_daiv_agent(
                     model_names=model_names,
                     thinking_level=ThinkingLevel.HIGH,
                     ctx=ctx,
-                    store=store,
-                    # checkpointer=checkpointer,  # noqa: ERA001
+                    store=InMemoryStore(),
                     auto_commit_changes=False,
                     # On sandbox-enabled runs the agent's edits live in the sandbox
                     # /workspace/repo, not in this local clone (it only seeds the session), so
@@ -72,102 +160,134 @@ async def main(
                     web_search_enabled=False,
                     web_fetch_enabled=False,
                 )
-                human_message = dedent(
-                    """\
-                    You are given a problem statement, along with some hints extracted from the issue tracker, to help you understand and solve the problem.
-
-                    VERY IMPORTANT: never activate the plan skill, just solve the problem.
-
-                    ## Execution constraints
-
-                    - Web research is unavailable: web search/fetch tools are disabled. Rely on the repository itself (existing code patterns, tests, docs). Installing packages with pip/uv DOES work — use it to provision test dependencies.
-
-                    ## How to work
-
-                    - Treat any root-cause analysis embedded in the problem statement as a hypothesis to verify, not a conclusion — reporters are sometimes wrong or partial.
-                    - Before running tests, provision the environment in ONE step: check `pyproject.toml` / `setup.py` / `tox.ini` for the supported Python version and the test extra's name, then install it once (e.g. `pip install -e ".[test]"`) instead of discovering missing dependencies one test failure at a time.
-                    - Prefer the smallest change that addresses the problem statement while preserving all existing intended behavior. A 3-line fix that follows the issue beats a 30-line architectural change; avoid touching files the fix doesn't require.
-                    - When the bug was introduced by an identifiable feature commit, fix the interaction between that feature and the broken case — do NOT revert or remove the feature; upstream maintainers virtually never resolve a regression by deleting the feature that caused it. Untested does not mean unintended: behavior promised by the offending commit's docs/changelog must keep working even when no test pins it, and a green test suite does not prove behavior preservation.
-                    - The grader resets every test file to its original state and applies its own held-out tests before scoring, so your edits to existing test files are discarded and never graded — only your source change is scored. Editing a pre-existing test to make it pass therefore cannot help here; if one seems to need changing, treat that as a signal you may be altering behavior the task wants preserved and re-examine your source. Adding new tests to characterize behavior is fine.
-                    - Once your fix is implemented, run the issue's reproduction (if any) and the tests directly affected by your change. When those pass, do ONE final check and stop:
-                      - Re-read the problem statement and verify every described behavior / expected outcome is addressed — multi-symptom issues need all symptoms fixed, not just the first one you reproduced.
-                      - If your change introduced warnings in the test output that were not there before (RuntimeWarning, DeprecationWarning, ...), eliminate them — new warnings are regressions even when every test passes.
-                      - Do NOT re-run test suites repeatedly, do not investigate or fix pre-existing failures unrelated to your change, and do not keep polishing (docstrings, comments, optional refactors).
-
-                    ## Problem Statement
-                    ```markdown
-                    {problem_statement}
-                    ```
-                    """  # noqa: E501
-                ).format(problem_statement=item["problem_statement"])
-
-                if item["hints_text"]:
-                    human_message += dedent(
-                        """
-                        ## Hints
-
-                        Hints are **contextual clues** extracted from mid-discussion comments, not authoritative decisions. They may come from:
-                        - Issue reporters (who might misunderstand the intended behavior)
-                        - Discussion threads (where conclusions may be incomplete or premature)
-                        - Maintainer comments (which carry more weight but may reflect an intermediate position)
-
-                        **CRITICAL:** Even if hints suggest "closing", "won't fix", "working as intended", or otherwise imply no change is needed — **you MUST still produce a code fix**. This task always requires a code change. Hints that dismiss the issue may reflect an early opinion that was later reversed, or the fix may be a small improvement (e.g., better error messages, edge-case handling, or documentation) rather than the reporter's exact request. Your job is to find and implement the change that addresses the problem statement.
-
-                        When hints describe a specific approach, prefer the simplest implementation that matches the hint over a more elaborate design.
-
-                        **Hints:**
-                        ```
-                        {hints_text}
-                        ```
-                        """  # noqa: E501
-                    ).format(hints_text=item["hints_text"])
-
-                result = None
-                try:
-                    result = await daiv_agent.ainvoke(
-                        {"messages": [human_message]},
-                        context=ctx,
-                        config={"configurable": {"thread_id": item["instance_id"]}},
-                    )
-                except Exception:
-                    print(f"[{item['instance_id']}] run failed:", file=sys.stderr)  # noqa: T201
-                    traceback.print_exc()
-                finally:
-                    # GitMiddleware sets this when the workspace differed from HEAD before the
-                    # agent acted — the patch below is poisoned with changes the agent never
-                    # made. Surface it next to the run so a bad grading batch is explainable
-                    # without grepping server logs. (Kept out of the predictions file: SWE-bench
-                    # loaders may be strict about its schema.)
-                    if result is not None and (dirty := result.get("pre_run_dirty_files")):
-                        print(  # noqa: T201
-                            f"[{item['instance_id']}] WARNING: workspace was dirty before the run; "
-                            f"model_patch includes pre-existing changes to: {', '.join(dirty)}",
-                            file=sys.stderr,
-                        )
-                    # A failed run degrades to an empty patch (the traceback above is the
-                    # signal); a *successful* run missing the key means capture_patch wiring
-                    # drifted — let the KeyError kill the eval rather than silently emit a
-                    # predictions file full of empty patches.
-                    predictions.append({
-                        "model_patch": result["model_patch"] if result is not None else "",
-                        "model_name_or_path": ", ".join(model_names),
-                        "instance_id": item["instance_id"],
-                    })
-    finally:
-        print(json.dumps(predictions, indent=2))  # noqa: T201
-
-        with Path(output_path).open("w") as f:
-            json.dump(predictions, f, indent=2)
+                result = await daiv_agent.ainvoke(
+                    {"messages": [build_prompt(item)]}, context=ctx, config={"configurable": {"thread_id": instance_id}}
+                )
+        except Exception as exc:
+            print(f"[{instance_id}] run failed:", file=sys.stderr)  # noqa: T201
+            traceback.print_exc()
+            metrics["error"] = repr(exc)
+        else:
+            # GitMiddleware sets this when the workspace differed from HEAD before the agent
+            # acted — the patch is poisoned with changes the agent never made. Surface it next to
+            # the run so a bad grading batch is explainable without grepping server logs. (Kept
+            # out of the predictions file: SWE-bench loaders may be strict about its schema.)
+            if dirty := result.get("pre_run_dirty_files"):
+                print(  # noqa: T201
+                    f"[{instance_id}] WARNING: workspace was dirty before the run; "
+                    f"model_patch includes pre-existing changes to: {', '.join(dirty)}",
+                    file=sys.stderr,
+                )
+                metrics["pre_run_dirty_files"] = list(dirty)
+            # A *successful* run missing the key means capture_patch wiring drifted — let the
+            # KeyError kill the eval rather than silently emit a predictions file full of empty
+            # patches.
+            metrics["model_patch"] = result["model_patch"]
+            metrics["status"] = "completed"
+
+    usage = build_usage_summary(usage_handler)
+    metrics.update(
+        wall_time_s=round(time.monotonic() - started, 1),
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens,
+        total_tokens=usage.total_tokens,
+        cost_usd=usage.cost_usd,
+    )
+    return metrics
+
+
+async def main(
+    dataset_path: str,
+    dataset_split: str,
+    output_path: str,
+    metrics_path: str | None,
+    model_names: list[ModelName | str],
+    workers: int,
+    clone_cache_dir: str | None,
+    instance_ids: list[str] | None = None,
+    num_samples: int | None = None,
+):
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    dataset = load_dataset(dataset_path, split=dataset_split)
+    if instance_ids:
+        selected_instance_ids = set(instance_ids)
+        dataset = dataset.filter(lambda item: item["instance_id"] in selected_instance_ids)
+    if num_samples is not None:
+        dataset = dataset.take(num_samples)
+
+    predictions_file = Path(output_path)
+    metrics_file = Path(metrics_path) if metrics_path else predictions_file.with_suffix(".metrics.jsonl")
+    completed = completed_instance_ids(predictions_file)
+    pending = [item for item in dataset if item["instance_id"] not in completed]
+    print(  # noqa: T201
+        f"{len(pending)} instance(s) to run, {len(completed)} already in {predictions_file}", file=sys.stderr
+    )
+
+    semaphore = asyncio.Semaphore(workers)
+    totals = {"completed": 0, "failed": 0, "cost_usd": 0.0}
+
+    async def run(item: dict, cache_dir: Path) -> None:
+        async with semaphore:
+            metrics = await evaluate_instance(item, model_names=model_names, clone_cache_dir=cache_dir)
+        model_patch = metrics.pop("model_patch")
+        append_line(metrics_file, metrics)
+        totals[metrics["status"]] += 1
+        totals["cost_usd"] += float(metrics["cost_usd"] or 0)
+        if metrics["status"] == "completed":
+            append_line(
+                predictions_file,
+                {
+                    "model_patch": model_patch,
+                    "model_name_or_path": ", ".join(model_names),
+                    "instance_id": item["instance_id"],
+                },
+            )
+        print(  # noqa: T201
+            f"[{item['instance_id']}] {metrics['status']} in {metrics['wall_time_s']}s "
+            f"({totals['completed'] + totals['failed']}/{len(pending)})",
+            file=sys.stderr,
+        )
+
+    with tempfile.TemporaryDirectory(prefix="swebench-clones-") as tmp_cache_dir:
+        cache_dir = Path(clone_cache_dir) if clone_cache_dir else Path(tmp_cache_dir)
+        async with asyncio.TaskGroup() as group:
+            for item in pending:
+                group.create_task(run(item, cache_dir))
+
+    print(  # noqa: T201
+        f"Done: {totals['completed']} completed, {totals['failed']} failed, ${totals['cost_usd']:.2f} "
+        "(unpriced models count as $0)."
+    )
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--dataset-path", type=str, default="princeton-nlp/SWE-bench_Verified")
     parser.add_argument("--dataset-split", type=str, default="test")
-    parser.add_argument("--num-samples", type=int, default=10)
+    parser.add_argument("--num-samples", type=int, default=None, help="Only the first N instances (default: all).")
     parser.add_argument("--model-names", type=str, nargs="+", default=[ModelName.MINIMAX_M3])
     parser.add_argument("--instance-ids", type=str, nargs="+")
-    parser.add_argument("--output-path", type=str, default="predictions.json")
+    parser.add_argument("--workers", type=int, default=4, help="Instances run concurrently.")
+    parser.add_argument(
+        "--output-path",
+        type=str,
+        default="predictions.jsonl",
+        help="Predictions, one JSON line per instance. Instances already in it are skipped.",
+    )
+    parser.add_argument(
+        "--metrics-path",
+        type=str,
+        default=None,
+        help="Per-instance wall time, tokens and cost (default: the output path with a .metrics.jsonl suffix).",
+    )
+    parser.add_argument(
+        "--clone-cache-dir",
+        type=str,
+        default=None,
+        help="Keep repository clones here to reuse them across runs (default: a temporary directory).",
+    )
 
     args = parser.parse_args()
 
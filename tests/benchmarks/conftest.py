@@ -0,0 +1,127 @@
+"""Options and baseline bookkeeping for the agent overhead benchmarks.
+
+Each scenario's round-trip counts must match its stored baseline exactly: the replay is
+deterministic, so a changed count is a changed code path, and the committed baseline holds them for
+every run. Timings and peak allocations only mean something on the reference machine, so they are
+measured and compared only with ``--benchmark-timings``, and must then stay within
+``--benchmark-tolerance`` times their baseline. ``--update-baseline`` records the results instead of
+comparing them: the counts anywhere, the timings and peaks only together with ``--benchmark-timings``.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+MEASURED_KEY = pytest.StashKey[dict[str, dict]]()
+
+# Timings within this many milliseconds of their baseline never fail, whatever the tolerance: the
+# small buckets (the relay, the checkpointer) are dominated by scheduler noise.
+TIMING_NOISE_FLOOR_MS = 5.0
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks")
+    group.addoption("--update-baseline", action="store_true", help="Record the benchmark results as the new baseline.")
+    group.addoption(
+        "--benchmark-timings",
+        action="store_true",
+        help="Also measure timings and peak allocations and compare them (reference machine only).",
+    )
+    group.addoption("--benchmark-repeat", type=int, default=5, help="Timed replays per scenario (median reported).")
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=1.5,
+        help="Fail when a timing or peak allocation exceeds its baseline by this factor (0 disables the check).",
+    )
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    if not (measured := config.stash.get(MEASURED_KEY, None)):
+        return
+    if not config.getoption("--benchmark-timings", default=False):
+        terminalreporter.section("agent overhead (round-trips)")
+        for name, result in sorted(measured.items()):
+            terminalreporter.write_line(f"{name}: " + " ".join(f"{key}={n}" for key, n in result["counts"].items()))
+        return
+    terminalreporter.section("agent overhead (median ms; peak KiB)")
+    for name, result in sorted(measured.items()):
+        timings = " ".join(f"{bucket}={value:.1f}" for bucket, value in result["timings_ms"].items())
+        peaks = " ".join(f"{phase}={value}" for phase, value in result["peak_kib"].items())
+        terminalreporter.write_line(f"{name}: {timings} | {peaks}")
+
+
+class Baseline:
+    """The stored results each benchmark is compared against, or records into."""
+
+    def __init__(self, path: Path, *, update: bool, timings: bool, tolerance: float):
+        self.path = path
+        self.update = update
+        self.timings = timings
+        self.tolerance = tolerance
+        self.results: dict[str, dict] = json.loads(path.read_text()) if path.exists() else {}
+        self.measured: dict[str, dict] = {}
+
+    def skip_if_missing(self, name: str) -> None:
+        """Skip before any replay runs, so a plain ``pytest`` without a baseline stays quick."""
+        if not self.update and name not in self.results:
+            pytest.skip(f"No baseline for {name!r}; record one with --update-baseline.")
+
+    def check(self, name: str, result: dict) -> None:
+        self.measured[name] = result
+        if self.update:
+            # A counts-only update keeps the timings and peaks last recorded on the reference machine.
+            self.results[name] = {**self.results.get(name, {}), **result}
+            return
+        baseline = self.results[name]
+
+        assert result["counts"] == baseline["counts"], "Round-trip counts changed; see the diff above."
+        if not (self.timings and self.tolerance):
+            return
+        if "timings_ms" not in baseline:
+            pytest.fail(f"No timings recorded for {name!r}; record them with --update-baseline --benchmark-timings.")
+        regressions = [
+            f"{bucket}: {value:.1f} ms (baseline {baseline['timings_ms'][bucket]:.1f} ms)"
+            for bucket, value in result["timings_ms"].items()
+            if bucket in baseline["timings_ms"]
+            and value > baseline["timings_ms"][bucket] * self.tolerance + TIMING_NOISE_FLOOR_MS
+        ]
+        regressions += [
+            f"{phase} peak: {value} KiB (baseline {baseline['peak_kib'][phase]} KiB)"
+            for phase, value in result["peak_kib"].items()
+            if phase in baseline["peak_kib"] and value > baseline["peak_kib"][phase] * self.tolerance
+        ]
+        assert not regressions, f"Regressed beyond {self.tolerance}x the baseline:\n" + "\n".join(regressions)
+
+    def save(self) -> None:
+        self.path.write_text(json.dumps(dict(sorted(self.results.items())), indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture(scope="session")
+def benchmark_baseline(request: pytest.FixtureRequest):
+    baseline = Baseline(
+        BASELINE_PATH,
+        update=request.config.getoption("--update-baseline", default=False),
+        timings=request.config.getoption("--benchmark-timings", default=False),
+        tolerance=request.config.getoption("--benchmark-tolerance", default=1.5),
+    )
+    request.config.stash[MEASURED_KEY] = baseline.measured
+    yield baseline
+    if baseline.update:
+        baseline.save()
+
+
+@pytest.fixture(scope="session")
+def benchmark_repeat(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--benchmark-repeat", default=5)
+
+
+@pytest.fixture(autouse=True)
+def sandbox_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The sandbox middleware refuses to build without a key; the stand-in client never checks it."""
+    monkeypatch.setenv("DAIV_SANDBOX_API_KEY", "bench-key")
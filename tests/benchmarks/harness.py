@@ -0,0 +1,655 @@
+"""In-process harness for the agent overhead benchmarks.
+
+Drives the real DAIV agent end to end — graph construction, the middleware stack, the file-system
+and bash tools, the turn-end patch capture, checkpoint writes and the chat relay — with every slow
+or external dependency swapped for an in-process stand-in:
+
+- :class:`ScriptedChatModel` replays a scenario's recorded trajectory instead of calling a provider;
+- :class:`LocalSandboxClient` serves the sandbox API from a local directory;
+- :class:`InMemoryRelayRedis` takes the relay's stream writes;
+- :class:`CountingSaver` keeps checkpoints in memory.
+
+Each stand-in counts its round-trips and the time spent in it, so what is left of a run's wall time
+is DAIV's own overhead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import fnmatch
+import io
+import json
+import re
+import subprocess  # noqa: S404
+import tarfile
+import time
+import tracemalloc
+import uuid
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, patch
+
+from ag_ui.core import RunAgentInput
+from ag_ui.core.events import EventType
+from asgiref.sync import ThreadSensitiveContext
+from git import Actor, Repo
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.chat_models import generate_from_stream
+from langchain_core.messages import AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.store.memory import InMemoryStore
+
+from automation.agent.base import BaseAgent
+from automation.agent.graph import create_daiv_agent
+from automation.agent.mcp.toolkits import MCPToolkit
+from chat.api.event_filter import SubagentEventFilter
+from chat.api.relay import RunRelay
+from chat.api.streaming import RuntimeContextLangGraphAGUIAgent
+from codebase.base import GitPlatform, Repository, Scope
+from codebase.context import RepoHandle, RuntimeCtx, SandboxRuntime
+from codebase.repo_config import RepositoryConfig
+from core.sandbox.client import DAIVSandboxClient, reset_run_sandbox_client, set_run_sandbox_client
+from core.sandbox.command_policy import SandboxCommandPolicy
+from core.sandbox.schemas import (
+    FsDeleteResponse,
+    FsEditResponse,
+    FsEntry,
+    FsError,
+    FsErrorCode,
+    FsGlobResponse,
+    FsGrepMatch,
+    FsGrepResponse,
+    FsLsResponse,
+    FsReadResponse,
+    FsWriteResponse,
+    RunCommandResult,
+    RunCommandsResponse,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from langchain_core.callbacks import CallbackManagerForLLMRun
+    from langchain_core.messages import BaseMessage
+    from langchain_core.outputs import ChatResult
+
+    from core.sandbox.schemas import (
+        EgressConfigRequest,
+        FsDeleteRequest,
+        FsEditRequest,
+        FsGlobRequest,
+        FsGrepRequest,
+        FsLsRequest,
+        FsReadRequest,
+        FsWriteRequest,
+        RunCommandsRequest,
+        StartSessionRequest,
+    )
+
+SCENARIOS_DIR = Path(__file__).parent / "data" / "scenarios"
+
+REPO_ID = "bench/fixture"
+WORKSPACE = PurePosixPath("/workspace")
+FIXTURE_AUTHOR = Actor("DAIV Bench", "bench@daiv.local")
+FIXTURE_DATE = "2026-01-01T00:00:00+0000"  # GitPython rejects the colon in "+00:00"
+
+# Directories the real sandbox prunes from grep and glob unless asked not to.
+SANDBOX_PRUNED_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv"})
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One recorded agent run, replayed against a fixture repository.
+
+    ``trajectory`` holds the model's side of the run, one entry per model call in call order
+    (subagent calls included): the text it streamed and the tool calls it made. ``expected_patch``
+    lists snippets the captured patch must contain, so a trajectory that stopped applying — an
+    ``edit_file`` whose ``old_string`` no longer matches, say — fails instead of timing a run of
+    tool errors.
+    """
+
+    name: str
+    prompt: str
+    files: dict[str, str]
+    trajectory: list[dict[str, Any]]
+    sandbox: bool = False
+    expected_patch: tuple[str, ...] = ()
+
+    @classmethod
+    def load(cls, path: Path) -> Scenario:
+        data = json.loads(path.read_text())
+        return cls(
+            name=path.stem,
+            prompt=data["prompt"],
+            files=data["files"],
+            trajectory=data["trajectory"],
+            sandbox=data.get("sandbox", False),
+            expected_patch=tuple(data.get("expected_patch", ())),
+        )
+
+
+def load_scenarios() -> list[Scenario]:
+    return [Scenario.load(path) for path in sorted(SCENARIOS_DIR.glob("*.json"))]
+
+
+@dataclass
+class Probe:
+    """Round-trip counts and the seconds spent per bucket, shared by every stand-in of one run."""
+
+    counts: Counter[str] = field(default_factory=Counter)
+    seconds: defaultdict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+    @contextmanager
+    def measure(self, bucket: str, name: str | None = None) -> Iterator[None]:
+        """Time the block into ``bucket`` and count one ``bucket:name`` (or ``bucket``) round-trip."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[bucket] += time.perf_counter() - start
+            self.counts[f"{bucket}:{name}" if name else bucket] += 1
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Replays a recorded trajectory, one entry per call, streaming its text a word at a time.
+
+    ``bind_tools`` returns the model itself so the main agent and every subagent share one
+    trajectory. Tool call ids are numbered by call, so checkpoints and relay events are identical
+    from run to run. Running out of entries raises: the agent took a path the recording did not.
+    """
+
+    trajectory: list[dict[str, Any]]
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs) -> ScriptedChatModel:
+        return self
+
+    @property
+    def exhausted(self) -> bool:
+        return self.calls == len(self.trajectory)
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        if self.exhausted:
+            raise RuntimeError(f"Scripted trajectory exhausted after {self.calls} model calls.")
+        turn = self.trajectory[self.calls]
+        self.calls += 1
+
+        for piece in re.findall(r"\S+\s*", turn.get("content", "")):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            if run_manager is not None:
+                run_manager.on_llm_new_token(piece, chunk=chunk)
+            yield chunk
+
+        tool_call_chunks = [
+            {"name": call["name"], "args": json.dumps(call["args"]), "id": f"call_{self.calls}_{index}", "index": index}
+            for index, call in enumerate(turn.get("tool_calls", []))
+        ]
+        input_tokens = sum(len(str(message.content)) for message in messages) // 4
+        output_tokens = len(json.dumps(turn)) // 4
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content="",
+                tool_call_chunks=tool_call_chunks,
+                usage_metadata={
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                    "total_tokens": input_tokens + output_tokens,
+                },
+                chunk_position="last",
+            )
+        )
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return generate_from_stream(self._stream(messages, stop, run_manager, **kwargs))
+
+
+class ProbeMiddleware(AgentMiddleware):
+    """Times the main agent's model calls and tool executions.
+
+    Registered last, so it wraps only the call itself: the work the other middleware does around
+    it stays in the run's unaccounted overhead. Subagent calls are not wrapped; their time is
+    part of the ``task`` tool call that ran them.
+    """
+
+    def __init__(self, probe: Probe):
+        super().__init__()
+        self.probe = probe
+
+    async def awrap_model_call(self, request, handler):
+        with self.probe.measure("model"):
+            return await handler(request)
+
+    async def awrap_tool_call(self, request, handler):
+        with self.probe.measure("tools", request.tool_call["name"]):
+            return await handler(request)
+
+
+class CountingSaver(InMemorySaver):
+    """In-memory checkpointer that counts its reads and writes."""
+
+    def __init__(self, probe: Probe):
+        super().__init__()
+        self.probe = probe
+
+    async def aget_tuple(self, config):
+        with self.probe.measure("checkpoint", "get"):
+            return await super().aget_tuple(config)
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        with self.probe.measure("checkpoint", "put"):
+            return await super().aput(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        with self.probe.measure("checkpoint", "put_writes"):
+            return await super().aput_writes(config, writes, task_id, task_path)
+
+
+class InMemoryRelayRedis:
+    """The slice of ``redis.asyncio`` the chat relay publishes through, kept in memory."""
+
+    def __init__(self, probe: Probe):
+        self.probe = probe
+        self.streams: dict[str, list[dict[str, str]]] = defaultdict(list)
+        self.kv: dict[str, str] = {}
+
+    def pipeline(self, transaction: bool = True) -> _RelayPipeline:
+        return _RelayPipeline(self)
+
+    async def get(self, key: str) -> str | None:
+        with self.probe.measure("relay", "get"):
+            return self.kv.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        with self.probe.measure("relay", "set"):
+            self.kv[key] = str(value)
+            return True
+
+
+class _RelayPipeline:
+    def __init__(self, redis: InMemoryRelayRedis):
+        self.redis = redis
+        self.entries: list[tuple[str, dict[str, str]]] = []
+
+    async def __aenter__(self) -> _RelayPipeline:
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+    def xadd(self, key: str, fields: dict[str, str], **kwargs) -> _RelayPipeline:
+        self.entries.append((key, fields))
+        return self
+
+    def expire(self, key: str, ttl: int) -> _RelayPipeline:
+        return self
+
+    async def execute(self) -> list:
+        with self.redis.probe.measure("relay", "pipeline"):
+            for key, fields in self.entries:
+                self.redis.streams[key].append(dict(fields))
+            return [True] * len(self.entries)
+
+
+class LocalSandboxClient(DAIVSandboxClient):
+    """The sandbox API served from a local directory standing in for ``/workspace``.
+
+    Every call is answered in-process, so the run pays DAIV's side of each sandbox round-trip and
+    none of the network or container cost. Commands run in a local shell with ``/workspace``
+    rewritten to the directory, which is enough for the git commands the patch capture issues and
+    for the shell commands the recorded trajectories use.
+    """
+
+    SESSION_ID = "bench-session"
+
+    def __init__(self, root: Path, probe: Probe):
+        self.root = root
+        self.probe = probe
+        self._client = None
+
+    async def open(self) -> LocalSandboxClient:
+        return self
+
+    async def close(self) -> None:
+        return None
+
+    def _local(self, path: str) -> Path | None:
+        virtual = PurePosixPath(path)
+        if virtual != WORKSPACE and WORKSPACE not in virtual.parents:
+            return None
+        return self.root.joinpath(*virtual.relative_to(WORKSPACE).parts)
+
+    def _virtual(self, local: Path) -> str:
+        return str(WORKSPACE.joinpath(*local.relative_to(self.root).parts))
+
+    @staticmethod
+    def _error(code: FsErrorCode, message: str) -> FsError:
+        return FsError(code=code, message=message)
+
+    def _walk(self, base: Path) -> Iterator[Path]:
+        for path in sorted(base.rglob("*")):
+            if not SANDBOX_PRUNED_DIRS.intersection(path.relative_to(base).parts):
+                yield path
+
+    async def start_session(self, request: StartSessionRequest) -> str:
+        with self.probe.measure("sandbox", "start_session"):
+            (self.root / "tmp").mkdir(parents=True, exist_ok=True)
+            return self.SESSION_ID
+
+    async def seed_session(
+        self, session_id: str, repo_archive: bytes | None = None, skills_archive: bytes | None = None
+    ) -> None:
+        with self.probe.measure("sandbox", "seed_session"):
+            for name, archive in (("repo", repo_archive), ("skills", skills_archive)):
+                if archive is not None:
+                    with tarfile.open(fileobj=io.BytesIO(archive), mode="r:gz") as tf:
+                        tf.extractall(self.root / name, filter="data")
+
+    async def fs_ls(self, session_id: str, request: FsLsRequest) -> FsLsResponse:
+        with self.probe.measure("sandbox", "fs_ls"):
+            local = self._local(request.path)
+            if local is None or not local.exists():
+                return FsLsResponse(error=self._error(FsErrorCode.NOT_FOUND, f"{request.path} does not exist."))
+            if not local.is_dir():
+                return FsLsResponse(error=self._error(FsErrorCode.NOT_A_DIRECTORY, f"{request.path} is a file."))
+            return FsLsResponse(
+                entries=[FsEntry(path=self._virtual(child), is_dir=child.is_dir()) for child in sorted(local.iterdir())]
+            )
+
+    async def fs_read(self, session_id: str, request: FsReadRequest) -> FsReadResponse:
+        with self.probe.measure("sandbox", "fs_read"):
+            local = self._local(request.path)
+            if local is None or not local.exists():
+                return FsReadResponse(error=self._error(FsErrorCode.NOT_FOUND, f"{request.path} does not exist."))
+            if local.is_dir():
+                return FsReadResponse(error=self._error(FsErrorCode.IS_A_DIRECTORY, f"{request.path} is a directory."))
+            data = local.read_bytes()
+            try:
+                text = data.decode("utf-8")
+            except UnicodeDecodeError:
+                return FsReadResponse(content=base64.b64encode(data).decode(), encoding="base64")
+            lines = text.splitlines(keepends=True)
+            if not lines:
+                return FsReadResponse(content="System reminder: File exists but has empty contents", encoding="utf-8")
+            if request.offset >= len(lines):
+                return FsReadResponse(
+                    error=self._error(FsErrorCode.INVALID_OFFSET, f"The file has only {len(lines)} lines.")
+                )
+            window = lines[request.offset : request.offset + request.limit]
+            return FsReadResponse(
+                content="".join(window), encoding="utf-8", total_lines=len(lines), end_line=request.offset + len(window)
+            )
+
+    async def fs_grep(self, session_id: str, request: FsGrepRequest) -> FsGrepResponse:
+        with self.probe.measure("sandbox", "fs_grep"):
+            local = self._local(request.path)
+            if local is None or not local.exists():
+                return FsGrepResponse(error=self._error(FsErrorCode.NOT_FOUND, f"{request.path} does not exist."))
+            try:
+                pattern = re.compile(request.pattern)
+            except re.error as exc:
+                return FsGrepResponse(error=self._error(FsErrorCode.INVALID_PATTERN, str(exc)))
+            matches = []
+            for path in [local] if local.is_file() else self._walk(local):
+                if not path.is_file() or (request.glob and not fnmatch.fnmatch(path.name, request.glob)):
+                    continue
+                try:
+                    lines = path.read_text().splitlines()
+                except UnicodeDecodeError:
+                    continue
+                matches += [
+                    FsGrepMatch(path=self._virtual(path), line=number, text=line)
+                    for number, line in enumerate(lines, start=1)
+                    if pattern.search(line)
+                ]
+            return FsGrepResponse(matches=matches)
+
+    async def fs_glob(self, session_id: str, request: FsGlobRequest) -> FsGlobResponse:
+        with self.probe.measure("sandbox", "fs_glob"):
+            local = self._local(request.path)
+            if local is None or not local.is_dir():
+                return FsGlobResponse(error=self._error(FsErrorCode.NOT_FOUND, f"{request.path} does not exist."))
+            return FsGlobResponse(
+                matches=[
+                    FsEntry(path=self._virtual(path), is_dir=path.is_dir())
+                    for path in sorted(local.glob(request.pattern))
+                    if not SANDBOX_PRUNED_DIRS.intersection(path.relative_to(local).parts)
+                ]
+            )
+
+    async def fs_write(self, session_id: str, request: FsWriteRequest) -> FsWriteResponse:
+        with self.probe.measure("sandbox", "fs_write"):
+            local = self._local(request.path)
+            if local is None:
+                return FsWriteResponse(
+                    error=self._error(FsErrorCode.INVALID_PATH, f"{request.path} is outside /workspace.")
+                )
+            local.parent.mkdir(parents=True, exist_ok=True)
+            local.write_bytes(request.content)
+            local.chmod(request.mode)
+            return FsWriteResponse()
+
+    async def fs_edit(self, session_id: str, request: FsEditRequest) -> FsEditResponse:
+        with self.probe.measure("sandbox", "fs_edit"):
+            local = self._local(request.path)
+            if local is None or not local.is_file():
+                return FsEditResponse(error=self._error(FsErrorCode.NOT_FOUND, f"{request.path} does not exist."))
+            text = local.read_text()
+            occurrences = text.count(request.old)
+            if occurrences == 0:
+                return FsEditResponse(error=self._error(FsErrorCode.STRING_NOT_FOUND, "The old string was not found."))
+            if occurrences > 1 and not request.replace_all:
+                return FsEditResponse(
+                    error=self._error(FsErrorCode.MULTIPLE_OCCURRENCES, f"The old string occurs {occurrences} times.")
+                )
+            local.write_text(text.replace(request.old, request.new, -1 if request.replace_all else 1))
+            return FsEditResponse(occurrences=occurrences if request.replace_all else 1)
+
+    async def fs_delete(self, session_id: str, request: FsDeleteRequest) -> FsDeleteResponse:
+        with self.probe.measure("sandbox", "fs_delete"):
+            local = self._local(request.path)
+            if local is None:
+                return FsDeleteResponse(
+                    error=self._error(FsErrorCode.INVALID_PATH, f"{request.path} is outside /workspace.")
+                )
+            removed = local.is_file()
+            local.unlink(missing_ok=True)
+            return FsDeleteResponse(removed=removed)
+
+    async def run_commands(self, session_id: str, request: RunCommandsRequest) -> RunCommandsResponse:
+        with self.probe.measure("sandbox", "run_commands"):
+            return await asyncio.to_thread(self._run_commands, request)
+
+    def _run_commands(self, request: RunCommandsRequest) -> RunCommandsResponse:
+        results = []
+        for command in request.commands:
+            proc = subprocess.run(  # noqa: S603
+                ["bash", "-c", command.replace(str(WORKSPACE), str(self.root))],  # noqa: S607
+                cwd=self.root / "repo",
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            results.append(
+                RunCommandResult(command=command, output=proc.stdout + proc.stderr, exit_code=proc.returncode)
+            )
+            if proc.returncode != 0 and request.fail_fast:
+                break
+        return RunCommandsResponse(results=results)
+
+    async def session_exists(self, session_id: str) -> bool:
+        with self.probe.measure("sandbox", "session_exists"):
+            return session_id == self.SESSION_ID
+
+    async def close_session(self, session_id: str, *, force: bool = False):
+        with self.probe.measure("sandbox", "close_session"):
+            return None
+
+    async def update_egress(self, session_id: str, egress: EgressConfigRequest) -> None:
+        with self.probe.measure("sandbox", "update_egress"):
+            return None
+
+
+@dataclass
+class RunMetrics:
+    """What one replay of a scenario measured."""
+
+    counts: dict[str, int]
+    seconds: dict[str, float]
+    peak_bytes: dict[str, int] = field(default_factory=dict)
+    patch: str = ""
+
+
+def _init_repository(path: Path, files: dict[str, str]) -> Repo:
+    """The scenario's fixture repository, committed with a fixed author and date."""
+    repo = Repo.init(path, initial_branch="main")
+    for name, content in files.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_text(content)
+    repo.index.add(list(files))
+    repo.index.commit(
+        "Initial commit",
+        author=FIXTURE_AUTHOR,
+        committer=FIXTURE_AUTHOR,
+        author_date=FIXTURE_DATE,
+        commit_date=FIXTURE_DATE,
+    )
+    return repo
+
+
+def _runtime_ctx(repo: Repo, *, sandbox: bool) -> RuntimeCtx:
+    repository = Repository(
+        pk=1,
+        slug=REPO_ID,
+        name="fixture",
+        clone_url=Path(repo.working_dir).as_uri(),
+        html_url=f"https://example.com/{REPO_ID}",
+        default_branch="main",
+        git_platform=GitPlatform.SWE,
+    )
+    handle = RepoHandle(
+        repo_id=REPO_ID,
+        git_platform=GitPlatform.SWE,
+        repository=repository,
+        gitrepo=repo,
+        config=RepositoryConfig(),
+        ref="main",
+    )
+    return RuntimeCtx(
+        bot_username="daiv",
+        repos=(handle,),
+        sandbox=SandboxRuntime(
+            base_image="bench:latest" if sandbox else None,
+            memory_bytes=None,
+            cpus=None,
+            env_vars={},
+            command_policy=SandboxCommandPolicy(),
+        ),
+        scope=Scope.GLOBAL,
+    )
+
+
+async def run_scenario(scenario: Scenario, workdir: Path, *, trace_allocations: bool = False) -> RunMetrics:
+    """Replay ``scenario`` once in ``workdir`` and return what it measured.
+
+    The run goes the way a chat turn does: the agent is built, run through the AG-UI adapter and
+    the subagent event filter, and every event it emits is published to the relay. Seconds are
+    recorded per bucket — ``build`` and ``run`` for the two phases, plus the time inside the model,
+    the tools, the checkpointer, the relay and the sandbox — and, with ``trace_allocations``, the
+    peak Python heap of each phase (tracing slows the run, so timed runs leave it off).
+    """
+    probe = Probe()
+    peak_bytes: dict[str, int] = {}
+    model = ScriptedChatModel(trajectory=scenario.trajectory)
+    saver = CountingSaver(probe)
+    repo = _init_repository(workdir / "repo", scenario.files)
+    ctx = _runtime_ctx(repo, sandbox=scenario.sandbox)
+
+    sandbox_token = None
+    if scenario.sandbox:
+        sandbox_token = set_run_sandbox_client(LocalSandboxClient(workdir / "sandbox", probe))
+    if trace_allocations:
+        tracemalloc.start()
+    try:
+        with (
+            patch.object(BaseAgent, "get_model", return_value=model),
+            patch.object(MCPToolkit, "get_tools", AsyncMock(return_value=[])),
+        ):
+            if trace_allocations:
+                tracemalloc.reset_peak()
+            with probe.measure("build"):
+                agent = await create_daiv_agent(
+                    model_names=["scripted"],
+                    thinking_level=None,
+                    ctx=ctx,
+                    checkpointer=saver,
+                    store=InMemoryStore(),
+                    auto_commit_changes=False,
+                    capture_patch=True,
+                    middleware=[ProbeMiddleware(probe)],
+                    web_search_enabled=False,
+                    web_fetch_enabled=False,
+                )
+            if trace_allocations:
+                peak_bytes["build"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.reset_peak()
+
+            thread_id, run_id = str(uuid.uuid4()), str(uuid.uuid4())
+            relay = RunRelay(thread_id, run_id, client=InMemoryRelayRedis(probe))
+            agui = RuntimeContextLangGraphAGUIAgent(
+                name="DAIV", description="DAIV agent", graph=agent, config={"recursion_limit": 500}, runtime_context=ctx
+            )
+            run_input = RunAgentInput(
+                thread_id=thread_id,
+                run_id=run_id,
+                state={},
+                messages=[{"id": "m1", "role": "user", "content": scenario.prompt}],
+                tools=[],
+                context=[],
+                forwarded_props={},
+            )
+            with probe.measure("run"):
+                async with ThreadSensitiveContext():
+                    async for event in SubagentEventFilter().apply(agui.run(run_input)):
+                        if event.type == EventType.RUN_ERROR:
+                            raise RuntimeError(f"Scenario {scenario.name} failed: {event.message}")
+                        await relay.publish_event(event.model_dump_json(by_alias=True, exclude_none=True))
+                        probe.counts["relay:events"] += 1
+                    await relay.publish_end()
+            if trace_allocations:
+                peak_bytes["run"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        if trace_allocations:
+            tracemalloc.stop()
+        if sandbox_token is not None:
+            reset_run_sandbox_client(sandbox_token)
+
+    if not model.exhausted:
+        raise RuntimeError(
+            f"Scenario {scenario.name} finished after {model.calls} of {len(scenario.trajectory)} model calls."
+        )
+    metrics = RunMetrics(counts=dict(probe.counts), seconds=dict(probe.seconds), peak_bytes=peak_bytes)
+    state = await agent.aget_state({"configurable": {"thread_id": thread_id}})
+    metrics.patch = state.values.get("model_patch", "")
+    return metrics
@@ -0,0 +1,59 @@
+from statistics import median
+
+import pytest
+
+from .harness import load_scenarios, run_scenario
+
+# The agent reads site settings while it is built.
+pytestmark = pytest.mark.django_db
+
+# Buckets that run inside the ``run`` phase and are not part of DAIV's own overhead. Sandbox time is
+# reported too but not subtracted: it is spent inside tool calls and agent hooks already counted here.
+EXTERNAL_BUCKETS = ("model", "tools", "checkpoint", "relay")
+
+
+def _summarize(timed: list, traced) -> dict:
+    for metrics in timed[1:]:
+        assert metrics.counts == timed[0].counts, "Replays of one scenario made different round-trips."
+    counts = dict(sorted(timed[0].counts.items()))
+    if traced is None:
+        return {"counts": counts}
+
+    timings_ms = {
+        bucket: round(median(metrics.seconds.get(bucket, 0.0) for metrics in timed) * 1000, 1)
+        for bucket in ("build", "run", *EXTERNAL_BUCKETS, "sandbox")
+    }
+    timings_ms["overhead"] = round(
+        median(
+            metrics.seconds["run"] - sum(metrics.seconds.get(bucket, 0.0) for bucket in EXTERNAL_BUCKETS)
+            for metrics in timed
+        )
+        * 1000,
+        1,
+    )
+    return {
+        "counts": counts,
+        "timings_ms": timings_ms,
+        "peak_kib": {phase: peak // 1024 for phase, peak in traced.peak_bytes.items()},
+    }
+
+
+@pytest.mark.parametrize("scenario", load_scenarios(), ids=lambda scenario: scenario.name)
+async def test_agent_overhead(scenario, tmp_path, benchmark_baseline, benchmark_repeat):
+    benchmark_baseline.skip_if_missing(scenario.name)
+
+    # The first replay pays for imports and cold caches, which no later run of the process does.
+    warmup = await run_scenario(scenario, tmp_path / "warmup")
+    for snippet in scenario.expected_patch:
+        assert snippet in warmup.patch, f"The replay no longer produces {snippet!r}; re-record the trajectory."
+
+    if not benchmark_baseline.timings:
+        # Counts only: the warmup and one more replay, which must agree with it.
+        replay = await run_scenario(scenario, tmp_path / "replay")
+        benchmark_baseline.check(scenario.name, _summarize([warmup, replay], None))
+        return
+
+    timed = [await run_scenario(scenario, tmp_path / f"run-{index}") for index in range(benchmark_repeat)]
+    traced = await run_scenario(scenario, tmp_path / "traced", trace_allocations=True)
+
+    benchmark_baseline.check(scenario.name, _summarize(timed, traced))
@@ -0,0 +1,40 @@
+import uuid
+from datetime import date
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils import timezone
+
+import pytest
+from sessions.models import Run, RunDailyStats, RunStatus, Session, SessionOrigin
+
+from codebase.models import MergeDailyStats
+
+
+@pytest.mark.django_db
+class TestBackfillDashboardRollups:
+    def test_rebuilds_missing_and_stale_rows(self):
+        session = Session.objects.create(thread_id=str(uuid.uuid4()), origin=SessionOrigin.API_JOB, repo_id="a/b")
+        # Created without the on-commit refresh firing, as in a test transaction.
+        run = Run.objects.create(
+            session=session, status=RunStatus.SUCCESSFUL, trigger_type=SessionOrigin.API_JOB, repo_id="a/b"
+        )
+        RunDailyStats.objects.create(day=date(2020, 1, 1), repo_id="a/b", trigger_type=SessionOrigin.API_JOB, total=3)
+        MergeDailyStats.objects.create(day=date(2020, 1, 1), merges=2)
+
+        call_command("backfill_dashboard_rollups")
+
+        stats = RunDailyStats.objects.get()
+        assert (stats.day, stats.total) == (timezone.localdate(run.created_at), 1)
+        assert not MergeDailyStats.objects.exists()
+
+    def test_days_limits_the_recompute(self):
+        RunDailyStats.objects.create(day=date(2020, 1, 1), repo_id="a/b", trigger_type=SessionOrigin.API_JOB, total=3)
+
+        call_command("backfill_dashboard_rollups", days=7)
+
+        assert RunDailyStats.objects.exists()
+
+    def test_rejects_non_positive_days(self):
+        with pytest.raises(CommandError):
+            call_command("backfill_dashboard_rollups", days=0)
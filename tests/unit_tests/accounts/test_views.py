@@ -346,10 +346,12 @@ class TestDashboardChatSegment:
             session=session, status=status, trigger_type=trigger_type, repo_id="daiv/test", user=user
         )
 
-    def test_chat_segment_appears_with_correct_count_and_url(self, user):
-        self._make_run(user, SessionOrigin.CHAT)
-        self._make_run(user, SessionOrigin.CHAT)
-        self._make_run(user, SessionOrigin.API_JOB)
+    def test_chat_segment_appears_with_correct_count_and_url(self, user, django_capture_on_commit_callbacks):
+        # Finished runs reach the dashboard through the rollup refreshed on commit.
+        with django_capture_on_commit_callbacks(execute=True):
+            self._make_run(user, SessionOrigin.CHAT)
+            self._make_run(user, SessionOrigin.CHAT)
+            self._make_run(user, SessionOrigin.API_JOB)
 
         client = Client()
         client.force_login(user)
@@ -365,12 +367,13 @@ class TestDashboardChatSegment:
         sessions_url = reverse("session_list")
         assert chat_seg["url"] == f"{sessions_url}?trigger={SessionOrigin.CHAT}"
 
-    def test_chat_runs_not_double_counted_in_other(self, user):
+    def test_chat_runs_not_double_counted_in_other(self, user, django_capture_on_commit_callbacks):
         # 1 UI_JOB run → goes to Other (not a named trigger segment)
         # 2 CHAT runs → go to Chat segment, NOT Other
-        self._make_run(user, SessionOrigin.UI_JOB)
-        self._make_run(user, SessionOrigin.CHAT)
-        self._make_run(user, SessionOrigin.CHAT)
+        with django_capture_on_commit_callbacks(execute=True):
+            self._make_run(user, SessionOrigin.UI_JOB)
+            self._make_run(user, SessionOrigin.CHAT)
+            self._make_run(user, SessionOrigin.CHAT)
 
         client = Client()
         client.force_login(user)
@@ -1,7 +1,10 @@
+from unittest.mock import patch
+
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
-from automation.agent.deferred.index import DeferredToolsIndex
+from automation.agent.deferred import index as index_module
+from automation.agent.deferred.index import DeferredToolsIndex, clear_index_cache, tool_set_fingerprint
 
 
 class _GitHubArgs(BaseModel):
@@ -137,3 +140,44 @@ class TestDeferredToolsIndex:
         entry = index.get("plain_tool")
         assert entry is not None
         assert "plain" in entry.indexed_text and "tool" in entry.indexed_text
+
+
+class TestIndexCache:
+    def setup_method(self):
+        clear_index_cache()
+
+    def test_an_unchanged_tool_set_reuses_the_build_with_this_runs_tools(self):
+        first_run = [_make_tool("github_create_issue", "Create a GitHub issue")]
+        second_run = [_make_tool("github_create_issue", "Create a GitHub issue")]
+        DeferredToolsIndex(first_run)
+
+        with patch.object(index_module, "BM25Plus") as bm25:
+            index = DeferredToolsIndex(second_run)
+
+        bm25.assert_not_called()
+        assert index.get("github_create_issue").tool is second_run[0]
+        assert [entry.name for entry in index.search("github issue")] == ["github_create_issue"]
+
+    def test_a_changed_description_is_a_different_tool_set(self):
+        before = [_make_tool("gitlab", "Inspect GitLab merge requests")]
+        after = [_make_tool("gitlab", "Inspect GitLab pipelines")]
+
+        assert tool_set_fingerprint(before) != tool_set_fingerprint(after)
+        DeferredToolsIndex(before)
+        assert [entry.name for entry in DeferredToolsIndex(after).search("pipelines")] == ["gitlab"]
+
+    def test_clear_forces_a_rebuild(self):
+        tools = [_make_tool("github_create_issue", "Create a GitHub issue")]
+        DeferredToolsIndex(tools)
+        clear_index_cache()
+
+        with patch.object(index_module, "BM25Plus", wraps=index_module.BM25Plus) as bm25:
+            DeferredToolsIndex(tools)
+
+        bm25.assert_called_once()
+
+    def test_cache_is_bounded(self):
+        for i in range(index_module._CORPUS_CACHE_SIZE + 5):
+            DeferredToolsIndex([_make_tool(f"tool_{i}", f"Tool number {i}")])
+
+        assert len(index_module._corpus_cache) == index_module._CORPUS_CACHE_SIZE
@@ -416,7 +416,7 @@ class TestGitMiddleware:
         runtime = _make_runtime()
         existing_mr = MagicMock(source_branch="feature-x")
         client = MagicMock()
-        client.get_merge_request_by_branches = MagicMock(return_value=existing_mr)
+        client.aget_merge_request_by_branches = AsyncMock(return_value=existing_mr)
 
         with (
             patch("automation.agent.middlewares.git.get_repo_ref", return_value="feature-x"),
@@ -425,14 +425,14 @@ class TestGitMiddleware:
             mr = await GitMiddleware._alookup_open_mr(runtime.context)  # noqa: SLF001
 
         assert mr is existing_mr
-        client.get_merge_request_by_branches.assert_called_once_with("a/b", "feature-x")
+        client.aget_merge_request_by_branches.assert_awaited_once_with("a/b", "feature-x")
 
     async def test_alookup_open_mr_returns_nondefault_target_mr(self):
         """The lookup no longer filters on target, so an MR targeting a release branch is found."""
         runtime = _make_runtime()
         existing_mr = MagicMock(source_branch="feature-x", target_branch="release/x")
         client = MagicMock()
-        client.get_merge_request_by_branches = MagicMock(return_value=existing_mr)
+        client.aget_merge_request_by_branches = AsyncMock(return_value=existing_mr)
 
         with (
             patch("automation.agent.middlewares.git.get_repo_ref", return_value="feature-x"),
@@ -441,7 +441,7 @@ class TestGitMiddleware:
             mr = await GitMiddleware._alookup_open_mr(runtime.context)  # noqa: SLF001
 
         assert mr.target_branch == "release/x"
-        client.get_merge_request_by_branches.assert_called_once_with("a/b", "feature-x")
+        client.aget_merge_request_by_branches.assert_awaited_once_with("a/b", "feature-x")
 
     async def test_alookup_open_mr_skips_detached_head(self):
         """Commit-pinned runs (SWE-bench evals check out a raw SHA) have no branch, so
@@ -466,7 +466,7 @@ class TestGitMiddleware:
         or, worse, match a same-named repo's MR."""
         runtime = _make_runtime()
         client = MagicMock()
-        client.get_merge_request_by_branches = MagicMock(return_value=None)
+        client.aget_merge_request_by_branches = AsyncMock(return_value=None)
 
         with (
             patch("automation.agent.middlewares.git.get_repo_ref", return_value="feature-x"),
@@ -493,7 +493,7 @@ class TestGitMiddleware:
 
         runtime = _make_runtime()
         client = MagicMock()
-        client.get_merge_request_by_branches = MagicMock(side_effect=GitlabError("gitlab down"))
+        client.aget_merge_request_by_branches = AsyncMock(side_effect=GitlabError("gitlab down"))
 
         with (
             patch("automation.agent.middlewares.git.get_repo_ref", return_value="feature-x"),
@@ -511,7 +511,7 @@ class TestGitMiddleware:
 
         runtime = _make_runtime()
         client = MagicMock()
-        client.get_merge_request_by_branches = MagicMock(side_effect=requests.ConnectionError("dns failure"))
+        client.aget_merge_request_by_branches = AsyncMock(side_effect=requests.ConnectionError("dns failure"))
 
         with (
             patch("automation.agent.middlewares.git.get_repo_ref", return_value="feature-x"),
@@ -527,7 +527,7 @@ class TestGitMiddleware:
         """
         runtime = _make_runtime()
         client = MagicMock()
-        client.get_merge_request_by_branches = MagicMock(side_effect=KeyError("missing field"))
+        client.aget_merge_request_by_branches = AsyncMock(side_effect=KeyError("missing field"))
 
         with (
             patch("automation.agent.middlewares.git.get_repo_ref", return_value="feature-x"),
@@ -9,6 +9,7 @@ from langgraph.types import Command
 
 from automation.agent.middlewares.file_system import DAIVCompositeBackend, SandboxFileBackend
 from automation.agent.middlewares.git_platform import (
+    DEFAULT_CLI_TIMEOUT,
     GITHUB_TOOL_DESCRIPTION,
     GITLAB_TOOL_DESCRIPTION,
     GitPlatformMiddleware,
@@ -30,7 +31,14 @@ def _mock_backend(*, error: str | None = None):
     return backend
 
 
-async def _run_gl(subcommand, runtime, *, output_mode="simplified", to_file=False, backend=None):
+def _mock_gitlab_session(output: str = ""):
+    """GitLab CLI session stub whose ``run`` records the argv and returns ``output``."""
+    session = Mock()
+    session.run.return_value = output
+    return session
+
+
+async def _run_gl(subcommand, runtime, *, output_mode="simplified", to_file=False, backend=None, session=None):
     """Invoke the gitlab tool implementation with a default mock backend + results prefix."""
     return await _run_gitlab_subcommand(
         subcommand,
@@ -39,6 +47,7 @@ async def _run_gl(subcommand, runtime, *, output_mode="simplified", to_file=Fals
         to_file,
         backend=backend if backend is not None else _mock_backend(),
         large_tool_results_prefix=LARGE_TOOL_RESULTS_PREFIX,
+        session=session if session is not None else _mock_gitlab_session(),
     )
 
 
@@ -248,28 +257,25 @@ class TestGitLabToolInlineDiscussionFallback:
         assert json.loads(result)["id"] == "disc-eq"
 
     async def test_falls_through_to_cli_when_no_position_flag(self):
-        """Without --position the CLI subprocess must still be invoked."""
+        """Without --position the CLI must still be invoked."""
         runtime = _make_gitlab_runtime()
+        session = _mock_gitlab_session("cli-output\n")
 
-        mock_settings = Mock()
-        mock_settings.GITLAB_AUTH_TOKEN.get_secret_value.return_value = "test-token"  # noqa: S106
-        mock_settings.GITLAB_URL.encoded_string.return_value = "https://gitlab.com"
-
-        with (
-            patch("automation.agent.middlewares.git_platform.RepoClient") as mock_rc,
-            patch("automation.agent.middlewares.git_platform.asyncio.create_subprocess_exec") as create_proc,
-            patch("automation.agent.middlewares.git_platform.settings", mock_settings),
-        ):
-            proc = Mock()
-            proc.communicate = AsyncMock(return_value=(b"cli-output\n", b""))
-            proc.returncode = 0
-            create_proc.return_value = proc
-
-            result = await _run_gl('project-merge-request-discussion create --mr-iid 10 --body "hi"', runtime)
+        with patch("automation.agent.middlewares.git_platform.RepoClient") as mock_rc:
+            result = await _run_gl(
+                'project-merge-request-discussion create --mr-iid 10 --body "hi"', runtime, session=session
+            )
 
         assert result == "cli-output"
         mock_rc.create_instance.return_value.create_merge_request_inline_discussion.assert_not_called()
-        create_proc.assert_called_once()
+        session.run.assert_called_once_with(
+            [
+                *("project-merge-request-discussion", "create", "--mr-iid", "10", "--body", "hi"),
+                *("--project-id", "group/repo"),
+            ],
+            cacheable=False,
+            timeout=DEFAULT_CLI_TIMEOUT,
+        )
 
     async def test_error_when_mr_iid_missing(self):
         runtime = _make_gitlab_runtime()
@@ -458,26 +464,18 @@ async def test_gitlab_output_to_file_forces_json_writes_and_confirms():
     runtime = _make_gitlab_runtime()
     backend = _mock_backend()
 
-    mock_settings = Mock()
-    mock_settings.GITLAB_AUTH_TOKEN.get_secret_value.return_value = "test-token"  # noqa: S106
-    mock_settings.GITLAB_URL.encoded_string.return_value = "https://gitlab.com"
-
-    payload = b'[{"iid": 1}, {"iid": 2}]\n'
+    session = _mock_gitlab_session('[{"iid": 1}, {"iid": 2}]\n')
 
-    with (
-        patch("automation.agent.middlewares.git_platform.asyncio.create_subprocess_exec") as create_proc,
-        patch("automation.agent.middlewares.git_platform.settings", mock_settings),
-    ):
-        proc = Mock()
-        proc.communicate = AsyncMock(return_value=(payload, b""))
-        proc.returncode = 0
-        create_proc.return_value = proc
-
-        result = await _run_gl(
-            "project-merge-request list --state opened", runtime, output_mode="detailed", to_file=True, backend=backend
-        )
+    result = await _run_gl(
+        "project-merge-request list --state opened",
+        runtime,
+        output_mode="detailed",
+        to_file=True,
+        backend=backend,
+        session=session,
+    )
 
-    argv = list(create_proc.call_args.args)
+    argv = session.run.call_args.args[0]
     assert "--output" in argv and argv[argv.index("--output") + 1] == "json"
     assert "--verbose" not in argv  # output_mode ignored when writing to file
 
@@ -492,44 +490,21 @@ async def test_gitlab_output_to_file_forces_json_writes_and_confirms():
 async def test_gitlab_output_to_file_does_not_force_json_for_job_trace():
     runtime = _make_gitlab_runtime()
     backend = _mock_backend()
-    mock_settings = Mock()
-    mock_settings.GITLAB_AUTH_TOKEN.get_secret_value.return_value = "test-token"  # noqa: S106
-    mock_settings.GITLAB_URL.encoded_string.return_value = "https://gitlab.com"
-    with (
-        patch("automation.agent.middlewares.git_platform.asyncio.create_subprocess_exec") as create_proc,
-        patch("automation.agent.middlewares.git_platform.settings", mock_settings),
-    ):
-        proc = Mock()
-        proc.communicate = AsyncMock(return_value=(b"log line 1\nlog line 2\n", b""))
-        proc.returncode = 0
-        create_proc.return_value = proc
-        result = await _run_gl("project-job trace --id 55", runtime, to_file=True, backend=backend)
-    argv = list(create_proc.call_args.args)
+    session = _mock_gitlab_session("log line 1\nlog line 2\n")
+    result = await _run_gl("project-job trace --id 55", runtime, to_file=True, backend=backend, session=session)
+    argv = session.run.call_args.args[0]
     assert "--output" not in argv  # traces are raw log text; JSON would be degenerate
     assert backend.awrite.call_args.args[0] == "/workspace/large_tool_results/test_call_gitlab"
     assert result.startswith("Wrote ")
 
 
 async def test_gitlab_empty_output_to_file_notes_no_file_written():
-    """When the gitlab CLI returns empty stdout and output_to_file is true, the result must
+    """When the gitlab CLI prints nothing and output_to_file is true, the result must
     contain both the 'empty result' sentinel and a note that no file was written."""
     runtime = _make_gitlab_runtime()
     backend = _mock_backend()
 
-    mock_settings = Mock()
-    mock_settings.GITLAB_AUTH_TOKEN.get_secret_value.return_value = "test-token"  # noqa: S106
-    mock_settings.GITLAB_URL.encoded_string.return_value = "https://gitlab.com"
-
-    with (
-        patch("automation.agent.middlewares.git_platform.asyncio.create_subprocess_exec") as create_proc,
-        patch("automation.agent.middlewares.git_platform.settings", mock_settings),
-    ):
-        proc = Mock()
-        proc.communicate = AsyncMock(return_value=(b"", b""))
-        proc.returncode = 0
-        create_proc.return_value = proc
-
-        result = await _run_gl("project-issue list --state opened", runtime, to_file=True, backend=backend)
+    result = await _run_gl("project-issue list --state opened", runtime, to_file=True, backend=backend)
 
     assert "empty result" in result
     assert "no file was written" in result
@@ -698,27 +673,17 @@ class TestGitPlatformMiddlewareWiring:
         proving the closure captured and forwarded both ``backend`` and ``large_tool_results_prefix``."""
         backend = DAIVCompositeBackend(default=SandboxFileBackend(), routes={}, artifacts_root="/workspace")
         backend.awrite = AsyncMock(return_value=Mock(error=None))
-        mw = GitPlatformMiddleware(git_platform=GitPlatform.GITLAB, backend=backend)
+        with patch("automation.agent.middlewares.git_platform.GitLabCLISession") as session_cls:
+            session_cls.return_value.run.return_value = '[{"iid": 1}]\n'
+            mw = GitPlatformMiddleware(git_platform=GitPlatform.GITLAB, backend=backend)
 
         runtime = _make_gitlab_runtime()  # tool_call_id="test_call_gitlab"
-        mock_settings = Mock()
-        mock_settings.GITLAB_AUTH_TOKEN.get_secret_value.return_value = "test-token"  # noqa: S106
-        mock_settings.GITLAB_URL.encoded_string.return_value = "https://gitlab.com"
-
-        with (
-            patch("automation.agent.middlewares.git_platform.asyncio.create_subprocess_exec") as create_proc,
-            patch("automation.agent.middlewares.git_platform.settings", mock_settings),
-        ):
-            proc = Mock()
-            proc.communicate = AsyncMock(return_value=(b'[{"iid": 1}]\n', b""))
-            proc.returncode = 0
-            create_proc.return_value = proc
-
-            result = await mw.tools[0].coroutine(
-                subcommand="project-merge-request list --state opened", runtime=runtime, output_to_file=True
-            )
+        result = await mw.tools[0].coroutine(
+            subcommand="project-merge-request list --state opened", runtime=runtime, output_to_file=True
+        )
 
         path, content = backend.awrite.call_args.args
         assert path == "/workspace/large_tool_results/test_call_gitlab"
         assert content == '[{"iid": 1}]'
         assert result.startswith("Wrote ")
+        session_cls.return_value.run.assert_called_once()
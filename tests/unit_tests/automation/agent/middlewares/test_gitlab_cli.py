@@ -0,0 +1,159 @@
+import json
+import time
+from unittest.mock import patch
+
+import gitlab
+import pytest
+import requests
+
+from automation.agent.middlewares.gitlab_cli import GitLabCLIError, GitLabCLISession
+
+ISSUE = {"id": 1, "iid": 7, "title": "Flaky test", "project_id": 3}
+
+
+class FakeAPI:
+    """Answers ``requests.Session.request`` the way the GitLab API would, recording each call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        if url.endswith("/issues/404"):
+            response.status_code = 404
+            response._content = json.dumps({"message": "404 Issue Not Found"}).encode()
+        elif url.endswith("/trace"):
+            response.headers["Content-Type"] = "text/plain"
+            response._content = b"line 1\nline 2"
+        elif "/issues/" in url:
+            response._content = json.dumps(ISSUE).encode()
+        else:
+            response._content = json.dumps([ISSUE]).encode()
+        return response
+
+
+@pytest.fixture
+def api():
+    fake = FakeAPI()
+    with patch.object(requests.Session, "request", lambda _session, *args, **kwargs: fake.request(*args, **kwargs)):
+        yield fake
+
+
+@pytest.fixture
+def session():
+    return GitLabCLISession(lambda: gitlab.Gitlab("https://gitlab.example.com", private_token="token"))  # noqa: S106
+
+
+def test_renders_like_the_cli(api, session):
+    listed = session.run(["project-issue", "list", "--project-id", "group/repo"], cacheable=True)
+    detailed = session.run(
+        ["--output", "json", "project-issue", "get", "--iid", "7", "--project-id", "g/r"], cacheable=True
+    )
+    trace = session.run(["project-job", "trace", "--id", "5", "--project-id", "group/repo"], cacheable=True)
+
+    assert listed == "iid: 7\ntitle: Flaky test\n\n"
+    assert json.loads(detailed)["title"] == "Flaky test"
+    assert trace == "line 1\nline 2"
+    assert api.calls[0] == ("get", "https://gitlab.example.com/api/v4/projects/group%2Frepo/issues")
+
+
+def test_repeated_reads_are_served_from_the_cache(api, session):
+    argv = ["project-issue", "get", "--iid", "7", "--project-id", "group/repo"]
+
+    first = session.run(argv, cacheable=True)
+    second = session.run(argv, cacheable=True)
+
+    assert first == second
+    assert len(api.calls) == 1
+
+
+def test_a_write_invalidates_the_cache(api, session):
+    argv = ["project-issue", "get", "--iid", "7", "--project-id", "group/repo"]
+
+    session.run(argv, cacheable=True)
+    session.run(["project-issue", "list", "--project-id", "group/repo"], cacheable=False)
+    session.run(argv, cacheable=True)
+
+    assert len(api.calls) == 3
+
+
+def test_projects_do_not_leak_into_the_manager_class(api, session):
+    session.run(["project-issue", "list", "--project-id", "group/one"], cacheable=True)
+    session.run(["project-issue", "list", "--project-id", "group/two"], cacheable=True)
+
+    assert [url for _, url in api.calls] == [
+        "https://gitlab.example.com/api/v4/projects/group%2Fone/issues",
+        "https://gitlab.example.com/api/v4/projects/group%2Ftwo/issues",
+    ]
+    assert gitlab.v4.objects.ProjectIssueManager._path == "/projects/{project_id}/issues"
+
+
+def test_usage_errors_raise_with_the_cli_message(api, session):
+    with pytest.raises(GitLabCLIError, match="invalid choice: 'bogus'"):
+        session.run(["project-issue", "bogus", "--project-id", "group/repo"], cacheable=False)
+
+    with pytest.raises(GitLabCLIError, match="the following arguments are required: --iid"):
+        session.run(["project-issue", "get", "--project-id", "group/repo"], cacheable=False)
+    assert api.calls == []
+
+
+def test_help_is_returned_as_output(session):
+    assert session.run(["project-issue", "list", "--help"], cacheable=True).startswith(
+        "usage: gitlab project-issue list"
+    )
+
+
+def test_api_errors_keep_the_cli_message(api, session):
+    with pytest.raises(GitLabCLIError, match=r"^Impossible to get object \(404: 404 Issue Not Found\)$"):
+        session.run(["project-issue", "get", "--iid", "404", "--project-id", "group/repo"], cacheable=True)
+
+
+def test_api_requests_run_outside_the_output_lock(session):
+    from automation.agent.middlewares.gitlab_cli import _output_lock
+
+    held = []
+    fake = FakeAPI()
+
+    def request(_session, *args, **kwargs):
+        held.append(_output_lock.locked())
+        return fake.request(*args, **kwargs)
+
+    with patch.object(requests.Session, "request", request):
+        session.run(["project-issue", "list", "--project-id", "group/repo"], cacheable=True)
+
+    assert held == [False]
+
+
+def test_output_is_captured_without_reaching_stdout(api, session, capsys):
+    session.run(["project-issue", "list", "--project-id", "group/repo"], cacheable=True)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_a_call_past_its_deadline_stops_at_the_next_response(session):
+    def slow_send(_adapter, request, **kwargs):
+        time.sleep(0.05)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(ISSUE).encode()
+        response.request, response.url = request, request.url
+        return response
+
+    with (
+        patch.object(requests.adapters.HTTPAdapter, "send", slow_send),
+        pytest.raises(GitLabCLIError, match="exceeded its deadline"),
+    ):
+        session.run(["project-issue", "get", "--iid", "7", "--project-id", "group/repo"], cacheable=True, timeout=0.01)
+
+
+def test_a_call_already_past_its_deadline_never_reaches_the_api(api, session):
+    with pytest.raises(GitLabCLIError, match="exceeded its deadline"):
+        session.run(
+            ["project-issue", "create", "--title", "Flaky", "--project-id", "group/repo"], cacheable=False, timeout=0
+        )
+
+    assert api.calls == []
@@ -1,4 +1,3 @@
-from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,9 +8,6 @@ from automation.agent.base import BaseAgent, ResolvedProvider, parse_model_spec
 from automation.agent.chat_models import OPENROUTER_BASE_URL, ChatOpenRouter
 from core.models import Provider, ProviderType, ThinkingLevelChoices
 
-if TYPE_CHECKING:
-    import httpx
-
 
 class ConcreteAgent(BaseAgent):
     def compile(self) -> Runnable:
@@ -243,9 +239,24 @@ class TestGetModelKwargs:
         assert "http_client" not in kw
         assert any("SDK has no http_client hook" in rec.message for rec in caplog.records)
 
-    def test_insecure_http_clients_closed_when_init_chat_model_fails(self):
-        """Construction failures must not leak httpx pools."""
+    def test_insecure_http_clients_are_pooled_per_endpoint(self):
+        """Every model for one endpoint shares the same warm clients instead of opening new ones."""
+        Provider.objects.create(
+            slug="pooled",
+            display_name="Pooled",
+            provider_type=ProviderType.OPENAI,
+            api_key="sk-x",
+            base_url="https://pooled.example/v1",
+            verify_ssl=False,
+        )
+        first = BaseAgent.get_model_kwargs(resolved=parse_model_spec("pooled:gpt-5.4"))
+        second = BaseAgent.get_model_kwargs(resolved=parse_model_spec("pooled:gpt-5.5"))
 
+        assert first["http_client"] is second["http_client"]
+        assert first["http_async_client"] is second["http_async_client"]
+
+    def test_insecure_http_clients_stay_open_when_init_chat_model_fails(self):
+        """A construction failure must not close clients other models share."""
         Provider.objects.create(
             slug="badmodel",
             display_name="Bad",
@@ -254,25 +265,45 @@ class TestGetModelKwargs:
             base_url="https://x.example/v1",
             verify_ssl=False,
         )
-        sync_holder: list[httpx.Client] = []
-        orig_init = sync_holder.append  # placeholder; reassigned via patch below
+        with (
+            patch("automation.agent.base.init_chat_model", side_effect=RuntimeError("simulated failure")),
+            pytest.raises(RuntimeError, match="simulated"),
+        ):
+            BaseAgent.get_model(model="badmodel:gpt-5.4")
 
-        with patch("automation.agent.base.init_chat_model") as mock_init:
-            # Capture the clients before raising so we can assert they were closed.
-            def capture_and_raise(**kwargs):
-                sync_holder.append(kwargs["http_client"])
-                sync_holder.append(kwargs["http_async_client"])
-                raise RuntimeError("simulated wrapper construction failure")
+        kw = BaseAgent.get_model_kwargs(resolved=parse_model_spec("badmodel:gpt-5.4"))
+        assert not kw["http_client"].is_closed
 
-            mock_init.side_effect = capture_and_raise
+    def test_get_model_reuses_the_instance_for_the_same_configuration(self):
+        self._enable_seed("anthropic", "sk-a")
+        with patch("automation.agent.base.init_chat_model", side_effect=lambda **kw: Mock(spec=BaseChatModel)) as init:
+            first = BaseAgent.get_model(model="anthropic:claude-sonnet-4-6")
+            again = BaseAgent.get_model(model="anthropic:claude-sonnet-4-6")
+            thinking = BaseAgent.get_model(
+                model="anthropic:claude-sonnet-4-6", thinking_level=ThinkingLevelChoices.HIGH
+            )
+
+        assert again is first
+        assert thinking is not first
+        assert init.call_count == 2
+
+    def test_get_model_rebuilds_after_the_api_key_changes(self):
+        self._enable_seed("anthropic", "sk-a")
+        first = BaseAgent.get_model(model="anthropic:claude-sonnet-4-6")
+        Provider.invalidate_cache()
+        self._enable_seed("anthropic", "sk-rotated")
+        Provider.invalidate_cache()
 
-            with pytest.raises(RuntimeError, match="simulated"):
-                BaseAgent.get_model(model="badmodel:gpt-5.4")
+        assert BaseAgent.get_model(model="anthropic:claude-sonnet-4-6") is not first
+
+    def test_get_model_skips_the_cache_for_unkeyable_kwargs(self):
+        self._enable_seed("anthropic", "sk-a")
+        callbacks = [object()]
+        with patch("automation.agent.base.init_chat_model", side_effect=lambda **kw: Mock(spec=BaseChatModel)) as init:
+            BaseAgent.get_model(model="anthropic:claude-sonnet-4-6", callbacks=callbacks)
+            BaseAgent.get_model(model="anthropic:claude-sonnet-4-6", callbacks=callbacks)
 
-        assert len(sync_holder) == 2
-        sync_client, _async_client = sync_holder
-        assert sync_client.is_closed
-        del orig_init
+        assert init.call_count == 2
 
     def test_get_model_openrouter_returns_chat_openrouter(self):
         self._enable_seed("openrouter", "sk-or")
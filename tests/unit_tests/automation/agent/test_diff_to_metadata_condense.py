@@ -0,0 +1,65 @@
+from automation.agent.diff_to_metadata.condense import condense_diff
+
+
+def _file_diff(path: str, hunks: list[list[str]]) -> str:
+    """A unified diff of ``path`` with one hunk per list of added lines."""
+    parts = [f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n"]
+    line = 1
+    for added in hunks:
+        parts.append(f"@@ -{line},1 +{line},{len(added) + 1} @@\n context\n")
+        parts += (f"+{text}\n" for text in added)
+        line += 100
+    return "".join(parts)
+
+
+def test_diff_within_budget_is_unchanged():
+    diff = _file_diff("src/app.py", [["print('hi')"]])
+
+    assert condense_diff(diff, max_tokens=1_000) is diff
+
+
+def test_lockfiles_and_generated_files_are_summarised():
+    diff = (
+        _file_diff("src/app.py", [["import json"]])
+        + _file_diff("uv.lock", [[f"pkg-{i} = '1.0'" for i in range(400)]])
+        + _file_diff("static/app.min.js", [["x" * 2_000]])
+    )
+
+    condensed = condense_diff(diff, max_tokens=500)
+
+    assert "+import json" in condensed
+    assert "[lockfile changed: +400 -0 lines, content omitted]" in condensed
+    assert "[generated file changed: +1 -0 lines, content omitted]" in condensed
+    assert "pkg-0" not in condensed
+    assert "+++ b/uv.lock" in condensed
+
+
+def test_every_file_keeps_its_largest_hunk_before_any_second_hunk():
+    big = [f"line {i}" for i in range(60)]
+    diff = _file_diff("src/a.py", [["small a"] * 50, big]) + _file_diff("src/b.py", [big, ["small b"] * 50])
+
+    condensed = condense_diff(diff, max_tokens=400)
+
+    assert condensed.count("+line 0") == 2
+    assert "small a" not in condensed
+    assert "small b" not in condensed
+    assert condensed.count("[1 hunk(s) omitted to fit the size budget: +50 -0 lines]") == 2
+
+
+def test_files_beyond_the_budget_are_counted():
+    diff = "".join(_file_diff(f"src/module_{i}.py", [["x = 1"]]) for i in range(50))
+
+    condensed = condense_diff(diff, max_tokens=200)
+
+    assert "diff --git a/src/module_0.py" in condensed
+    assert "more changed file(s) omitted to fit the size budget]" in condensed
+    assert len(condensed) <= 200 * 4 + 100
+
+
+def test_unparseable_diff_is_truncated():
+    diff = "diff --git a/x b/x\n--- a/x\n+++ b/x\n@@ -1,5 +1,5 @@\n+only one line\n" + "z" * 10_000
+
+    condensed = condense_diff(diff, max_tokens=100)
+
+    assert condensed.endswith("[diff truncated to fit the size budget]\n")
+    assert len(condensed) < 500
@@ -801,6 +801,53 @@ async def test_get_diff_local_includes_tracked_changes_and_untracked(tmp_path: P
     assert diff.endswith("\n")
 
 
+async def test_get_diff_local_folds_untracked_in_one_pass_without_touching_the_index(
+    tmp_path: Path, monkeypatch
+) -> None:
+    import subprocess as subprocess_module  # noqa: S404
+
+    repo, _ = _init_repo_with_origin(tmp_path)
+    repo_dir = tmp_path / "work"
+    names = [f"new_{i}.py" for i in range(20)] + ["with space.txt", "glob[1]*.txt", "ünïcode.md", "empty.txt"]
+    for name in names:
+        (repo_dir / name).write_text("" if name == "empty.txt" else f"content of {name}\n")
+    index_before = (repo_dir / ".git" / "index").read_bytes()
+    real_run = subprocess_module.run
+    git_calls: list[list[str]] = []
+
+    def counting_run(cmd, *args, **kwargs):
+        git_calls.append(cmd)
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr("automation.agent.git_manager.subprocess.run", counting_run)
+
+    diff = await GitManager.for_local(repo).get_diff()
+
+    patch = PatchSet(diff)
+    assert len(patch) == len(names)
+    assert all(patched.is_added_file for patched in patch)
+    assert {"with space.txt", "glob[1]*.txt", "empty.txt"} <= {patched.path for patched in patch}
+    assert len(git_calls) == 3  # ls-files, add --intent-to-add, diff — however many files
+    assert (repo_dir / ".git" / "index").read_bytes() == index_before
+    assert repo.untracked_files  # still untracked in the real index
+
+
+async def test_status_snapshot_local_diffs_tracked_and_untracked_together(tmp_path: Path) -> None:
+    repo, _ = _init_repo_with_origin(tmp_path)
+    repo_dir = tmp_path / "work"
+    (repo_dir / "README.md").write_text("changed\n")
+    (repo_dir / "new.py").write_text("print('hi')\n")
+
+    status = await GitManager.for_local(repo).status_snapshot(base_branch="main", mr_source_branch=None)
+
+    assert status.dirty
+    assert status.remote_branches == ["main"]
+    assert {patched.path: patched.is_added_file for patched in PatchSet(status.diff)} == {
+        "README.md": False,
+        "new.py": True,
+    }
+
+
 async def test_get_diff_local_empty_when_clean(tmp_path: Path) -> None:
     repo, _ = _init_repo_with_origin(tmp_path)
     assert await GitManager.for_local(repo).get_diff() == ""
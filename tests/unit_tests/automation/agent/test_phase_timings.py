@@ -0,0 +1,54 @@
+import asyncio
+
+from automation.agent.phase_timings import Phase, phase, track_phases
+
+
+async def test_phases_are_summed_and_counted_per_name():
+    async with track_phases() as phases:
+        for _ in range(2):
+            with phase(Phase.MODEL):
+                pass
+        with phase(Phase.TOOLS):
+            await asyncio.sleep(0.01)
+
+    summary = phases.summary()
+    assert list(summary) == ["model", "tools"]
+    assert summary["model"]["count"] == 2
+    assert summary["tools"] == {"seconds": summary["tools"]["seconds"], "count": 1}
+    assert summary["tools"]["seconds"] >= 0.01
+
+
+async def test_phases_in_worker_threads_reach_the_run_recorder():
+    def _clone():
+        with phase(Phase.CLONE):
+            pass
+
+    async with track_phases() as phases:
+        await asyncio.to_thread(_clone)
+
+    assert phases.summary()["clone"]["count"] == 1
+
+
+async def test_failed_blocks_are_still_timed():
+    async with track_phases() as phases:
+        try:
+            with phase(Phase.PUBLISH):
+                raise RuntimeError("push rejected")
+        except RuntimeError:
+            pass
+
+    assert phases.summary()["publish"]["count"] == 1
+
+
+def test_phase_is_a_noop_outside_a_tracked_run():
+    with phase(Phase.BUILD):
+        pass
+
+
+async def test_recorder_is_detached_on_exit():
+    async with track_phases() as phases:
+        pass
+    with phase(Phase.MODEL):
+        pass
+
+    assert phases.summary() == {}
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 import pytest
 from pydantic import SecretStr
 
-from automation.agent.provider_clients import build_sdk_client_kwargs
+from automation.agent.provider_clients import (
+    LoopBoundAsyncClient,
+    build_sdk_client_kwargs,
+    close_pooled_http_clients,
+    pooled_http_clients,
+)
 from core.models import Provider, ProviderType
 
 
@@ -65,8 +72,6 @@ def test_http_client_returned_when_verify_ssl_false():
     kw = build_sdk_client_kwargs(_cached(verify_ssl=False))
     assert isinstance(kw["http_client"], httpx.AsyncClient)
     # Caller owns lifecycle; close to avoid ResourceWarning.
-    import asyncio
-
     asyncio.run(kw["http_client"].aclose())
 
 
@@ -75,3 +80,67 @@ def test_missing_api_key_raises():
 
     with pytest.raises(MissingApiKeyError):
         build_sdk_client_kwargs(_cached(api_key=None))
+
+
+class TestPooledHttpClients:
+    @pytest.fixture(autouse=True)
+    def _empty_pool(self):
+        close_pooled_http_clients()
+        yield
+        close_pooled_http_clients()
+
+    def test_same_endpoint_shares_one_pool(self):
+        first = pooled_http_clients(_cached(slug="a", base_url="https://proxy.example/v1", verify_ssl=False))
+        second = pooled_http_clients(_cached(slug="b", base_url="https://proxy.example/v1", verify_ssl=False))
+
+        assert first is second
+
+    def test_endpoint_and_verification_split_pools(self):
+        insecure = pooled_http_clients(_cached(base_url="https://proxy.example/v1", verify_ssl=False))
+
+        assert pooled_http_clients(_cached(base_url="https://other.example/v1", verify_ssl=False)) is not insecure
+        assert pooled_http_clients(_cached(base_url="https://proxy.example/v1", verify_ssl=True)) is not insecure
+
+    def test_close_releases_the_clients_and_empties_the_pool(self):
+        sync_client, async_client = pooled_http_clients(_cached(verify_ssl=False))
+
+        close_pooled_http_clients()
+
+        assert sync_client.is_closed
+        assert async_client.is_closed
+        assert pooled_http_clients(_cached(verify_ssl=False))[0] is not sync_client
+
+    def test_async_client_opens_a_pool_per_event_loop(self):
+        _, async_client = pooled_http_clients(_cached(verify_ssl=False))
+
+        async def loop_clients():
+            return async_client.loop_client(), async_client.loop_client()
+
+        first, again = asyncio.run(loop_clients())
+        other, _ = asyncio.run(loop_clients())
+
+        assert first is again
+        assert other is not first
+
+
+class TestLoopBoundAsyncClient:
+    def test_requests_are_sent_through_the_running_loops_client(self):
+        seen = []
+        client = LoopBoundAsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True})),
+            headers={"X-Foo": "bar"},
+        )
+
+        async def call():
+            response = await client.get("https://api.example/v1/models")
+            seen.append(client.loop_client())
+            return response
+
+        first = asyncio.run(call())
+        second = asyncio.run(call())
+
+        assert first.json() == second.json() == {"ok": True}
+        assert first.request.headers["X-Foo"] == "bar"
+        assert seen[0] is not seen[1]
+        asyncio.run(client.aclose())
+        assert client.is_closed
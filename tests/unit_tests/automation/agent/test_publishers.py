@@ -1,15 +1,18 @@
 import inspect
+import threading
 from contextlib import asynccontextmanager, nullcontext
 from unittest.mock import AsyncMock, Mock, patch
 from urllib.parse import parse_qs, urlparse
 
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 
 import pytest
 
+from automation.agent.diff_to_metadata.schemas import CommitMetadata
 from automation.agent.git_manager import RepoStatus
 from automation.agent.publishers import SESSION_TRAILER, GitChangePublisher, PublishOutcome, append_trailer
-from codebase.base import GitPlatform, Issue, MergeRequest, MergeRequestDiffStats, User
+from codebase.base import GitPlatform, Issue, MergeRequest, MergeRequestDiffStats, Scope, User
 from codebase.clients.base import GitAuthEnv
 from codebase.exceptions import MergeRequestBranchNotVisibleError
 from core.constants import BOT_AUTO_LABEL, BOT_NAME
@@ -1106,3 +1109,109 @@ class TestPublishDiffStats:
         outcome = await publisher.publish(merge_request=None)
 
         assert outcome.diff_stats == _LOCAL_STATS
+
+
+class TestDiffToMetadataCache:
+    """Metadata is generated once per condensed diff: re-publishing it reuses the model's answer."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        cache.clear()
+
+    def _publisher(self):
+        publisher = _make_publisher()
+        publisher.ctx.scope = Scope.GLOBAL
+        publisher.ctx.config.omit_content_patterns = ()
+        return publisher
+
+    async def test_identical_diff_reuses_the_generated_metadata(self):
+        graph = Mock(ainvoke=AsyncMock(return_value={"commit_message": CommitMetadata(commit_message="feat: x")}))
+
+        with (
+            patch("automation.agent.publishers.create_diff_to_metadata_graph", return_value=graph) as create_graph,
+            patch("automation.agent.publishers.build_langsmith_config", return_value={}),
+        ):
+            first = await self._publisher()._diff_to_metadata(commit_message_diff="diff --git a/x b/x\n")
+            second = await self._publisher()._diff_to_metadata(commit_message_diff="diff --git a/x b/x\n")
+
+        assert first == second == {"commit_message": CommitMetadata(commit_message="feat: x")}
+        create_graph.assert_called_once()
+        graph.ainvoke.assert_awaited_once()
+
+    async def test_a_different_diff_asks_the_model_again(self):
+        graph = Mock(ainvoke=AsyncMock(return_value={"commit_message": CommitMetadata(commit_message="feat: x")}))
+
+        with (
+            patch("automation.agent.publishers.create_diff_to_metadata_graph", return_value=graph),
+            patch("automation.agent.publishers.build_langsmith_config", return_value={}),
+        ):
+            await self._publisher()._diff_to_metadata(commit_message_diff="diff --git a/x b/x\n")
+            await self._publisher()._diff_to_metadata(commit_message_diff="diff --git a/y b/y\n")
+
+        assert graph.ainvoke.await_count == 2
+
+
+class TestPublishOverlap:
+    """Platform lookups run alongside the metadata call unless it needs their answer."""
+
+    @staticmethod
+    def _metadata_signalling(started: threading.Event):
+        async def _diff_to_metadata(**kwargs):
+            started.set()
+            return _metadata_stub()
+
+        return _diff_to_metadata
+
+    async def test_lookups_overlap_the_metadata_call(self, monkeypatch):
+        """Both lookups block until the metadata call has started: run one after another, they would time out."""
+        publisher = _make_publisher()
+        mr = _make_merge_request(draft=True)
+        started = threading.Event()
+        publisher.client.is_branch_protected.side_effect = lambda *args: not started.wait(5)
+        publisher.client.push_uses_ephemeral_token.side_effect = lambda *args: not started.wait(5)
+        gm = _fake_git_manager()
+        _patch_open_git_manager(monkeypatch, gm)
+
+        with (
+            patch.object(publisher, "_diff_to_metadata", side_effect=self._metadata_signalling(started)) as meta,
+            patch.object(publisher.client, "update_merge_request", return_value=mr),
+        ):
+            outcome = await publisher.publish(merge_request=mr)
+
+        assert meta.call_args.kwargs["pr_metadata_diff"] == "diff"
+        gm.push_head_to.assert_awaited_once_with("feature", integrate_on_reject=True, skip_ci=False)
+        assert outcome.published is True
+        assert outcome.protected_branch_fallback_source is None
+
+    async def test_metadata_waits_for_protection_on_a_ready_mr(self, monkeypatch):
+        """On a ready MR only a protected branch makes PR metadata necessary, so the call waits for the answer."""
+        publisher = _make_publisher()
+        publisher.client.is_branch_protected.return_value = True
+        gm = _fake_git_manager()
+        _patch_open_git_manager(monkeypatch, gm)
+
+        with (
+            patch.object(publisher, "_diff_to_metadata", return_value=_metadata_stub()) as meta,
+            patch.object(publisher, "_create_merge_request", return_value=_make_merge_request(merge_request_id=43)),
+            patch.object(publisher, "_suggest_context_file"),
+        ):
+            outcome = await publisher.publish(merge_request=_make_merge_request())
+
+        meta.assert_awaited_once_with(pr_metadata_diff="diff", commit_message_diff="diff")
+        assert outcome.protected_branch_fallback_source == "feature"
+
+    async def test_snapshot_is_timed_by_the_phase_recorder(self, monkeypatch):
+        from automation.agent.phase_timings import Phase, track_phases
+
+        publisher = _make_publisher()
+        _patch_open_git_manager(monkeypatch, _fake_git_manager())
+
+        with (
+            patch.object(publisher, "_diff_to_metadata", return_value=_metadata_stub()),
+            patch.object(publisher, "_create_merge_request", return_value=_make_merge_request()),
+            patch.object(publisher, "_suggest_context_file"),
+        ):
+            async with track_phases() as phases:
+                await publisher.publish(merge_request=None)
+
+        assert phases.counts == {Phase.SNAPSHOT: 1}
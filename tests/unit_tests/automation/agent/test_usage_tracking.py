@@ -1,13 +1,16 @@
 # tests/unit_tests/automation/agent/test_usage_tracking.py
 from __future__ import annotations
 
+import logging
 from decimal import Decimal
 from typing import Any
+from unittest.mock import patch
 
+from genai_prices.data_snapshot import get_snapshot
 from langchain_core.messages import AIMessage
 from langchain_core.outputs import ChatGeneration, LLMResult
 
-from automation.agent.usage_tracking import CostAwareUsageMetadataCallbackHandler, build_usage_summary
+from automation.agent.usage_tracking import CostAwareUsageMetadataCallbackHandler, _resolve_pricing, build_usage_summary
 
 
 def _usage_metadata(
@@ -409,3 +412,26 @@ class TestEmptyMetadataWarning:
 
         assert summary.input_tokens == 0
         assert any("callback hook may not have fired" in rec.message for rec in caplog.records)
+
+
+class TestPricingResolution:
+    def test_lookup_runs_once_per_model_and_day(self):
+        _resolve_pricing.cache_clear()
+        snapshot = get_snapshot()
+        handler = CostAwareUsageMetadataCallbackHandler()
+        with patch.object(snapshot, "find_provider_model", wraps=snapshot.find_provider_model) as lookup:
+            for _ in range(3):
+                handler.on_llm_end(_llm_result("gpt-5.4", _usage_metadata()))
+
+        assert lookup.call_count == 1
+        assert handler.cost_by_model["gpt-5.4"] > 0
+
+    def test_unpriced_model_is_looked_up_once_across_runs(self, caplog):
+        _resolve_pricing.cache_clear()
+        with caplog.at_level(logging.WARNING, logger="daiv.usage"):
+            for _ in range(2):
+                CostAwareUsageMetadataCallbackHandler().on_llm_end(
+                    _llm_result("totally-unknown-xyz", _usage_metadata())
+                )
+
+        assert sum("No pricing found" in rec.message for rec in caplog.records) == 1
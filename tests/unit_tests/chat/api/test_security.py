@@ -1,5 +1,7 @@
 from datetime import timedelta
+from unittest.mock import patch
 
+from django.core.cache import cache
 from django.utils import timezone
 
 import pytest
@@ -92,3 +94,48 @@ async def test_authenticate_inactive_user_rejected(auth: AuthBearer, api_key: tu
 
     assert await auth.authenticate(None, api_key[1]) is None
     await api_key[0].user.adelete()
+
+
+@pytest.mark.django_db
+async def test_verified_key_is_served_from_cache(auth: AuthBearer, api_key: tuple[APIKey, str]):
+    """A repeat request skips the key lookup and hash verification; only the user is loaded."""
+    await auth.authenticate(None, api_key[1])
+
+    with patch.object(APIKey.objects.key_generator, "verify", wraps=APIKey.objects.key_generator.verify) as verify:
+        for _ in range(5):
+            assert await auth.authenticate(None, api_key[1]) == api_key[0].user
+
+    verify.assert_not_called()
+    await api_key[0].user.adelete()
+
+
+@pytest.mark.django_db
+async def test_revoking_a_cached_key_takes_effect_immediately(auth: AuthBearer, api_key: tuple[APIKey, str]):
+    assert await auth.authenticate(None, api_key[1]) == api_key[0].user
+
+    api_key[0].revoked = True
+    await api_key[0].asave()
+
+    assert await auth.authenticate(None, api_key[1]) is None
+    await api_key[0].user.adelete()
+
+
+@pytest.mark.django_db
+async def test_deactivating_the_user_of_a_cached_key_takes_effect_immediately(
+    auth: AuthBearer, api_key: tuple[APIKey, str]
+):
+    assert await auth.authenticate(None, api_key[1]) == api_key[0].user
+
+    api_key[0].user.is_active = False
+    await api_key[0].user.asave(update_fields=["is_active"])
+
+    assert await auth.authenticate(None, api_key[1]) is None
+    await api_key[0].user.adelete()
+
+
+@pytest.mark.django_db
+async def test_cache_never_holds_the_raw_token(auth: AuthBearer, api_key: tuple[APIKey, str]):
+    await auth.authenticate(None, api_key[1])
+
+    assert api_key[1] not in repr(cache._cache)
+    await api_key[0].user.adelete()
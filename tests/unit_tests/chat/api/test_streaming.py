@@ -283,7 +283,7 @@ async def test_events_finalizes_failed_when_run_error_event_emitted():
 
     finalize_calls: list = []
 
-    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message=""):
+    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message="", phase_timings=None):
         finalize_calls.append({"success": success, "error_message": error_message})
 
     persist_calls: list = []
@@ -333,7 +333,7 @@ async def test_events_finalizes_failed_with_generic_message_when_agent_raises():
 
     finalize_calls: list = []
 
-    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message=""):
+    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message="", phase_timings=None):
         finalize_calls.append({"success": success, "error_message": error_message})
 
     with (
@@ -521,7 +521,7 @@ async def test_events_stops_with_run_cancelled_when_cancel_flag_set():
 
     finalize_calls: list = []
 
-    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message=""):
+    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message="", phase_timings=None):
         finalize_calls.append({"success": success, "error_message": error_message})
 
     release_calls: list = []
@@ -576,7 +576,7 @@ async def test_events_finalizes_interrupted_on_task_cancellation():
 
     finalize_calls: list = []
 
-    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message=""):
+    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message="", phase_timings=None):
         finalize_calls.append({"success": success, "error_message": error_message})
 
     with (
@@ -620,7 +620,7 @@ async def test_events_stops_when_slot_lost_to_stale_takeover():
 
     finalize_calls: list = []
 
-    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message=""):
+    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message="", phase_timings=None):
         finalize_calls.append({"success": success, "error_message": error_message})
 
     with (
@@ -695,7 +695,7 @@ async def test_events_buffers_text_deltas_into_result_summary():
 
     captured: dict = {}
 
-    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message=""):
+    async def _capture_finalize(run_pk, *, success, usage, response_text, error_message="", phase_timings=None):
         captured["response_text"] = response_text
         captured["success"] = success
 
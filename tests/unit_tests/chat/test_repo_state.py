@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -40,7 +40,7 @@ async def test_returns_none_when_ref_missing():
 
 
 async def test_returns_none_when_ref_is_default_branch_and_skips_lookup():
-    repo_client = MagicMock()
+    repo_client = MagicMock(aget_merge_request_by_branches=AsyncMock())
     with (
         patch("chat.repo_state.RepositoryConfig.get_config", return_value=MagicMock(default_branch="main")),
         patch("chat.repo_state.RepoClient.create_instance", return_value=repo_client) as factory,
@@ -49,12 +49,12 @@ async def test_returns_none_when_ref_is_default_branch_and_skips_lookup():
 
     assert result is None
     factory.assert_not_called()
-    repo_client.get_merge_request_by_branches.assert_not_called()
+    repo_client.aget_merge_request_by_branches.assert_not_awaited()
 
 
 async def test_returns_payload_on_happy_path():
-    repo_client = MagicMock()
-    repo_client.get_merge_request_by_branches.return_value = _make_mr()
+    repo_client = MagicMock(aget_merge_request_by_branches=AsyncMock())
+    repo_client.aget_merge_request_by_branches.return_value = _make_mr()
     with (
         patch("chat.repo_state.RepositoryConfig.get_config", return_value=MagicMock(default_branch="main")),
         patch("chat.repo_state.RepoClient.create_instance", return_value=repo_client),
@@ -64,12 +64,12 @@ async def test_returns_payload_on_happy_path():
     assert result == mr_to_payload(_make_mr())
     assert result["id"] == 42
     assert result["draft"] is True
-    repo_client.get_merge_request_by_branches.assert_called_once_with("a/b", "feature-x")
+    repo_client.aget_merge_request_by_branches.assert_awaited_once_with("a/b", "feature-x")
 
 
 async def test_returns_none_when_lookup_returns_none():
-    repo_client = MagicMock()
-    repo_client.get_merge_request_by_branches.return_value = None
+    repo_client = MagicMock(aget_merge_request_by_branches=AsyncMock())
+    repo_client.aget_merge_request_by_branches.return_value = None
     with (
         patch("chat.repo_state.RepositoryConfig.get_config", return_value=MagicMock(default_branch="main")),
         patch("chat.repo_state.RepoClient.create_instance", return_value=repo_client),
@@ -99,8 +99,8 @@ async def test_swallows_errors_from_client_call():
     """SDK errors (gitlab/github/httpx) are caught."""
     from gitlab.exceptions import GitlabError
 
-    repo_client = MagicMock()
-    repo_client.get_merge_request_by_branches.side_effect = GitlabError("api 500")
+    repo_client = MagicMock(aget_merge_request_by_branches=AsyncMock())
+    repo_client.aget_merge_request_by_branches.side_effect = GitlabError("api 500")
     with (
         patch("chat.repo_state.RepositoryConfig.get_config", return_value=MagicMock(default_branch="main")),
         patch("chat.repo_state.RepoClient.create_instance", return_value=repo_client),
@@ -116,8 +116,8 @@ async def test_swallows_requests_transport_errors():
     to "no MR" like any other platform hiccup."""
     import requests
 
-    repo_client = MagicMock()
-    repo_client.get_merge_request_by_branches.side_effect = requests.ConnectionError("dns failure")
+    repo_client = MagicMock(aget_merge_request_by_branches=AsyncMock())
+    repo_client.aget_merge_request_by_branches.side_effect = requests.ConnectionError("dns failure")
     with (
         patch("chat.repo_state.RepositoryConfig.get_config", return_value=MagicMock(default_branch="main")),
         patch("chat.repo_state.RepoClient.create_instance", return_value=repo_client),
@@ -131,8 +131,8 @@ async def test_propagates_unexpected_errors():
     """Bugs (KeyError/AttributeError/TypeError) must NOT be silently caught —
     they should surface as 500s rather than masking as a fake 'no MR'.
     """
-    repo_client = MagicMock()
-    repo_client.get_merge_request_by_branches.side_effect = KeyError("missing field")
+    repo_client = MagicMock(aget_merge_request_by_branches=AsyncMock())
+    repo_client.aget_merge_request_by_branches.side_effect = KeyError("missing field")
     with (
         patch("chat.repo_state.RepositoryConfig.get_config", return_value=MagicMock(default_branch="main")),
         patch("chat.repo_state.RepoClient.create_instance", return_value=repo_client),
@@ -1,6 +1,7 @@
 import logging
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
 from github.GithubException import GithubException
 
@@ -15,7 +16,11 @@ from core.constants import BOT_AUTO_LABEL, BOT_LABEL, BOT_MAX_LABEL
 def mock_repo_client():
     """Mock RepoClient instance."""
     client = Mock()
-    client.has_issue_reaction.return_value = False
+    client.acurrent_user = AsyncMock()
+    client.ahas_issue_reaction = AsyncMock(return_value=False)
+    client.acreate_issue_emoji = AsyncMock()
+    client.acreate_merge_request_note_emoji = AsyncMock()
+    client.aget_merge_request = AsyncMock()
     return client
 
 
@@ -56,131 +61,133 @@ def create_issue_callback(
 class TestIssueCallback:
     """Tests for GitHub IssueCallback."""
 
-    def test_accept_callback_opened_with_daiv_label(self, monkeypatch_dependencies):
+    async def test_accept_callback_opened_with_daiv_label(self, monkeypatch_dependencies):
         """Test that callback is accepted when issue is opened with a DAIV label."""
         callback = create_issue_callback(action="opened", issue_labels=[Label(id=1, name=BOT_LABEL)])
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_accept_callback_labeled_with_daiv_label(self, monkeypatch_dependencies):
+    async def test_accept_callback_labeled_with_daiv_label(self, monkeypatch_dependencies):
         """Test that callback is accepted when a DAIV label is added."""
         callback = create_issue_callback(
             action="labeled", issue_labels=[Label(id=1, name=BOT_LABEL)], label=Label(id=1, name="daiv")
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_accept_callback_labeled_with_daiv_auto_label(self, monkeypatch_dependencies):
+    async def test_accept_callback_labeled_with_daiv_auto_label(self, monkeypatch_dependencies):
         """Test that callback is accepted when daiv-auto label is added."""
         callback = create_issue_callback(
             action="labeled", issue_labels=[Label(id=3, name=BOT_AUTO_LABEL)], label=Label(id=2, name="daiv-auto")
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_accept_callback_labeled_with_daiv_max_label(self, monkeypatch_dependencies):
+    async def test_accept_callback_labeled_with_daiv_max_label(self, monkeypatch_dependencies):
         """Test that callback is accepted when daiv-max label is added."""
         callback = create_issue_callback(
             action="labeled", issue_labels=[Label(id=4, name=BOT_MAX_LABEL)], label=Label(id=3, name="daiv-max")
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_reject_callback_labeled_with_non_daiv_label(self, monkeypatch_dependencies):
+    async def test_reject_callback_labeled_with_non_daiv_label(self, monkeypatch_dependencies):
         """Test that callback is rejected when a non-DAIV label is added."""
         callback = create_issue_callback(
             action="labeled", issue_labels=[Label(id=2, name="bug")], label=Label(id=4, name="bug")
         )
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_labeled_without_label_field(self, monkeypatch_dependencies):
+    async def test_reject_callback_labeled_without_label_field(self, monkeypatch_dependencies):
         """Test that callback is rejected when labeled action has no label field."""
         callback = create_issue_callback(action="labeled", issue_labels=[Label(id=1, name=BOT_LABEL)], label=None)
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_when_already_reacted(self, monkeypatch_dependencies, mock_repo_client):
+    async def test_reject_callback_when_already_reacted(self, monkeypatch_dependencies, mock_repo_client):
         """Test that callback is rejected when DAIV has already reacted to the issue."""
-        mock_repo_client.has_issue_reaction.return_value = True
+        mock_repo_client.ahas_issue_reaction.return_value = True
 
         callback = create_issue_callback(action="opened", issue_labels=[Label(id=1, name=BOT_LABEL)])
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_closed_issue(self, monkeypatch_dependencies):
+    async def test_reject_callback_closed_issue(self, monkeypatch_dependencies):
         """Test that callback is rejected for closed issues."""
         callback = create_issue_callback(
             action="opened", issue_labels=[Label(id=1, name=BOT_LABEL)], issue_state="closed"
         )
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_edited_action(self, monkeypatch_dependencies):
+    async def test_reject_callback_edited_action(self, monkeypatch_dependencies):
         """Test that callback is rejected for edited action."""
         callback = create_issue_callback(action="edited", issue_labels=[Label(id=1, name=BOT_LABEL)])
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_issue_addressing_disabled(
+    async def test_reject_callback_issue_addressing_disabled(
         self, monkeypatch_dependencies, mock_repo_config, mock_repo_client
     ):
         """Test that callback is rejected when issue addressing is disabled."""
         mock_repo_config.issue_addressing.enabled = False
 
         callback = create_issue_callback(action="opened", issue_labels=[Label(id=1, name=BOT_LABEL)])
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_accept_callback_reopened_with_daiv_label(self, monkeypatch_dependencies):
+    async def test_accept_callback_reopened_with_daiv_label(self, monkeypatch_dependencies):
         """Test that callback is accepted when issue is reopened with a DAIV label."""
         callback = create_issue_callback(action="reopened", issue_labels=[Label(id=1, name=BOT_LABEL)])
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_reject_callback_reopened_without_daiv_label(self, monkeypatch_dependencies):
+    async def test_reject_callback_reopened_without_daiv_label(self, monkeypatch_dependencies):
         """Test that callback is rejected when issue is reopened without a DAIV label."""
         callback = create_issue_callback(action="reopened", issue_labels=[Label(id=2, name="bug")])
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_label_check_case_insensitive(self, monkeypatch_dependencies):
+    async def test_label_check_case_insensitive(self, monkeypatch_dependencies):
         """Test that label checking is case-insensitive."""
         callback = create_issue_callback(
             action="labeled", issue_labels=[Label(id=1, name="DAIV")], label=Label(id=1, name="DAIV")
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_reject_callback_user_not_in_allowlist(self, monkeypatch_dependencies, mock_repo_config):
+    async def test_reject_callback_user_not_in_allowlist(self, monkeypatch_dependencies, mock_repo_config):
         """Test that callback is rejected when user is not in the allowed usernames list."""
         mock_repo_config.allowed_usernames = ("alice", "bob")
 
         callback = create_issue_callback(
             action="opened", issue_labels=[Label(id=1, name=BOT_LABEL)], sender_username="mallory"
         )
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_accept_callback_user_in_allowlist(self, monkeypatch_dependencies, mock_repo_config):
+    async def test_accept_callback_user_in_allowlist(self, monkeypatch_dependencies, mock_repo_config):
         """Test that callback is accepted when user is in the allowed usernames list."""
         mock_repo_config.allowed_usernames = ("alice", "bob")
 
         callback = create_issue_callback(
             action="opened", issue_labels=[Label(id=1, name=BOT_LABEL)], sender_username="alice"
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_accept_callback_empty_allowlist(self, monkeypatch_dependencies, mock_repo_config):
+    async def test_accept_callback_empty_allowlist(self, monkeypatch_dependencies, mock_repo_config):
         """Test that callback is accepted when allowlist is empty (all users allowed)."""
         mock_repo_config.allowed_usernames = ()
 
         callback = create_issue_callback(action="opened", issue_labels=[Label(id=1, name=BOT_LABEL)])
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_allowlist_case_insensitive(self, monkeypatch_dependencies, mock_repo_config):
+    async def test_allowlist_case_insensitive(self, monkeypatch_dependencies, mock_repo_config):
         """Test that allowlist check is case-insensitive."""
         mock_repo_config.allowed_usernames = ("Alice",)
 
         callback = create_issue_callback(
             action="opened", issue_labels=[Label(id=1, name=BOT_LABEL)], sender_username="alice"
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
 
 class TestIssueCommentCallbackAllowlist:
     """Tests for GitHub IssueCommentCallback allowlist."""
 
-    def test_reject_comment_user_not_in_allowlist(self, monkeypatch_dependencies, mock_repo_config, mock_repo_client):
+    async def test_reject_comment_user_not_in_allowlist(
+        self, monkeypatch_dependencies, mock_repo_config, mock_repo_client
+    ):
         """Test that comment callback is rejected when user is not in the allowed usernames list."""
         mock_repo_config.allowed_usernames = ("alice",)
-        mock_repo_client.current_user = User(**{"id": 999, "login": "daiv-bot"})
+        mock_repo_client.acurrent_user.return_value = User(**{"id": 999, "login": "daiv-bot"})
 
         callback = IssueCommentCallback(
             action="created",
@@ -188,12 +195,12 @@ class TestIssueCommentCallbackAllowlist:
             issue=Issue(id=100, number=42, title="Test Issue", state="open", labels=[Label(id=1, name=BOT_LABEL)]),
             comment=Comment(id=200, body="@daiv-bot help", user=User(**{"id": 10, "login": "mallory"})),
         )
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_accept_comment_user_in_allowlist(self, monkeypatch_dependencies, mock_repo_config, mock_repo_client):
+    async def test_accept_comment_user_in_allowlist(self, monkeypatch_dependencies, mock_repo_config, mock_repo_client):
         """Test that comment callback is accepted when user is in the allowed usernames list."""
         mock_repo_config.allowed_usernames = ("alice",)
-        mock_repo_client.current_user = User(**{"id": 999, "login": "daiv-bot"})
+        mock_repo_client.acurrent_user.return_value = User(**{"id": 999, "login": "daiv-bot"})
 
         callback = IssueCommentCallback(
             action="created",
@@ -201,7 +208,7 @@ class TestIssueCommentCallbackAllowlist:
             issue=Issue(id=100, number=42, title="Test Issue", state="open", labels=[Label(id=1, name=BOT_LABEL)]),
             comment=Comment(id=200, body="@daiv-bot help", user=User(**{"id": 10, "login": "alice"})),
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
 
 def create_pull_request_callback(
@@ -233,30 +240,30 @@ def create_pull_request_callback(
 class TestPullRequestCallback:
     """Tests for GitHub PullRequestCallback."""
 
-    def test_accept_callback_on_closed_and_merged(self):
+    async def test_accept_callback_on_closed_and_merged(self):
         """Test that callback is accepted when PR is closed and merged."""
         callback = create_pull_request_callback()
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_reject_callback_on_closed_not_merged(self):
+    async def test_reject_callback_on_closed_not_merged(self):
         """Test that callback is rejected when PR is closed but not merged."""
         callback = create_pull_request_callback(merged=False)
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_on_opened(self):
+    async def test_reject_callback_on_opened(self):
         """Test that callback is rejected when PR is opened."""
         callback = create_pull_request_callback(action="opened", merged=False)
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_on_synchronize(self):
+    async def test_reject_callback_on_synchronize(self):
         """Test that callback is rejected when PR is synchronized."""
         callback = create_pull_request_callback(action="synchronize", merged=False)
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_when_target_not_default_branch(self):
+    async def test_reject_callback_when_target_not_default_branch(self):
         """Test that callback is rejected when PR targets a non-default branch."""
         callback = create_pull_request_callback(base_ref="develop")
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
     async def test_process_callback_enqueues_task(self):
         """Test that process_callback enqueues the merge metrics task with correct args."""
@@ -387,7 +394,7 @@ class TestProcessCallbackThreadId:
         ):
             mock_task.aenqueue = AsyncMock(return_value=Mock(id="task-1"))
             mock_activity.side_effect = AsyncMock(return_value=None)
-            callback._client.get_merge_request = Mock(return_value=Mock(source_branch="feat/x"))
+            callback._client.aget_merge_request = AsyncMock(return_value=Mock(source_branch="feat/x"))
             await callback.process_callback()
 
         assert mock_task.aenqueue.call_args.kwargs["thread_id"] == expected
@@ -442,7 +449,7 @@ class TestProcessCallbackSandboxEnvironment:
         ):
             mock_task.aenqueue = AsyncMock(return_value=Mock(id="task-1"))
             mock_activity.side_effect = AsyncMock(return_value=None)
-            callback._client.get_merge_request = Mock(return_value=Mock(source_branch="feat/x"))
+            callback._client.aget_merge_request = AsyncMock(return_value=Mock(source_branch="feat/x"))
             await callback.process_callback()
 
         assert mock_task.aenqueue.call_args.kwargs["sandbox_environment_id"] == "env-uuid-2"
@@ -478,14 +485,18 @@ class TestProcessCallbackSandboxEnvironment:
 class TestReactionFailureVisibility:
     """The 👀 reaction is best-effort, but its failure must be visible and must not lose the run."""
 
-    @pytest.mark.parametrize("exc", [GithubException(403, {}, {}), ConnectionError("dns")], ids=["api", "transport"])
+    @pytest.mark.parametrize(
+        "exc",
+        [GithubException(403, {}, {}), httpx.ConnectError("dns"), ConnectionError("dns")],
+        ids=["api", "http", "transport"],
+    )
     async def test_pr_comment_reaction_failure_logs_error_and_still_enqueues(
         self, monkeypatch_dependencies, mock_repo_config, mock_repo_client, caplog, exc
     ):
         from unittest.mock import AsyncMock, patch
 
         mock_repo_config.pull_request_assistant.enabled = True
-        mock_repo_client.create_merge_request_note_emoji.side_effect = exc
+        mock_repo_client.acreate_merge_request_note_emoji.side_effect = exc
 
         callback = IssueCommentCallback(
             action="created",
@@ -507,10 +518,10 @@ class TestReactionFailureVisibility:
         ):
             mock_task.aenqueue = AsyncMock(return_value=Mock(id="task-1"))
             mock_run.side_effect = AsyncMock(return_value=None)
-            callback._client.get_merge_request = Mock(return_value=Mock(source_branch="feat/x"))
+            callback._client.aget_merge_request = AsyncMock(return_value=Mock(source_branch="feat/x"))
             await callback.process_callback()
 
-        mock_repo_client.create_merge_request_note_emoji.assert_called_once_with("owner/repo", 99, Emoji.EYES, 300)
+        mock_repo_client.acreate_merge_request_note_emoji.assert_awaited_once_with("owner/repo", 99, Emoji.EYES, 300)
         mock_task.aenqueue.assert_awaited_once()
         record = next(r for r in caplog.records if "reaction" in r.message)
         assert record.levelno == logging.ERROR
@@ -539,4 +550,4 @@ class TestReactionFailureVisibility:
             mock_run.side_effect = AsyncMock(return_value=None)
             await callback.process_callback()
 
-        mock_repo_client.create_issue_emoji.assert_called_once_with("owner/repo", 7, Emoji.EYES, 301)
+        mock_repo_client.acreate_issue_emoji.assert_awaited_once_with("owner/repo", 7, Emoji.EYES, 301)
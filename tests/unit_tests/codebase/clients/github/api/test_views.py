@@ -0,0 +1,49 @@
+import hmac
+import json
+from hashlib import sha256
+
+import pytest
+from ninja.testing import TestAsyncClient
+
+from codebase.base import GitPlatform
+from codebase.models import WebhookDelivery
+from daiv.api import api
+
+
+@pytest.fixture
+def client(mock_settings):
+    mock_settings.CLIENT = GitPlatform.GITHUB
+    return TestAsyncClient(api)
+
+
+def _post(client: TestAsyncClient, event: str, payload: dict):
+    body = json.dumps(payload).encode()
+    signature = hmac.new(b"test_secret", msg=body, digestmod=sha256).hexdigest()
+    return client.post(
+        "/codebase/callbacks/github/",
+        data=body,
+        content_type="application/json",
+        headers={"X-GitHub-Event": event, "X-Hub-Signature-256": f"sha256={signature}"},
+    )
+
+
+PAYLOAD = {"repository": {"id": 1, "full_name": "owner/repo", "default_branch": "main"}, "ref": "refs/heads/feat"}
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_github_callback_records_handled_event(client: TestAsyncClient):
+    """Test GitHub callback records an event DAIV subscribes to."""
+    response = await _post(client, "push", PAYLOAD)
+
+    assert response.status_code == 204
+    delivery = await WebhookDelivery.objects.aget()
+    assert delivery.event == "push"
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_github_callback_unhandled_event_is_not_recorded(client: TestAsyncClient):
+    """Test GitHub callback for an event without a callback is acknowledged without a record."""
+    response = await _post(client, "ping", PAYLOAD)
+
+    assert response.status_code == 204
+    assert not await WebhookDelivery.objects.aexists()
@@ -77,13 +77,16 @@ async def _make_db_task_result() -> uuid.UUID:
 class _StubClient:
     current_user = MagicMock(id=999, username="daiv")
 
-    def create_issue_emoji(self, *_a, **_kw):
+    async def acreate_issue_emoji(self, *_a, **_kw):
         pass
 
-    def create_merge_request_note_emoji(self, *_a, **_kw):
+    async def acreate_merge_request_note_emoji(self, *_a, **_kw):
         pass
 
-    def has_issue_reaction(self, *_a, **_kw):
+    async def acurrent_user(self):
+        return self.current_user
+
+    async def ahas_issue_reaction(self, *_a, **_kw):
         return False
 
 
@@ -34,16 +34,19 @@ class StubClient:
     def set_discussion(self, discussion):
         self._discussion = discussion
 
-    def has_issue_reaction(self, *_a, **_kw):
+    async def acurrent_user(self):
+        return self.current_user
+
+    async def ahas_issue_reaction(self, *_a, **_kw):
         return self._has_reaction
 
     def set_has_reaction(self, value):
         self._has_reaction = value
 
-    def create_issue_emoji(self, *_a, **_kw):
+    async def acreate_issue_emoji(self, *_a, **_kw):
         pass
 
-    def create_merge_request_note_emoji(self, *_a, **_kw):
+    async def acreate_merge_request_note_emoji(self, *_a, **_kw):
         pass
 
 
@@ -95,14 +98,14 @@ def create_note_callback(note_body: str, username: str = "reviewer") -> NoteCall
     )
 
 
-def test_accept_when_mention(monkeypatch_dependencies, stub_client):
+async def test_accept_when_mention(monkeypatch_dependencies, stub_client):
     """Test that callback is accepted when note body contains @daiv mention."""
     callback = create_note_callback("@daiv please review this code")
 
-    assert callback.accept_callback() is True
+    assert await callback.accept_callback() is True
 
 
-def test_reject_when_thread_only_has_daiv(monkeypatch_dependencies, stub_client):
+async def test_reject_when_thread_only_has_daiv(monkeypatch_dependencies, stub_client):
     """Test that callback is rejected when discussion thread has only DAIV-authored notes."""
     callback = create_note_callback("This looks good to me")
 
@@ -131,10 +134,10 @@ def test_reject_when_thread_only_has_daiv(monkeypatch_dependencies, stub_client)
 
     stub_client.set_discussion(discussion)
 
-    assert callback.accept_callback() is False
+    assert await callback.accept_callback() is False
 
 
-def test_reject_unmentioned_and_no_daiv_thread(monkeypatch_dependencies, stub_client):
+async def test_reject_unmentioned_and_no_daiv_thread(monkeypatch_dependencies, stub_client):
     """Test that callback is rejected when no mention and discussion has no DAIV notes."""
     callback = create_note_callback("This looks good to me")
 
@@ -163,19 +166,19 @@ def test_reject_unmentioned_and_no_daiv_thread(monkeypatch_dependencies, stub_cl
 
     stub_client.set_discussion(discussion)
 
-    assert callback.accept_callback() is False
+    assert await callback.accept_callback() is False
 
 
-def test_reject_when_bare_daiv_mention(monkeypatch_dependencies, stub_client):
+async def test_reject_when_bare_daiv_mention(monkeypatch_dependencies, stub_client):
     """Test that callback is rejected when note body contains bare DAIV reference."""
     callback = create_note_callback("DAIV please fix this issue")
 
     stub_client.set_discussion(Discussion(id="discussion_1", notes=[]))
 
-    assert callback.accept_callback() is False
+    assert await callback.accept_callback() is False
 
 
-def test_reject_when_note_by_daiv_itself(monkeypatch_dependencies, stub_client):
+async def test_reject_when_note_by_daiv_itself(monkeypatch_dependencies, stub_client):
     """Test that callback is rejected when the note is created by DAIV itself."""
     callback = NoteCallback(
         object_kind="note",
@@ -202,10 +205,10 @@ def test_reject_when_note_by_daiv_itself(monkeypatch_dependencies, stub_client):
         ),
     )
 
-    assert callback.accept_callback() is False
+    assert await callback.accept_callback() is False
 
 
-def test_reject_when_system_note(monkeypatch_dependencies, stub_client):
+async def test_reject_when_system_note(monkeypatch_dependencies, stub_client):
     """Test that callback is rejected when note is a system note."""
     callback = NoteCallback(
         object_kind="note",
@@ -232,7 +235,7 @@ def test_reject_when_system_note(monkeypatch_dependencies, stub_client):
         ),
     )
 
-    assert callback.accept_callback() is False
+    assert await callback.accept_callback() is False
 
 
 def create_issue_callback(
@@ -265,12 +268,12 @@ def create_issue_callback(
 class TestIssueCallback:
     """Tests for GitLab IssueCallback."""
 
-    def test_accept_callback_opened_with_daiv_label(self, monkeypatch_dependencies):
+    async def test_accept_callback_opened_with_daiv_label(self, monkeypatch_dependencies):
         """Test that callback is accepted when issue is opened with a DAIV label."""
         callback = create_issue_callback(action=IssueAction.OPEN, issue_labels=[Label(title="daiv")])
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_accept_callback_update_with_daiv_label_added(self, monkeypatch_dependencies):
+    async def test_accept_callback_update_with_daiv_label_added(self, monkeypatch_dependencies):
         """Test that callback is accepted when a DAIV label is added in an update."""
         changes = IssueChanges(
             labels=LabelChange(previous=[Label(title="bug")], current=[Label(title="bug"), Label(title="daiv")])
@@ -278,56 +281,56 @@ class TestIssueCallback:
         callback = create_issue_callback(
             action=IssueAction.UPDATE, issue_labels=[Label(title="bug"), Label(title="daiv")], changes=changes
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_accept_callback_update_with_daiv_auto_label_added(self, monkeypatch_dependencies):
+    async def test_accept_callback_update_with_daiv_auto_label_added(self, monkeypatch_dependencies):
         """Test that callback is accepted when daiv-auto label is added."""
         changes = IssueChanges(labels=LabelChange(previous=[], current=[Label(title="daiv-auto")]))
         callback = create_issue_callback(
             action=IssueAction.UPDATE, issue_labels=[Label(title="daiv-auto")], changes=changes
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_accept_callback_update_with_daiv_max_label_added(self, monkeypatch_dependencies):
+    async def test_accept_callback_update_with_daiv_max_label_added(self, monkeypatch_dependencies):
         """Test that callback is accepted when daiv-max label is added."""
         changes = IssueChanges(labels=LabelChange(previous=[], current=[Label(title="daiv-max")]))
         callback = create_issue_callback(
             action=IssueAction.UPDATE, issue_labels=[Label(title="daiv-max")], changes=changes
         )
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_reject_callback_update_with_non_daiv_label_added(self, monkeypatch_dependencies):
+    async def test_reject_callback_update_with_non_daiv_label_added(self, monkeypatch_dependencies):
         """Test that callback is rejected when a non-DAIV label is added."""
         changes = IssueChanges(labels=LabelChange(previous=[], current=[Label(title="bug")]))
         callback = create_issue_callback(action=IssueAction.UPDATE, issue_labels=[Label(title="bug")], changes=changes)
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_update_with_daiv_label_removed(self, monkeypatch_dependencies):
+    async def test_reject_callback_update_with_daiv_label_removed(self, monkeypatch_dependencies):
         """Test that callback is rejected when a DAIV label is removed."""
         changes = IssueChanges(
             labels=LabelChange(previous=[Label(title="daiv"), Label(title="bug")], current=[Label(title="bug")])
         )
         callback = create_issue_callback(action=IssueAction.UPDATE, issue_labels=[Label(title="bug")], changes=changes)
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_update_without_label_changes(self, monkeypatch_dependencies):
+    async def test_reject_callback_update_without_label_changes(self, monkeypatch_dependencies):
         """Test that callback is rejected when update doesn't include label changes."""
         callback = create_issue_callback(action=IssueAction.UPDATE, issue_labels=[Label(title="daiv")], changes=None)
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_when_already_reacted(self, monkeypatch_dependencies, stub_client):
+    async def test_reject_callback_when_already_reacted(self, monkeypatch_dependencies, stub_client):
         """Test that callback is rejected when DAIV has already reacted to the issue."""
         stub_client.set_has_reaction(True)
 
         callback = create_issue_callback(action=IssueAction.OPEN, issue_labels=[Label(title="daiv")])
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_closed_issue(self, monkeypatch_dependencies):
+    async def test_reject_callback_closed_issue(self, monkeypatch_dependencies):
         """Test that callback is rejected for closed issues."""
         callback = create_issue_callback(
             action=IssueAction.OPEN, issue_labels=[Label(title="daiv")], issue_state="closed"
         )
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
     def test_reject_callback_work_item(self, monkeypatch_dependencies):
         """Test that callback is rejected for work items."""
@@ -348,57 +351,57 @@ class TestIssueCallback:
             ),
         )
 
-    def test_label_check_case_insensitive(self, monkeypatch_dependencies):
+    async def test_label_check_case_insensitive(self, monkeypatch_dependencies):
         """Test that label checking is case-insensitive."""
         changes = IssueChanges(labels=LabelChange(previous=[], current=[Label(title="DAIV")]))
         callback = create_issue_callback(action=IssueAction.UPDATE, issue_labels=[Label(title="DAIV")], changes=changes)
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_reject_callback_user_not_in_allowlist(self, monkeypatch_dependencies, repo_config):
+    async def test_reject_callback_user_not_in_allowlist(self, monkeypatch_dependencies, repo_config):
         """Test that callback is rejected when user is not in the allowed usernames list."""
         repo_config.allowed_usernames = ("alice", "bob")
 
         callback = create_issue_callback(
             action=IssueAction.OPEN, issue_labels=[Label(title="daiv")], username="mallory"
         )
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_accept_callback_user_in_allowlist(self, monkeypatch_dependencies, repo_config):
+    async def test_accept_callback_user_in_allowlist(self, monkeypatch_dependencies, repo_config):
         """Test that callback is accepted when user is in the allowed usernames list."""
         repo_config.allowed_usernames = ("alice", "bob")
 
         callback = create_issue_callback(action=IssueAction.OPEN, issue_labels=[Label(title="daiv")], username="alice")
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_accept_callback_empty_allowlist(self, monkeypatch_dependencies):
+    async def test_accept_callback_empty_allowlist(self, monkeypatch_dependencies):
         """Test that callback is accepted when allowlist is empty (all users allowed)."""
         callback = create_issue_callback(action=IssueAction.OPEN, issue_labels=[Label(title="daiv")])
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_allowlist_case_insensitive(self, monkeypatch_dependencies, repo_config):
+    async def test_allowlist_case_insensitive(self, monkeypatch_dependencies, repo_config):
         """Test that allowlist check is case-insensitive."""
         repo_config.allowed_usernames = ("Alice",)
 
         callback = create_issue_callback(action=IssueAction.OPEN, issue_labels=[Label(title="daiv")], username="alice")
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
 
 class TestNoteCallbackAllowlist:
     """Tests for GitLab NoteCallback allowlist."""
 
-    def test_reject_note_user_not_in_allowlist(self, monkeypatch_dependencies, repo_config):
+    async def test_reject_note_user_not_in_allowlist(self, monkeypatch_dependencies, repo_config):
         """Test that note callback is rejected when user is not in the allowed usernames list."""
         repo_config.allowed_usernames = ("alice",)
 
         callback = create_note_callback("@daiv please review this code", username="mallory")
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_accept_note_user_in_allowlist(self, monkeypatch_dependencies, repo_config):
+    async def test_accept_note_user_in_allowlist(self, monkeypatch_dependencies, repo_config):
         """Test that note callback is accepted when user is in the allowed usernames list."""
         repo_config.allowed_usernames = ("reviewer",)
 
         callback = create_note_callback("@daiv please review this code")
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
 
 def create_merge_request_callback(
@@ -426,35 +429,35 @@ def create_merge_request_callback(
 class TestMergeRequestCallback:
     """Tests for GitLab MergeRequestCallback."""
 
-    def test_accept_callback_on_merge(self):
+    async def test_accept_callback_on_merge(self):
         """Test that callback is accepted when MR is merged."""
         callback = create_merge_request_callback()
-        assert callback.accept_callback() is True
+        assert await callback.accept_callback() is True
 
-    def test_reject_callback_on_open(self):
+    async def test_reject_callback_on_open(self):
         """Test that callback is rejected when MR is opened."""
         callback = create_merge_request_callback(action=MergeRequestAction.OPEN, state="opened")
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_on_close(self):
+    async def test_reject_callback_on_close(self):
         """Test that callback is rejected when MR is closed."""
         callback = create_merge_request_callback(action=MergeRequestAction.CLOSE, state="closed")
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_on_update(self):
+    async def test_reject_callback_on_update(self):
         """Test that callback is rejected when MR is updated."""
         callback = create_merge_request_callback(action=MergeRequestAction.UPDATE, state="opened")
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_when_state_not_merged(self):
+    async def test_reject_callback_when_state_not_merged(self):
         """Test that callback is rejected when action is merge but state is not merged."""
         callback = create_merge_request_callback(action=MergeRequestAction.MERGE, state="opened")
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
-    def test_reject_callback_when_target_not_default_branch(self):
+    async def test_reject_callback_when_target_not_default_branch(self):
         """Test that callback is rejected when MR targets a non-default branch."""
         callback = create_merge_request_callback(target_branch="develop")
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
     async def test_process_callback_enqueues_task(self):
         """Test that process_callback enqueues the merge metrics task with correct args."""
@@ -475,7 +478,7 @@ class TestMergeRequestCallback:
             platform="gitlab",
         )
 
-    def test_reject_callback_when_default_branch_is_none(self):
+    async def test_reject_callback_when_default_branch_is_none(self):
         """Test that callback is rejected when project has no default branch."""
         callback = MergeRequestCallback(
             object_kind="merge_request",
@@ -492,7 +495,7 @@ class TestMergeRequestCallback:
                 author_id=2,
             ),
         )
-        assert callback.accept_callback() is False
+        assert await callback.accept_callback() is False
 
     async def test_process_callback_coalesces_none_merged_at(self):
         """Test that process_callback passes empty string when merged_at is None."""
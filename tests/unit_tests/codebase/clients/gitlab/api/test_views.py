@@ -1,10 +1,13 @@
 from unittest.mock import patch
 
+from django.db import DatabaseError
+
 import pytest
 from ninja.testing import TestAsyncClient
 
 from codebase.clients.gitlab.api.callbacks import PushCallback
 from codebase.clients.gitlab.api.models import Project
+from codebase.models import WebhookDelivery
 from daiv.api import api
 
 
@@ -20,6 +23,7 @@ def mock_push_callback():
     ).model_dump()
 
 
+@pytest.mark.django_db(transaction=True)
 async def test_gitlab_callback_valid_token(client: TestAsyncClient, mock_push_callback):
     """Test GitLab callback with valid token."""
     # Execute
@@ -35,6 +39,9 @@ async def test_gitlab_callback_valid_token(client: TestAsyncClient, mock_push_ca
     assert response.status_code == 204
     accept_callback.assert_called_once()
     process_callback.assert_called_once()
+    delivery = await WebhookDelivery.objects.aget()
+    assert delivery.status == WebhookDelivery.Status.PROCESSED
+    assert delivery.payload == mock_push_callback
 
 
 async def test_gitlab_callback_invalid_token(client: TestAsyncClient, mock_push_callback):
@@ -56,6 +63,7 @@ async def test_gitlab_callback_invalid_token(client: TestAsyncClient, mock_push_
     process_callback.assert_not_called()
 
 
+@pytest.mark.django_db(transaction=True)
 async def test_gitlab_callback_not_accepted(client: TestAsyncClient, mock_push_callback, mock_settings):
     """
     Test GitLab callback with not accepted webhook.
@@ -73,3 +81,30 @@ async def test_gitlab_callback_not_accepted(client: TestAsyncClient, mock_push_c
     assert response.status_code == 204
     accept_callback.assert_called_once()
     process_callback.assert_not_called()
+
+
+async def test_gitlab_callback_unrecorded_is_retried(client: TestAsyncClient, mock_push_callback):
+    """
+    Test GitLab callback that cannot be recorded asks GitLab to retry it.
+    """
+    with patch("codebase.webhooks.WebhookDelivery.objects.acreate", side_effect=DatabaseError("down")):
+        response = await client.post(
+            "/codebase/callbacks/gitlab/", json=mock_push_callback, headers={"X-Gitlab-Token": "test_secret"}
+        )
+
+    assert response.status_code == 503
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_gitlab_callback_unhandled_kind_is_not_recorded(client: TestAsyncClient, mock_push_callback):
+    """
+    Test GitLab callback for an event kind without a callback is acknowledged without a record.
+    """
+    response = await client.post(
+        "/codebase/callbacks/gitlab/",
+        json={**mock_push_callback, "object_kind": "pipeline"},
+        headers={"X-Gitlab-Token": "test_secret"},
+    )
+
+    assert response.status_code == 204
+    assert not await WebhookDelivery.objects.aexists()
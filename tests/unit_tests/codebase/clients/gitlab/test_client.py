@@ -896,6 +896,23 @@ class TestGitLabClient:
 
         assert [r.slug for r in gitlab_client.list_repositories(limit=limit)] == expected
 
+    def test_iter_repository_pages_chunks_and_dedupes_across_pages(self, gitlab_client):
+        gitlab_client.client.projects.list.return_value = iter([_gl_project(s) for s in ["g/a", "g/b", "g/a", "g/c"]])
+
+        pages = gitlab_client.iter_repository_pages(page_size=2)
+
+        assert [[r.slug for r in page] for page in pages] == [["g/a", "g/b"], ["g/c"]]
+        assert gitlab_client.client.projects.list.call_args.kwargs["per_page"] == 2
+
+    def test_iter_repository_pages_walks_a_stable_keyset_order(self, gitlab_client):
+        """The access sync prunes what the walk misses, so it must not page over last_activity_at."""
+        gitlab_client.client.projects.list.return_value = iter([])
+
+        list(gitlab_client.iter_repository_pages())
+
+        kwargs = gitlab_client.client.projects.list.call_args.kwargs
+        assert (kwargs["order_by"], kwargs["sort"], kwargs["pagination"]) == ("id", "asc", "keyset")
+
     def test_list_branches_passes_search_and_per_page(self, gitlab_client):
         """`list_branches` forwards `search` and caps `per_page` at `limit`."""
         mock_project = Mock()
@@ -0,0 +1,310 @@
+"""The async platform API clients, exercised against a local fake GitLab/GitHub HTTP server."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from codebase.base import User
+from codebase.clients.aio import AsyncAPIClient, _pooled_client, aclose_pooled_client, retry_delay
+from codebase.clients.base import Emoji
+from codebase.clients.github.client import GitHubClient
+from codebase.clients.gitlab.client import GitLabClient
+
+
+class FakePlatform:
+    """A threaded HTTP server answering scripted responses per ``(method, path)``.
+
+    A route holds a list of ``(status, body, headers)``; each request pops the first one, and the
+    last is repeated once the list is down to it. Requests are recorded for assertions.
+    """
+
+    def __init__(self):
+        self.routes: dict[tuple[str, str], list[tuple[int, object, dict[str, str]]]] = {}
+        self.requests: list[dict] = []
+        platform = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                path, _, query = self.path.partition("?")
+                platform.requests.append({
+                    "method": self.command,
+                    "path": path,
+                    "query": query,
+                    "headers": dict(self.headers),
+                    "json": json.loads(body) if body else None,
+                })
+                replies = platform.routes.get((self.command, path))
+                if not replies:
+                    status, payload, headers = 404, {"message": "404 Not Found"}, {}
+                else:
+                    status, payload, headers = replies.pop(0) if len(replies) > 1 else replies[0]
+                encoded = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(encoded)))
+                for name, value in headers.items():
+                    self.send_header(name, value.replace("{base}", platform.url))
+                self.end_headers()
+                self.wfile.write(encoded)
+
+            def do_GET(self):  # noqa: N802
+                self._serve()
+
+            def do_POST(self):  # noqa: N802
+                self._serve()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+
+    def route(self, method: str, path: str, *replies: tuple[int, object] | tuple[int, object, dict[str, str]]):
+        self.routes[(method, path)] = [(*reply, {}) if len(reply) == 2 else reply for reply in replies]
+
+
+@pytest.fixture
+def fake_platform():
+    platform = FakePlatform()
+    platform.thread.start()
+    yield platform
+    platform.server.shutdown()
+    platform.server.server_close()
+
+
+@pytest.fixture
+async def pooled_client():
+    """Close the test loop's shared client on teardown, as a long-lived loop never would."""
+    yield
+    await aclose_pooled_client()
+
+
+def _gitlab_note(note_id: int, body: str) -> dict:
+    return {
+        "id": note_id,
+        "body": body,
+        "type": None,
+        "noteable_type": "MergeRequest",
+        "system": False,
+        "resolvable": False,
+        "author": {"id": 10, "username": "alice", "name": "Alice"},
+    }
+
+
+@pytest.fixture
+def gitlab_client(fake_platform):
+    client = GitLabClient(auth_token="gl-token", url=fake_platform.url)  # noqa: S106
+    client.__dict__["current_user"] = User(id=1, username="daiv", name="DAIV")
+    return client
+
+
+@pytest.fixture
+def github_client(fake_platform):
+    integration = Mock()
+    github = integration.get_app_installation.return_value.get_github_for_installation.return_value
+    github.requester.base_url = fake_platform.url
+    github.requester.auth.token = "gh-token"  # noqa: S105
+    client = GitHubClient(integration=integration, installation_id=1)
+    client.__dict__["current_user"] = User(id=1, username="daiv", name="DAIV")
+    return client
+
+
+@pytest.mark.usefixtures("pooled_client")
+class TestGitLab:
+    async def test_get_merge_request_comment_encodes_the_project_path(self, fake_platform, gitlab_client):
+        fake_platform.route(
+            "GET",
+            "/api/v4/projects/group%2Frepo/merge_requests/5/discussions/abc",
+            (200, {"id": "abc", "notes": [_gitlab_note(7, "@daiv fix it")]}),
+        )
+
+        discussion = await gitlab_client.aget_merge_request_comment("group/repo", 5, "abc")
+
+        assert discussion.id == "abc"
+        assert discussion.notes[0].body == "@daiv fix it"
+        assert discussion.notes[0].author.username == "alice"
+        assert fake_platform.requests[0]["headers"]["PRIVATE-TOKEN"] == "gl-token"
+
+    async def test_has_issue_reaction_follows_pagination(self, fake_platform, gitlab_client):
+        path = "/api/v4/projects/group%2Frepo/issues/3/award_emoji"
+        fake_platform.route(
+            "GET",
+            path,
+            (
+                200,
+                [{"name": "eyes", "user": {"id": 99}}],
+                {"Link": '<{base}/api/v4/projects/group%2Frepo/issues/3/award_emoji?page=2&per_page=100>; rel="next"'},
+            ),
+            (200, [{"name": "eyes", "user": {"id": 1}}]),
+        )
+
+        assert await gitlab_client.ahas_issue_reaction("group/repo", 3, Emoji.EYES) is True
+        assert [r["query"] for r in fake_platform.requests] == ["per_page=100", "page=2&per_page=100"]
+
+    async def test_award_already_taken_is_a_success(self, fake_platform, gitlab_client):
+        fake_platform.route(
+            "POST",
+            "/api/v4/projects/group%2Frepo/merge_requests/5/notes/7/award_emoji",
+            (404, {"message": "404 Award Emoji Name has already been taken"}),
+        )
+
+        await gitlab_client.acreate_merge_request_note_emoji("group/repo", 5, Emoji.EYES, 7)
+
+        assert fake_platform.requests[0]["json"] == {"name": "eyes"}
+
+    async def test_other_not_found_errors_propagate(self, fake_platform, gitlab_client):
+        with pytest.raises(httpx.HTTPStatusError):
+            await gitlab_client.acreate_issue_emoji("group/repo", 3, Emoji.EYES, note_id=8)
+
+    async def test_rate_limited_request_is_retried_after_the_advertised_delay(self, fake_platform, gitlab_client):
+        fake_platform.route(
+            "GET",
+            "/api/v4/projects/group%2Frepo/issues/3/discussions/d1",
+            (429, {"message": "Too Many Requests"}, {"Retry-After": "0"}),
+            (200, {"id": "d1", "notes": [_gitlab_note(7, "hello")]}),
+        )
+
+        discussion = await gitlab_client.aget_issue_comment("group/repo", 3, "d1")
+
+        assert discussion.notes[0].body == "hello"
+        assert len(fake_platform.requests) == 2
+
+    async def test_get_merge_request_by_branches_picks_the_oldest_open_match(self, fake_platform, gitlab_client):
+        merge_request = {
+            "iid": 5,
+            "source_branch": "feat-x",
+            "target_branch": "main",
+            "title": "Feature X",
+            "description": None,
+            "labels": ["daiv"],
+            "web_url": "https://gitlab.test/group/repo/-/merge_requests/5",
+            "sha": "abc",
+            "author": {"id": 10, "username": "alice", "name": "Alice"},
+            "draft": True,
+        }
+        fake_platform.route(
+            "GET", "/api/v4/projects/group%2Frepo/merge_requests", (200, [merge_request, {**merge_request, "iid": 6}])
+        )
+
+        result = await gitlab_client.aget_merge_request_by_branches("group/repo", "feat-x")
+
+        assert result.merge_request_id == 5
+        assert result.description == ""
+        assert result.draft is True
+        assert "source_branch=feat-x" in fake_platform.requests[0]["query"]
+        assert "state=opened" in fake_platform.requests[0]["query"]
+
+    async def test_get_merge_request_by_branches_returns_none_when_empty(self, fake_platform, gitlab_client):
+        fake_platform.route("GET", "/api/v4/projects/group%2Frepo/merge_requests", (200, []))
+
+        assert await gitlab_client.aget_merge_request_by_branches("group/repo", "feat-x") is None
+
+
+@pytest.mark.usefixtures("pooled_client")
+class TestGitHub:
+    async def test_get_merge_request_comment_fetches_the_comment_directly(self, fake_platform, github_client):
+        fake_platform.route(
+            "GET",
+            "/repos/owner/repo/issues/comments/300",
+            (200, {"id": 300, "body": "@daiv review", "user": {"id": 10, "login": "alice"}}),
+        )
+
+        discussion = await github_client.aget_merge_request_comment("owner/repo", 99, "300")
+
+        assert discussion.id == "300"
+        assert discussion.notes[0].author.username == "alice"
+        assert fake_platform.requests[0]["headers"]["Authorization"] == "Bearer gh-token"
+
+    async def test_create_issue_emoji_reacts_on_the_comment(self, fake_platform, github_client):
+        fake_platform.route(
+            "POST", "/repos/owner/repo/issues/comments/301/reactions", (200, {"id": 1, "content": "eyes"})
+        )
+
+        await github_client.acreate_issue_emoji("owner/repo", 7, Emoji.EYES, note_id=301)
+
+        assert fake_platform.requests[0]["json"] == {"content": "eyes"}
+
+    async def test_has_issue_reaction_filters_server_side(self, fake_platform, github_client):
+        fake_platform.route("GET", "/repos/owner/repo/issues/7/reactions", (200, [{"user": {"id": 42}}]))
+
+        assert await github_client.ahas_issue_reaction("owner/repo", 7, Emoji.EYES) is False
+        assert "content=eyes" in fake_platform.requests[0]["query"]
+
+    async def test_get_merge_request_by_branches_skips_mismatched_head(self, fake_platform, github_client):
+        def pull(number: int, ref: str) -> dict:
+            return {
+                "number": number,
+                "head": {"ref": ref, "sha": "abc"},
+                "base": {"ref": "main"},
+                "title": "Feature X",
+                "body": None,
+                "labels": [{"name": "daiv"}],
+                "html_url": f"https://github.test/owner/repo/pull/{number}",
+                "user": {"id": 10, "login": "alice"},
+                "draft": False,
+            }
+
+        fake_platform.route("GET", "/repos/owner/repo/pulls", (200, [pull(3, "feat-x-old"), pull(4, "feat-x")]))
+
+        result = await github_client.aget_merge_request_by_branches("owner/repo", "feat-x")
+
+        assert result.merge_request_id == 4
+        assert result.labels == ["daiv"]
+        assert result.author.username == "alice"
+        assert "head=owner%3Afeat-x" in fake_platform.requests[0]["query"]
+
+
+@pytest.mark.usefixtures("pooled_client")
+class TestAsyncAPIClient:
+    async def test_clients_on_one_loop_share_the_connection_pool(self, fake_platform):
+        fake_platform.route("GET", "/ping", (200, {}))
+        first = AsyncAPIClient(fake_platform.url, dict)
+        second = AsyncAPIClient(fake_platform.url, dict)
+
+        await first.get("ping")
+        await second.get("ping")
+
+        assert _pooled_client() is _pooled_client()
+        assert len(fake_platform.requests) == 2
+
+    async def test_transient_error_on_post_is_not_retried(self, fake_platform):
+        fake_platform.route("POST", "/notes", (502, {}), (201, {"id": 1}))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await AsyncAPIClient(fake_platform.url, dict).post("notes", json={"body": "x"})
+        assert len(fake_platform.requests) == 1
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status, headers=headers, request=httpx.Request("GET", "https://gitlab.test/api/v4"))
+
+
+class TestRetryDelay:
+    def test_success_and_client_errors_are_not_retried(self):
+        assert retry_delay(_response(200), "GET", 0) is None
+        assert retry_delay(_response(404), "GET", 0) is None
+
+    def test_retry_after_wins_and_is_capped(self):
+        assert retry_delay(_response(429, {"Retry-After": "3"}), "POST", 0) == 3.0
+        assert retry_delay(_response(429, {"Retry-After": "3600"}), "GET", 0) == 30.0
+
+    def test_exhausted_github_quota_waits_for_the_reset(self, monkeypatch):
+        monkeypatch.setattr("codebase.clients.aio.time.time", lambda: 1000.0)
+        response = _response(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1004"})
+        assert retry_delay(response, "GET", 0) == 4.0
+
+    def test_plain_forbidden_is_not_a_rate_limit(self):
+        assert retry_delay(_response(403), "GET", 0) is None
+
+    def test_transient_errors_back_off_exponentially_on_idempotent_methods(self):
+        assert [retry_delay(_response(503), "GET", attempt) for attempt in range(3)] == [0.5, 1.0, 2.0]
+        assert retry_delay(_response(503), "POST", 0) is None
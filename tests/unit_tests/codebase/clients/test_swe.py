@@ -202,6 +202,59 @@ class TestSWERepoClient:
             assert not (Path(repo.git_dir) / "logs").exists()
             assert "the very issue under evaluation" not in repo.git.log("--all", "--oneline")
 
+    def test_load_repo_reuses_cached_clone_per_commit(self, tmp_path):
+        origin = Repo.init(tmp_path / "origin", initial_branch="main")
+        with origin.config_writer() as cw:
+            cw.set_value("user", "name", "Test").set_value("user", "email", "test@example.com")
+        (Path(origin.working_dir) / "file.txt").write_text("base")
+        origin.index.add(["file.txt"])
+        base_commit = origin.index.commit("base commit")
+        (Path(origin.working_dir) / "file.txt").write_text("the future fix")
+        origin.index.add(["file.txt"])
+        origin.index.commit("fix: the very issue under evaluation")
+
+        swe_client = SWERepoClient("github.com", clone_cache_dir=tmp_path / "cache")
+        repository = swe_client.get_repository("psf/requests")
+        repository = repository.model_copy(update={"clone_url": str(tmp_path / "origin")})
+
+        with patch("codebase.clients.swe.Repo.clone_from", wraps=Repo.clone_from) as clone_from:
+            with swe_client.load_repo(repository, base_commit.hexsha) as first:
+                (Path(first.working_dir) / "file.txt").write_text("the agent's edit")
+            with swe_client.load_repo(repository, base_commit.hexsha) as second:
+                assert second.working_dir != first.working_dir
+                assert (Path(second.working_dir) / "file.txt").read_text() == "base"
+                assert second.head.commit.hexsha == base_commit.hexsha
+                assert list(second.remotes) == []
+                assert "the very issue under evaluation" not in second.git.log("--all", "--oneline")
+                assert not second.is_dirty()
+
+        # One fetch from the remote and one checkout of the commit, however many loads.
+        assert [call.args[0] for call in clone_from.call_args_list] == [
+            str(tmp_path / "origin"),
+            str(tmp_path / "cache" / "psf_requests.git"),
+        ]
+
+    def test_load_repo_copies_working_tree_objects_directories(self, tmp_path):
+        """Only the prepared clone's git objects are hardlinked: a tracked ``objects/`` directory in
+        the working tree is copied, so an agent's edit there cannot reach the cached clone."""
+        origin = Repo.init(tmp_path / "origin", initial_branch="main")
+        with origin.config_writer() as cw:
+            cw.set_value("user", "name", "Test").set_value("user", "email", "test@example.com")
+        (Path(origin.working_dir) / "objects").mkdir()
+        (Path(origin.working_dir) / "objects" / "model.py").write_text("base")
+        origin.index.add(["objects/model.py"])
+        base_commit = origin.index.commit("base commit")
+
+        swe_client = SWERepoClient("github.com", clone_cache_dir=tmp_path / "cache")
+        repository = swe_client.get_repository("psf/requests")
+        repository = repository.model_copy(update={"clone_url": str(tmp_path / "origin")})
+
+        with swe_client.load_repo(repository, base_commit.hexsha) as first:
+            (Path(first.working_dir) / "objects" / "model.py").write_text("the agent's edit")
+        with swe_client.load_repo(repository, base_commit.hexsha) as second:
+            assert (Path(second.working_dir) / "objects" / "model.py").read_text() == "base"
+            assert not second.is_dirty()
+
     def test_current_user(self, swe_client):
         """Test current_user property."""
         user = swe_client.current_user
@@ -67,8 +67,10 @@ def _failing_agent() -> MagicMock:
 
 class TestReviewNotePostedOnce:
     async def test_agent_failure_posts_single_note(self, captured_client):
-        captured_client.get_merge_request_comment.return_value = SimpleNamespace(
-            notes=[SimpleNamespace(author=SimpleNamespace(username="bob"), id="n1", body="hi")]
+        captured_client.aget_merge_request_comment = AsyncMock(
+            return_value=SimpleNamespace(
+                notes=[SimpleNamespace(author=SimpleNamespace(username="bob"), id="n1", body="hi")]
+            )
         )
         merge_request = MergeRequest(
             repo_id="owner/repo",
@@ -9,10 +9,13 @@ from allauth.socialaccount.models import SocialAccount
 
 from codebase.authorization import (
     RepositoryAccessDenied,
+    all_viewable_repo_ids,
     assert_can_run,
     can_run,
     can_view,
     get_access_level,
+    invalidate_repository_visibility,
+    repository_visibility,
     search_viewable_repositories,
     viewable_repo_ids,
     viewable_repo_ids_subquery,
@@ -280,24 +283,81 @@ class TestSearchViewableRepositories:
         assert [r.slug for r in result] == ["a/r0", "a/r1", "a/r2"]
 
 
-class TestViewableRepoIdsSubquery:
+class TestAllViewableRepoIds:
     def test_returns_fresh_read_and_write_repos(self, linked_member, fresh_sync):
 
         _grant("101", "a/read", RepoAccessLevel.READ)
         _grant("101", "a/write", RepoAccessLevel.WRITE)
-        assert set(viewable_repo_ids_subquery(linked_member)) == {"a/read", "a/write"}
+        assert set(all_viewable_repo_ids(linked_member)) == {"a/read", "a/write"}
 
     def test_excludes_stale_rows(self, linked_member, fresh_sync):
 
         _grant("101", "a/fresh", RepoAccessLevel.READ)
         _grant("101", "a/stale", RepoAccessLevel.READ, synced_at=timezone.now() - timedelta(hours=25))
-        assert set(viewable_repo_ids_subquery(linked_member)) == {"a/fresh"}
+        assert set(all_viewable_repo_ids(linked_member)) == {"a/fresh"}
 
     def test_unlinked_member_returns_empty(self, member_user, fresh_sync):
 
+        assert list(all_viewable_repo_ids(member_user)) == []
+
+
+class TestViewableRepoIdsSubquery:
+    def test_filters_in_sql_without_materializing_the_ids(self, linked_member, fresh_sync):
+        from sessions.models import Session, SessionOrigin
+
+        _grant("101", "a/fresh", RepoAccessLevel.READ)
+        _grant("101", "a/stale", RepoAccessLevel.READ, synced_at=timezone.now() - timedelta(hours=25))
+        Session.objects.create(thread_id="t-fresh", origin=SessionOrigin.API_JOB, repo_id="a/fresh")
+        Session.objects.create(thread_id="t-stale", origin=SessionOrigin.API_JOB, repo_id="a/stale")
+
+        visible = Session.objects.visible_to(linked_member)
+
+        assert "codebase_repositoryaccess" in str(visible.query)
+        assert list(visible.values_list("repo_id", flat=True)) == ["a/fresh"]
+
+    def test_unlinked_member_matches_nothing(self, member_user, fresh_sync):
+        _grant("101", "a/b", RepoAccessLevel.READ)
+
         assert list(viewable_repo_ids_subquery(member_user)) == []
 
 
+class TestRepositoryVisibility:
+    def test_resolved_once_per_request(self, linked_member, fresh_sync, django_assert_num_queries):
+        _grant("101", "a/b", RepoAccessLevel.WRITE)
+        can_view(linked_member, "a/b")
+
+        with django_assert_num_queries(0):
+            assert can_run(linked_member, "a/b") is True
+            assert viewable_repo_ids(linked_member, ["a/b", "c/d"]) == {"a/b"}
+
+    def test_cached_across_requests_until_the_sync_invalidates(self, linked_member, fresh_sync):
+        _grant("101", "a/b", RepoAccessLevel.READ)
+        assert can_run(linked_member, "a/b") is False
+
+        RepositoryAccess.objects.filter(repo_id="a/b").update(access_level=RepoAccessLevel.WRITE)
+        fresh_request_user = type(linked_member).objects.get(pk=linked_member.pk)
+        assert can_run(fresh_request_user, "a/b") is False  # served from the cached snapshot
+
+        invalidate_repository_visibility()
+        fresh_request_user = type(linked_member).objects.get(pk=linked_member.pk)
+        assert can_run(fresh_request_user, "a/b") is True
+
+    def test_linking_an_account_drops_the_cached_snapshot(self, member_user, fresh_sync):
+        _grant("101", "a/b", RepoAccessLevel.READ)
+        assert can_view(member_user, "a/b") is False
+
+        SocialAccount.objects.create(user=member_user, provider="gitlab", uid="101")
+
+        assert can_view(type(member_user).objects.get(pk=member_user.pk), "a/b") is True
+
+    def test_snapshot_expires_with_its_oldest_row(self, linked_member, fresh_sync):
+        _grant("101", "a/b", RepoAccessLevel.READ, synced_at=timezone.now() - timedelta(hours=23, minutes=59))
+
+        visibility = repository_visibility(linked_member)
+
+        assert visibility.expires_at <= (timezone.now() + timedelta(minutes=1)).timestamp()
+
+
 class TestCanRun:
     def test_write_row_can_run(self, linked_member, fresh_sync):
 
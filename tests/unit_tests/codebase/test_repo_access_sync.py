@@ -33,7 +33,7 @@ def _row(repo_id: str, uid: str, level=RepoAccessLevel.READ) -> RepositoryAccess
 @pytest.mark.django_db
 class TestSyncRepositoryAccess:
     def test_mirrors_members_and_marks_success(self, mock_repo_client):
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.WRITE),
             RepoMember(uid="2", username="bob", access_level=RepoAccessLevel.READ),
@@ -52,7 +52,7 @@ class TestSyncRepositoryAccess:
     def test_replaces_previous_rows_and_prunes_vanished_repos(self, mock_repo_client):
         _row("a/b", "99")
         _row("old/gone", "1")
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.READ)
         ]
@@ -65,7 +65,7 @@ class TestSyncRepositoryAccess:
 
     def test_per_repo_failure_keeps_previous_rows_and_marks_failed(self, mock_repo_client):
         _row("a/b", "7", RepoAccessLevel.WRITE)
-        mock_repo_client.list_repositories.return_value = [_repo("a/b"), _repo("c/d")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b"), _repo("c/d")]]
         mock_repo_client.list_repository_members.side_effect = [
             Exception("boom"),
             [RepoMember(uid="8", username="carol", access_level=RepoAccessLevel.READ)],
@@ -81,7 +81,7 @@ class TestSyncRepositoryAccess:
 
     def test_listing_failure_marks_failed_and_keeps_rows(self, mock_repo_client):
         _row("a/b", "7")
-        mock_repo_client.list_repositories.side_effect = Exception("api down")
+        mock_repo_client.iter_repository_pages.side_effect = Exception("api down")
 
         sync_repository_access_cron_task.func()
 
@@ -89,13 +89,47 @@ class TestSyncRepositoryAccess:
         state = RepositoryAccessSyncState.objects.get(pk=RepositoryAccessSyncState.SINGLETON_PK)
         assert state.status == RepositoryAccessSyncState.Status.FAILED
 
+    def test_streams_pages_and_prunes_against_every_page_seen(self, mock_repo_client):
+        _row("a/b", "7")
+        _row("old/gone", "1")
+        mock_repo_client.iter_repository_pages.return_value = iter([[_repo("a/b")], [_repo("c/d"), _repo("e/f")]])
+        mock_repo_client.list_repository_members.return_value = [
+            RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.READ)
+        ]
+
+        sync_repository_access_cron_task.func()
+
+        assert set(RepositoryAccess.objects.values_list("repo_id", flat=True)) == {"a/b", "c/d", "e/f"}
+        assert set(RepositoryCatalog.objects.values_list("slug", flat=True)) == {"a/b", "c/d", "e/f"}
+        state = RepositoryAccessSyncState.objects.get(pk=RepositoryAccessSyncState.SINGLETON_PK)
+        assert state.status == RepositoryAccessSyncState.Status.OK
+
+    def test_listing_failure_mid_stream_keeps_synced_pages_and_skips_prune(self, mock_repo_client):
+        _row("old/gone", "1")
+
+        def _pages(**kwargs):
+            yield [_repo("a/b")]
+            raise Exception("api down")
+
+        mock_repo_client.iter_repository_pages.side_effect = _pages
+        mock_repo_client.list_repository_members.return_value = [
+            RepoMember(uid="2", username="bob", access_level=RepoAccessLevel.READ)
+        ]
+
+        sync_repository_access_cron_task.func()
+
+        assert RepositoryAccess.objects.filter(repo_id="a/b", uid="2").exists()  # first page synced
+        assert RepositoryAccess.objects.filter(repo_id="old/gone").exists()  # not pruned on a partial listing
+        state = RepositoryAccessSyncState.objects.get(pk=RepositoryAccessSyncState.SINGLETON_PK)
+        assert state.status == RepositoryAccessSyncState.Status.FAILED
+
     def test_write_failure_keeps_previous_rows_and_marks_failed(self, mock_repo_client):
         """A DB write failure (e.g. duplicate uid in the fetched member list) must not escape the
         per-repo try/except: it should be isolated like a listing failure, leaving prior rows
         untouched (serve-stale) and letting sibling repos still sync.
         """
         _row("a/b", "7", RepoAccessLevel.WRITE)
-        mock_repo_client.list_repositories.return_value = [_repo("a/b"), _repo("c/d")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b"), _repo("c/d")]]
         mock_repo_client.list_repository_members.side_effect = [
             [RepoMember(uid="9", username="dave", access_level=RepoAccessLevel.READ)],
             [RepoMember(uid="8", username="carol", access_level=RepoAccessLevel.READ)],
@@ -125,7 +159,7 @@ class TestSyncRepositoryAccess:
         # keep the previous rows (serve-stale) rather than silently wiping access, and count it
         # as a failure so last_success_at does not advance.
         _row("a/b", "7", RepoAccessLevel.WRITE)
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = []
 
         sync_repository_access_cron_task.func()
@@ -137,7 +171,7 @@ class TestSyncRepositoryAccess:
 
     def test_empty_members_without_prior_rows_is_clean(self, mock_repo_client):
         # A repo that legitimately has no members and no prior rows is not a failure.
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = []
 
         sync_repository_access_cron_task.func()
@@ -152,7 +186,7 @@ class TestSyncRepositoryAccess:
         # wipe every access row; the prune is skipped, rows are preserved, and the run is marked
         # failed rather than reading as a clean success.
         _row("a/b", "7", RepoAccessLevel.WRITE)
-        mock_repo_client.list_repositories.return_value = []
+        mock_repo_client.iter_repository_pages.return_value = []
 
         sync_repository_access_cron_task.func()
 
@@ -164,7 +198,7 @@ class TestSyncRepositoryAccess:
 
     def test_empty_universe_without_rows_is_clean(self, mock_repo_client):
         # A genuinely empty install (no repos, no rows) is a clean success, not a failure.
-        mock_repo_client.list_repositories.return_value = []
+        mock_repo_client.iter_repository_pages.return_value = []
 
         sync_repository_access_cron_task.func()
 
@@ -178,7 +212,7 @@ class TestSyncRepositoryAccess:
         stale = _row("a/b", "7", RepoAccessLevel.WRITE)
         stale.synced_at = timezone.now() - timedelta(hours=codebase_settings.REPO_ACCESS_HARD_TTL_HOURS + 1)
         stale.save(update_fields=["synced_at"])
-        mock_repo_client.list_repositories.return_value = [_repo("c/d")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("c/d")]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="8", username="carol", access_level=RepoAccessLevel.READ)
         ]
@@ -192,7 +226,7 @@ class TestSyncRepositoryAccess:
         with patch.object(codebase_settings, "CLIENT", GitPlatform.SWE):
             sync_repository_access_cron_task.func()
 
-        assert not mock_repo_client.list_repositories.called
+        assert not mock_repo_client.iter_repository_pages.called
         assert not RepositoryAccess.objects.exists()
         assert not RepositoryAccessSyncState.objects.exists()
 
@@ -200,7 +234,7 @@ class TestSyncRepositoryAccess:
 @pytest.mark.django_db
 class TestSyncRepositoryCatalog:
     def test_upserts_catalog_from_universe(self, mock_repo_client):
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.READ)
         ]
@@ -222,7 +256,7 @@ class TestSyncRepositoryCatalog:
             topics=[],
             synced_at=timezone.now() - timedelta(hours=1),
         )
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.READ)
         ]
@@ -242,7 +276,7 @@ class TestSyncRepositoryCatalog:
             topics=[],
             synced_at=timezone.now(),
         )
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.READ)
         ]
@@ -263,7 +297,7 @@ class TestSyncRepositoryCatalog:
             synced_at=timezone.now(),
         )
         _row("a/b", "1")  # non-empty access rows → the degraded "empty universe" branch
-        mock_repo_client.list_repositories.return_value = []
+        mock_repo_client.iter_repository_pages.return_value = []
 
         sync_repository_access_cron_task.func()
 
@@ -273,7 +307,7 @@ class TestSyncRepositoryCatalog:
         repo = _repo("a/b")
         repo.topics = ["python", "api"]
         repo.default_branch = None  # a repo with no default branch (e.g. empty repo) → coerced to ""
-        mock_repo_client.list_repositories.return_value = [repo]
+        mock_repo_client.iter_repository_pages.return_value = [[repo]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.READ)
         ]
@@ -287,7 +321,7 @@ class TestSyncRepositoryCatalog:
     def test_catalog_upsert_failure_does_not_block_access_sync(self, mock_repo_client):
         # The catalog is not security-load-bearing: a failed catalog write must still let the
         # access sync run and must mark the run degraded (not leave it unrecorded/clean).
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.READ)
         ]
@@ -305,7 +339,7 @@ class TestSyncRepositoryCatalog:
 
     def test_catalog_prune_failure_does_not_block_access_prune(self, mock_repo_client):
         _row("old/gone", "1")  # a vanished repo's access row → the access prune should still remove it
-        mock_repo_client.list_repositories.return_value = [_repo("a/b")]
+        mock_repo_client.iter_repository_pages.return_value = [[_repo("a/b")]]
         mock_repo_client.list_repository_members.return_value = [
             RepoMember(uid="1", username="alice", access_level=RepoAccessLevel.READ)
         ]
@@ -0,0 +1,54 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+import pytest
+
+from codebase.models import MergeDailyStats, MergeMetric, PlatformType
+from codebase.rollups import merge_velocity_stats
+
+
+def _make_metric(iid, *, merged_at, daiv_commits=0, **kwargs):
+    return MergeMetric.objects.create(
+        repo_id="acme/api",
+        merge_request_iid=iid,
+        merged_at=merged_at,
+        target_branch="main",
+        source_branch=f"feature-{iid}",
+        platform=PlatformType.GITLAB,
+        total_commits=2,
+        daiv_commits=daiv_commits,
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestMergeDailyStats:
+    def test_velocity_is_summed_from_the_rollup(self, django_capture_on_commit_callbacks):
+        now = timezone.now()
+        with django_capture_on_commit_callbacks(execute=True):
+            _make_metric(1, merged_at=now, daiv_commits=1, lines_added=10, lines_removed=2)
+            _make_metric(2, merged_at=now, lines_added=5)
+            _make_metric(3, merged_at=now - timedelta(days=40), lines_added=100)
+
+        stats = merge_velocity_stats(timezone.localdate() - timedelta(days=29))
+
+        assert stats["total"] == 2
+        assert stats["daiv_merges_sum"] == 1
+        assert (stats["total_added"], stats["total_removed"]) == (15, 2)
+        assert (stats["total_commits_sum"], stats["daiv_commits_sum"]) == (4, 1)
+        assert merge_velocity_stats(None)["total"] == 3
+
+    def test_redelivered_merge_does_not_inflate_the_rollup(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            metric = _make_metric(1, merged_at=timezone.now(), lines_added=10)
+        with django_capture_on_commit_callbacks(execute=True):
+            metric.lines_added = 12
+            metric.save()
+
+        stats = MergeDailyStats.objects.get()
+        assert (stats.merges, stats.lines_added) == (1, 12)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            metric.delete()
+        assert not MergeDailyStats.objects.exists()
@@ -0,0 +1,165 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.utils import timezone
+
+import pytest
+from redis.exceptions import LockError
+
+from codebase.clients.gitlab.api.callbacks import PushCallback
+from codebase.models import WebhookDelivery
+from codebase.webhooks import _claim, aprocess_inbox, coalesce_key, sweep_inbox
+
+
+def _push(ref: str = "refs/heads/main", sha: str = "abc") -> dict:
+    return {
+        "object_kind": "push",
+        "project": {"id": 1, "path_with_namespace": "group/repo", "default_branch": "main"},
+        "checkout_sha": sha,
+        "ref": ref,
+    }
+
+
+def _note(note_id: int, action: str) -> dict:
+    return {"object_kind": "note", "object_attributes": {"id": note_id, "action": action}}
+
+
+def _record(event: str, payload: dict, *, platform: str = "gitlab", **fields) -> WebhookDelivery:
+    return WebhookDelivery.objects.create(
+        platform=platform,
+        event=event,
+        repo_id="group/repo",
+        payload=payload,
+        coalesce_key=coalesce_key(platform, event, payload),
+        **fields,
+    )
+
+
+class TestCoalesceKey:
+    def test_pushes_coalesce_per_ref(self):
+        assert coalesce_key("gitlab", "push", _push()) == "push:refs/heads/main"
+        assert coalesce_key("github", "push", {"ref": "refs/heads/dev"}) == "push:refs/heads/dev"
+
+    def test_comments_coalesce_per_comment_and_action(self):
+        assert coalesce_key("gitlab", "note", _note(5, "update")) == "note:5:update"
+        assert coalesce_key("github", "issue_comment", {"action": "edited", "comment": {"id": 9}}) == "comment:9:edited"
+
+    def test_other_events_are_never_coalesced(self):
+        assert coalesce_key("gitlab", "issue", {"object_attributes": {"id": 1}}) == ""
+        assert coalesce_key("gitlab", "note", {"object_attributes": {}}) == ""
+
+
+@pytest.mark.django_db
+class TestClaim:
+    def test_only_the_latest_delivery_per_key_is_claimed(self):
+        pushes = [_record("push", _push(sha=sha)) for sha in ("a", "b", "c")]
+        issue = _record("issue", {"object_kind": "issue"})
+        created = _record("note", _note(5, "create"))
+        edits = [_record("note", _note(5, "update")) for _ in range(2)]
+
+        claimed = _claim("group/repo")
+
+        assert [delivery.pk for delivery in claimed] == [pushes[2].pk, issue.pk, created.pk, edits[1].pk]
+        statuses = dict(WebhookDelivery.objects.values_list("pk", "status"))
+        assert {statuses[d.pk] for d in (pushes[0], pushes[1], edits[0])} == {WebhookDelivery.Status.SUPERSEDED}
+        assert {statuses[d.pk] for d in claimed} == {WebhookDelivery.Status.PROCESSING}
+
+    def test_other_repositories_and_claimed_deliveries_are_left_alone(self):
+        _record("push", _push(), status=WebhookDelivery.Status.PROCESSING)
+        other = WebhookDelivery.objects.create(
+            platform="gitlab", event="push", repo_id="group/other", payload=_push(), coalesce_key="push:refs/heads/main"
+        )
+
+        assert _claim("group/repo") == []
+        other.refresh_from_db()
+        assert other.status == WebhookDelivery.Status.PENDING
+
+
+@pytest.mark.django_db(transaction=True)
+class TestProcessInbox:
+    async def test_burst_of_pushes_is_processed_once(self):
+        for sha in ("a", "b", "c"):
+            await WebhookDelivery.objects.acreate(
+                platform="gitlab",
+                event="push",
+                repo_id="group/repo",
+                payload=_push(sha=sha),
+                coalesce_key="push:refs/heads/main",
+            )
+
+        with patch.object(PushCallback, "process_callback", new_callable=AsyncMock) as process_callback:
+            assert await aprocess_inbox("group/repo") == 1
+
+        process_callback.assert_awaited_once()
+        statuses = [status async for status in WebhookDelivery.objects.order_by("pk").values_list("status", flat=True)]
+        assert statuses == ["superseded", "superseded", "processed"]
+
+    async def test_unknown_and_rejected_deliveries_are_ignored(self):
+        await WebhookDelivery.objects.acreate(
+            platform="gitlab", event="push", repo_id="group/repo", payload={"object_kind": "push"}
+        )
+        await WebhookDelivery.objects.acreate(
+            platform="gitlab", event="push", repo_id="group/repo", payload=_push(ref="refs/heads/feature")
+        )
+
+        await aprocess_inbox("group/repo")
+
+        deliveries = [delivery async for delivery in WebhookDelivery.objects.order_by("pk")]
+        assert [delivery.status for delivery in deliveries] == ["ignored", "ignored"]
+        assert "validation error" in deliveries[0].error
+        assert all(delivery.processed_at for delivery in deliveries)
+
+    async def test_a_failing_callback_marks_its_delivery_failed(self):
+        await WebhookDelivery.objects.acreate(platform="gitlab", event="push", repo_id="group/repo", payload=_push())
+
+        with patch.object(PushCallback, "process_callback", side_effect=RuntimeError("boom")):
+            await aprocess_inbox("group/repo")
+
+        delivery = await WebhookDelivery.objects.aget()
+        assert delivery.status == WebhookDelivery.Status.FAILED
+        assert delivery.error == "boom"
+
+    async def test_a_repository_being_processed_is_left_to_its_run(self):
+        await WebhookDelivery.objects.acreate(platform="gitlab", event="push", repo_id="group/repo", payload=_push())
+        held = MagicMock()
+        held.lock.return_value.__enter__.side_effect = LockError("held")
+
+        with patch("codebase.webhooks.cache", held):
+            assert await aprocess_inbox("group/repo") == 0
+
+        assert (await WebhookDelivery.objects.aget()).status == WebhookDelivery.Status.PENDING
+
+    async def test_deliveries_recorded_during_a_run_are_processed_by_it_in_order(self):
+        await WebhookDelivery.objects.acreate(platform="gitlab", event="push", repo_id="group/repo", payload=_push())
+        shas = []
+
+        async def process_callback(callback):
+            shas.append(callback.checkout_sha)
+            if len(shas) == 1:
+                await WebhookDelivery.objects.acreate(
+                    platform="gitlab", event="push", repo_id="group/repo", payload=_push(sha="def")
+                )
+
+        with patch.object(PushCallback, "process_callback", process_callback):
+            assert await aprocess_inbox("group/repo") == 2
+
+        assert shas == ["abc", "def"]
+
+
+@pytest.mark.django_db
+class TestSweepInbox:
+    def test_recovers_stuck_and_missed_deliveries_and_prunes_finished_ones(self):
+        stuck = _record("push", _push(), status=WebhookDelivery.Status.PROCESSING)
+        old = timezone.now() - timedelta(days=30)
+        WebhookDelivery.objects.filter(pk=stuck.pk).update(created=old, modified=old)
+        finished = _record("issue", {}, status=WebhookDelivery.Status.PROCESSED)
+        WebhookDelivery.objects.filter(pk=finished.pk).update(created=old)
+        recent = _record("issue", {}, status=WebhookDelivery.Status.PROCESSED)
+
+        with patch("codebase.tasks.process_webhook_inbox_task") as task:
+            sweep_inbox()
+
+        task.enqueue.assert_called_once_with(repo_id="group/repo")
+        stuck.refresh_from_db()
+        assert stuck.status == WebhookDelivery.Status.PENDING
+        assert set(WebhookDelivery.objects.values_list("pk", flat=True)) == {stuck.pk, recent.pk}
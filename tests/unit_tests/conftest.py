@@ -11,6 +11,7 @@ from pydantic import SecretStr
 
 from accounts.models import Role
 from accounts.models import User as AccountUser
+from automation.agent.base import clear_model_cache
 from codebase.base import GitPlatform, MergeRequest, Repository, User
 from codebase.clients import RepoClient
 from codebase.conf import settings as codebase_settings
@@ -25,9 +26,11 @@ def _clear_model_caches():
     keys = (PROVIDERS_CACHE_KEY, SITE_CONFIGURATION_CACHE_KEY, WEB_FETCH_AUTH_HEADERS_CACHE_KEY)
     for key in keys:
         cache.delete(key)
+    clear_model_cache()
     yield
     for key in keys:
         cache.delete(key)
+    clear_model_cache()
 
 
 @pytest.fixture(autouse=True)
@@ -47,6 +50,15 @@ def _no_repo_access_backstop():
         yield
 
 
+@pytest.fixture(autouse=True)
+def _reset_repository_visibility():
+    """Retire cached repository-visibility snapshots. Tests roll back their access rows without
+    running the sync that would invalidate them, and user pks repeat across tests."""
+    from codebase.authorization import invalidate_repository_visibility
+
+    invalidate_repository_visibility()
+
+
 @pytest.fixture
 def admin_user(db):
     return AccountUser.objects.create_user(
@@ -147,6 +159,7 @@ def mock_repo_client():
             html_url="https://test-repo.com",
         )
         mock_client.list_repositories.return_value = []
+        mock_client.iter_repository_pages.return_value = []
         mock_client.list_repository_members.return_value = []
         mock_client.get_repository_file.return_value = None
         mock_client.get_project_uploaded_file = AsyncMock(return_value=b"image content")
@@ -159,6 +172,8 @@ def mock_repo_client():
         mock_client.create_issue_comment.return_value = None
         mock_client.create_issue_emoji.return_value = None
         mock_client.get_issue_comment.return_value = Mock()
+        mock_client.acreate_issue_emoji.return_value = None
+        mock_client.aget_issue_comment.return_value = Mock()
 
         # Mock merge request operations
         merge_request = MergeRequest(
@@ -179,6 +194,9 @@ def mock_repo_client():
         mock_client.get_merge_request_comment.return_value = Mock()
         mock_client.create_merge_request_comment.return_value = None
         mock_client.create_merge_request_note_emoji.return_value = None
+        mock_client.aget_merge_request.return_value = merge_request
+        mock_client.aget_merge_request_comment.return_value = Mock()
+        mock_client.acreate_merge_request_note_emoji.return_value = None
         mock_client.mark_merge_request_comment_as_resolved.return_value = None
         mock_client.get_merge_request_commits.return_value = []
         mock_client.get_bot_commit_email.return_value = "daiv@users.noreply.gitlab.com"
@@ -52,3 +52,36 @@ def test_dedup_backend_creates_new_for_different_args(database_task_backend):
 
     assert result.id != second_result.id
     assert DBTaskResult.objects.filter(task_path=sample_issue_task.module_path).count() == 2
+
+
+@task()
+def sample_plain_task(repo_id: str) -> str:
+    return repo_id
+
+
+@pytest.mark.django_db
+def test_bulk_enqueue_dedups_against_queued_and_within_the_batch(database_task_backend):
+    queued = sample_issue_task.enqueue("repo-1", 1)
+    backend = sample_issue_task.get_backend()
+
+    results = backend.bulk_enqueue(
+        sample_issue_task, [(("repo-1", 1), {}), (("repo-2", 2), {}), (("repo-2", 2), {}), (("repo-3", 3), {})]
+    )
+
+    assert results[0].id == queued.id
+    assert results[1].id == results[2].id
+    assert len({result.id for result in results}) == 3
+    assert DBTaskResult.objects.filter(task_path=sample_issue_task.module_path).count() == 3
+
+
+@pytest.mark.django_db
+def test_bulk_enqueue_inserts_every_call_of_a_plain_task(database_task_backend, django_assert_max_num_queries):
+    backend = sample_plain_task.get_backend()
+
+    with django_assert_max_num_queries(3):
+        results = backend.bulk_enqueue(sample_plain_task, [(("repo-1",), {}), (("repo-1",), {})])
+
+    assert results[0].id != results[1].id
+    rows = DBTaskResult.objects.filter(task_path=sample_plain_task.module_path)
+    assert rows.count() == 2
+    assert all(row.status == "READY" and row.run_after is not None for row in rows)
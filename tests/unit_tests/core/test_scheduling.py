@@ -0,0 +1,274 @@
+"""The fair scheduling policy the task workers claim by, and the worker that applies it."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from django_tasks_db.models import DBTaskResult, get_date_max
+
+from core.management.commands.db_worker import FairWorker
+from core.scheduling import (
+    Candidate,
+    Load,
+    SchedulingPolicy,
+    WorkClass,
+    candidates_from,
+    claim_window,
+    current_load,
+    queue_positions,
+)
+
+NOW = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _candidate(id_: str, work_class=WorkClass.BATCH, *, waited_s=0, user=None, schedule=None, priority=0):
+    return Candidate(
+        id=id_,
+        work_class=work_class,
+        enqueued_at=NOW - timedelta(seconds=waited_s),
+        priority=priority,
+        user_key=user,
+        schedule_key=schedule,
+    )
+
+
+class TestPick:
+    def test_nothing_ready_picks_nothing(self):
+        assert SchedulingPolicy().pick([], Load(), NOW) is None
+
+    def test_interactive_goes_first_on_an_idle_fleet_even_behind_an_older_batch(self):
+        batch = _candidate("batch", waited_s=60)
+        interactive = _candidate("chat", WorkClass.INTERACTIVE, waited_s=1)
+        assert SchedulingPolicy().pick([batch, interactive], Load(), NOW) == interactive
+
+    def test_batch_gets_its_share_once_interactive_holds_more_than_its_weight(self):
+        policy = SchedulingPolicy(weights={WorkClass.INTERACTIVE: 2, WorkClass.BATCH: 1})
+        load = Load.from_running([_candidate(f"i{n}", WorkClass.INTERACTIVE) for n in range(3)])
+        batch = _candidate("batch")
+        assert policy.pick([_candidate("chat", WorkClass.INTERACTIVE), batch], load, NOW) == batch
+
+    def test_within_a_class_priority_then_fifo(self):
+        older, newer = _candidate("older", waited_s=30), _candidate("newer", waited_s=10)
+        urgent = _candidate("urgent", waited_s=5, priority=10)
+        assert SchedulingPolicy().pick([newer, older], Load(), NOW) == older
+        assert SchedulingPolicy().pick([newer, older, urgent], Load(), NOW) == urgent
+
+    def test_a_capped_user_is_skipped_until_one_of_their_tasks_finishes(self):
+        policy = SchedulingPolicy(max_running_per_user=1)
+        load = Load.from_running([_candidate("running", user="alice")])
+        alice, bob = _candidate("alice", waited_s=60, user="alice"), _candidate("bob", user="bob")
+        assert policy.pick([alice, bob], load, NOW) == bob
+        assert policy.pick([alice], load, NOW) is None
+        assert policy.pick([alice], Load(), NOW) == alice
+
+    def test_a_capped_schedule_is_skipped(self):
+        policy = SchedulingPolicy(max_running_per_schedule=2)
+        load = Load.from_running([_candidate(f"r{n}", schedule="nightly") for n in range(2)])
+        assert policy.pick([_candidate("next", schedule="nightly")], load, NOW) is None
+        assert policy.pick([_candidate("other", schedule="weekly")], load, NOW).id == "other"
+
+    def test_an_aged_task_jumps_the_fair_share(self):
+        policy = SchedulingPolicy(aging_after=timedelta(minutes=5))
+        starving = _candidate("starving", waited_s=301)
+        assert policy.pick([_candidate("chat", WorkClass.INTERACTIVE), starving], Load(), NOW) == starving
+
+    def test_aging_never_overrides_a_cap(self):
+        policy = SchedulingPolicy(max_running_per_user=1, aging_after=timedelta(minutes=5))
+        load = Load.from_running([_candidate("running", user="alice")])
+        assert policy.pick([_candidate("aged", waited_s=3600, user="alice")], load, NOW) is None
+
+
+class TestOrder:
+    def test_order_interleaves_classes_by_weight(self):
+        policy = SchedulingPolicy(weights={WorkClass.INTERACTIVE: 2, WorkClass.BATCH: 1})
+        interactive = [_candidate(f"i{n}", WorkClass.INTERACTIVE, waited_s=10 - n) for n in range(4)]
+        batch = [_candidate(f"b{n}", waited_s=100 - n) for n in range(4)]
+        ordered = [c.id for c in policy.order(batch + interactive, Load(), NOW)]
+        assert ordered == ["i0", "b0", "i1", "i2", "b1", "i3", "b2", "b3"]
+
+    def test_capped_candidates_trail_oldest_first(self):
+        policy = SchedulingPolicy(max_running_per_schedule=1)
+        batch = [_candidate(f"b{n}", waited_s=100 - n, schedule="nightly") for n in range(3)]
+        ordered = [c.id for c in policy.order([*batch, _candidate("chat", WorkClass.INTERACTIVE)], Load(), NOW)]
+        assert ordered == ["chat", "b0", "b1", "b2"]
+
+    def test_order_is_deterministic_whatever_the_input_order(self):
+        candidates = [_candidate(f"c{n}", WorkClass(("batch", "interactive")[n % 2]), waited_s=n) for n in range(20)]
+        policy = SchedulingPolicy()
+        assert policy.order(candidates, Load(), NOW) == policy.order(list(reversed(candidates)), Load(), NOW)
+
+
+def _simulate(policy: SchedulingPolicy, arrivals: list[tuple[int, Candidate, int]], *, workers: int) -> dict[str, int]:
+    """Discrete-time fleet of ``workers``; returns each task's wait (start - arrival) in ticks.
+
+    ``arrivals`` are ``(tick, candidate, duration)``; the candidate's ``enqueued_at`` is derived
+    from its arrival tick so aging sees simulated time.
+    """
+    start = NOW
+    pending: list[tuple[Candidate, int, int]] = []
+    running: list[tuple[Candidate, int]] = []
+    waits: dict[str, int] = {}
+    queue = sorted(arrivals, key=lambda a: (a[0], a[1].id))
+    tick = 0
+    while queue or pending or running:
+        while queue and queue[0][0] <= tick:
+            arrived, candidate, duration = queue.pop(0)
+            stamped = replace(candidate, enqueued_at=start + timedelta(seconds=arrived))
+            pending.append((stamped, duration, arrived))
+        running = [(c, end) for c, end in running if end > tick]
+        now = start + timedelta(seconds=tick)
+        while len(running) < workers and pending:
+            load = Load.from_running(c for c, _ in running)
+            chosen = policy.pick([c for c, _, _ in pending], load, now)
+            if chosen is None:
+                break
+            entry = next(p for p in pending if p[0] == chosen)
+            pending.remove(entry)
+            running.append((chosen, tick + entry[1]))
+            waits[chosen.id] = tick - entry[2]
+        tick += 1
+    return waits
+
+
+class TestSimulation:
+    """Synthetic workloads: a 200-repo scheduled batch lands a moment before users' jobs."""
+
+    @staticmethod
+    def _workload() -> list[tuple[int, Candidate, int]]:
+        batch = [(0, _candidate(f"batch-{n:03}", schedule="nightly", user="ops"), 300) for n in range(200)]
+        interactive = [
+            (60 * n + 5, _candidate(f"job-{n}", WorkClass.INTERACTIVE, user=f"user-{n % 3}"), 120) for n in range(10)
+        ]
+        return batch + interactive
+
+    def test_fifo_baseline_makes_users_wait_behind_the_whole_batch(self):
+        """Pin what the policy fixes: with plain FIFO, the first user job waits for the batch."""
+        fifo = SchedulingPolicy(weights={WorkClass.INTERACTIVE: 1, WorkClass.BATCH: 1}, aging_after=timedelta(0))
+        waits = _simulate(fifo, self._workload(), workers=4)
+        assert waits["job-0"] >= 300 * 200 // 4 - 300
+
+    def test_fair_policy_bounds_interactive_wait_by_one_batch_task(self):
+        policy = SchedulingPolicy(max_running_per_schedule=3, aging_after=timedelta(hours=24))
+        waits = _simulate(policy, self._workload(), workers=4)
+        assert max(waits[f"job-{n}"] for n in range(10)) <= 300
+        assert all(f"batch-{n:03}" in waits for n in range(200))
+
+    def test_aging_keeps_a_flood_of_interactive_work_from_starving_batch(self):
+        policy = SchedulingPolicy(
+            weights={WorkClass.INTERACTIVE: 100, WorkClass.BATCH: 1}, aging_after=timedelta(seconds=60)
+        )
+        flood = [(n, _candidate(f"chat-{n:04}", WorkClass.INTERACTIVE), 10) for n in range(500)]
+        waits = _simulate(policy, [(0, _candidate("batch"), 10), *flood], workers=1)
+        assert waits["batch"] <= 60 + 10
+
+
+@pytest.fixture
+def make_task(database_task_backend):
+    def _make(*, queue_name="default", status="READY", user_id=None, enqueued_delta_s=0, priority=0):
+        task = DBTaskResult.objects.create(
+            id=uuid.uuid4(),
+            status=status,
+            task_path="jobs.tasks.run_job_task",
+            args_kwargs={"args": [], "kwargs": {"user_id": user_id}},
+            queue_name=queue_name,
+            backend_name="default",
+            priority=priority,
+            run_after=get_date_max(),
+        )
+        DBTaskResult.objects.filter(pk=task.pk).update(enqueued_at=NOW - timedelta(seconds=enqueued_delta_s))
+        return task
+
+    return _make
+
+
+def _worker(policy: SchedulingPolicy, queue_names=("*",)) -> FairWorker:
+    return FairWorker(
+        policy=policy,
+        queue_names=list(queue_names),
+        interval=0,
+        batch=True,
+        backend_name="default",
+        startup_delay=False,
+        max_tasks=None,
+        worker_id="worker-1",
+    )
+
+
+@pytest.mark.django_db
+class TestFairWorker:
+    def test_claims_the_policy_pick_and_marks_it_running(self, make_task):
+        make_task(enqueued_delta_s=60)
+        interactive = make_task(queue_name="interactive", enqueued_delta_s=1)
+
+        claimed = _worker(SchedulingPolicy()).claim_next()
+
+        assert claimed.pk == interactive.pk
+        claimed.refresh_from_db()
+        assert claimed.status == "RUNNING"
+        assert claimed.worker_ids == ["worker-1"]
+
+    def test_leaves_everything_ready_when_every_candidate_is_capped(self, make_task):
+        make_task(status="RUNNING", user_id=7)
+        waiting = make_task(user_id=7)
+
+        assert _worker(SchedulingPolicy(max_running_per_user=1)).claim_next() is None
+        waiting.refresh_from_db()
+        assert waiting.status == "READY"
+
+    def test_respects_the_queues_it_serves(self, make_task):
+        make_task(queue_name="interactive")
+        default = make_task()
+
+        assert _worker(SchedulingPolicy(), queue_names=["default"]).claim_next().pk == default.pk
+
+    def test_candidates_carry_the_user_from_the_task_kwargs(self, make_task):
+        make_task(user_id=42)
+        (candidate,) = candidates_from(DBTaskResult.objects.all())
+        assert candidate.user_key == "42"
+        assert candidate.work_class == WorkClass.BATCH
+
+    def test_claim_window_holds_the_oldest_tasks_of_a_priority(self, make_task):
+        newest = make_task(enqueued_delta_s=10)
+        oldest = make_task(enqueued_delta_s=90)
+        make_task(enqueued_delta_s=50)
+
+        with patch("core.scheduling.CLAIM_WINDOW", 2):
+            window = list(claim_window(DBTaskResult.objects.ready(), SchedulingPolicy(), Load()))
+
+        assert oldest in window
+        assert newest not in window
+
+    def test_claim_window_leaves_out_capped_users(self, make_task):
+        make_task(status="RUNNING", user_id=7)
+        capped = [make_task(user_id=7, enqueued_delta_s=90 - n) for n in range(3)]
+        eligible = make_task(user_id=8, enqueued_delta_s=20)
+        anonymous = make_task(enqueued_delta_s=10)
+        policy = SchedulingPolicy(max_running_per_user=1)
+
+        with patch("core.scheduling.CLAIM_WINDOW", 3):
+            window = list(claim_window(DBTaskResult.objects.ready(), policy, current_load("default")))
+
+        assert window == [eligible, anonymous]
+        assert not set(window) & set(capped)
+
+    def test_queue_positions_follow_the_policy_order(self, make_task):
+        older = make_task(enqueued_delta_s=60)
+        newer = make_task(enqueued_delta_s=30)
+
+        positions = queue_positions("default", ["default"], now=NOW)
+
+        assert positions == {str(older.pk): 1, str(newer.pk): 2}
+
+    def test_queue_positions_read_only_the_claim_window(self, make_task):
+        first = make_task(priority=1)
+        beyond = make_task()
+
+        with patch("core.scheduling.CLAIM_WINDOW", 1):
+            positions = queue_positions("default", ["default"], now=NOW)
+
+        assert positions == {str(first.pk): 1}
+        assert str(beyond.pk) not in positions
@@ -359,4 +359,14 @@ async def test_run_job_task_survives_a_failed_ref_sync():
     ):
         result = await run_job_task.func(repo_id="owner/repo", prompt="hi", ref="main", thread_id="t-ref-job-3")
 
-    assert result == {"response": "ok"}
+    assert result["response"] == "ok"
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_run_job_task_attaches_the_phase_timings_to_its_result():
+    await Session.objects.acreate(thread_id="t-phases", origin=SessionOrigin.UI_JOB, repo_id="owner/repo", ref="main")
+
+    with _job_scaffolding(_agent_with_mr(None)):
+        result = await run_job_task.func(repo_id="owner/repo", prompt="hi", ref="main", thread_id="t-phases")
+
+    assert result["phase_timings"]["build"]["count"] == 1
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from django.core.exceptions import PermissionDenied
 from django.db import IntegrityError, transaction
 from django.http import Http404
@@ -241,3 +243,11 @@ def test_status_check_constraint_rejects_unknown_value():
         # Bypass field-choice validation with a raw update to hit the DB constraint.
         s = MCPServer.objects.create(name="s-bad", transport=MCPServer.Transport.HTTP, url="http://x")
         MCPServer.objects.filter(pk=s.pk).update(status="banana")
+
+
+@pytest.mark.django_db
+def test_catalog_change_clears_the_deferred_index_cache():
+    with patch("automation.agent.deferred.index.clear_index_cache") as clear:
+        _global("custom").delete()
+
+    assert clear.call_count == 2
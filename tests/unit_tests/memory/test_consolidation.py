@@ -14,6 +14,7 @@ from memory.models import (
     ObservationStatus,
     RepositoryMemory,
 )
+from memory.retrieval import FULL_CONTEXT_MAX_ENTRIES
 from memory.schemas import CONTENT_HARD_LIMIT, MAX_OPERATIONS, MemoryOperation
 
 from tests.unit_tests.memory.consolidation_helpers import (
@@ -564,3 +565,62 @@ async def test_a_truncated_operation_naming_an_unknown_observation_is_not_counte
     outcome = await _run_round(_structured_llm_returning(*_adds_for(observations), hallucinated))
 
     assert (outcome.applied, outcome.still_pending, outcome.truncated) == (MAX_OPERATIONS, 0, 0)
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_a_large_store_is_consolidated_in_relevance_scoped_batches():
+    entries = [await _entry(f"topic{i} module{i} behaves in way{i}") for i in range(FULL_CONTEXT_MAX_ENTRIES + 40)]
+    first = await _observation(content="topic3 module3 changed behaviour")
+    second = await _observation(content="topic90 module90 changed behaviour")
+    llm = _structured_llm_returning(
+        MemoryOperation(op="CONFIRM", entry_ids=[str(entries[3].pk)], observation_ids=[str(first.pk)]),
+        MemoryOperation(op="CONFIRM", entry_ids=[str(entries[90].pk)], observation_ids=[str(second.pk)]),
+    )
+
+    # Unrelated clusters share a batch while it has room; a one-entry cap gives each its own call.
+    with patch("memory.retrieval.MAX_ENTRIES_PER_BATCH", 1):
+        outcome = await _run_round(llm)
+
+    prompts = [messages[-1].content for (messages,), _ in llm.with_config.return_value.ainvoke.call_args_list]
+    assert len(prompts) == 2
+    assert "topic3 module3" in prompts[0]
+    assert "topic90 module90" not in prompts[0]
+    assert "topic90 module90" in prompts[1]
+    # Each batch re-proposes both operations; the duplicates are rejected, not applied twice.
+    assert (outcome.applied, outcome.rejected) == (2, 2)
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_an_observation_restating_an_entry_is_confirmed_without_the_model():
+    entry = await _entry("`make lint` runs ruff and ty")
+    obs = await _observation(content="make lint runs ruff and ty")
+    llm = _structured_llm_returning()
+
+    outcome = await _run_round(llm)
+
+    llm.with_config.return_value.ainvoke.assert_not_called()
+    assert (outcome.applied, outcome.consolidated, outcome.deduplicated) == (1, 1, 1)
+    assert [o.pk async for o in entry.observations.all()] == [obs.pk]
+    memory = await RepositoryMemory.objects.aget(repo_id="group/project")
+    assert (memory.deduplicated_observations, memory.avoided_llm_calls) == (1, 1)
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_a_repeated_observation_follows_its_first_statement():
+    first = await _observation(content="migrations need a postgres database")
+    repeat = await _observation(content="Migrations need a Postgres database.")
+    llm = _structured_llm_returning(
+        MemoryOperation(
+            op="ADD", observation_ids=[str(first.pk)], category="pitfall", content="migrations need a postgres database"
+        )
+    )
+
+    outcome = await _run_round(llm)
+
+    (messages,), _ = llm.with_config.return_value.ainvoke.call_args
+    assert str(repeat.pk) not in messages[-1].content
+    assert (outcome.consolidated, outcome.deduplicated) == (2, 1)
+    entry = await MemoryEntry.objects.aget(repo_id="group/project")
+    assert {o.pk async for o in entry.observations.all()} == {first.pk, repeat.pk}
+    memory = await RepositoryMemory.objects.aget(repo_id="group/project")
+    assert (memory.deduplicated_observations, memory.avoided_llm_calls) == (1, 0)
@@ -1,7 +1,7 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from memory.models import MemoryObservation, ObservationStatus
+from memory.models import MemoryObservation, ObservationStatus, RepositoryMemory
 from memory.schemas import ExtractedObservation
 from memory.tasks import extract_observations_task
 
@@ -137,3 +137,28 @@ async def test_extraction_propagates_llm_failure_without_partial_writes():
         await extract_observations_task.func(str(run.pk))
 
     assert await MemoryObservation.objects.acount() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+async def test_extraction_skips_restatements_of_pending_observations():
+    run = await _create_run()
+    await MemoryObservation.objects.acreate(
+        repo_id="group/project", category="build_test", content="`make test` needs LANGCHAIN_TRACING_V2=false set"
+    )
+    extracted = [
+        ExtractedObservation(category="build_test", content="make test needs langchain_tracing_v2=false set."),
+        ExtractedObservation(category="pitfall", content="editing pyproject.toml directly breaks uv lock sync"),
+    ]
+
+    with (
+        patch("memory.tasks.RepositoryConfig") as cfg,
+        patch("core.checkpointer.open_checkpointer", _checkpointer_with(TRANSCRIPT)),
+        patch("memory.extraction.build_structured_llm", return_value=_structured_llm_returning(extracted)),
+        patch("memory.extraction.site_settings", _site_settings()),
+    ):
+        cfg.get_config.return_value = _enabled_config()
+        await extract_observations_task.func(str(run.pk))
+
+    assert [obs.category async for obs in MemoryObservation.objects.filter(run=run)] == ["pitfall"]
+    memory = await RepositoryMemory.objects.aget(repo_id="group/project")
+    assert (memory.deduplicated_observations, memory.avoided_llm_calls) == (1, 0)
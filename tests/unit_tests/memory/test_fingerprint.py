@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+from memory.fingerprint import Fingerprint, FingerprintIndex, deduplicate, normalize, novel
+from memory.schemas import MemoryOperation
+
+
+def _item(content, category="build_test", pk=None):
+    return SimpleNamespace(pk=pk or content, category=category, content=content)
+
+
+def test_normalize_drops_case_punctuation_and_stopwords():
+    assert normalize("Run `make test` to run the tests.") == "run make test run tests"
+
+
+class TestFingerprint:
+    def test_rewording_noise_is_an_exact_match(self):
+        reworded = Fingerprint.of("run make test, run tests")
+
+        assert Fingerprint.of("Run `make test` to run the tests").similarity(reworded) == 1.0
+
+    def test_similarity_is_the_shingle_jaccard(self):
+        first = Fingerprint.of("uv sync installs dev dependencies")
+        second = Fingerprint.of("uv sync installs dev dependencies quickly")
+
+        assert first.similarity(second) == 4 / 5
+
+    def test_signature_is_stable_across_calls(self):
+        assert Fingerprint.of("the sandbox caps output") == Fingerprint.of("the sandbox caps output")
+
+
+class TestFingerprintIndex:
+    def test_matches_a_near_duplicate_in_the_same_category(self):
+        entry = _item("pytest must run with -n auto to finish within the ci timeout")
+        index = FingerprintIndex([entry])
+
+        assert index.match("build_test", "pytest must run with -n auto to finish within the CI timeout!") is entry
+        assert index.match("pitfall", "pytest must run with -n auto to finish within the ci timeout") is None
+
+    def test_facts_differing_in_a_detail_do_not_match(self):
+        index = FingerprintIndex([_item("the project targets python 3.12")])
+
+        assert index.match("build_test", "the project targets python 3.14") is None
+
+
+def test_novel_drops_known_facts_and_repeats_within_the_candidates():
+    known = [_item("make lint runs ruff and ty")]
+    candidates = [
+        _item("make lint runs ruff and ty", pk="restates-known"),
+        _item("migrations need a postgres database", pk="first"),
+        _item("Migrations need a Postgres database.", pk="repeat"),
+    ]
+
+    assert [candidate.pk for candidate in novel(candidates, known)] == ["first"]
+
+
+class TestDeduplicate:
+    def test_restating_an_entry_becomes_one_confirm(self):
+        entry = _item("make lint runs ruff and ty", pk="entry")
+        observations = [_item("make lint runs ruff and ty", pk="a"), _item("`make lint` runs ruff and ty", pk="b")]
+
+        result = deduplicate(observations, [entry])
+
+        assert result.undecided == []
+        assert result.confirmations == [MemoryOperation(op="CONFIRM", entry_ids=["entry"], observation_ids=["a", "b"])]
+        assert result.resolved == 2
+
+    def test_repeats_follow_the_oldest_statement(self):
+        first = _item("migrations need a postgres database", pk="first")
+        repeat = _item("Migrations need a Postgres database.", pk="repeat")
+        other = _item("the api is versioned under /api/v1", pk="other")
+
+        result = deduplicate([first, other, repeat], [])
+
+        assert result.undecided == [first, other]
+        assert result.followers == {"first": ["repeat"]}
+        expanded = result.expand([
+            MemoryOperation(op="ADD", observation_ids=["first"], category="build_test", content="a consolidated fact"),
+            MemoryOperation(op="ADD", observation_ids=["other"], category="build_test", content="another fact here"),
+        ])
+        assert [operation.observation_ids for operation in expanded] == [["first", "repeat"], ["other"]]
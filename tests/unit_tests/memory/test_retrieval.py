@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+from memory.retrieval import (
+    FULL_CONTEXT_MAX_ENTRIES,
+    MAX_ENTRIES_PER_BATCH,
+    MAX_OBSERVATIONS_PER_BATCH,
+    MemoryIndex,
+    plan_batches,
+    tokenize,
+)
+
+
+def _item(content):
+    return SimpleNamespace(content=content)
+
+
+def _store(count):
+    """``count`` entries, each about its own distinct topic."""
+    return [_item(f"topic{i} module{i} behaves in way{i}") for i in range(count)]
+
+
+def test_tokenize_keeps_commands_and_paths_whole():
+    assert tokenize("Run `make test` in daiv/core/utils.py, not --fast") == [
+        "run",
+        "make",
+        "test",
+        "daiv/core/utils.py",
+        "not",
+        "fast",
+    ]
+
+
+class TestMemoryIndex:
+    def test_neighbours_are_ranked_best_first(self):
+        index = MemoryIndex([
+            _item("the celery worker needs redis"),
+            _item("pytest runs with xdist and redis fixtures"),
+            _item("pytest runs with xdist"),
+        ])
+
+        assert index.neighbours("pytest xdist redis", top_k=2) == [1, 2]
+
+    def test_entries_sharing_no_term_are_never_neighbours(self):
+        index = MemoryIndex([_item("the celery worker needs redis"), _item("pytest runs with xdist")])
+
+        assert index.neighbours("pytest flakes on macos") == [1]
+        assert index.neighbours("unrelated words entirely") == []
+
+    def test_empty_store(self):
+        assert MemoryIndex([]).neighbours("anything") == []
+
+
+class TestPlanBatches:
+    def test_small_store_is_one_whole_store_batch(self):
+        entries = _store(FULL_CONTEXT_MAX_ENTRIES)
+        observations = [_item("something unrelated to every entry")]
+
+        [batch] = plan_batches(observations, entries)
+
+        assert batch.observations == observations
+        assert batch.entries == entries
+
+    def test_large_store_shows_each_observation_only_its_neighbours(self):
+        entries = _store(200)
+        observations = [_item("topic7 module7 changed"), _item("topic150 module150 changed")]
+
+        batches = plan_batches(observations, entries)
+
+        shown = [entry for batch in batches for entry in batch.entries]
+        assert entries[7] in shown
+        assert entries[150] in shown
+        assert len(shown) < FULL_CONTEXT_MAX_ENTRIES
+
+    def test_observations_about_the_same_entry_land_in_one_batch(self):
+        entries = _store(200)
+        first, second = _item("topic42 breaks on upgrade"), _item("module42 needs pinning")
+        observations = [first, *(_item(f"topic{i} module{i} note") for i in range(100, 140)), second]
+
+        batches = plan_batches(observations, entries)
+
+        [batch] = [batch for batch in batches if first in batch.observations]
+        assert second in batch.observations
+
+    def test_batches_respect_the_caps_and_never_share_an_entry(self):
+        entries = _store(300)
+        observations = [_item(f"topic{i} module{i} note") for i in range(0, 300, 3)]
+
+        batches = plan_batches(observations, entries)
+
+        assert len(batches) > 1
+        seen_entries, seen_observations = [], []
+        for batch in batches:
+            assert len(batch.entries) <= MAX_ENTRIES_PER_BATCH
+            assert len(batch.observations) <= MAX_OBSERVATIONS_PER_BATCH
+            seen_entries += [id(entry) for entry in batch.entries]
+            seen_observations += batch.observations
+        assert len(seen_entries) == len(set(seen_entries))
+        assert sorted(map(id, seen_observations)) == sorted(map(id, observations))
+
+    def test_near_duplicate_observations_are_decided_together(self):
+        entries = _store(100)
+        first = _item("the staging deploy requires vpn access first")
+        second = _item("staging deploy requires vpn access")
+        observations = [first, *(_item(f"topic{i} module{i} note") for i in range(60)), second]
+
+        batches = plan_batches(observations, entries)
+
+        [batch] = [batch for batch in batches if first in batch.observations]
+        assert second in batch.observations
@@ -40,3 +40,83 @@ def test_empty_message_list_serializes_to_empty_string():
 def test_message_without_text_or_tool_calls_contributes_nothing():
     # An AI message with empty content and no tool calls yields no transcript lines.
     assert serialize_transcript([AIMessage(content="")]) == ""
+
+
+def _read(call_id, path="foo.py", tool="read_file"):
+    return AIMessage(content="", tool_calls=[{"name": tool, "args": {"file_path": path}, "id": call_id}])
+
+
+def test_a_re_read_shows_only_its_call():
+    messages = [
+        _read("tc-1"),
+        ToolMessage(content="def foo(): ...", tool_call_id="tc-1", name="read_file"),
+        _read("tc-2"),
+        ToolMessage(content="def foo(): ...", tool_call_id="tc-2", name="read_file"),
+    ]
+
+    transcript = serialize_transcript(messages)
+
+    assert transcript.count("def foo(): ...") == 1
+    assert "(re-read)" in transcript
+    assert "already read above" in transcript
+
+
+def test_a_read_after_the_file_is_written_is_kept():
+    messages = [
+        _read("tc-1"),
+        ToolMessage(content="def foo(): ...", tool_call_id="tc-1", name="read_file"),
+        _read("tc-2", tool="edit_file"),
+        ToolMessage(content="Edited foo.py", tool_call_id="tc-2", name="edit_file"),
+        _read("tc-3"),
+        ToolMessage(content="def foo(): return 1", tool_call_id="tc-3", name="read_file"),
+    ]
+
+    transcript = serialize_transcript(messages)
+
+    assert "(re-read)" not in transcript
+    assert "def foo(): return 1" in transcript
+
+
+def test_identical_outputs_are_replaced_by_a_back_reference():
+    output = '{"commands": [{"command": "make lint", "output": "All checks passed!", "exit_code": 0}]}'
+    messages = [
+        ToolMessage(content=output, tool_call_id="tc-1", name="bash"),
+        ToolMessage(content=output, tool_call_id="tc-2", name="bash"),
+    ]
+
+    transcript = serialize_transcript(messages)
+
+    assert transcript.count("All checks passed!") == 1
+    assert "(same output as an earlier call)" in transcript
+
+
+def test_error_outputs_keep_more_than_other_outputs():
+    traceback = "Traceback (most recent call last):\n" + "  File x.py\n" * 200
+    transcript = serialize_transcript([ToolMessage(content=traceback, tool_call_id="tc-1", name="bash")])
+
+    assert len(transcript) > 2_000
+
+
+def test_over_budget_drops_plain_reads_before_errors_and_their_correction():
+    messages = [HumanMessage(content="Fix the build")]
+    for i in range(40):
+        messages += [
+            _read(f"read-{i}", path=f"module_{i}.py"),
+            ToolMessage(content=f"module {i} " + "z" * 900, tool_call_id=f"read-{i}", name="read_file"),
+        ]
+        if i == 20:
+            messages += [
+                AIMessage(content="", tool_calls=[{"name": "bash", "args": {"command": "make test"}, "id": "run"}]),
+                ToolMessage(content="error: uv lock is out of date", tool_call_id="run", name="bash", status="error"),
+                AIMessage(content="Actually the lockfile must be regenerated with `uv lock` first."),
+            ]
+    messages.append(AIMessage(content="Done: the build passes."))
+
+    transcript = serialize_transcript(messages, max_chars=10_000)
+
+    assert len(transcript) <= 10_000
+    assert "[human] Fix the build" in transcript
+    assert "error: uv lock is out of date" in transcript
+    assert "regenerated with `uv lock` first" in transcript
+    assert "Done: the build passes." in transcript
+    assert "lower-signal turn(s) elided" in transcript
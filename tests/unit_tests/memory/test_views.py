@@ -160,6 +160,16 @@ def test_detail_reports_document_stats_when_consolidated(client, member_user):
     assert b"Never consolidated" not in resp.content
 
 
+@pytest.mark.django_db
+def test_detail_pluralizes_deduplication_savings(client, member_user):
+    RepositoryMemory.objects.create(repo_id="group/proj", content="x", deduplicated_observations=3, avoided_llm_calls=1)
+    client.force_login(member_user)
+    resp = client.get(reverse("memory:detail", args=["group/proj"]))
+    assert resp.status_code == 200
+    assert b"3 repeats deduplicated" in resp.content
+    assert b"1 model call avoided" in resp.content
+
+
 @pytest.mark.django_db
 def test_detail_shows_consolidate_button_for_admin(client, admin_user):
     RepositoryMemory.objects.create(repo_id="group/proj", content="x")
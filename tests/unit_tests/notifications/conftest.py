@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.utils import timezone
 
 import pytest
@@ -8,6 +9,17 @@ from pydantic import SecretStr
 from schedules.models import Frequency, ScheduledJob
 
 
+@pytest.fixture(autouse=True)
+def _clear_drain_scheduled():
+    """A drain enqueue patched out by a test never clears its marker; don't let it suppress the next test's."""
+    from notifications.tasks import DRAIN_SCHEDULED_KEY
+
+    keys = [DRAIN_SCHEDULED_KEY.format(channel_type=channel_type) for channel_type in ChannelType.values]
+    cache.delete_many(keys)
+    yield
+    cache.delete_many(keys)
+
+
 @pytest.fixture
 def run_schedule(member_user, email_binding):
     """A daily schedule owned by ``member_user`` with notifications always on.
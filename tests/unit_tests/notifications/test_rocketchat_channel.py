@@ -20,7 +20,7 @@ from notifications.channels.rocketchat import (
 )
 from notifications.choices import ChannelType
 from notifications.exceptions import UnrecoverableDeliveryError
-from notifications.models import UserChannelBinding
+from notifications.models import Notification, NotificationDelivery, UserChannelBinding
 from pydantic import SecretStr
 
 
@@ -250,6 +250,44 @@ class TestSend:
             RocketChatChannel().send(n, d)
         assert "disabled" in str(exc.value)
 
+    def test_batch_posts_over_one_pooled_client_and_reports_each_outcome(
+        self, httpx_mock, notification_with_delivery, rocketchat_configured
+    ):
+        n, d = notification_with_delivery
+        d.channel_type, d.address = ChannelType.ROCKETCHAT, "alice"
+        d.save()
+        other = NotificationDelivery.objects.create(
+            notification=Notification.objects.create(
+                recipient=n.recipient, event_type=n.event_type, source_id="other", subject="s"
+            ),
+            channel_type=ChannelType.ROCKETCHAT,
+            address="bob",
+        )
+
+        endpoint = "https://rc.example.com/api/v1/chat.postMessage"
+        httpx_mock.add_response(method="POST", url=endpoint, json={"success": True})
+        httpx_mock.add_response(method="POST", url=endpoint, status_code=404, json={"error": "User not found"})
+
+        with patch("notifications.channels.rocketchat.httpx.Client", wraps=httpx.Client) as client_factory:
+            outcomes = RocketChatChannel().send_batch([d, other])
+
+        client_factory.assert_called_once()
+        assert outcomes[d.id] is None
+        assert isinstance(outcomes[other.id], UnrecoverableDeliveryError)
+        assert [json.loads(r.content)["channel"] for r in httpx_mock.get_requests()] == ["@alice", "@bob"]
+
+    def test_batch_on_disabled_channel_fails_every_delivery(
+        self, notification_with_delivery, rocketchat_configured, monkeypatch
+    ):
+        from core.site_settings import site_settings
+
+        monkeypatch.setattr(site_settings, "rocketchat_enabled", False)
+        _n, d = notification_with_delivery
+
+        outcomes = RocketChatChannel().send_batch([d])
+
+        assert isinstance(outcomes[d.id], UnrecoverableDeliveryError)
+
     def test_job_batch_finished_renders_repo_breakdown_on_the_wire(
         self, httpx_mock, notification_with_delivery, rocketchat_configured
     ):
@@ -84,7 +84,7 @@ class TestCreateNotification:
 
 @pytest.mark.django_db
 class TestDispatchNotification:
-    def test_enqueue_failure_marks_delivery_failed(self, member_user, email_binding):
+    def test_enqueue_failure_leaves_delivery_pending_for_the_sweep(self, member_user, email_binding):
         n = create_notification(
             recipient=member_user,
             event_type="schedule.finished",
@@ -95,13 +95,13 @@ class TestDispatchNotification:
             link_url="/",
             channels=[ChannelType.EMAIL],
         )
-        with patch("notifications.tasks.deliver_notification_task") as mock_task:
+        with patch("notifications.tasks.deliver_notifications_task") as mock_task:
             mock_task.enqueue.side_effect = RuntimeError("broker down")
             dispatch_notification(n)
 
         d = n.deliveries.get()
-        assert d.status == DeliveryStatus.FAILED
-        assert "Failed to enqueue" in d.error_message
+        assert d.status == DeliveryStatus.PENDING
+        assert d.attempts == 0
 
 
 @pytest.mark.django_db
@@ -123,7 +123,7 @@ class TestNotify:
         # Assert the effect, not the callback count: `create_notification` now also
         # defers a nav badge poke, and a bare length would break on every future
         # deferred side effect.
-        with patch("notifications.tasks.deliver_notification_task") as mock_task:
+        with patch("notifications.tasks.deliver_notifications_task") as mock_task:
             for callback in callbacks:
                 callback()
-        assert mock_task.enqueue.call_count == 1
+        mock_task.enqueue.assert_called_once_with(ChannelType.EMAIL)
@@ -1,25 +1,46 @@
 import logging
 import uuid
+from datetime import timedelta
 from unittest.mock import patch
 
+from django.core import mail
+from django.core.mail import get_connection
 from django.utils import timezone
 
 import pytest
-from notifications.choices import DeliveryStatus, EventType
+from notifications.channels.email import _SMTP_TIMEOUT_SECONDS
+from notifications.choices import ChannelType, DeliveryStatus, EventType
 from notifications.exceptions import UnknownChannelError, UnrecoverableDeliveryError
-from notifications.models import Notification
-from notifications.tasks import _deliver_notification, redrive_missing_notifications_cron_task
+from notifications.models import Notification, NotificationDelivery
+from notifications.tasks import (
+    DELIVERY_BATCH_SIZE,
+    MAX_DELIVERY_ATTEMPTS,
+    deliver_notifications_task,
+    redrive_missing_notifications_cron_task,
+    schedule_delivery,
+    sweep_notification_deliveries_cron_task,
+)
 from sessions.models import EnvelopeStatus, Run, RunEnvelope, RunStatus, Session, SessionOrigin
 
 from accounts.models import User
 
 
+def _pending_email(recipient, **kwargs):
+    # A source of its own: finished-event notifications are unique per source and recipient.
+    n = Notification.objects.create(
+        recipient=recipient, event_type="schedule.finished", source_id=str(uuid.uuid4()), subject="s", body="b"
+    )
+    return NotificationDelivery.objects.create(
+        notification=n, channel_type=ChannelType.EMAIL, address=recipient.email, **kwargs
+    )
+
+
 @pytest.mark.django_db
-class TestDeliverNotification:
+class TestDeliverNotifications:
     def test_success_marks_sent(self, notification_with_delivery):
         _n, d = notification_with_delivery
         with patch("notifications.channels.email.EmailChannel.send"):
-            _deliver_notification(d.id)
+            assert deliver_notifications_task.func(ChannelType.EMAIL) == 1
 
         d.refresh_from_db()
         assert d.status == DeliveryStatus.SENT
@@ -27,75 +48,202 @@ class TestDeliverNotification:
         assert d.delivered_at is not None
         assert d.last_attempted_at is not None
 
+    def test_fan_out_is_sent_in_batches_over_one_connection(self, member_user):
+        deliveries = [_pending_email(member_user) for _ in range(DELIVERY_BATCH_SIZE + 3)]
+
+        with patch("notifications.channels.email.get_connection", wraps=get_connection) as connection_factory:
+            assert deliver_notifications_task.func(ChannelType.EMAIL) == len(deliveries)
+
+        assert connection_factory.call_count == 2
+        connection_factory.assert_called_with(timeout=_SMTP_TIMEOUT_SECONDS)
+        assert len(mail.outbox) == len(deliveries)
+        assert NotificationDelivery.objects.filter(status=DeliveryStatus.SENT).count() == len(deliveries)
+
     def test_unrecoverable_error_marks_failed_no_retry(self, notification_with_delivery):
         _n, d = notification_with_delivery
-        with patch(
-            "notifications.channels.email.EmailChannel.send", side_effect=UnrecoverableDeliveryError("bad address")
+        with (
+            patch(
+                "notifications.channels.email.EmailChannel.send", side_effect=UnrecoverableDeliveryError("bad address")
+            ),
+            patch("notifications.tasks.deliver_notifications_task") as mock_task,
         ):
-            _deliver_notification(d.id)
+            deliver_notifications_task.func(ChannelType.EMAIL)
 
         d.refresh_from_db()
         assert d.status == DeliveryStatus.FAILED
         assert d.attempts == 1
         assert "bad address" in d.error_message
+        mock_task.using.assert_not_called()
+
+    def test_one_failure_does_not_hold_back_the_rest_of_the_batch(self, member_user):
+        bad, good = _pending_email(member_user), _pending_email(member_user)
+
+        def send(notification, delivery, **kwargs):
+            if delivery.id == bad.id:
+                raise UnrecoverableDeliveryError("bad address")
+
+        with patch("notifications.channels.email.EmailChannel.send", side_effect=send):
+            deliver_notifications_task.func(ChannelType.EMAIL)
 
-    def test_transient_error_within_max_attempts_stays_pending(self, notification_with_delivery):
+        bad.refresh_from_db()
+        good.refresh_from_db()
+        assert (bad.status, good.status) == (DeliveryStatus.FAILED, DeliveryStatus.SENT)
+
+    def test_transient_error_within_max_attempts_stays_pending_until_its_backoff(self, notification_with_delivery):
         _n, d = notification_with_delivery
         with (
             patch("notifications.channels.email.EmailChannel.send", side_effect=ConnectionError("timeout")),
-            patch("notifications.tasks.deliver_notification_task") as mock_task,
+            patch("notifications.tasks.deliver_notifications_task") as mock_task,
         ):
-            _deliver_notification(d.id)
+            assert deliver_notifications_task.func(ChannelType.EMAIL) == 1
 
         d.refresh_from_db()
         assert d.status == DeliveryStatus.PENDING
         assert d.attempts == 1
         assert "timeout" in d.error_message
-        mock_task.using.return_value.enqueue.assert_called_once()
+        mock_task.using.assert_called_once_with(run_after=d.last_attempted_at + timedelta(seconds=60))
+        mock_task.using.return_value.enqueue.assert_called_once_with(ChannelType.EMAIL)
+
+        # Not due again until the backoff has passed.
+        with patch("notifications.channels.email.EmailChannel.send") as mock_send:
+            assert deliver_notifications_task.func(ChannelType.EMAIL) == 0
+        mock_send.assert_not_called()
+
+        NotificationDelivery.objects.filter(pk=d.pk).update(last_attempted_at=timezone.now() - timedelta(seconds=61))
+        with patch("notifications.channels.email.EmailChannel.send"):
+            assert deliver_notifications_task.func(ChannelType.EMAIL) == 1
+        d.refresh_from_db()
+        assert (d.status, d.attempts) == (DeliveryStatus.SENT, 2)
 
     def test_transient_error_at_max_attempts_marks_failed(self, notification_with_delivery):
         _n, d = notification_with_delivery
         d.attempts = 2
+        d.last_attempted_at = timezone.now() - timedelta(hours=1)
         d.save()
         with patch("notifications.channels.email.EmailChannel.send", side_effect=ConnectionError("timeout")):
-            _deliver_notification(d.id)
+            deliver_notifications_task.func(ChannelType.EMAIL)
 
         d.refresh_from_db()
         assert d.status == DeliveryStatus.FAILED
         assert d.attempts == 3
 
+    def test_connection_failure_fails_the_batch_as_transient(self, notification_with_delivery):
+        _n, d = notification_with_delivery
+        with (
+            patch("notifications.channels.email.get_connection", side_effect=ConnectionRefusedError("smtp down")),
+            patch("notifications.tasks.deliver_notifications_task"),
+        ):
+            deliver_notifications_task.func(ChannelType.EMAIL)
+
+        d.refresh_from_db()
+        assert (d.status, d.attempts) == (DeliveryStatus.PENDING, 1)
+        assert "smtp down" in d.error_message
+
+    def test_a_dead_connection_leaves_the_rest_of_the_batch_for_its_retry(self, member_user):
+        sent, stalled, unsent = (_pending_email(member_user) for _ in range(3))
+        calls = []
+
+        def send(notification, delivery, *, connection):
+            calls.append(delivery.id)
+            if delivery.id == stalled.id:
+                raise TimeoutError("timed out")
+
+        with (
+            patch("notifications.channels.email.EmailChannel.send", side_effect=send),
+            patch("django.core.mail.backends.locmem.EmailBackend.close", side_effect=TimeoutError("timed out")),
+            patch("notifications.tasks.deliver_notifications_task"),
+        ):
+            deliver_notifications_task.func(ChannelType.EMAIL)
+
+        assert calls == [sent.id, stalled.id]
+        statuses = dict(NotificationDelivery.objects.values_list("id", "status"))
+        assert statuses == {
+            sent.id: DeliveryStatus.SENT,
+            stalled.id: DeliveryStatus.PENDING,
+            unsent.id: DeliveryStatus.PENDING,
+        }
+
     def test_skipped_delivery_is_not_processed(self, notification_with_delivery):
         _n, d = notification_with_delivery
         d.status = DeliveryStatus.SKIPPED
         d.save()
         with patch("notifications.channels.email.EmailChannel.send") as mock_send:
-            _deliver_notification(d.id)
+            assert deliver_notifications_task.func(ChannelType.EMAIL) == 0
         mock_send.assert_not_called()
 
-    def test_nonexistent_delivery_does_not_raise(self):
-        _deliver_notification(uuid.uuid4())
-
     def test_unknown_channel_at_delivery_time(self, notification_with_delivery):
         _n, d = notification_with_delivery
         with patch("notifications.tasks.get_channel", side_effect=UnknownChannelError("sms")):
-            _deliver_notification(d.id)
+            deliver_notifications_task.func(ChannelType.EMAIL)
 
         d.refresh_from_db()
         assert d.status == DeliveryStatus.SKIPPED
         assert "sms" in d.error_message
 
-    def test_reenqueue_failure_marks_failed(self, notification_with_delivery):
+    def test_retry_enqueue_failure_leaves_delivery_pending(self, notification_with_delivery):
         _n, d = notification_with_delivery
         with (
             patch("notifications.channels.email.EmailChannel.send", side_effect=ConnectionError("timeout")),
-            patch("notifications.tasks.deliver_notification_task") as mock_task,
+            patch("notifications.tasks.deliver_notifications_task") as mock_task,
         ):
             mock_task.using.return_value.enqueue.side_effect = RuntimeError("broker down")
-            _deliver_notification(d.id)
+            deliver_notifications_task.func(ChannelType.EMAIL)
 
         d.refresh_from_db()
-        assert d.status == DeliveryStatus.FAILED
-        assert "Re-enqueue failed" in d.error_message
+        assert d.status == DeliveryStatus.PENDING
+
+
+@pytest.mark.django_db
+class TestScheduleDelivery:
+    def test_fan_out_enqueues_one_drain_per_channel(self):
+        with patch("notifications.tasks.deliver_notifications_task") as mock_task:
+            for _ in range(5):
+                schedule_delivery(ChannelType.EMAIL)
+            schedule_delivery(ChannelType.ROCKETCHAT)
+
+        assert [c.args for c in mock_task.enqueue.call_args_list] == [(ChannelType.EMAIL,), (ChannelType.ROCKETCHAT,)]
+
+    def test_a_started_drain_lets_the_next_delivery_schedule_another(self):
+        with patch("notifications.tasks.deliver_notifications_task") as mock_task:
+            schedule_delivery(ChannelType.EMAIL)
+        deliver_notifications_task.func(ChannelType.EMAIL)
+        with patch("notifications.tasks.deliver_notifications_task") as mock_task:
+            schedule_delivery(ChannelType.EMAIL)
+
+        mock_task.enqueue.assert_called_once_with(ChannelType.EMAIL)
+
+    def test_enqueue_failure_does_not_block_the_next_attempt(self):
+        with patch("notifications.tasks.deliver_notifications_task") as mock_task:
+            mock_task.enqueue.side_effect = RuntimeError("broker down")
+            schedule_delivery(ChannelType.EMAIL)
+            mock_task.enqueue.side_effect = None
+            schedule_delivery(ChannelType.EMAIL)
+
+        assert mock_task.enqueue.call_count == 2
+
+
+@pytest.mark.django_db
+class TestSweepNotificationDeliveries:
+    def test_delivers_what_no_drain_picked_up(self, notification_with_delivery):
+        _n, d = notification_with_delivery
+
+        sweep_notification_deliveries_cron_task.func()
+
+        d.refresh_from_db()
+        assert d.status == DeliveryStatus.SENT
+
+    def test_fails_abandoned_last_attempts(self, member_user):
+        abandoned = _pending_email(
+            member_user, attempts=MAX_DELIVERY_ATTEMPTS, last_attempted_at=timezone.now() - timedelta(hours=1)
+        )
+        in_flight = _pending_email(member_user, attempts=MAX_DELIVERY_ATTEMPTS, last_attempted_at=timezone.now())
+
+        sweep_notification_deliveries_cron_task.func()
+
+        abandoned.refresh_from_db()
+        in_flight.refresh_from_db()
+        assert abandoned.status == DeliveryStatus.FAILED
+        assert in_flight.status == DeliveryStatus.PENDING
 
 
 def _classified_finished_run(user, *, status=EnvelopeStatus.FAILED):
@@ -2,6 +2,8 @@ import uuid
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+from django.db import transaction
+
 import pytest
 from django_tasks_db.models import DBTaskResult, get_date_max
 from sessions.models import Run, SessionOrigin
@@ -391,3 +393,84 @@ def test_dispatch_skips_once_schedule_of_inactive_owner_without_retiring(member_
     assert schedule.is_enabled is True
     assert schedule.next_run_at == past
     assert schedule.run_count == 0
+
+
+def _due_daily(user, name: str, past: datetime) -> ScheduledJob:
+    return ScheduledJob.objects.create(
+        user=user,
+        name=name,
+        prompt="do stuff",
+        repos=[{"repo_id": "acme/repo", "ref": ""}],
+        frequency="daily",
+        time="09:00",
+        is_enabled=True,
+        next_run_at=past,
+    )
+
+
+def _fake_batch_result() -> MagicMock:
+    return MagicMock(batch_id=uuid.uuid4(), runs=[], failed=[])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_claims_every_due_schedule_in_chunks(member_user):
+    past = datetime.now(tz=UTC) - timedelta(minutes=1)
+    schedules = [_due_daily(member_user, f"s{i}", past) for i in range(5)]
+
+    with (
+        patch("schedules.tasks.DISPATCH_CHUNK_SIZE", 2),
+        patch("sessions.services.submit_batch_runs", side_effect=lambda **kw: _fake_batch_result()) as submit,
+    ):
+        dispatch_scheduled_jobs_cron_task.func()
+
+    assert sorted(call.kwargs["scheduled_job"].pk for call in submit.call_args_list) == [s.pk for s in schedules]
+    for schedule in schedules:
+        schedule.refresh_from_db()
+        assert schedule.next_run_at > past
+        assert schedule.run_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_skips_a_schedule_that_cannot_be_advanced(member_user):
+    past = datetime.now(tz=UTC) - timedelta(minutes=1)
+    stuck = _due_daily(member_user, "stuck", past)
+    healthy = _due_daily(member_user, "healthy", past)
+    advance = ScheduledJob.advance_after_dispatch
+
+    def _advance(schedule, after):
+        if schedule.pk == stuck.pk:
+            raise ValueError("corrupt cron expression")
+        return advance(schedule, after)
+
+    with (
+        patch.object(ScheduledJob, "advance_after_dispatch", _advance),
+        patch("sessions.services.submit_batch_runs", side_effect=lambda **kw: _fake_batch_result()) as submit,
+    ):
+        dispatch_scheduled_jobs_cron_task.func()
+
+    assert [call.kwargs["scheduled_job"].pk for call in submit.call_args_list] == [healthy.pk]
+    stuck.refresh_from_db()
+    assert not stuck.is_enabled
+    assert stuck.run_count == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_advances_and_unlocks_before_submitting(member_user):
+    from schedules.tasks import _claim_due
+
+    past = datetime.now(tz=UTC) - timedelta(minutes=1)
+    schedule = _due_daily(member_user, "daily", past)
+    seen = {}
+
+    def _submit(**kwargs):
+        # A sweep overlapping this one finds nothing left to claim, and the row is not locked.
+        seen["reclaimed"] = _claim_due(datetime.now(tz=UTC), set())
+        with transaction.atomic():
+            seen["next_run_at"] = ScheduledJob.objects.select_for_update(nowait=True).get(pk=schedule.pk).next_run_at
+        return _fake_batch_result()
+
+    with patch("sessions.services.submit_batch_runs", side_effect=_submit):
+        dispatch_scheduled_jobs_cron_task.func()
+
+    assert seen["reclaimed"] == ([], [])
+    assert seen["next_run_at"] > past
@@ -4,6 +4,7 @@ from datetime import timedelta
 from django.utils import timezone
 
 import pytest
+from sessions import locks
 from sessions.locks import SessionLock
 from sessions.models import Session, SessionOrigin
 
@@ -55,3 +56,104 @@ async def test_heartbeat_only_by_holder():
     await SessionLock.heartbeat(session.thread_id, "run-1")
     await session.arefresh_from_db()
     assert session.last_active_at > old
+
+
+class FakeLeaseRedis:
+    """The slice of ``redis.Redis`` the lease backend needs, with each script run in Python."""
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+
+    def set(self, key, value, *, nx, px):
+        assert nx
+        if key in self.values:
+            return None
+        self.values[key] = value
+        self.ttls[key] = px
+        return True
+
+    def register_script(self, source):
+        return {locks._RENEW_SCRIPT: self._renew, locks._RELEASE_SCRIPT: self._release}[source]
+
+    def _holds(self, key, holder_id):
+        return self.values.get(key) == holder_id
+
+    def _renew(self, keys, args):
+        if not self._holds(keys[0], args[0]):
+            return 0
+        self.ttls[keys[0]] = int(args[1])
+        return 1
+
+    def _release(self, keys, args):
+        if not self._holds(keys[0], args[0]):
+            return 0
+        del self.values[keys[0]]
+        return 1
+
+    def expire(self, thread_id):
+        """What Redis does once a lease's TTL runs out."""
+        del self.values[locks.RedisSessionLeases._key(thread_id)]
+
+
+class TestRedisBackend:
+    @pytest.fixture(autouse=True)
+    def fake_redis(self, monkeypatch):
+        fake = FakeLeaseRedis()
+        monkeypatch.setattr(locks.core_settings, "SESSION_LOCK_BACKEND", "redis")
+        monkeypatch.setattr(locks.RedisSessionLeases, "_client", staticmethod(lambda: fake))
+        monkeypatch.setattr(locks, "_BACKENDS", {**locks._BACKENDS, "redis": locks.RedisSessionLeases()})
+        return fake
+
+    async def test_claim_mirrors_holder_to_the_session(self, fake_redis):
+        session = await _mk_session()
+
+        assert await SessionLock.try_claim(session.thread_id, "run-1") is True
+        assert await SessionLock.try_claim(session.thread_id, "run-2") is False
+
+        await session.arefresh_from_db()
+        assert session.active_run_id == "run-1"
+        assert fake_redis.ttls[locks.RedisSessionLeases._key(session.thread_id)] == locks.STALE_RUN_MINUTES * 60_000
+
+    async def test_claim_of_unknown_session_gives_the_lease_back(self, fake_redis):
+        assert await SessionLock.try_claim("missing-thread", "run-1") is False
+        assert fake_redis.values == {}
+
+    async def test_expired_lease_is_taken_over(self, fake_redis, caplog):
+        session = await _mk_session()
+        await SessionLock.try_claim(session.thread_id, "run-1")
+        fake_redis.expire(session.thread_id)
+
+        with caplog.at_level("WARNING", logger="daiv.sessions"):
+            assert await SessionLock.try_claim(session.thread_id, "run-2") is True
+
+        assert fake_redis.values[locks.RedisSessionLeases._key(session.thread_id)] == "run-2"
+        assert "prior holder=run-1" in caplog.text
+        assert await SessionLock.heartbeat(session.thread_id, "run-1") is False
+        await SessionLock.release(session.thread_id, "run-1")  # superseded holder: no-op
+        await session.arefresh_from_db()
+        assert session.active_run_id == "run-2"
+
+    async def test_heartbeat_renews_without_writing_the_session_each_time(self, fake_redis):
+        session = await _mk_session()
+        await SessionLock.try_claim(session.thread_id, "run-1")
+        claimed = (await Session.objects.aget(pk=session.pk)).last_active_at
+
+        assert await SessionLock.heartbeat(session.thread_id, "run-1") is True
+        assert (await Session.objects.aget(pk=session.pk)).last_active_at == claimed
+
+        backend = locks._BACKENDS["redis"]
+        backend._mirrored[(session.thread_id, "run-1")] -= locks.LEASE_MIRROR_INTERVAL_S
+        assert await SessionLock.heartbeat(session.thread_id, "run-1") is True
+        assert (await Session.objects.aget(pk=session.pk)).last_active_at > claimed
+
+    async def test_release_frees_lease_and_session(self, fake_redis):
+        session = await _mk_session()
+        await SessionLock.try_claim(session.thread_id, "run-1")
+
+        await SessionLock.release(session.thread_id, "run-1")
+
+        await session.arefresh_from_db()
+        assert session.active_run_id is None
+        assert fake_redis.values == {}
+        assert await SessionLock.try_claim(session.thread_id, "run-2") is True
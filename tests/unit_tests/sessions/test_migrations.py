@@ -2,9 +2,11 @@ import uuid
 from importlib import import_module
 
 import pytest
-from sessions.models import Run, RunStatus, Session, SessionOrigin
+from sessions.models import Run, RunDailyStats, RunStatus, Session, SessionOrigin
 
 muted_migration = import_module("sessions.migrations.0006_run_muted_classify_eligible")
+daily_stats_migration = import_module("sessions.migrations.0007_rundailystats")
+run_summary_migration = import_module("sessions.migrations.0009_session_run_summary")
 
 
 def _run(status):
@@ -32,3 +34,37 @@ def test_backfill_ineligible_freezes_only_terminal_runs():
     assert runs[RunStatus.FAILED].classify_eligible is False
     assert runs[RunStatus.RUNNING].classify_eligible is True
     assert runs[RunStatus.QUEUED].classify_eligible is True
+
+
+@pytest.mark.django_db
+def test_populate_run_daily_stats_rolls_up_only_finished_runs():
+    from django.apps import apps as global_apps
+
+    for status in (RunStatus.SUCCESSFUL, RunStatus.SUCCESSFUL, RunStatus.FAILED, RunStatus.RUNNING):
+        _run(status)
+    RunDailyStats.objects.all().delete()  # Drop what the on-save refresh may have written.
+
+    daily_stats_migration.populate_run_daily_stats(global_apps, None)
+
+    stats = RunDailyStats.objects.get()
+    assert (stats.total, stats.successful, stats.failed) == (3, 2, 1)
+
+
+@pytest.mark.django_db
+def test_populate_session_run_summary_fills_in_existing_sessions():
+    from django.apps import apps as global_apps
+
+    session = Session.objects.create(thread_id=str(uuid.uuid4()), origin=SessionOrigin.API_JOB, repo_id="x/y")
+    Run.objects.create(session=session, trigger_type=SessionOrigin.API_JOB, repo_id="x/y", status=RunStatus.FAILED)
+    latest = Run.objects.create(
+        session=session, trigger_type=SessionOrigin.API_JOB, repo_id="x/y", status=RunStatus.SUCCESSFUL
+    )
+    empty = Session.objects.create(thread_id=str(uuid.uuid4()), origin=SessionOrigin.CHAT, repo_id="x/y")
+    Session.objects.update(latest_run=None, latest_run_status="", run_count=0)  # As before the migration.
+
+    run_summary_migration.populate_session_run_summary(global_apps, None)
+
+    session.refresh_from_db()
+    empty.refresh_from_db()
+    assert (session.latest_run_id, session.latest_run_status, session.run_count) == (latest.pk, "SUCCESSFUL", 2)
+    assert (empty.latest_run_id, empty.run_count) == (None, 0)
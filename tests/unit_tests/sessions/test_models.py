@@ -92,12 +92,13 @@ def test_by_owner_matches_run_actor(django_user_model):
     assert list(Session.objects.by_owner(user)) == [session]
 
 
-def test_with_latest_status_annotation():
+def test_latest_run_status_follows_the_newest_run():
     session = _mk_session()
     _mk_run(session, status=RunStatus.SUCCESSFUL)
-    _mk_run(session, status=RunStatus.RUNNING)
-    annotated = Session.objects.with_latest_status().get(pk=session.pk)
-    assert annotated.latest_run_status == RunStatus.RUNNING
+    newest = _mk_run(session, status=RunStatus.RUNNING)
+    session.refresh_from_db()
+    assert session.latest_run_status == RunStatus.RUNNING
+    assert session.latest_run_id == newest.pk
 
 
 def test_run_is_retryable_mirrors_activity_semantics():
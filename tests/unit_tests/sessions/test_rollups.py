@@ -0,0 +1,77 @@
+import uuid
+from datetime import timedelta
+
+from django.utils import timezone
+
+import pytest
+from sessions.models import Run, RunDailyStats, RunStatus, Session, SessionOrigin
+from sessions.rollups import refresh_run_daily_stats, run_activity_stats
+
+
+def _make_run(user, *, status=RunStatus.SUCCESSFUL, trigger_type=SessionOrigin.API_JOB, duration=None, **kwargs):
+    session = Session.objects.create(thread_id=str(uuid.uuid4()), origin=trigger_type, repo_id="acme/api", user=user)
+    if duration is not None:
+        now = timezone.now()
+        kwargs.update(started_at=now - duration, finished_at=now)
+    return Run.objects.create(
+        session=session, status=status, trigger_type=trigger_type, repo_id="acme/api", user=user, **kwargs
+    )
+
+
+@pytest.mark.django_db
+class TestRunDailyStats:
+    def test_finishing_a_run_refreshes_its_day(self, member_user, django_capture_on_commit_callbacks):
+        run = _make_run(member_user, status=RunStatus.RUNNING)
+        assert not RunDailyStats.objects.exists()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            run.status = RunStatus.SUCCESSFUL
+            run.code_changes = True
+            run.save(update_fields=["status", "code_changes"])
+
+        stats = RunDailyStats.objects.get()
+        assert stats.day == timezone.localdate(run.created_at)
+        assert (stats.total, stats.successful, stats.failed, stats.code_changes) == (1, 1, 0, 1)
+
+    def test_refresh_converges_on_the_runs_as_they_are(self, member_user, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            run = _make_run(member_user, status=RunStatus.FAILED)
+            _make_run(member_user)
+        day = timezone.localdate(run.created_at)
+
+        refresh_run_daily_stats([day])
+        refresh_run_daily_stats([day])
+        assert RunDailyStats.objects.get().total == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            run.delete()
+        assert RunDailyStats.objects.get().total == 1
+
+    def test_activity_counts_finished_runs_from_the_rollup_and_in_flight_runs_live(
+        self, member_user, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            _make_run(member_user, duration=timedelta(minutes=2))
+            _make_run(member_user, duration=timedelta(minutes=4), trigger_type=SessionOrigin.CHAT)
+            _make_run(member_user, status=RunStatus.FAILED, trigger_type=SessionOrigin.CHAT)
+            _make_run(member_user, status=RunStatus.RUNNING, trigger_type=SessionOrigin.CHAT)
+
+        stats = run_activity_stats(member_user, timezone.localdate() - timedelta(days=6))
+
+        assert stats["total"] == 4
+        assert stats["successful"] == 2
+        assert stats["failed_count"] == 1
+        assert stats["avg_duration"] == timedelta(minutes=3)
+        assert stats["api_jobs"] == 1
+        assert stats["chat_jobs"] == 2
+
+    def test_activity_only_counts_runs_the_user_may_view(
+        self, admin_user, member_user, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            _make_run(member_user)
+            _make_run(admin_user)
+            _make_run(admin_user, status=RunStatus.RUNNING)
+
+        assert run_activity_stats(member_user, None)["total"] == 1
+        assert run_activity_stats(admin_user, None)["total"] == 3
@@ -109,3 +109,32 @@ def test_sync_and_save_emits_run_finished_on_terminal_transition(create_db_task_
         assert run.sync_and_save() is True
         m_emit.assert_called_once()
         assert m_emit.call_args.kwargs["previous_status"] == RunStatus.RUNNING
+
+
+def test_phase_timings_synced_from_task_result(create_db_task_result):
+    timings = {"model": {"seconds": 12.5, "count": 3}, "tools": {"seconds": 4.0, "count": 7}}
+    tr = create_db_task_result(status="SUCCESSFUL", return_value={"response": "x", "phase_timings": timings})
+    run = _run(tr)
+    run.sync_from_task_result()
+    assert run.phase_timings == timings
+
+
+def test_phase_percentiles_per_phase():
+    for seconds in (1.0, 2.0, 3.0, 4.0, 5.0):
+        _run(None, status=RunStatus.SUCCESSFUL, phase_timings={"model": {"seconds": seconds, "count": 1}})
+    _run(None, status=RunStatus.SUCCESSFUL, phase_timings={"clone": {"seconds": 0.5, "count": 1}})
+    _run(None, status=RunStatus.SUCCESSFUL)
+
+    result = Run.objects.phase_percentiles(since=_STARTED)
+
+    assert result["model"]["runs"] == 5
+    assert result["model"]["p50"] == 3.0
+    assert result["model"]["p99"] <= 5.0
+    assert result["clone"] == {"runs": 1, "p50": 0.5, "p90": 0.5, "p99": 0.5}
+
+
+def test_phase_percentiles_filters_by_repo():
+    _run(None, phase_timings={"model": {"seconds": 1.0, "count": 1}})
+    _run(None, repo_id="other/repo", phase_timings={"model": {"seconds": 9.0, "count": 1}})
+
+    assert Run.objects.phase_percentiles(since=_STARTED, repo_id="g/r")["model"]["runs"] == 1
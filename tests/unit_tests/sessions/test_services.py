@@ -322,6 +322,48 @@ class TestSubmitBatchRunsSync:
         assert session.scheduled_job_id == schedule.pk
 
 
+@pytest.mark.django_db(transaction=True)
+class TestBulkSubmit:
+    """New-session batches on the database task backend are written set-based, not per repo."""
+
+    def test_batch_links_each_run_to_its_own_task(self, member_user, database_task_backend):
+        repos = [RepoTarget(repo_id=f"o/r{i}", ref="dev" if i % 2 else "") for i in range(5)]
+        with mock.patch("sessions.services.acreate_run") as per_repo_create:
+            result = submit_batch_runs(user=member_user, prompt="p", repos=repos, trigger_type=SessionOrigin.UI_JOB)
+
+        per_repo_create.assert_not_called()
+        assert result.failed == []
+        assert [run.repo_id for run in result.runs] == [f"o/r{i}" for i in range(5)]
+        for run in Run.objects.filter(batch_id=result.batch_id).select_related("session"):
+            assert run.status == RunStatus.READY
+            assert run.session.origin == SessionOrigin.UI_JOB
+            kwargs = DBTaskResult.objects.get(id=run.task_result_id).args_kwargs["kwargs"]
+            assert kwargs["run_id"] == str(run.pk)
+            assert kwargs["thread_id"] == run.session_id
+            assert kwargs["ref"] == (run.ref or None)
+
+    def test_statement_count_does_not_grow_with_the_batch(self, member_user, database_task_backend):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        def _submit(count):
+            repos = [RepoTarget(repo_id=f"o/r{i}") for i in range(count)]
+            with CaptureQueriesContext(connection) as queries:
+                submit_batch_runs(user=member_user, prompt="", repos=repos, trigger_type=SessionOrigin.UI_JOB)
+            return len(queries)
+
+        small = _submit(2)
+        assert _submit(20) <= small
+
+    def test_bulk_failure_falls_back_to_per_repo_submission(self, member_user, database_task_backend):
+        repos = [RepoTarget(repo_id="o/a"), RepoTarget(repo_id="o/b")]
+        with mock.patch("sessions.services._bulk_submit", side_effect=RuntimeError("boom")):
+            result = submit_batch_runs(user=member_user, prompt="p", repos=repos, trigger_type=SessionOrigin.UI_JOB)
+
+        assert len(result.runs) == 2
+        assert all(run.task_result_id for run in result.runs)
+
+
 # ---------------------------------------------------------------------------
 # Async batch submit tests (ported from TestAsubmitBatchRuns)
 # ---------------------------------------------------------------------------
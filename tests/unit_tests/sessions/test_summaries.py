@@ -0,0 +1,84 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.utils import timezone
+
+import pytest
+from sessions.models import Run, RunStatus, Session, SessionOrigin
+from sessions.summaries import refresh_session_summaries
+
+pytestmark = pytest.mark.django_db
+
+
+def _session() -> Session:
+    return Session.objects.create(thread_id=str(uuid.uuid4()), origin=SessionOrigin.API_JOB, repo_id="acme/api")
+
+
+def _run(session, **kwargs) -> Run:
+    kwargs.setdefault("status", RunStatus.SUCCESSFUL)
+    return Run.objects.create(session=session, trigger_type=SessionOrigin.API_JOB, repo_id="acme/api", **kwargs)
+
+
+def test_a_new_session_has_an_empty_summary():
+    session = _session()
+    assert (session.latest_run_id, session.latest_run_status, session.run_count) == (None, "", 0)
+    assert session.total_cost_usd is None
+
+
+def test_saving_runs_keeps_the_summary_current():
+    session = _session()
+    _run(session, cost_usd=Decimal("0.25"))
+    now = timezone.now()
+    newest = _run(session, status=RunStatus.RUNNING, started_at=now, cost_usd=Decimal("0.50"))
+
+    newest.status = RunStatus.SUCCESSFUL
+    newest.finished_at = now + timedelta(seconds=90)
+    newest.merge_request_web_url = "https://git.example.com/acme/api/-/merge_requests/3"
+    newest.save(update_fields=["status", "finished_at", "merge_request_web_url"])
+
+    session.refresh_from_db()
+    assert session.latest_run_id == newest.pk
+    assert session.latest_run_status == RunStatus.SUCCESSFUL
+    assert session.latest_run_duration == 90
+    assert session.latest_run_merge_request_web_url == "https://git.example.com/acme/api/-/merge_requests/3"
+    assert session.run_count == 2
+    assert session.total_cost_usd == Decimal("0.75")
+
+
+def test_saves_of_other_fields_skip_the_refresh():
+    session = _session()
+    run = _run(session)
+    with patch("sessions.summaries.refresh_session_summaries") as refresh:
+        run.title = "Renamed"
+        run.save(update_fields=["title"])
+    refresh.assert_not_called()
+
+
+def test_deleting_the_latest_run_falls_back_to_the_previous_one():
+    session = _session()
+    previous = _run(session, status=RunStatus.FAILED)
+    _run(session).delete()
+
+    session.refresh_from_db()
+    assert (session.latest_run_id, session.latest_run_status, session.run_count) == (previous.pk, "FAILED", 1)
+
+
+def test_refresh_converges_after_writes_that_bypass_the_signals():
+    session = _session()
+    run = _run(session, status=RunStatus.RUNNING)
+    Run.objects.filter(pk=run.pk).update(status=RunStatus.FAILED, cost_usd=Decimal("1.5"))
+
+    refresh_session_summaries([session.pk])
+
+    session.refresh_from_db()
+    assert session.latest_run_status == RunStatus.FAILED
+    assert session.total_cost_usd == Decimal("1.5")
+
+
+def test_a_failed_refresh_never_breaks_the_run_write():
+    session = _session()
+    with patch("sessions.summaries.Session.objects.select_for_update", side_effect=RuntimeError("db down")):
+        run = _run(session)
+    assert Run.objects.filter(pk=run.pk).exists()
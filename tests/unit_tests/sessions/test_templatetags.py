@@ -93,16 +93,6 @@ def test_session_title_falls_back_to_thread_prefix():
     assert session_title(session) == "abcdef12"
 
 
-class _Runs:
-    """Minimal stand-in for session.runs.all() over a fixed list."""
-
-    def __init__(self, runs):
-        self._runs = runs
-
-    def all(self):
-        return self._runs
-
-
 def _session_at(dt):
     return types.SimpleNamespace(last_active_at=dt)
 
@@ -157,19 +147,16 @@ def test_origin_icon(origin, expected):
     assert origin_icon(origin) == expected
 
 
-def test_session_cost_sums_runs():
-    runs = [types.SimpleNamespace(cost_usd=Decimal("0.30")), types.SimpleNamespace(cost_usd=Decimal("0.08"))]
-    session = types.SimpleNamespace(runs=_Runs(runs))
+def test_session_cost_formats_the_session_total():
+    session = types.SimpleNamespace(total_cost_usd=Decimal("0.38"))
     assert session_cost(session) == "$0.38"
 
 
 def test_session_cost_empty_when_zero():
-    session = types.SimpleNamespace(runs=_Runs([types.SimpleNamespace(cost_usd=None)]))
+    session = types.SimpleNamespace(total_cost_usd=Decimal("0"))
     assert session_cost(session) == ""
 
 
-def test_session_cost_skips_null_costs():
-    # A run with cost_usd=None must be skipped (the `is not None` guard), not coerce a TypeError.
-    runs = [types.SimpleNamespace(cost_usd=None), types.SimpleNamespace(cost_usd=Decimal("0.30"))]
-    session = types.SimpleNamespace(runs=_Runs(runs))
-    assert session_cost(session) == "$0.30"
+def test_session_cost_empty_when_no_run_recorded_a_cost():
+    session = types.SimpleNamespace(total_cost_usd=None)
+    assert session_cost(session) == ""
@@ -8,6 +8,7 @@ from django.urls import reverse
 from django.utils import timezone
 
 import pytest
+from django_tasks_db.models import DBTaskResult
 from sessions.locks import STALE_RUN_MINUTES
 from sessions.models import Run, RunStatus, Session, SessionOrigin
 
@@ -280,6 +281,45 @@ def test_detail_missing_checkpoint_not_expired_while_run_in_flight(member_client
     assert "has expired" not in content
 
 
+@pytest.mark.django_db
+def test_detail_shows_queue_position_while_run_waits_for_a_worker(member_client, member_user, create_db_task_result):
+    """A READY run no worker has claimed yet reports where it stands in the fair claim order."""
+    session = _create_session(user=member_user, ref="")
+    ahead = create_db_task_result(status="READY")  # another user's run, submitted first
+    _create_run(_create_session(), trigger_type=SessionOrigin.API_JOB, status=RunStatus.READY, task_result=ahead)
+    task = create_db_task_result(status="READY")
+    _create_run(session, trigger_type=SessionOrigin.UI_JOB, status=RunStatus.READY, task_result=task)
+
+    with patch("sessions.views.ahydrate_thread", _null_hydration()):
+        resp = member_client.get(reverse("session_detail", kwargs={"thread_id": session.thread_id}))
+
+    assert resp.status_code == 200
+    assert resp.context["queue_position"] == "2"
+    assert "Position 2 in queue" in resp.content.decode()
+
+
+@pytest.mark.django_db
+def test_detail_shows_queue_position_beyond_the_claim_window(member_client, member_user, create_db_task_result):
+    """A run deeper in the queue than the claim window reports the window size as a lower bound."""
+    session = _create_session(user=member_user, ref="")
+    ahead = create_db_task_result(status="READY")
+    DBTaskResult.objects.filter(pk=ahead.pk).update(priority=1)  # first in the window's read order
+    _create_run(_create_session(), trigger_type=SessionOrigin.API_JOB, status=RunStatus.READY, task_result=ahead)
+    task = create_db_task_result(status="READY")
+    _create_run(session, trigger_type=SessionOrigin.UI_JOB, status=RunStatus.READY, task_result=task)
+
+    with (
+        patch("sessions.views.ahydrate_thread", _null_hydration()),
+        patch("core.scheduling.CLAIM_WINDOW", 1),
+        patch("sessions.services.CLAIM_WINDOW", 1),
+    ):
+        resp = member_client.get(reverse("session_detail", kwargs={"thread_id": session.thread_id}))
+
+    assert resp.status_code == 200
+    assert resp.context["queue_position"] == "1+"
+    assert "Position 1+ in queue" in resp.content.decode()
+
+
 @pytest.mark.django_db
 def test_detail_missing_checkpoint_expired_when_all_runs_terminal(member_client, member_user):
     """No checkpoint AND no in-flight run => genuinely expired; banner still shows."""
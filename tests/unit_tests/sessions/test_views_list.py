@@ -171,21 +171,43 @@ class TestSessionListView:
         expected_href = reverse("session_detail", kwargs={"thread_id": session.thread_id})
         assert f'href="{expected_href}"' in response.content.decode()
 
-    def test_pagination_uses_paginate_by(self, logged_in_client, user):
-        """Check that paginated results are returned when there are more than paginate_by sessions."""
-        # Create 30 sessions to exceed typical paginate_by=25.
-        for _ in range(30):
-            _create_session(user=user)
+    def test_pagination_pages_by_cursor(self, logged_in_client, user):
+        """Pages are cut at a keyset cursor: no row repeats or goes missing across pages, and the
+        previous cursor leads back to the first page."""
+        sessions = [_create_session(user=user) for _ in range(30)]
 
         response = logged_in_client.get(reverse("session_list"))
+        page = response.context["page_obj"]
+        first = [s.pk for s in response.context["sessions"]]
+        assert len(first) == 25
+        assert page.has_next() and not page.has_previous()
+
+        response_p2 = logged_in_client.get(reverse("session_list"), {"cursor": page.next_cursor})
+        second = [s.pk for s in response_p2.context["sessions"]]
+        assert sorted(first + second) == sorted(s.pk for s in sessions)
+        assert not response_p2.context["page_obj"].has_next()
+
+        previous_cursor = response_p2.context["page_obj"].previous_cursor
+        back = logged_in_client.get(reverse("session_list"), {"cursor": previous_cursor})
+        assert [s.pk for s in back.context["sessions"]] == first
+
+    def test_malformed_cursor_serves_the_first_page(self, logged_in_client, user):
+        session = _create_session(user=user)
+        response = logged_in_client.get(reverse("session_list"), {"cursor": "not-a-cursor"})
         assert response.status_code == 200
-        # Page 1 should have at most 25 sessions (default paginate_by).
-        assert len(response.context["sessions"]) <= 25
+        assert [s.pk for s in response.context["sessions"]] == [session.pk]
 
-        # Page 2 should exist.
-        response_p2 = logged_in_client.get(reverse("session_list"), {"page": "2"})
-        assert response_p2.status_code == 200
-        assert len(response_p2.context["sessions"]) > 0
+    def test_page_cost_does_not_grow_with_the_rows(self, logged_in_client, user, django_assert_max_num_queries):
+        """Rows read the session's run summary, so a page of many sessions with many runs costs the
+        same handful of queries as a page of one."""
+        for _ in range(10):
+            session = _create_session(user=user)
+            for _ in range(3):
+                _create_run(session, cost_usd="0.10")
+
+        with django_assert_max_num_queries(12):
+            response = logged_in_client.get(reverse("session_list"), HTTP_HX_REQUEST="true")
+        assert "3 runs" in response.content.decode()
 
     def test_context_has_search_and_range(self, logged_in_client, user):
         _create_session(user=user)
@@ -212,15 +234,23 @@ class TestSessionListView:
         assert response.context["has_active_filters"] is True
         assert "Merge request !42" in response.content.decode()
 
-    def test_runs_are_prefetched_newest_first(self, logged_in_client, user, django_assert_num_queries):
-        session = _create_session(user=user)
-        _create_run(session, status=RunStatus.SUCCESSFUL)
-        newest = _create_run(session, status=RunStatus.RUNNING)
+    def test_row_shows_the_latest_run_summary(self, logged_in_client, user):
+        session = _create_session(user=user, merge_request_iid=7)
+        _create_run(session, status=RunStatus.SUCCESSFUL, cost_usd="0.30")
+        newest = _create_run(
+            session,
+            status=RunStatus.FAILED,
+            cost_usd="0.08",
+            merge_request_web_url="https://git.example.com/group/project/-/merge_requests/7",
+        )
+
         response = logged_in_client.get(reverse("session_list"))
         row = next(s for s in response.context["sessions"] if s.pk == session.pk)
-        with django_assert_num_queries(0):
-            latest = list(row.runs.all())[0]  # served from the prefetch cache — no query
-        assert latest.pk == newest.pk
+        assert row.latest_run_id == newest.pk
+        html = response.content.decode()
+        assert "session-row--failed" in html
+        assert "https://git.example.com/group/project/-/merge_requests/7" in html
+        assert "$0.38" in html
 
     def test_header_has_new_cta(self, logged_in_client, user):
         response = logged_in_client.get(reverse("session_list"))
@@ -329,9 +359,9 @@ class TestSessionListView:
             _create_session(user=user)
         response = logged_in_client.get(reverse("session_list"), HTTP_HX_REQUEST="true")
         html = response.content.decode()
-        # The marker must sit on a pagination anchor next to a page= href, not leak onto
+        # The marker must sit on a pagination anchor next to a cursor= href, not leak onto
         # some unrelated element (a bare substring check would miss that regression).
-        assert re.search(r'href="[^"]*page=\d+[^"]*"[^>]*data-page-swap', html)
+        assert re.search(r'href="[^"]*cursor=[^"]+"[^>]*data-page-swap', html)
 
     def test_htmx_no_match_fragment_uses_filtered_empty_state(self, logged_in_client, user):
         """An HX-Request whose filters exclude everything renders the no-match state.
@@ -356,18 +386,18 @@ class TestSessionListView:
         assert "No sessions match these filters." not in html
 
     def test_row_latest_run_matches_status_filter_on_equal_created_at(self, logged_in_client, user):
-        """DISPLAY order must match the FILTER tiebreaker (-created_at, -id).
+        """The latest run breaks ``created_at`` ties on ``-id``.
 
         When two runs share the same created_at timestamp (e.g. batch runs created in
-        one transaction), managers.py picks the higher-id run for status FILTERING via
-        order_by("-created_at", "-id").  The prefetch in views.py must use the same
-        tiebreaker so the DISPLAY first-run (row.runs.all()[0]) is the SAME run whose
-        status the annotation selected.
+        one transaction), the summary must pick the higher-id run, so the row's status dot
+        and the status filter both follow the same run.
         """
         import datetime
 
         from django.utils import timezone
 
+        from sessions.summaries import refresh_session_summaries
+
         session = _create_session(user=user)
         run_a = _create_run(session, status=RunStatus.FAILED)
         run_b = _create_run(session, status=RunStatus.SUCCESSFUL)
@@ -376,20 +406,17 @@ class TestSessionListView:
         # lexicographically, not by insertion order — UUIDv4 is random).
         run_winner = run_a if run_a.pk > run_b.pk else run_b
 
-        # Force both runs to an identical created_at so the only tiebreaker is id.
+        # Force both runs to an identical created_at so the only tiebreaker is id. ``update()``
+        # fires no post_save, so the summary is refreshed by hand.
         fixed_dt = timezone.make_aware(datetime.datetime(2024, 1, 1, 12, 0, 0))
         Run.objects.filter(pk__in=[run_a.pk, run_b.pk]).update(created_at=fixed_dt)
+        refresh_session_summaries([session.pk])
 
-        response = logged_in_client.get(reverse("session_list"))
+        response = logged_in_client.get(reverse("session_list"), {"status": run_winner.status})
         assert response.status_code == 200
 
         row = next(s for s in response.context["sessions"] if s.pk == session.pk)
-        # DISPLAY: first run from the prefetch must be the higher-id run (matching -id tiebreaker).
-        display_first = list(row.runs.all())[0]
-        assert display_first.pk == run_winner.pk, (
-            f"Prefetch tiebreaker mismatch: display first run pk={display_first.pk} "
-            f"but expected pk={run_winner.pk} (higher id, matching managers.py -id tiebreaker)"
-        )
+        assert row.latest_run_id == run_winner.pk
 
 
 def test_pagination_partial_swap_marker_is_opt_in(rf):
@@ -53,7 +53,7 @@ DECLARED_QUEUES = set(settings.TASKS["default"]["QUEUES"])
 INTERACTIVE_TASKS = {
     "automation.titling.tasks:generate_title_task",
     "automation.titling.tasks:generate_batch_title_task",
-    "notifications.tasks:deliver_notification_task",
+    "notifications.tasks:deliver_notifications_task",
     "sessions.tasks:classify_run_task",
 }
 TITLING_TASKS = {"automation.titling.tasks:generate_title_task", "automation.titling.tasks:generate_batch_title_task"}